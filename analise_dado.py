@@ -10,32 +10,89 @@ analise_de_dados/
     ├── analise_3/
     └── ...
 
-Cada execução cria uma nova pasta "analise_X".
+Cada execução cria uma nova pasta "analise_X" — exceto quando nenhum
+gráfico mudou: os agregados de entrada de cada gráfico têm um hash
+(graficos.json na pasta); se todos batem com os da última análise, a
+pasta anterior é reaproveitada. Os gráficos que mudaram são desenhados em
+paralelo (Agg, um processo por gráfico) e os demais são copiados.
+
+Modos de execução:
+    python analise_dado.py               -> carrega tudo num DataFrame
+    python analise_dado.py --streaming   -> lê o histórico em blocos
+                                            (memória: o bloco e um hash
+                                            por partida)
+    python analise_dado.py --streaming --bloco 50000
+    python analise_dado.py --sem-cache   -> ignora o snapshot colunar
+
+O modo em memória usa um snapshot colunar das partidas já limpas em
+dados/cache_analise/ (um arquivo binário por coluna, aberto com
+np.memmap). Quando o log cresce, só as partidas novas são limpas e
+anexadas ao snapshot.
+
+Também pode ser usado como biblioteca: importar o módulo não cria pastas
+nem importa numpy/pandas/matplotlib; cada etapa é uma função
+(carregar_partidas_limpas, estatisticas_por_jogador, entradas_do_dataframe,
+renderizar_graficos) e main(argv) reproduz a linha de comando.
 """
 
 import os
 import json
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import time
+import shutil
+import hashlib
+
+# numpy/pandas/matplotlib/seaborn são importados dentro das funções que os
+# usam: importar este módulo (ou rodar --help) não paga ~0,5 s de imports.
 
 # ============================================
 # LOCALIZAÇÃO DOS ARQUIVOS
 # ============================================
 
 BASE = os.getcwd()
-ARQ_PARTIDAS = os.path.join(BASE, "dados", "partidas.txt")
+ARQ_PARTIDAS = os.path.join(BASE, "dados", "partidas.txt")  # formato legado
+ARQ_PARTIDAS_LOG = os.path.join(BASE, "dados", "partidas.jsonl")  # log atual
 
 # Pasta principal das análises
 PASTA_ANALISE = os.path.join(BASE, "analise_de_dados")
-os.makedirs(PASTA_ANALISE, exist_ok=True)
+
+# Snapshot colunar das partidas limpas (modo em memória)
+PASTA_SNAPSHOT = os.path.join(BASE, "dados", "cache_analise")
+ARQ_SNAPSHOT_META = os.path.join(PASTA_SNAPSHOT, "meta.json")
+COLUNAS_SNAPSHOT = {
+    "id": "int64",
+    "jogador": "int32",  # código da categoria
+    "numero_secreto": "int32",
+    "total_tentativas": "int16",
+    "pontuacao": "int16",
+    "resultado": "int8",  # código da categoria
+    "data": "int64",  # datetime64[ns]
+}
+CATEGORICAS = ("jogador", "resultado")
+# hash de cada linha guardada: as partidas novas que repetem uma linha já
+# no snapshot (lote regravado) são descartadas, como no drop_duplicates
+# do histórico inteiro
+COLUNA_HASH = "hash_linha"
+TIPO_HASH = "uint64"
+VERSAO_SNAPSHOT = 2  # meta de outra versão: o snapshot é recriado
+
+# Leitura em blocos (modo --streaming)
+TAMANHO_BLOCO = 100_000
+COLUNAS_NUMERICAS = ["pontuacao", "total_tentativas", "vitoria_bin"]
+TIPOS_BLOCO = {
+    "id": "int64",
+    "jogador": "category",
+    "numero_secreto": "int32",
+    "total_tentativas": "int16",
+    "pontuacao": "int16",
+    "resultado": "category",
+}
 
 # ============================================
 # GERAR PRÓXIMA PASTA analise_X
 # ============================================
 
 def gerar_pasta_analise():
+    os.makedirs(PASTA_ANALISE, exist_ok=True)
     pastas = [p for p in os.listdir(PASTA_ANALISE) if p.startswith("analise_")]
     if not pastas:
         novo_numero = 1
@@ -48,100 +105,781 @@ def gerar_pasta_analise():
     os.makedirs(caminho, exist_ok=True)
     return caminho
 
-PASTA_ATUAL = gerar_pasta_analise()
+# ============================================
+# LEITURA INCREMENTAL DAS PARTIDAS
+# ============================================
 
-print(f"\n📁 Salvando gráficos em: {PASTA_ATUAL}\n")
+def arquivo_partidas():
+    """Log JSONL do jogo; o .txt antigo quando o log ainda não existe."""
+    return ARQ_PARTIDAS_LOG if os.path.exists(ARQ_PARTIDAS_LOG) else ARQ_PARTIDAS
+
+
+def _iterar_json_lines(f):
+    for linha in f:
+        try:
+            yield json.loads(linha)
+        except ValueError:
+            continue  # linha final incompleta
+
+
+def _iterar_array_json(f, tamanho_leitura=1 << 20):
+    """Parser incremental de uma lista JSON: devolve um objeto por vez.
+
+    Lê o arquivo em pedaços e usa JSONDecoder.raw_decode, então nunca
+    mantém a lista inteira em memória.
+    """
+    decodificador = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    fim_arquivo = False
+    dentro = False
+    while True:
+        # pula espaços, "[" inicial e vírgulas entre objetos
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,[":
+            dentro = dentro or buffer[pos] == "["
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+        if dentro and pos < len(buffer):
+            try:
+                objeto, pos = decodificador.raw_decode(buffer, pos)
+                yield objeto
+                continue
+            except json.JSONDecodeError:
+                if fim_arquivo:
+                    return  # lixo/arquivo truncado no fim
+        elif fim_arquivo:
+            return
+        pedaco = f.read(tamanho_leitura)
+        fim_arquivo = not pedaco
+        buffer = buffer[pos:] + pedaco
+        pos = 0
+
+
+def iterar_partidas(caminho):
+    """Itera as partidas do arquivo (JSON Lines ou lista JSON) uma a uma."""
+    with open(caminho, "r", encoding="utf-8") as f:
+        if caminho.endswith(".jsonl"):
+            yield from _iterar_json_lines(f)
+        else:
+            yield from _iterar_array_json(f)
+
+
+def ler_partidas_em_blocos(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera DataFrames de até `tamanho_bloco` partidas com tipos compactos.
+
+    A lista `tentativas` é descartada antes de montar o DataFrame (nunca
+    vira coluna); jogador/resultado são categóricos e as pontuações int16.
+    Linhas repetidas (um lote regravado após uma queda) contam uma vez só,
+    como no drop_duplicates de limpar_partidas, mesmo em blocos diferentes:
+    guarda-se o hash de 64 bits de cada linha já vista, o único estado
+    que cresce com o histórico.
+    """
+    vistas = set()
+    linhas = []
+    for partida in iterar_partidas(caminho):
+        partida.pop("tentativas", None)
+        linhas.append(partida)
+        if len(linhas) >= tamanho_bloco:
+            yield _montar_bloco(linhas, vistas)
+            linhas = []
+    if linhas:
+        yield _montar_bloco(linhas, vistas)
+
+
+def _montar_bloco(linhas, vistas):
+    import pandas as pd
+
+    bloco = pd.DataFrame.from_records(linhas).dropna(how="all")
+    bloco = bloco.astype({c: t for c, t in TIPOS_BLOCO.items() if c in bloco.columns})
+    bloco["data"] = pd.to_datetime(bloco["data"], errors="coerce")
+    bloco = bloco[_linhas_novas(bloco, vistas)]
+    return bloco.assign(vitoria_bin=(bloco["resultado"] == "Vitória").astype("int8"))
+
+
+def _hashes_das_linhas(df):
+    """Hash de 64 bits de cada linha (independe da ordem das colunas)."""
+    import pandas as pd
+
+    return pd.util.hash_pandas_object(df[sorted(df.columns)], index=False).to_numpy()
+
+
+def _linhas_novas(df, vistas):
+    """Máscara das linhas cujo hash não está em `vistas` (que é atualizado)."""
+    import numpy as np
+
+    novas = np.ones(len(df), dtype=bool)
+    for i, h in enumerate(_hashes_das_linhas(df).tolist()):
+        if h in vistas:
+            novas[i] = False
+        else:
+            vistas.add(h)
+    return novas
 
 # ============================================
-# CARREGAR ARQUIVO
+# AGREGADOS PARCIAIS (POR BLOCO)
 # ============================================
 
-with open(ARQ_PARTIDAS, "r", encoding="utf-8") as f:
-    dados = json.load(f)
+def agregar_blocos(blocos):
+    """Combina agregados parciais de cada bloco num resumo do histórico.
+
+    Guarda só o que os relatórios e gráficos precisam: somas por jogador,
+    contagem de cada pontuação (histograma/boxplot) e, para a correlação,
+    médias e co-momentos centrados, combinados bloco a bloco como no
+    algoritmo de Welford/Chan (somas de x·y brutas perdem precisão em
+    E[xy] − E[x]E[y]). O tamanho independe do histórico.
+    """
+    import numpy as np
+    import pandas as pd
+
+    por_jogador = None
+    contagem_pontuacao = pd.Series(dtype="int64")
+    n = 0
+    medias = np.zeros(len(COLUNAS_NUMERICAS))
+    comomentos = np.zeros((len(COLUNAS_NUMERICAS), len(COLUNAS_NUMERICAS)))
+
+    for bloco in blocos:
+        numericos = bloco[COLUNAS_NUMERICAS].astype("int64")
+        numericos["jogador"] = bloco["jogador"].astype(str)
+        parcial = numericos.groupby("jogador").agg(
+            partidas=("pontuacao", "size"),
+            pontuacao_soma=("pontuacao", "sum"),
+            pontuacao_max=("pontuacao", "max"),
+            tentativas_soma=("total_tentativas", "sum"),
+            vitorias=("vitoria_bin", "sum"),
+        )
+        if por_jogador is None:
+            por_jogador = parcial
+        else:
+            por_jogador = pd.concat([por_jogador, parcial]).groupby(level=0).agg(
+                {
+                    "partidas": "sum",
+                    "pontuacao_soma": "sum",
+                    "pontuacao_max": "max",
+                    "tentativas_soma": "sum",
+                    "vitorias": "sum",
+                }
+            )
+
+        contagem_pontuacao = contagem_pontuacao.add(
+            bloco["pontuacao"].astype("int64").value_counts(), fill_value=0
+        )
+        x = numericos[COLUNAS_NUMERICAS].to_numpy(dtype="float64")
+        if len(x):
+            n_bloco = len(x)
+            media_bloco = x.mean(axis=0)
+            centrado = x - media_bloco
+            delta = media_bloco - medias
+            total = n + n_bloco
+            comomentos += centrado.T @ centrado + np.outer(delta, delta) * (n * n_bloco / total)
+            medias += delta * (n_bloco / total)
+            n = total
+
+    return {
+        "por_jogador": por_jogador if por_jogador is not None else pd.DataFrame(),
+        "contagem_pontuacao": contagem_pontuacao.sort_index().astype("int64"),
+        "n": n,
+        "medias": medias,
+        "comomentos": comomentos,
+    }
+
+
+def stats_por_jogador_de_agregados(agregados):
+    """Mesmo formato do groupby do modo em memória (colunas MultiIndex)."""
+    import pandas as pd
+
+    pj = agregados["por_jogador"]
+    return pd.DataFrame(
+        {
+            ("pontuacao", "mean"): pj["pontuacao_soma"] / pj["partidas"],
+            ("pontuacao", "max"): pj["pontuacao_max"],
+            ("pontuacao", "sum"): pj["pontuacao_soma"],
+            ("total_tentativas", "mean"): pj["tentativas_soma"] / pj["partidas"],
+            ("vitoria_bin", "sum"): pj["vitorias"],
+        }
+    ).rename_axis("jogador")
+
+
+def correlacao_de_agregados(agregados):
+    """Matriz de correlação de Pearson a partir dos co-momentos acumulados."""
+    import numpy as np
+    import pandas as pd
+
+    cov = agregados["comomentos"]
+    desvio = np.sqrt(np.diag(cov))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.outer(desvio, desvio)
+    return pd.DataFrame(corr, index=COLUNAS_NUMERICAS, columns=COLUNAS_NUMERICAS)
+
+
+def _percentil_de_contagens(valores, acumuladas, q):
+    import numpy as np
+
+    # mesmo critério (interpolação linear) de np.percentile nos dados brutos
+    posicao = (acumuladas[-1] - 1) * q
+    baixo = int(np.floor(posicao))
+    alto = int(np.ceil(posicao))
+    v_baixo = valores[np.searchsorted(acumuladas, baixo, side="right")]
+    v_alto = valores[np.searchsorted(acumuladas, alto, side="right")]
+    return v_baixo + (v_alto - v_baixo) * (posicao - baixo)
+
+
+def boxplot_de_contagens(contagem):
+    """Estatísticas do boxplot (formato de Axes.bxp) a partir de contagens."""
+    import numpy as np
+
+    valores = contagem.index.to_numpy(dtype="float64")
+    acumuladas = np.cumsum(contagem.to_numpy())
+    q1, mediana, q3 = (_percentil_de_contagens(valores, acumuladas, q) for q in (0.25, 0.5, 0.75))
+    iqr = q3 - q1
+    dentro = valores[(valores >= q1 - 1.5 * iqr) & (valores <= q3 + 1.5 * iqr)]
+    return {
+        "med": mediana,
+        "q1": q1,
+        "q3": q3,
+        "whislo": dentro.min(),
+        "whishi": dentro.max(),
+        "fliers": valores[(valores < dentro.min()) | (valores > dentro.max())],
+    }
 
-df = pd.DataFrame(dados)
+# ============================================
+# LIMPEZA E SNAPSHOT COLUNAR
+# ============================================
 
-print("\n=== DATAFRAME INICIAL ===")
-print(df.head(), "\n")
+def limpar_partidas(df):
+    """Limpeza aplicada às partidas antes das análises."""
+    import pandas as pd
+
+    # Remover coluna 'tentativas' (contém listas → causa erro no drop_duplicates)
+    if "tentativas" in df.columns:
+        df = df.drop(columns=["tentativas"])
+
+    # Converter data para datetime
+    df["data"] = pd.to_datetime(df["data"], errors="coerce")
+
+    # Remover duplicatas
+    df = df.drop_duplicates()
+
+    # Remover linhas totalmente vazias
+    df = df.dropna(how="all")
+
+    # Converter pontuacao/total_tentativas para int
+    df["pontuacao"] = df["pontuacao"].astype(int)
+    df["total_tentativas"] = df["total_tentativas"].astype(int)
+    return df
+
+
+def _arquivo_coluna(nome):
+    return os.path.join(PASTA_SNAPSHOT, f"{nome}.bin")
+
+
+def _ler_meta_snapshot():
+    try:
+        with open(ARQ_SNAPSHOT_META, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _salvar_meta_snapshot(meta):
+    temporario = ARQ_SNAPSHOT_META + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(temporario, ARQ_SNAPSHOT_META)
+
+
+def _snapshot_vazio(caminho):
+    for nome in (*COLUNAS_SNAPSHOT, COLUNA_HASH):
+        if os.path.exists(_arquivo_coluna(nome)):
+            os.remove(_arquivo_coluna(nome))
+    return {
+        "versao": VERSAO_SNAPSHOT,
+        "origem": caminho,
+        "tamanho": -1,
+        "mtime_ns": -1,
+        "inode": -1,
+        "bytes_lidos": 0,
+        "ultima_linha": "",
+        "linhas": 0,
+        "categorias": {nome: [] for nome in CATEGORICAS},
+    }
+
+
+def _prefixo_intacto(caminho, meta):
+    """O log só cresceu desde o snapshot? (confere a última linha lida)."""
+    ultima = meta["ultima_linha"].encode("utf-8")
+    fim = meta["bytes_lidos"]
+    if os.path.getsize(caminho) < fim:
+        return False
+    with open(caminho, "rb") as f:
+        f.seek(fim - len(ultima))
+        return f.read(len(ultima)) == ultima
+
+
+def _blocos_jsonl(caminho, inicio, tamanho_bloco):
+    """Blocos de registros do log a partir do byte `inicio`.
+
+    Cada item é (registros, byte após o bloco, última linha lida).
+    """
+    registros = []
+    posicao = inicio
+    ultima = b""
+    with open(caminho, "rb") as f:
+        f.seek(inicio)
+        for linha in f:
+            if not linha.endswith(b"\n"):
+                break  # linha final incompleta: fica para a próxima leitura
+            posicao += len(linha)
+            ultima = linha
+            try:
+                registros.append(json.loads(linha))
+            except ValueError:
+                continue
+            if len(registros) >= tamanho_bloco:
+                yield registros, posicao, ultima
+                registros = []
+    yield registros, posicao, ultima
+
+
+def _blocos_array(caminho, tamanho_bloco):
+    registros = []
+    with open(caminho, "r", encoding="utf-8") as f:
+        for partida in _iterar_array_json(f):
+            registros.append(partida)
+            if len(registros) >= tamanho_bloco:
+                yield registros, 0, b""
+                registros = []
+    yield registros, 0, b""
+
+
+def _anexar_ao_snapshot(meta, registros):
+    """Limpa os registros e anexa às colunas.
+
+    O que já foi lido é controlado pela posição no log (bytes_lidos), não
+    pelo id: com vários processos gravando, ids chegam fora de ordem.
+    Linhas iguais a uma já guardada (em qualquer atualização anterior) são
+    descartadas pelo hash: o resultado não depende de quando o snapshot
+    foi atualizado.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not registros:
+        return
+    df = limpar_partidas(pd.DataFrame.from_records(registros))
+    if df.empty:
+        return
+
+    colunas = {
+        "id": df["id"],
+        "numero_secreto": df["numero_secreto"],
+        "total_tentativas": df["total_tentativas"],
+        "pontuacao": df["pontuacao"],
+        "data": df["data"].to_numpy(dtype="datetime64[ns]").view("int64"),
+    }
+    for nome in CATEGORICAS:
+        categorias = meta["categorias"][nome]
+        codigos = {c: i for i, c in enumerate(categorias)}
+        for valor in df[nome].unique():
+            if valor not in codigos:
+                codigos[valor] = len(categorias)
+                categorias.append(valor)
+        colunas[nome] = df[nome].map(codigos)
+
+    valores = {
+        nome: np.ascontiguousarray(colunas[nome], dtype=tipo)
+        for nome, tipo in COLUNAS_SNAPSHOT.items()
+    }
+    hashes = _hashes_das_linhas(pd.DataFrame(valores))
+    guardados = _abrir_coluna(COLUNA_HASH, TIPO_HASH, meta["linhas"])
+    novas = ~(np.isin(hashes, guardados) | pd.Series(hashes).duplicated().to_numpy())
+    if not novas.all():
+        valores = {nome: v[novas] for nome, v in valores.items()}
+        hashes = hashes[novas]
+    valores[COLUNA_HASH] = np.ascontiguousarray(hashes, dtype=TIPO_HASH)
+
+    for nome, coluna in valores.items():
+        with open(_arquivo_coluna(nome), "ab") as f:
+            f.write(coluna.tobytes())
+    meta["linhas"] += len(hashes)
+
+
+def atualizar_snapshot(caminho=None, tamanho_bloco=TAMANHO_BLOCO):
+    """Garante que o snapshot reflete o arquivo de partidas; retorna o meta.
+
+    - tamanho e mtime iguais aos do snapshot: nada a fazer
+    - log JSONL que só cresceu: lê a partir do último byte processado e
+      anexa as partidas das linhas novas (em qualquer ordem de id)
+    - qualquer outra mudança (arquivo reescrito, formato legado): recria
+    """
+    import numpy as np
+
+    caminho = caminho or arquivo_partidas()
+    os.makedirs(PASTA_SNAPSHOT, exist_ok=True)
+    st = os.stat(caminho)
+    meta = _ler_meta_snapshot()
+
+    if meta and meta.get("versao") != VERSAO_SNAPSHOT:
+        meta = None
+    if meta and meta["origem"] == caminho:
+        if meta["tamanho"] == st.st_size and meta["mtime_ns"] == st.st_mtime_ns:
+            return meta
+        # log reescrito (os.replace troca o inode) ou não-JSONL: recria
+        if not (
+            caminho.endswith(".jsonl")
+            and meta["inode"] == st.st_ino
+            and _prefixo_intacto(caminho, meta)
+        ):
+            meta = None
+    if not meta or meta["origem"] != caminho:
+        meta = _snapshot_vazio(caminho)
+
+    # descarta sobras de uma atualização interrompida
+    for nome, tipo in {**COLUNAS_SNAPSHOT, COLUNA_HASH: TIPO_HASH}.items():
+        with open(_arquivo_coluna(nome), "ab") as f:
+            f.truncate(meta["linhas"] * np.dtype(tipo).itemsize)
+
+    if caminho.endswith(".jsonl"):
+        blocos = _blocos_jsonl(caminho, meta["bytes_lidos"], tamanho_bloco)
+    else:
+        blocos = _blocos_array(caminho, tamanho_bloco)
+    for registros, posicao, ultima in blocos:
+        _anexar_ao_snapshot(meta, registros)
+        if ultima:
+            meta["bytes_lidos"] = posicao
+            meta["ultima_linha"] = ultima.decode("utf-8")
+
+    meta["tamanho"] = st.st_size
+    meta["mtime_ns"] = st.st_mtime_ns
+    meta["inode"] = st.st_ino
+    _salvar_meta_snapshot(meta)
+    return meta
+
+
+def _abrir_coluna(nome, tipo, linhas):
+    import numpy as np
+
+    if linhas == 0:
+        return np.empty(0, dtype=tipo)
+    return np.memmap(_arquivo_coluna(nome), dtype=tipo, mode="r", shape=(linhas,))
+
+
+def carregar_snapshot(caminho=None):
+    """DataFrame limpo das partidas, lido do snapshot (memory-mapped)."""
+    import pandas as pd
+
+    meta = atualizar_snapshot(caminho)
+    linhas = meta["linhas"]
+    colunas = {nome: _abrir_coluna(nome, tipo, linhas) for nome, tipo in COLUNAS_SNAPSHOT.items()}
+    for nome in CATEGORICAS:
+        colunas[nome] = pd.Categorical.from_codes(
+            colunas[nome], categories=meta["categorias"][nome]
+        )
+    colunas["data"] = colunas["data"].view("datetime64[ns]")
+    return pd.DataFrame(colunas)[
+        ["id", "jogador", "numero_secreto", "total_tentativas", "pontuacao", "resultado", "data"]
+    ]
 
 # ============================================
-# LIMPEZA DE DADOS
+# RENDERIZAÇÃO DOS GRÁFICOS
 # ============================================
 
-# Remover coluna 'tentativas' (contém listas → causa erro no drop_duplicates)
-if "tentativas" in df.columns:
-    df = df.drop(columns=["tentativas"])
+# Cada gráfico recebe só um agregado pequeno (listas/dicts simples), que
+# serve para o hash de mudança e viaja barato até os processos de desenho.
+ARQ_HASHES_GRAFICOS = "graficos.json"
+VERSAO_GRAFICOS = 1  # incrementar ao mudar o desenho, para forçar redesenho
 
-# Converter data para datetime
-df["data"] = pd.to_datetime(df["data"], errors="coerce")
 
-# Remover duplicatas
-df = df.drop_duplicates()
+def entradas_dos_graficos(contagem_pontuacao, vitorias_por_jogador, correlacao):
+    """Agregados de entrada de cada gráfico, em tipos simples."""
+    import numpy as np
 
-# Remover linhas totalmente vazias
-df = df.dropna(how="all")
+    return {
+        "hist_pontuacoes": {
+            "valores": [int(v) for v in contagem_pontuacao.index],
+            "frequencias": [int(c) for c in contagem_pontuacao.to_numpy()],
+        },
+        "barras_vitorias": {
+            "jogadores": [str(j) for j in vitorias_por_jogador.index],
+            "vitorias": [int(v) for v in vitorias_por_jogador.to_numpy()],
+        },
+        "boxplot_pontuacoes": {
+            chave: (valor.tolist() if isinstance(valor, np.ndarray) else float(valor))
+            for chave, valor in boxplot_de_contagens(contagem_pontuacao).items()
+        },
+        "heatmap_correlacao": {
+            "colunas": list(correlacao.columns),
+            # arredondado: streaming e DataFrame diferem só no último bit e
+            # não devem forçar um redesenho ao trocar de modo
+            "valores": np.round(correlacao.to_numpy(), 6).tolist(),
+        },
+    }
 
-# Converter pontuacao/total_tentativas para int
-df["pontuacao"] = df["pontuacao"].astype(int)
-df["total_tentativas"] = df["total_tentativas"].astype(int)
 
-print("=== DATAFRAME LIMPO ===")
-print(df.head(), "\n")
+def _hash_entrada(nome, entrada):
+    conteudo = json.dumps([VERSAO_GRAFICOS, nome, entrada], sort_keys=True)
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+
+
+def _desenhar_histograma(entrada, ax):
+    ax.hist(entrada["valores"], bins=7, weights=entrada["frequencias"])
+    ax.set_title("Histograma de Pontuações")
+    ax.set_xlabel("Pontuação")
+    ax.set_ylabel("Frequência")
+
+
+def _desenhar_barras(entrada, ax):
+    import pandas as pd
+
+    pd.Series(entrada["vitorias"], index=pd.Index(entrada["jogadores"], name="jogador")).plot(
+        kind="bar", ax=ax
+    )
+    ax.set_title("Vitórias por Jogador")
+    ax.set_ylabel("Vitórias")
+
+
+def _desenhar_boxplot(entrada, ax):
+    ax.bxp([entrada], orientation="horizontal")
+    ax.set_title("Boxplot das Pontuações")
+
+
+def _desenhar_heatmap(entrada, ax):
+    import pandas as pd
+    import seaborn as sns
+
+    corr = pd.DataFrame(entrada["valores"], index=entrada["colunas"], columns=entrada["colunas"])
+    sns.heatmap(corr, annot=True, cmap="Blues", ax=ax)
+    ax.set_title("Heatmap de Correlação")
+
+
+DESENHOS = {
+    "hist_pontuacoes": _desenhar_histograma,
+    "barras_vitorias": _desenhar_barras,
+    "boxplot_pontuacoes": _desenhar_boxplot,
+    "heatmap_correlacao": _desenhar_heatmap,
+}
+
+
+def _renderizar(nome, entrada, destino):
+    """Desenha um gráfico num Figure próprio (API OO + Agg, sem pyplot)."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(8, 5))
+    FigureCanvasAgg(fig)
+    DESENHOS[nome](entrada, fig.add_subplot())
+    fig.savefig(destino)
+    return nome
+
+
+def _iniciar_worker_grafico():
+    """Workers só geram arquivos: backend Agg (o seaborn importa o pyplot).
+
+    No próprio processo o backend não é trocado: quem importa o módulo
+    continua com o seu; o desenho usa FigureCanvasAgg diretamente.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
 
-# ============================================
-# ANÁLISES ESTATÍSTICAS
-# ============================================
 
-print("=== ESTATÍSTICAS DESCRITIVAS ===")
-print(df.describe(), "\n")
+def _ultima_pasta_analise():
+    if not os.path.isdir(PASTA_ANALISE):
+        return None
+    pastas = [p for p in os.listdir(PASTA_ANALISE) if p.startswith("analise_")]
+    if not pastas:
+        return None
+    ultima = max(pastas, key=lambda p: int(p.split("_")[1]))
+    return os.path.join(PASTA_ANALISE, ultima)
+
+
+def _hashes_da_pasta(pasta):
+    try:
+        with open(os.path.join(pasta, ARQ_HASHES_GRAFICOS), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def renderizar_graficos(entradas, workers=None):
+    """Desenha só os gráficos cujo agregado mudou desde a última análise.
+
+    - nada mudou: reaproveita a última pasta analise_X, sem desenhar
+    - algo mudou: cria a próxima pasta, copia os gráficos inalterados da
+      anterior e desenha os demais em paralelo (um processo por gráfico)
+
+    Retorna a pasta com os gráficos.
+    """
+    hashes = {nome: _hash_entrada(nome, entrada) for nome, entrada in entradas.items()}
+    anterior = _ultima_pasta_analise()
+    hashes_anteriores = _hashes_da_pasta(anterior) if anterior else {}
+
+    def inalterado(nome):
+        return hashes_anteriores.get(nome) == hashes[nome] and os.path.exists(
+            os.path.join(anterior, f"{nome}.png")
+        )
+
+    pendentes = [nome for nome in entradas if not inalterado(nome)]
+    if not pendentes:
+        print(f"\n📁 Dados sem mudanças; gráficos mantidos em: {anterior}\n")
+        return anterior
+
+    pasta = gerar_pasta_analise()
+    print(f"\n📁 Salvando gráficos em: {pasta}\n")
+    for nome in entradas:
+        if nome not in pendentes:
+            shutil.copy2(os.path.join(anterior, f"{nome}.png"), pasta)
+
+    tarefas = [(nome, entradas[nome], os.path.join(pasta, f"{nome}.png")) for nome in pendentes]
+    workers = min(len(tarefas), workers or os.cpu_count() or 1)
+    if workers <= 1:
+        for tarefa in tarefas:
+            _renderizar(*tarefa)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
 
-# Criar coluna binária para vitórias
-df["vitoria_bin"] = (df["resultado"] == "Vitória").astype(int)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_iniciar_worker_grafico) as pool:
+            list(pool.map(_renderizar, *zip(*tarefas)))
 
-# Agrupamento por jogador
-stats_por_jogador = df.groupby("jogador").agg({
-    "pontuacao": ["mean", "max", "sum"],
-    "total_tentativas": "mean",
-    "vitoria_bin": "sum"
-})
+    with open(os.path.join(pasta, ARQ_HASHES_GRAFICOS), "w", encoding="utf-8") as f:
+        json.dump(hashes, f, indent=2)
+    print(f"🖼️  {len(pendentes)} gráfico(s) desenhado(s), {len(entradas) - len(pendentes)} reaproveitado(s)")
+    return pasta
 
-print("=== ESTATÍSTICAS POR JOGADOR ===")
-print(stats_por_jogador, "\n")
+# ============================================
+# MODO STREAMING
+# ============================================
+
+def analise_em_streaming(tamanho_bloco=TAMANHO_BLOCO):
+    caminho = arquivo_partidas()
+    print(f"=== LEITURA EM BLOCOS DE {tamanho_bloco} PARTIDAS: {caminho} ===\n")
+    agregados = agregar_blocos(ler_partidas_em_blocos(caminho, tamanho_bloco))
+    if agregados["n"] == 0:
+        print("Nenhuma partida registrada.")
+        return None, None
+
+    contagem = agregados["contagem_pontuacao"]
+    media = agregados["medias"]
+    print("=== RESUMO GERAL ===")
+    print(f"Partidas: {agregados['n']}")
+    for nome, m in zip(COLUNAS_NUMERICAS, media):
+        print(f"Média de {nome}: {m:.2f}")
+    print(f"Pontuação mínima/máxima: {contagem.index.min()} / {contagem.index.max()}\n")
+
+    stats_por_jogador = stats_por_jogador_de_agregados(agregados)
+    print("=== ESTATÍSTICAS POR JOGADOR ===")
+    print(stats_por_jogador, "\n")
+
+    entradas = entradas_dos_graficos(
+        contagem,
+        stats_por_jogador[("vitoria_bin", "sum")],
+        correlacao_de_agregados(agregados),
+    )
+    pasta = renderizar_graficos(entradas)
+
+    print("\n✅ Gráficos disponíveis em:")
+    print(pasta)
+    return stats_por_jogador, pasta
 
 # ============================================
-# GRÁFICOS — SALVANDO NA PASTA ATUAL
+# MODO EM MEMÓRIA (DataFrame completo)
 # ============================================
 
-# 1) Histograma de pontuações
-plt.figure(figsize=(8, 5))
-plt.hist(df["pontuacao"], bins=7)
-plt.title("Histograma de Pontuações")
-plt.xlabel("Pontuação")
-plt.ylabel("Frequência")
-plt.savefig(os.path.join(PASTA_ATUAL, "hist_pontuacoes.png"))
-plt.close()
+def carregar_partidas_limpas(usar_cache=True):
+    """DataFrame limpo das partidas (do snapshot, ou relendo o arquivo)."""
+    import pandas as pd
+
+    if usar_cache:
+        inicio = time.perf_counter()
+        df = carregar_snapshot()
+        print(f"\n=== SNAPSHOT: {len(df)} partidas em {(time.perf_counter() - inicio) * 1000:.0f} ms ===\n")
+        return df
+
+    caminho = arquivo_partidas()
+    if caminho.endswith(".jsonl"):
+        with open(caminho, "r", encoding="utf-8") as f:
+            dados = list(_iterar_json_lines(f))
+    else:
+        with open(caminho, "r", encoding="utf-8") as f:
+            dados = json.load(f)
+
+    df = pd.DataFrame(dados)
+
+    print("\n=== DATAFRAME INICIAL ===")
+    print(df.head(), "\n")
+
+    return limpar_partidas(df)
+
+
+def estatisticas_por_jogador(df):
+    """Cria a coluna vitoria_bin e agrupa as estatísticas por jogador."""
+    # Criar coluna binária para vitórias
+    df["vitoria_bin"] = (df["resultado"] == "Vitória").astype(int)
+
+    # Agrupamento por jogador
+    return df.groupby("jogador").agg({
+        "pontuacao": ["mean", "max", "sum"],
+        "total_tentativas": "mean",
+        "vitoria_bin": "sum"
+    })
+
+
+def entradas_do_dataframe(df):
+    """Agregados dos gráficos a partir do DataFrame (com vitoria_bin)."""
+    return entradas_dos_graficos(
+        df["pontuacao"].value_counts().sort_index(),
+        df.groupby("jogador", observed=True)["vitoria_bin"].sum(),
+        df[COLUNAS_NUMERICAS].corr(),
+    )
+
+
+def analise_em_memoria(usar_cache=True):
+    df = carregar_partidas_limpas(usar_cache)
+
+    print("=== DATAFRAME LIMPO ===")
+    print(df.head(), "\n")
+
+    print("=== ESTATÍSTICAS DESCRITIVAS ===")
+    print(df.describe(), "\n")
+
+    stats_por_jogador = estatisticas_por_jogador(df)
+    print("=== ESTATÍSTICAS POR JOGADOR ===")
+    print(stats_por_jogador, "\n")
+
+    pasta = renderizar_graficos(entradas_do_dataframe(df))
+
+    print("\n✅ Gráficos disponíveis em:")
+    print(pasta)
+    return stats_por_jogador, pasta
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Análise de dados das partidas")
+    parser.add_argument(
+        "--streaming", action="store_true", help="lê o histórico em blocos (memória limitada)"
+    )
+    parser.add_argument("--bloco", type=int, default=TAMANHO_BLOCO, help="partidas por bloco")
+    parser.add_argument(
+        "--sem-cache", action="store_true", help="ignora o snapshot colunar e relê o arquivo"
+    )
+    parser.add_argument(
+        "--metricas", action="store_true", help="mede as etapas (relatorios/metricas_*.json)"
+    )
+    parser.add_argument("--perfil", choices=("cprofile", "tracemalloc"), help="perfil da análise")
+    args = parser.parse_args(argv)
+
+    import instrumentacao
 
-# 2) Gráfico de barras (Vitórias por jogador)
-plt.figure(figsize=(8, 5))
-df.groupby("jogador")["vitoria_bin"].sum().plot(kind="bar")
-plt.title("Vitórias por Jogador")
-plt.ylabel("Vitórias")
-plt.savefig(os.path.join(PASTA_ATUAL, "barras_vitorias.png"))
-plt.close()
+    instrumentacao.ativar_pelo_ambiente(args.metricas, args.perfil, os.path.join(BASE, "relatorios"))
 
-# 3) Boxplot de pontuações
-plt.figure(figsize=(8, 5))
-sns.boxplot(x=df["pontuacao"])
-plt.title("Boxplot das Pontuações")
-plt.savefig(os.path.join(PASTA_ATUAL, "boxplot_pontuacoes.png"))
-plt.close()
+    with instrumentacao.perfil("analise"):
+        if args.streaming:
+            analise_em_streaming(args.bloco)
+        else:
+            analise_em_memoria(usar_cache=not args.sem_cache)
 
-# 4) Heatmap de correlação
-plt.figure(figsize=(8, 5))
-sns.heatmap(df[["pontuacao", "total_tentativas", "vitoria_bin"]].corr(), annot=True, cmap="Blues")
-plt.title("Heatmap de Correlação")
-plt.savefig(os.path.join(PASTA_ATUAL, "heatmap_correlacao.png"))
-plt.close()
 
-print("\n✅ Gráficos gerados e salvos em:")
-print(PASTA_ATUAL)
+if __name__ == "__main__":
+    main()
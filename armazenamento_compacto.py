@@ -0,0 +1,440 @@
+"""
+Armazenamento compacto das partidas em memória (colunas `array`)
+----------------------------------------------------------------
+
+Em vez de um dict por partida (8 chaves, strings "Vitória"/"Derrota",
+nome do jogador e data repetidos, mais uma lista de tentativas),
+`TabelaPartidas` guarda cada campo numa coluna `array.array`:
+
+  - jogador: código inteiro de uma tabela de usuários internados
+  - resultado: 1 byte (1 = vitória)
+  - data: ordinal do dia (date.toordinal)
+  - config: código de uma tabela de configurações internadas (código 0 é
+    CONFIG_PADRAO, também usado para partidas gravadas sem a chave)
+  - tentativas: todos os palpites num único buffer de inteiros, com o
+    offset de início de cada partida
+
+A leitura continua "dict-like": `tabela[i]` devolve uma `PartidaView`
+(Mapping com __slots__) que lê as colunas sob demanda, então
+`p["pontuacao"]`, `p.get("data")` e `dict(p)` funcionam como antes.
+Chaves fora do formato padrão de partida ficam num dict à parte, só para
+as partidas que as têm.
+
+Campos inteiros gravados como texto ("7") ou float inteiro (7.0) são
+convertidos; um valor que não cabe no tipo da coluna levanta ValueError
+antes de qualquer coluna ser alterada.
+
+Medição contra a lista de dicts: python benchmarks/bench_memoria.py
+"""
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Mapping
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+CHAVES_PARTIDA = (
+    "id",
+    "jogador",
+    "numero_secreto",
+    "tentativas",
+    "total_tentativas",
+    "pontuacao",
+    "resultado",
+    "data",
+    "config",
+)
+_CHAVES_CONHECIDAS = frozenset(CHAVES_PARTIDA)
+VITORIA = "Vitória"
+DERROTA = "Derrota"
+
+# Configuração em que a partida foi jogada: "MIN..MAX/MAX_TENTATIVAS".
+# Partidas anteriores à marcação valem como jogadas na configuração padrão
+# (a de toda sessão nova do jogo).
+CONFIG_PADRAO = "1..100/10"
+_CONFIG = re.compile(r"(-?\d+)\.\.(-?\d+)/(\d+)")
+
+
+_LIMITE_INTEIRO = 1 << 63  # colunas inteiras vão no máximo a array("q")
+
+
+def _inteiro(valor, campo: str) -> int:
+    """Inteiro de um campo de partida; ValueError se não há conversão sem perda."""
+    if type(valor) is not int:
+        if isinstance(valor, float) and valor.is_integer():
+            valor = int(valor)
+        elif isinstance(valor, str):
+            try:
+                valor = int(valor)
+            except ValueError:
+                raise ValueError(f"Partida com {campo} inválido: {valor!r}") from None
+        else:
+            raise ValueError(f"Partida com {campo} inválido: {valor!r}")
+    if not -_LIMITE_INTEIRO <= valor < _LIMITE_INTEIRO:
+        raise ValueError(f"Partida com {campo} fora do intervalo: {valor}")
+    return valor
+
+
+def normalizar_partida(partida: Mapping) -> Dict:
+    """Cópia da partida com os campos nos tipos da tabela (ver append).
+
+    Levanta ValueError se algum campo não pode ser convertido.
+    """
+    normalizada = dict(partida)
+    for chave in ("id", "numero_secreto", "total_tentativas", "pontuacao"):
+        if chave in normalizada:
+            normalizada[chave] = _inteiro(normalizada[chave], chave)
+    if "tentativas" in normalizada:
+        normalizada["tentativas"] = _tentativas(normalizada["tentativas"])
+    _conferir_textos(normalizada)
+    return normalizada
+
+
+def _tentativas(valor) -> List[int]:
+    if not valor:
+        return []
+    if not isinstance(valor, list):
+        raise ValueError(f"Partida com tentativas inválidas: {valor!r}")
+    return [_inteiro(t, "tentativa") for t in valor]
+
+
+def _conferir_textos(partida: Mapping) -> None:
+    jogador = partida.get("jogador")
+    if jogador is not None and not isinstance(jogador, str):
+        raise ValueError(f"Partida com jogador inválido: {jogador!r}")
+    config = partida.get("config")
+    if config is not None and not isinstance(config, str):
+        raise ValueError(f"Partida com config inválida: {config!r}")
+
+
+def formatar_configuracao(minimo: int, maximo: int, max_tentativas: int) -> str:
+    return f"{minimo}..{maximo}/{max_tentativas}"
+
+
+def ler_configuracao(texto: str) -> Tuple[int, int, int]:
+    """(mínimo, máximo, máx. de tentativas) de uma configuração "MIN..MAX/T"."""
+    casamento = _CONFIG.fullmatch(texto or "")
+    if casamento is None:
+        raise ValueError(f"Configuração inválida: {texto!r} (formato MIN..MAX/TENTATIVAS)")
+    minimo, maximo, tentativas = map(int, casamento.groups())
+    if minimo > maximo or tentativas < 1:
+        raise ValueError(f"Configuração inválida: {texto!r}")
+    return minimo, maximo, tentativas
+
+
+def ordinal_iso(texto) -> Optional[int]:
+    """Ordinal do dia (date.toordinal) de uma data ISO canônica; senão None."""
+    if isinstance(texto, str):
+        try:
+            dia = date.fromisoformat(texto)
+        except ValueError:
+            return None
+        if dia.isoformat() == texto:
+            return dia.toordinal()
+    return None
+
+
+class PartidaView(Mapping):
+    """Visão de leitura (e escrita campo a campo) de uma partida da tabela."""
+
+    __slots__ = ("_tabela", "posicao")
+
+    def __init__(self, tabela: "TabelaPartidas", posicao: int) -> None:
+        self._tabela = tabela
+        self.posicao = posicao
+
+    def __getitem__(self, chave: str):
+        return self._tabela.valor(self.posicao, chave)
+
+    def __setitem__(self, chave: str, valor) -> None:
+        self._tabela.definir(self.posicao, chave, valor)
+
+    def __iter__(self) -> Iterator[str]:
+        extras = self._tabela.extras.get(self.posicao)
+        if extras is None:
+            return iter(CHAVES_PARTIDA)
+        return iter(CHAVES_PARTIDA + tuple(extras))
+
+    def __len__(self) -> int:
+        return len(CHAVES_PARTIDA) + len(self._tabela.extras.get(self.posicao, ()))
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class TabelaPartidas:
+    """Partidas em colunas paralelas, com API de lista de partidas.
+
+    - append/extend recebem dicts (ou qualquer Mapping) de partida
+    - len, iteração e tabela[i] / tabela[a:b] devolvem PartidaView
+    - as colunas (id, jogador, pontuacao, ...) podem ser lidas direto
+      para processamento em massa (ex.: np.frombuffer)
+    """
+
+    # colunas inteiras promovidas para "q" quando um valor não cabe no tipo
+    _COLUNAS_VARIAVEIS = ("numero_secreto", "total_tentativas", "pontuacao", "palpites", "config")
+    # todas as colunas `array`, na ordem usada por nbytes e pelos snapshots
+    COLUNAS = (
+        "id",
+        "jogador",
+        "numero_secreto",
+        "total_tentativas",
+        "pontuacao",
+        "resultado",
+        "data",
+        "config",
+        "palpites",
+        "inicio_palpites",
+    )
+
+    def __init__(self, partidas: Iterable[Mapping] = ()) -> None:
+        self.limpar()
+        self.extend(partidas)
+
+    def limpar(self) -> None:
+        self.id = array("q")
+        self.jogador = array("I")
+        self.numero_secreto = array("i")
+        self.total_tentativas = array("i")
+        self.pontuacao = array("i")
+        self.resultado = array("b")
+        self.data = array("i")
+        self.config = array("H")
+        self.palpites = array("i")
+        self.inicio_palpites = array("Q", [0])
+        self.usuarios: List[str] = []
+        self._codigo_usuario: Dict[str, int] = {}
+        # datas fora do formato ISO (ou ausentes) ficam numa tabela à parte,
+        # com código negativo na coluna `data`
+        self._datas_texto: List[str] = []
+        self._codigo_data_texto: Dict[str, int] = {}
+        self._texto_da_data: Dict[int, str] = {}
+        self.configs: List[str] = [CONFIG_PADRAO]
+        self._codigo_config: Dict[str, int] = {CONFIG_PADRAO: 0}
+        # posição -> chaves fora de CHAVES_PARTIDA (só partidas que as têm)
+        self.extras: Dict[int, Dict] = {}
+
+    # ---------- codificação ----------
+
+    def codigo_usuario(self, usuario: str) -> int:
+        codigo = self._codigo_usuario.get(usuario)
+        if codigo is None:
+            codigo = self._codigo_usuario[usuario] = len(self.usuarios)
+            self.usuarios.append(usuario)
+        return codigo
+
+    def codigo_config(self, config: Optional[str]) -> int:
+        config = config or CONFIG_PADRAO
+        codigo = self._codigo_config.get(config)
+        if codigo is None:
+            if not isinstance(config, str):
+                # ler_configuracao (rankings, repontuação) só aceita texto
+                raise TypeError(f"Partida com config inválida: {config!r}")
+            codigo = self._codigo_config[config] = len(self.configs)
+            self.configs.append(config)
+        return codigo
+
+    def _codificar_data(self, texto) -> int:
+        ordinal = ordinal_iso(texto)
+        if ordinal is not None:
+            return ordinal
+        texto = "" if texto is None else str(texto)
+        codigo = self._codigo_data_texto.get(texto)
+        if codigo is None:
+            self._datas_texto.append(texto)
+            codigo = self._codigo_data_texto[texto] = -len(self._datas_texto)
+        return codigo
+
+    def _decodificar_data(self, codigo: int) -> str:
+        texto = self._texto_da_data.get(codigo)
+        if texto is None:
+            if codigo < 0:
+                texto = self._datas_texto[-codigo - 1]
+            else:
+                texto = date.fromordinal(codigo).isoformat()
+            self._texto_da_data[codigo] = texto
+        return texto
+
+    def _anexar_inteiro(self, nome: str, valor: int) -> None:
+        coluna = getattr(self, nome)
+        try:
+            coluna.append(valor)
+        except OverflowError:
+            coluna = array("q", coluna)
+            coluna.append(valor)
+            setattr(self, nome, coluna)
+
+    # ---------- escrita ----------
+
+    def append(self, partida: Mapping) -> PartidaView:
+        """Anexa uma partida; ValueError (sem alterar a tabela) se um campo
+        não pode ser convertido para o tipo da sua coluna."""
+        posicao = len(self.id)
+        textos = (len(self.usuarios), len(self._datas_texto), len(self.configs))
+        try:
+            self._anexar(partida)
+        except (TypeError, OverflowError):
+            # campo fora do tipo ("7", 7.0, lista...): desfaz a linha parcial
+            # e tenta de novo com os campos convertidos
+            self._desfazer(posicao, textos)
+            self._anexar(normalizar_partida(partida))
+        if not _CHAVES_CONHECIDAS.issuperset(partida):
+            self.extras[posicao] = {c: v for c, v in partida.items() if c not in _CHAVES_CONHECIDAS}
+        return PartidaView(self, posicao)
+
+    def _anexar(self, partida: Mapping) -> None:
+        tentativas = partida.get("tentativas") or []
+        self.id.append(partida.get("id", 0))
+        self.jogador.append(self.codigo_usuario(partida.get("jogador")))
+        self._anexar_inteiro("numero_secreto", partida.get("numero_secreto", 0))
+        self._anexar_inteiro("total_tentativas", partida.get("total_tentativas", 0))
+        self._anexar_inteiro("pontuacao", partida.get("pontuacao", 0))
+        self.resultado.append(partida.get("resultado") == VITORIA)
+        self.data.append(self._codificar_data(partida.get("data")))
+        self._anexar_inteiro("config", self.codigo_config(partida.get("config")))
+        try:
+            self.palpites.extend(tentativas)
+        except OverflowError:
+            del self.palpites[self.inicio_palpites[-1] :]  # extend pode ter anexado parte
+            self.palpites = array("q", self.palpites)
+            self.palpites.extend(tentativas)
+        self.inicio_palpites.append(len(self.palpites))
+
+    def _desfazer(self, posicao: int, textos: Tuple[int, int, int]) -> None:
+        """Volta todas as colunas ao tamanho `posicao` (linha anexada pela metade)
+        e as tabelas de textos aos tamanhos `textos` (usuários, datas, configs)."""
+        del self.palpites[self.inicio_palpites[posicao] :]
+        del self.inicio_palpites[posicao + 1 :]
+        for nome in self.COLUNAS[:-2]:  # todas menos palpites e inicio_palpites
+            del getattr(self, nome)[posicao:]
+        usuarios, datas, configs = textos
+        for usuario in self.usuarios[usuarios:]:
+            del self._codigo_usuario[usuario]
+        del self.usuarios[usuarios:]
+        for i, texto in enumerate(self._datas_texto[datas:], datas):
+            del self._codigo_data_texto[texto]
+            self._texto_da_data.pop(-(i + 1), None)
+        del self._datas_texto[datas:]
+        for config in self.configs[configs:]:
+            del self._codigo_config[config]
+        del self.configs[configs:]
+
+    def extend(self, partidas: Iterable[Mapping]) -> None:
+        for p in partidas:
+            self.append(p)
+
+    def definir(self, posicao: int, chave: str, valor) -> None:
+        """Altera um campo de uma partida já guardada."""
+        if chave == "jogador":
+            self.jogador[posicao] = self.codigo_usuario(valor)
+        elif chave == "resultado":
+            self.resultado[posicao] = valor == VITORIA
+        elif chave == "data":
+            self.data[posicao] = self._codificar_data(valor)
+        elif chave in ("id", "numero_secreto", "total_tentativas", "pontuacao", "config"):
+            if chave == "config":
+                valor = self.codigo_config(valor)
+            coluna = getattr(self, chave)
+            try:
+                coluna[posicao] = valor
+            except OverflowError:
+                coluna = array("q", coluna)
+                coluna[posicao] = valor
+                setattr(self, chave, coluna)
+        else:
+            raise KeyError(f"Campo não pode ser alterado na tabela compacta: {chave}")
+
+    def substituir_coluna(self, nome: str, valores: Iterable[int]) -> None:
+        """Troca uma coluna inteira (mesmo tamanho) de uma vez."""
+        atual = getattr(self, nome)
+        try:
+            nova = array(atual.typecode, valores)
+        except OverflowError:
+            nova = array("q", valores)
+        if len(nova) != len(atual):
+            raise ValueError(f"Coluna {nome} com {len(nova)} valores; esperado {len(atual)}")
+        setattr(self, nome, nova)
+
+    # ---------- leitura ----------
+
+    def valor(self, posicao: int, chave: str):
+        if chave == "id":
+            return self.id[posicao]
+        if chave == "jogador":
+            return self.usuarios[self.jogador[posicao]]
+        if chave == "pontuacao":
+            return self.pontuacao[posicao]
+        if chave == "total_tentativas":
+            return self.total_tentativas[posicao]
+        if chave == "resultado":
+            return VITORIA if self.resultado[posicao] else DERROTA
+        if chave == "data":
+            return self._decodificar_data(self.data[posicao])
+        if chave == "numero_secreto":
+            return self.numero_secreto[posicao]
+        if chave == "config":
+            return self.configs[self.config[posicao]]
+        if chave == "tentativas":
+            inicio = self.inicio_palpites[posicao]
+            return self.palpites[inicio : self.inicio_palpites[posicao + 1]].tolist()
+        extras = self.extras.get(posicao)
+        if extras is not None and chave in extras:
+            return extras[chave]
+        raise KeyError(chave)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __getitem__(self, indice: Union[int, slice]):
+        if isinstance(indice, slice):
+            return [PartidaView(self, i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("posição fora da tabela de partidas")
+        return PartidaView(self, indice)
+
+    def __iter__(self) -> Iterator[PartidaView]:
+        for posicao in range(len(self)):
+            yield PartidaView(self, posicao)
+
+    def datas(self, inicio: int = 0) -> set:
+        """Conjunto de datas com partidas a partir da posição `inicio`
+        (sem decodificar linha a linha)."""
+        codigos = set(self.data[inicio:] if inicio else self.data)
+        return {self._decodificar_data(codigo) for codigo in codigos}
+
+    def nbytes(self) -> int:
+        """Bytes ocupados pelos buffers das colunas (sem as tabelas de textos)."""
+        return sum(c.itemsize * len(c) for c in self.colunas().values())
+
+    # ---------- snapshot ----------
+
+    def colunas(self) -> Dict[str, array]:
+        """Colunas por nome (as próprias arrays, sem cópia)."""
+        return {nome: getattr(self, nome) for nome in self.COLUNAS}
+
+    def textos(self) -> Dict[str, List[str]]:
+        """Tabelas de textos internados (usuários, datas fora do ISO e configurações)."""
+        return {
+            "usuarios": list(self.usuarios),
+            "datas_texto": list(self._datas_texto),
+            "configs": list(self.configs),
+            "extras": [[posicao, extras] for posicao, extras in self.extras.items()],
+        }
+
+    @classmethod
+    def restaurar(cls, colunas: Dict[str, array], textos: Dict[str, List[str]]) -> "TabelaPartidas":
+        """Monta a tabela a partir de colunas() e textos() (p.ex. de um snapshot)."""
+        tabela = cls()
+        for nome in cls.COLUNAS:
+            setattr(tabela, nome, colunas[nome])
+        tabela.usuarios = list(textos["usuarios"])
+        tabela._codigo_usuario = {u: c for c, u in enumerate(tabela.usuarios)}
+        tabela._datas_texto = list(textos["datas_texto"])
+        tabela._codigo_data_texto = {t: -(i + 1) for i, t in enumerate(tabela._datas_texto)}
+        tabela.configs = list(textos["configs"])
+        tabela._codigo_config = {c: i for i, c in enumerate(tabela.configs)}
+        tabela.extras = {posicao: extras for posicao, extras in textos.get("extras", [])}
+        return tabela
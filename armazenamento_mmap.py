@@ -0,0 +1,533 @@
+"""
+Backend mapeado em memória (mmap) do Sistema de Jogo de Adivinhação
+-------------------------------------------------------------------
+
+Ativado com JOGO_BACKEND=mmap. Abrir o histórico não decodifica nenhuma
+partida: o cabeçalho traz o total e o próximo id, e os contadores por
+jogador (estatísticas e rankings) ficam gravados à parte. Em dados/mmap/:
+
+  partidas.bin       -> cabeçalho (64 bytes) + registros de largura fixa
+                        (64 bytes): a partida i começa em 64 + 64*i
+  palpites.bin       -> todos os palpites (int64) em sequência; o registro
+                        guarda o offset e a quantidade dos seus
+  agregados.bin      -> cabeçalho + contadores por código de jogador, com a
+                        posição da última partida dele
+  usuarios.jsonl     -> nome de cada código de jogador (uma linha por código)
+  datas_texto.jsonl  -> datas fora do padrão ISO (código negativo no registro)
+  configs.jsonl      -> configurações além da padrão (código 0 no registro
+                        é CONFIG_PADRAO; a linha i tem o código i + 1)
+
+Cada registro aponta para a partida anterior do mesmo jogador, então o
+histórico de um jogador decodifica só as partidas dele; os arquivos são
+lidos por mmap e só os campos tocados passam por struct.unpack_from.
+
+Ordem de gravação: palpites e registros depois do fim confirmado, depois
+o cabeçalho (confirmação) e por fim os agregados. Ao abrir, bytes além do
+total do cabeçalho são descartados e, se os agregados não cobrem esse
+total, são recalculados a partir dos registros.
+
+Importação dos arquivos .txt/.jsonl existentes:
+  python armazenamento_mmap.py importar
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from datetime import date
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from armazenamento_compacto import CONFIG_PADRAO, DERROTA, VITORIA, ordinal_iso
+from persistencia import anexar_duravel
+
+VERSAO = 1
+TAMANHO_CABECALHO = 64
+MAGICA_PARTIDAS = b"JOGOPART"
+MAGICA_AGREGADOS = b"JOGOAGRG"
+
+# mágica, versão, tamanho do registro, total de partidas, próximo id
+CABECALHO_PARTIDAS = struct.Struct("<8sIIQQ")
+# mágica, versão, tamanho do registro, partidas já somadas aos agregados
+CABECALHO_AGREGADOS = struct.Struct("<8sIIQ")
+# id, numero_secreto, pontuacao, inicio dos palpites, partida anterior do
+# jogador (-1: nenhuma), código do jogador, total_tentativas, data,
+# quantidade de palpites, vitória, código da configuração (nos bytes que
+# eram de preenchimento: registros antigos têm 0, a configuração padrão)
+REGISTRO = struct.Struct("<qqqqqIiiIBH5x")
+# total, vitorias, soma_pontuacao, soma_tentativas, melhor_pontuacao,
+# menor_tentativas (-1: nenhuma vitória), última partida (-1: nenhuma)
+AGREGADO = struct.Struct("<qqqqqqq8x")
+
+_ID = struct.Struct("<q")
+_DESLOCAMENTO_ANTERIOR = 32
+_DATA = struct.Struct("<i")
+_DESLOCAMENTO_DATA = 48
+_TOTAL, _VITORIAS, _SOMA_PONTUACAO, _SOMA_TENTATIVAS, _MELHOR, _MENOR, _ULTIMA = range(7)
+
+
+def _agregado_vazio() -> List[int]:
+    return [0, 0, 0, 0, 0, -1, -1]
+
+
+def _somar(agg: List[int], pontuacao: int, total_tentativas: int, vitoria: bool, posicao: int) -> None:
+    """Mesma regra de jogo_adivinhacao._somar, sobre a lista do agregados.bin."""
+    agg[_TOTAL] += 1
+    agg[_SOMA_PONTUACAO] += pontuacao
+    agg[_SOMA_TENTATIVAS] += total_tentativas
+    if pontuacao > agg[_MELHOR]:
+        agg[_MELHOR] = pontuacao
+    if vitoria:
+        agg[_VITORIAS] += 1
+        if agg[_MENOR] < 0 or total_tentativas < agg[_MENOR]:
+            agg[_MENOR] = total_tentativas
+    agg[_ULTIMA] = posicao
+
+
+class ArmazemMmap:
+    """Partidas em registros de largura fixa, lidos sob demanda via mmap.
+
+    Anexar e consultar podem acontecer em threads diferentes (group
+    commit): arquivos e mapas só são usados sob `_trava`.
+    """
+
+    def __init__(self, pasta: str, durabilidade: str = "arquivo") -> None:
+        self.pasta = pasta
+        self.durabilidade = durabilidade
+        self._trava = threading.RLock()
+        self._mapas: Dict[str, mmap.mmap] = {}
+        os.makedirs(pasta, exist_ok=True)
+
+        self._partidas = self._abrir(
+            "partidas.bin", CABECALHO_PARTIDAS.pack(MAGICA_PARTIDAS, VERSAO, REGISTRO.size, 0, 1)
+        )
+        self._palpites = self._abrir("palpites.bin", b"")
+        self._arq_agregados = self._abrir(
+            "agregados.bin", CABECALHO_AGREGADOS.pack(MAGICA_AGREGADOS, VERSAO, AGREGADO.size, 0)
+        )
+        magica, versao, tamanho, self.total, self._proximo_id = CABECALHO_PARTIDAS.unpack(
+            self._ler(self._partidas, 0, CABECALHO_PARTIDAS.size)
+        )
+        if (magica, versao, tamanho) != (MAGICA_PARTIDAS, VERSAO, REGISTRO.size):
+            raise ValueError(f"{self._partidas.name}: formato desconhecido")
+
+        self.usuarios: List[str] = self._ler_textos("usuarios.jsonl")
+        self._codigo_usuario = {u: c for c, u in enumerate(self.usuarios)}
+        self._datas_texto: List[str] = self._ler_textos("datas_texto.jsonl")
+        self._codigo_data_texto = {t: -(i + 1) for i, t in enumerate(self._datas_texto)}
+        self._texto_da_data: Dict[int, str] = {}
+        self.configs: List[str] = [CONFIG_PADRAO] + self._ler_textos("configs.jsonl")
+        self._codigo_config = {c: i for i, c in enumerate(self.configs)}
+        self._recuperar()
+
+    # ---------------- arquivos ----------------
+
+    def _caminho(self, arquivo: str) -> str:
+        return os.path.join(self.pasta, arquivo)
+
+    def _abrir(self, arquivo: str, cabecalho: bytes) -> IO[bytes]:
+        caminho = self._caminho(arquivo)
+        if not os.path.exists(caminho):
+            with open(caminho, "wb") as f:
+                f.write(cabecalho.ljust(TAMANHO_CABECALHO, b"\0") if cabecalho else b"")
+        return open(caminho, "r+b", buffering=0)
+
+    @staticmethod
+    def _ler(arquivo: IO[bytes], posicao: int, tamanho: int) -> bytes:
+        arquivo.seek(posicao)
+        return arquivo.read(tamanho)
+
+    @staticmethod
+    def _escrever(arquivo: IO[bytes], posicao: int, dados: bytes) -> None:
+        arquivo.seek(posicao)
+        arquivo.write(dados)
+
+    def _sincronizar(self, *arquivos: IO[bytes]) -> None:
+        if self.durabilidade != "nenhuma":
+            for arquivo in arquivos:
+                os.fsync(arquivo.fileno())
+
+    def _ler_textos(self, arquivo: str) -> List[str]:
+        """Linhas JSON completas do arquivo (uma linha final cortada é descartada)."""
+        caminho = self._caminho(arquivo)
+        if not os.path.exists(caminho):
+            return []
+        with open(caminho, "rb") as f:
+            dados = f.read()
+        fim = dados.rfind(b"\n") + 1
+        if fim < len(dados):
+            with open(caminho, "r+b") as f:
+                f.truncate(fim)
+        return [json.loads(linha) for linha in dados[:fim].splitlines()]
+
+    def _mapa(self, arquivo: IO[bytes]):
+        """mmap somente leitura do arquivo inteiro (refeito se o arquivo cresceu)."""
+        tamanho = os.fstat(arquivo.fileno()).st_size
+        mapa = self._mapas.get(arquivo.name)
+        if mapa is None or len(mapa) != tamanho:
+            if mapa is not None:
+                mapa.close()
+                del self._mapas[arquivo.name]
+            if not tamanho:
+                return b""  # mmap não aceita arquivo vazio
+            mapa = self._mapas[arquivo.name] = mmap.mmap(
+                arquivo.fileno(), tamanho, access=mmap.ACCESS_READ
+            )
+        return mapa
+
+    def fechar(self) -> None:
+        with self._trava:
+            for mapa in self._mapas.values():
+                mapa.close()
+            self._mapas.clear()
+            for arquivo in (self._partidas, self._palpites, self._arq_agregados):
+                arquivo.close()
+
+    # ---------------- recuperação ----------------
+
+    def _recuperar(self) -> None:
+        """Descarta escritas não confirmadas e confere os agregados."""
+        fim = TAMANHO_CABECALHO + self.total * REGISTRO.size
+        if os.fstat(self._partidas.fileno()).st_size > fim:
+            self._partidas.truncate(fim)
+        self._fim_palpites = 0
+        if self.total:
+            registro = REGISTRO.unpack(self._ler(self._partidas, fim - REGISTRO.size, REGISTRO.size))
+            self._fim_palpites = registro[3] + registro[8]
+        if os.fstat(self._palpites.fileno()).st_size > self._fim_palpites * 8:
+            self._palpites.truncate(self._fim_palpites * 8)
+
+        dados = self._mapa(self._arq_agregados)
+        magica, versao, tamanho, aplicadas = CABECALHO_AGREGADOS.unpack_from(dados, 0)
+        if (magica, versao, tamanho) != (MAGICA_AGREGADOS, VERSAO, AGREGADO.size):
+            raise ValueError(f"{self._arq_agregados.name}: formato desconhecido")
+        quantidade = min(len(self.usuarios), (len(dados) - TAMANHO_CABECALHO) // AGREGADO.size)
+        self._agregados = [
+            list(AGREGADO.unpack_from(dados, TAMANHO_CABECALHO + c * AGREGADO.size))
+            for c in range(quantidade)
+        ]
+        self._agregados.extend(_agregado_vazio() for _ in range(len(self.usuarios) - quantidade))
+        if aplicadas != self.total:
+            self._recalcular_agregados()
+
+    def _recalcular_agregados(self) -> None:
+        """Refaz agregados.bin a partir de todos os registros (só após queda)."""
+        self._agregados = [_agregado_vazio() for _ in self.usuarios]
+        mapa = self._mapa(self._partidas)
+        for posicao in range(self.total):
+            registro = REGISTRO.unpack_from(mapa, TAMANHO_CABECALHO + posicao * REGISTRO.size)
+            _somar(self._agregados[registro[5]], registro[2], registro[6], bool(registro[9]), posicao)
+        self._arq_agregados.truncate(TAMANHO_CABECALHO)
+        self._escrever(
+            self._arq_agregados,
+            TAMANHO_CABECALHO,
+            b"".join(AGREGADO.pack(*agg) for agg in self._agregados),
+        )
+        self._confirmar_agregados()
+
+    def _confirmar_agregados(self) -> None:
+        self._sincronizar(self._arq_agregados)
+        cabecalho = CABECALHO_AGREGADOS.pack(MAGICA_AGREGADOS, VERSAO, AGREGADO.size, self.total)
+        self._escrever(self._arq_agregados, 0, cabecalho)
+        self._sincronizar(self._arq_agregados)
+
+    # ---------------- codificação ----------------
+
+    def _codigo(self, usuario: str, novos: Dict[str, int]) -> int:
+        codigo = self._codigo_usuario.get(usuario)
+        if codigo is None:
+            codigo = novos.setdefault(usuario, len(self.usuarios) + len(novos))
+        return codigo
+
+    def _codificar_data(self, texto, novas: Dict[str, int]) -> int:
+        ordinal = ordinal_iso(texto)
+        if ordinal is not None:
+            return ordinal
+        texto = "" if texto is None else str(texto)
+        codigo = self._codigo_data_texto.get(texto)
+        if codigo is None:
+            codigo = novas.setdefault(texto, -(len(self._datas_texto) + len(novas) + 1))
+        return codigo
+
+    def _codificar_config(self, config: Optional[str], novas: Dict[str, int]) -> int:
+        config = config or CONFIG_PADRAO
+        codigo = self._codigo_config.get(config)
+        if codigo is None:
+            codigo = novas.setdefault(config, len(self.configs) + len(novas))
+        return codigo
+
+    def _internar(
+        self, usuarios: Dict[str, int], datas: Dict[str, int], configs: Dict[str, int]
+    ) -> None:
+        """Grava nomes, datas e configurações novos e só então os adota.
+
+        Os códigos são posições nos .jsonl: se o lote falhar antes daqui
+        (ex.: struct.error num campo grande demais), nada foi internado.
+        """
+        for arquivo, textos in (
+            ("usuarios.jsonl", usuarios),
+            ("datas_texto.jsonl", datas),
+            ("configs.jsonl", configs),
+        ):
+            if textos:
+                anexar_duravel(
+                    self._caminho(arquivo),
+                    "".join(json.dumps(t, ensure_ascii=False) + "\n" for t in textos),
+                    self.durabilidade,
+                )
+        self._codigo_usuario.update(usuarios)
+        self.usuarios.extend(usuarios)
+        self._agregados.extend(_agregado_vazio() for _ in usuarios)
+        self._codigo_data_texto.update(datas)
+        self._datas_texto.extend(datas)
+        self._codigo_config.update(configs)
+        self.configs.extend(configs)
+
+    def _texto_data(self, codigo: int) -> str:
+        texto = self._texto_da_data.get(codigo)
+        if texto is None:
+            texto = self._datas_texto[-codigo - 1] if codigo < 0 else date.fromordinal(codigo).isoformat()
+            self._texto_da_data[codigo] = texto
+        return texto
+
+    # ---------------- escrita ----------------
+
+    def vazio(self) -> bool:
+        return self.total == 0
+
+    def anexar(self, lote: Iterable[Dict]) -> None:
+        """Anexa partidas: registros e palpites, cabeçalho e então agregados."""
+        lote = list(lote)
+        if not lote:
+            return
+        with self._trava:
+            novos_usuarios: Dict[str, int] = {}
+            novas_datas: Dict[str, int] = {}
+            novas_configs: Dict[str, int] = {}
+            registros = bytearray()
+            palpites = array("q")
+            alterados: Dict[int, List[int]] = {}
+            posicao = self.total
+            proximo_id = self._proximo_id
+            for p in lote:
+                codigo = self._codigo(p.get("jogador"), novos_usuarios)
+                agg = alterados.get(codigo)
+                if agg is None:
+                    # código novo: o agregado dele só existe depois de _internar
+                    agg = alterados[codigo] = (
+                        list(self._agregados[codigo])
+                        if codigo < len(self._agregados)
+                        else _agregado_vazio()
+                    )
+                tentativas = p.get("tentativas") or []
+                pid = p.get("id", 0)
+                pontuacao = p.get("pontuacao", 0)
+                total_tentativas = p.get("total_tentativas", 0)
+                vitoria = p.get("resultado") == VITORIA
+                registros += REGISTRO.pack(
+                    pid,
+                    p.get("numero_secreto", 0),
+                    pontuacao,
+                    self._fim_palpites + len(palpites),
+                    agg[_ULTIMA],
+                    codigo,
+                    total_tentativas,
+                    self._codificar_data(p.get("data"), novas_datas),
+                    len(tentativas),
+                    vitoria,
+                    self._codificar_config(p.get("config"), novas_configs),
+                )
+                palpites.extend(tentativas)
+                _somar(agg, pontuacao, total_tentativas, vitoria, posicao)
+                proximo_id = max(proximo_id, pid + 1)
+                posicao += 1
+
+            # nomes, datas e configurações novos antes dos registros que os referenciam
+            self._internar(novos_usuarios, novas_datas, novas_configs)
+            self._escrever(self._palpites, self._fim_palpites * 8, palpites.tobytes())
+            self._escrever(
+                self._partidas, TAMANHO_CABECALHO + self.total * REGISTRO.size, bytes(registros)
+            )
+            self._sincronizar(self._palpites, self._partidas)
+
+            # confirmação: só agora as partidas passam a existir
+            self.total = posicao
+            self._proximo_id = proximo_id
+            self._fim_palpites += len(palpites)
+            self._escrever(
+                self._partidas,
+                0,
+                CABECALHO_PARTIDAS.pack(MAGICA_PARTIDAS, VERSAO, REGISTRO.size, self.total, proximo_id),
+            )
+            self._sincronizar(self._partidas)
+
+            for codigo, agg in alterados.items():
+                self._agregados[codigo] = agg
+                self._escrever(
+                    self._arq_agregados, TAMANHO_CABECALHO + codigo * AGREGADO.size, AGREGADO.pack(*agg)
+                )
+            self._confirmar_agregados()
+
+    def importar(self, partidas: Iterable[Dict], lote: int = 50_000) -> int:
+        """Grava um histórico existente em lotes. Retorna o total."""
+        total = 0
+        pendentes: List[Dict] = []
+        for p in partidas:
+            pendentes.append(dict(p))
+            if len(pendentes) >= lote:
+                self.anexar(pendentes)
+                total += len(pendentes)
+                pendentes = []
+        self.anexar(pendentes)
+        return total + len(pendentes)
+
+    # ---------------- leitura ----------------
+
+    def _decodificar(self, posicao: int, mapa, mapa_palpites) -> Dict:
+        (pid, segredo, pontuacao, inicio, _, codigo, total, data, quantidade, vitoria, config) = (
+            REGISTRO.unpack_from(mapa, TAMANHO_CABECALHO + posicao * REGISTRO.size)
+        )
+        tentativas = array("q")
+        tentativas.frombytes(mapa_palpites[inicio * 8 : (inicio + quantidade) * 8])
+        return {
+            "id": pid,
+            "jogador": self.usuarios[codigo],
+            "numero_secreto": segredo,
+            "tentativas": tentativas.tolist(),
+            "total_tentativas": total,
+            "pontuacao": pontuacao,
+            "resultado": VITORIA if vitoria else DERROTA,
+            "data": self._texto_data(data),
+            "config": self.configs[config],
+        }
+
+    def _decodificar_varias(self, posicoes: Iterable[int]) -> List[Dict]:
+        mapa = self._mapa(self._partidas)
+        mapa_palpites = self._mapa(self._palpites)
+        return [self._decodificar(p, mapa, mapa_palpites) for p in posicoes]
+
+    def _posicoes_do_usuario(self, usuario: str) -> List[int]:
+        """Posições das partidas do jogador, seguindo a cadeia de anteriores."""
+        codigo = self._codigo_usuario.get(usuario)
+        if codigo is None:
+            return []
+        mapa = self._mapa(self._partidas)
+        posicoes = []
+        posicao = self._agregados[codigo][_ULTIMA]
+        while posicao >= 0:
+            posicoes.append(posicao)
+            (posicao,) = _ID.unpack_from(
+                mapa, TAMANHO_CABECALHO + posicao * REGISTRO.size + _DESLOCAMENTO_ANTERIOR
+            )
+        posicoes.reverse()
+        return posicoes
+
+    def _chave(self, mapa, posicao: int) -> Tuple[str, int]:
+        """(data, id) de um registro, sem decodificar o resto."""
+        inicio = TAMANHO_CABECALHO + posicao * REGISTRO.size
+        (codigo,) = _DATA.unpack_from(mapa, inicio + _DESLOCAMENTO_DATA)
+        return self._texto_data(codigo), _ID.unpack_from(mapa, inicio)[0]
+
+    def _coluna_datas(self) -> List[int]:
+        """Códigos de data de todas as partidas, lidos direto do mapa."""
+        mapa = self._mapa(self._partidas)
+        fim = TAMANHO_CABECALHO + self.total * REGISTRO.size
+        if sys.byteorder != "little":
+            return [
+                _DATA.unpack_from(mapa, inicio + _DESLOCAMENTO_DATA)[0]
+                for inicio in range(TAMANHO_CABECALHO, fim, REGISTRO.size)
+            ]
+        with memoryview(mapa) as visao, visao[TAMANHO_CABECALHO:fim] as registros:
+            with registros.cast("i") as inteiros:
+                return inteiros[_DESLOCAMENTO_DATA // 4 :: REGISTRO.size // 4].tolist()
+
+    def iterar(self) -> Iterator[Dict]:
+        """Todas as partidas, na ordem gravada (decodificadas em blocos)."""
+        total = self.total
+        for inicio in range(0, total, 10_000):
+            with self._trava:
+                bloco = self._decodificar_varias(range(inicio, min(inicio + 10_000, total)))
+            yield from bloco
+
+    def partidas_do_usuario(self, usuario: str) -> List[Dict]:
+        with self._trava:
+            partidas = self._decodificar_varias(self._posicoes_do_usuario(usuario))
+        return sorted(partidas, key=lambda p: p["id"])
+
+    def historico(self, usuario: str, limite: int) -> List[Dict]:
+        """Últimas partidas por (data, id) decrescente; só `limite` são decodificadas."""
+        with self._trava:
+            mapa = self._mapa(self._partidas)
+            posicoes = heapq.nlargest(
+                limite, self._posicoes_do_usuario(usuario), key=lambda p: self._chave(mapa, p)
+            )
+            return self._decodificar_varias(posicoes)
+
+    def partidas_no_periodo(
+        self, inicio: str, fim: str, usuario: Optional[str] = None
+    ) -> List[Dict]:
+        """Partidas com inicio <= data <= fim (datas ISO), em ordem de (data, id)."""
+        with self._trava:
+            if usuario is not None:
+                mapa = self._mapa(self._partidas)
+                posicoes = [
+                    p for p in self._posicoes_do_usuario(usuario)
+                    if inicio <= self._chave(mapa, p)[0] <= fim
+                ]
+            else:
+                coluna = self._coluna_datas()
+                aceitas = {c for c in set(coluna) if inicio <= self._texto_data(c) <= fim}
+                posicoes = [p for p, c in enumerate(coluna) if c in aceitas]
+            partidas = self._decodificar_varias(posicoes)
+        return sorted(partidas, key=lambda p: (p["data"], p["id"]))
+
+    def proximo_id(self) -> int:
+        return self._proximo_id
+
+    def datas(self) -> set:
+        """Datas com partidas (só a coluna de datas é lida)."""
+        with self._trava:
+            return {self._texto_data(c) for c in set(self._coluna_datas())}
+
+    def agregados(self) -> Dict[str, Dict]:
+        """Contadores por jogador de agregados.bin, sem ler nenhuma partida."""
+        with self._trava:
+            return {
+                self.usuarios[codigo]: {
+                    "total": agg[_TOTAL],
+                    "vitorias": agg[_VITORIAS],
+                    "soma_pontuacao": agg[_SOMA_PONTUACAO],
+                    "soma_tentativas": agg[_SOMA_TENTATIVAS],
+                    "melhor_pontuacao": agg[_MELHOR],
+                    "menor_tentativas": None if agg[_MENOR] < 0 else agg[_MENOR],
+                }
+                for codigo, agg in enumerate(self._agregados)
+                if agg[_TOTAL]
+            }
+
+
+def main() -> None:
+    """Grava o histórico de partidas (dados/partidas.jsonl) no formato mmap."""
+    if len(sys.argv) < 2 or sys.argv[1] != "importar":
+        print("Uso: python armazenamento_mmap.py importar")
+        return
+
+    import jogo_adivinhacao as jogo
+
+    # lê os arquivos .txt/.jsonl, independente de JOGO_BACKEND
+    jogo._garantir_pastas()
+    jogo._carregar_dados_arquivo()
+    armazem = ArmazemMmap(jogo.PASTA_MMAP, jogo.DURABILIDADE)
+    if not armazem.vazio():
+        print(f"⚠️  {jogo.PASTA_MMAP} já tem partidas; nada foi importado.")
+        return
+    total = armazem.importar(jogo.partidas)
+    print(f"✅ {total} partidas gravadas em {jogo.PASTA_MMAP}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Backend particionado por mês do Sistema de Jogo de Adivinhação
+--------------------------------------------------------------
+
+Ativado com JOGO_BACKEND=particionado. As partidas ficam em segmentos
+JSON Lines por mês, em dados/partidas/:
+
+  dados/partidas/2025-11.jsonl    -> partidas com data em novembro/2025
+  dados/partidas/sem-data.jsonl   -> partidas sem data ISO (AAAA-MM-DD)
+  dados/partidas/manifesto.json   -> por segmento: total, min/max id,
+                                     min/max data, datas e jogadores
+
+As consultas usam só o manifesto para escolher os segmentos (poda de
+partições): um período abre apenas os meses que o cobrem, o histórico
+recente de um jogador lê os meses mais novos em que ele jogou até
+completar o limite, e `datas()` nem abre segmentos.
+
+O manifesto é gravado depois dos segmentos (troca atômica, ver
+persistencia.py); se o processo cair entre as duas escritas, a abertura
+seguinte recalcula os segmentos cujo tamanho não bate com o manifesto.
+
+Importação dos arquivos .txt/.jsonl existentes:
+  python armazenamento_particionado.py importar
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from armazenamento_compacto import CONFIG_PADRAO
+from persistencia import anexar_duravel, gravar_atomico
+
+ARQ_MANIFESTO = "manifesto.json"
+SEM_DATA = "sem-data"
+
+
+def chave_particao(data) -> str:
+    """Mês (AAAA-MM) de uma data ISO; SEM_DATA para qualquer outra coisa."""
+    if isinstance(data, str) and len(data) >= 10 and data[4] == "-" and data[7] == "-":
+        if data[:4].isdigit() and data[5:7].isdigit():
+            return data[:7]
+    return SEM_DATA
+
+
+def _linha_partida(partida: Dict) -> str:
+    return json.dumps(partida, ensure_ascii=False) + "\n"
+
+
+def _nova_entrada(arquivo: str) -> Dict:
+    return {
+        "arquivo": arquivo,
+        "bytes": 0,
+        "total": 0,
+        "min_id": None,
+        "max_id": None,
+        "min_data": None,
+        "max_data": None,
+        "datas": [],
+        "jogadores": [],
+    }
+
+
+def _somar_entrada(entrada: Dict, lote: List[Dict]) -> None:
+    """Atualiza a entrada do manifesto com partidas anexadas ao segmento."""
+    datas = set(entrada["datas"])
+    jogadores = set(entrada["jogadores"])
+    for p in lote:
+        pid = p.get("id", 0)
+        data = p.get("data") or ""
+        entrada["total"] += 1
+        entrada["min_id"] = pid if entrada["min_id"] is None else min(entrada["min_id"], pid)
+        entrada["max_id"] = pid if entrada["max_id"] is None else max(entrada["max_id"], pid)
+        entrada["min_data"] = data if entrada["min_data"] is None else min(entrada["min_data"], data)
+        entrada["max_data"] = data if entrada["max_data"] is None else max(entrada["max_data"], data)
+        datas.add(data)
+        jogadores.add(p.get("jogador"))
+    entrada["datas"] = sorted(datas)
+    entrada["jogadores"] = sorted(jogadores, key=str)
+
+
+class ArmazemParticionado:
+    """Segmentos mensais de partidas + manifesto, na pasta indicada.
+
+    Anexar e consultar podem acontecer em threads diferentes (group
+    commit): o manifesto só é alterado/percorrido sob `_trava`.
+    """
+
+    def __init__(self, pasta: str, durabilidade: str = "arquivo") -> None:
+        self.pasta = pasta
+        self.durabilidade = durabilidade
+        self._trava = threading.RLock()
+        os.makedirs(pasta, exist_ok=True)
+        self.manifesto: Dict[str, Dict] = self._ler_manifesto()
+        self._recuperar()
+
+    # ---------------- manifesto ----------------
+
+    def _caminho(self, arquivo: str) -> str:
+        return os.path.join(self.pasta, arquivo)
+
+    def _ler_manifesto(self) -> Dict[str, Dict]:
+        try:
+            with open(self._caminho(ARQ_MANIFESTO), "r", encoding="utf-8") as f:
+                return json.load(f)["particoes"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _salvar_manifesto(self) -> None:
+        gravar_atomico(
+            self._caminho(ARQ_MANIFESTO),
+            lambda f: json.dump({"versao": 1, "particoes": self.manifesto}, f, ensure_ascii=False),
+            self.durabilidade,
+        )
+
+    def _recuperar(self) -> None:
+        """Recalcula entradas de segmentos alterados fora do manifesto."""
+        alterado = False
+        for arquivo in os.listdir(self.pasta):
+            if not arquivo.endswith(".jsonl"):
+                continue
+            chave = arquivo[: -len(".jsonl")]
+            entrada = self.manifesto.get(chave)
+            if entrada is None or entrada["bytes"] != os.path.getsize(self._caminho(arquivo)):
+                entrada = self.manifesto[chave] = _nova_entrada(arquivo)
+                _somar_entrada(entrada, list(self._ler_segmento(chave, truncar=True)))
+                entrada["bytes"] = os.path.getsize(self._caminho(arquivo))
+                alterado = True
+        for chave in [c for c, e in self.manifesto.items() if not os.path.exists(self._caminho(e["arquivo"]))]:
+            del self.manifesto[chave]
+            alterado = True
+        if alterado:
+            self._salvar_manifesto()
+
+    # ---------------- escrita ----------------
+
+    def vazio(self) -> bool:
+        with self._trava:
+            return not any(e["total"] for e in self.manifesto.values())
+
+    def anexar(self, lote: Iterable[Dict]) -> None:
+        """Anexa partidas aos segmentos dos seus meses e atualiza o manifesto.
+
+        Cada segmento tocado recebe uma única escrita (com fsync, conforme
+        a durabilidade); o manifesto é regravado uma vez por lote.
+        """
+        por_particao: Dict[str, List[Dict]] = {}
+        for p in lote:
+            por_particao.setdefault(chave_particao(p.get("data")), []).append(p)
+        if not por_particao:
+            return
+
+        with self._trava:
+            for chave, partidas in por_particao.items():
+                entrada = self.manifesto.get(chave)
+                if entrada is None:
+                    entrada = self.manifesto[chave] = _nova_entrada(f"{chave}.jsonl")
+                caminho = self._caminho(entrada["arquivo"])
+                anexar_duravel(caminho, "".join(_linha_partida(p) for p in partidas), self.durabilidade)
+                entrada["bytes"] = os.path.getsize(caminho)
+                _somar_entrada(entrada, partidas)
+            self._salvar_manifesto()
+
+    # ---------------- leitura ----------------
+
+    def _ler_segmento(
+        self, chave: str, usuario: Optional[str] = None, truncar: bool = False
+    ) -> Iterator[Dict]:
+        """Partidas de um segmento, na ordem gravada.
+
+        Com `usuario`, as linhas de outros jogadores são descartadas antes
+        do json.loads (filtro por substring, conferido depois do parse).
+        Com truncar=True, uma linha final incompleta é cortada do arquivo.
+        """
+        caminho = self._caminho(self.manifesto.get(chave, {}).get("arquivo", f"{chave}.jsonl"))
+        if not os.path.exists(caminho):
+            return
+        marca = None
+        if usuario is not None:
+            marca = ('"jogador": ' + json.dumps(usuario, ensure_ascii=False)).encode("utf-8")
+        fim_valido = 0
+        posicao = 0
+        with open(caminho, "rb") as f:
+            for linha in f:
+                posicao += len(linha)
+                if not linha.endswith(b"\n"):
+                    break
+                fim_valido = posicao
+                if marca is not None and marca not in linha:
+                    continue
+                try:
+                    partida = json.loads(linha)
+                except ValueError:
+                    continue
+                if usuario is None or partida.get("jogador") == usuario:
+                    partida.setdefault("config", CONFIG_PADRAO)  # gravada antes da marcação
+                    yield partida
+        if truncar and fim_valido < posicao:
+            with open(caminho, "r+b") as f:
+                f.truncate(fim_valido)
+
+    def _chaves(self, usuario: Optional[str] = None) -> List[str]:
+        """Partições em ordem cronológica, opcionalmente só as do jogador."""
+        with self._trava:
+            chaves = [
+                c
+                for c, e in self.manifesto.items()
+                if e["total"] and (usuario is None or usuario in e["jogadores"])
+            ]
+        # "sem-data" guarda datas fora do padrão ISO; fica antes dos meses
+        return sorted(chaves, key=lambda c: (c != SEM_DATA, c))
+
+    def iterar(self) -> Iterator[Dict]:
+        """Todas as partidas, partição por partição."""
+        for chave in self._chaves():
+            yield from self._ler_segmento(chave)
+
+    def partidas_do_usuario(self, usuario: str) -> List[Dict]:
+        partidas: List[Dict] = []
+        for chave in self._chaves(usuario):
+            partidas.extend(self._ler_segmento(chave, usuario))
+        return sorted(partidas, key=lambda p: p.get("id", 0))
+
+    def historico(self, usuario: str, limite: int) -> List[Dict]:
+        """Últimas partidas por (data, id) decrescente.
+
+        Lê as partições do jogador da mais recente para a mais antiga e
+        para quando a próxima só tem datas anteriores à última selecionada.
+        """
+        def chave(p: Dict):
+            return (p.get("data", ""), p.get("id", 0))
+
+        chaves = sorted(
+            self._chaves(usuario), key=lambda c: self.manifesto[c]["max_data"], reverse=True
+        )
+        selecionadas: List[Dict] = []
+        for c in chaves:
+            if len(selecionadas) >= limite and self.manifesto[c]["max_data"] < selecionadas[-1].get("data", ""):
+                break
+            selecionadas.extend(self._ler_segmento(c, usuario))
+            selecionadas.sort(key=chave, reverse=True)
+            del selecionadas[limite:]
+        return selecionadas
+
+    def partidas_no_periodo(
+        self, inicio: str, fim: str, usuario: Optional[str] = None
+    ) -> List[Dict]:
+        """Partidas com inicio <= data <= fim (datas ISO), em ordem de (data, id)."""
+        partidas: List[Dict] = []
+        for c in self._chaves(usuario):
+            e = self.manifesto[c]
+            if e["max_data"] < inicio or e["min_data"] > fim:
+                continue  # partição fora do período: nem é aberta
+            partidas.extend(
+                p for p in self._ler_segmento(c, usuario) if inicio <= p.get("data", "") <= fim
+            )
+        return sorted(partidas, key=lambda p: (p.get("data", ""), p.get("id", 0)))
+
+    def proximo_id(self) -> int:
+        with self._trava:
+            ids = [e["max_id"] for e in self.manifesto.values() if e["max_id"] is not None]
+        return max(ids, default=0) + 1
+
+    def datas(self) -> set:
+        """Datas com partidas, direto do manifesto."""
+        with self._trava:
+            return {d for e in self.manifesto.values() for d in e["datas"]}
+
+    def importar(self, partidas: Iterable[Dict], lote: int = 50_000) -> int:
+        """Distribui um histórico existente pelos segmentos. Retorna o total."""
+        total = 0
+        pendentes: List[Dict] = []
+        for p in partidas:
+            pendentes.append(dict(p))
+            if len(pendentes) >= lote:
+                self.anexar(pendentes)
+                total += len(pendentes)
+                pendentes = []
+        self.anexar(pendentes)
+        return total + len(pendentes)
+
+
+def main() -> None:
+    """Distribui o histórico de partidas (dados/partidas.jsonl) pelos segmentos."""
+    import sys
+
+    import jogo_adivinhacao as jogo
+
+    if len(sys.argv) < 2 or sys.argv[1] != "importar":
+        print("Uso: python armazenamento_particionado.py importar")
+        return
+
+    # lê os arquivos .txt/.jsonl, independente de JOGO_BACKEND
+    jogo._garantir_pastas()
+    jogo._carregar_dados_arquivo()
+    armazem = ArmazemParticionado(jogo.PASTA_PARTICOES, jogo.DURABILIDADE)
+    if not armazem.vazio():
+        print(f"⚠️  {jogo.PASTA_PARTICOES} já tem partidas; nada foi importado.")
+        return
+    total = armazem.importar(jogo.partidas)
+    print(f"✅ {total} partidas distribuídas em {len(armazem.manifesto)} partições")
+
+
+if __name__ == "__main__":
+    main()
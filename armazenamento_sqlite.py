@@ -0,0 +1,778 @@
+"""
+Backend SQLite (opcional) do Sistema de Jogo de Adivinhação
+-----------------------------------------------------------
+
+Ativado com a variável de ambiente JOGO_BACKEND=sqlite. Em vez de carregar
+os arquivos JSON inteiros para a memória, o jogo consulta o banco
+dados/jogo.db (modo WAL) sob demanda:
+
+  jogadores  -> cadastro (a coluna `ordem` guarda a ordem de cadastro)
+  partidas   -> uma linha por partida, índices em (jogador, data, id),
+                (data, id) e em resultado
+  agregados  -> estatísticas por jogador, atualizadas na mesma transação
+                da partida; os rankings são consultas indexadas com LIMIT
+  agregados_dia -> as mesmas estatísticas por (dia, jogador), para os
+                rankings por janela (dia/semana/mês); dias antigos são
+                descartados pelo jogo
+  agregados_config -> as mesmas estatísticas por (configuração, jogador),
+                para os rankings de cada intervalo/limite de tentativas
+
+Importação dos arquivos .txt/.jsonl existentes:
+  python armazenamento_sqlite.py importar
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from armazenamento_compacto import CONFIG_PADRAO
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS jogadores (
+    ordem          INTEGER PRIMARY KEY,
+    usuario        TEXT NOT NULL UNIQUE,
+    nome           TEXT NOT NULL,
+    data_cadastro  TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS partidas (
+    id               INTEGER PRIMARY KEY,
+    jogador          TEXT NOT NULL,
+    numero_secreto   INTEGER NOT NULL,
+    tentativas       TEXT NOT NULL,
+    total_tentativas INTEGER NOT NULL,
+    pontuacao        INTEGER NOT NULL,
+    resultado        TEXT NOT NULL,
+    data             TEXT NOT NULL,
+    config           TEXT NOT NULL DEFAULT '{config_padrao}'
+);
+CREATE INDEX IF NOT EXISTS idx_partidas_jogador_data_id
+    ON partidas (jogador, data, id);
+CREATE INDEX IF NOT EXISTS idx_partidas_resultado
+    ON partidas (resultado);
+CREATE INDEX IF NOT EXISTS idx_partidas_data_id
+    ON partidas (data, id);
+
+CREATE TABLE IF NOT EXISTS agregados (
+    usuario          TEXT PRIMARY KEY,
+    ordem            INTEGER NOT NULL,
+    total            INTEGER NOT NULL DEFAULT 0,
+    vitorias         INTEGER NOT NULL DEFAULT 0,
+    soma_pontuacao   INTEGER NOT NULL DEFAULT 0,
+    soma_tentativas  INTEGER NOT NULL DEFAULT 0,
+    melhor_pontuacao INTEGER NOT NULL DEFAULT 0,
+    menor_tentativas INTEGER,
+    media            REAL
+);
+CREATE INDEX IF NOT EXISTS idx_agregados_media
+    ON agregados (media DESC, ordem) WHERE total > 0;
+CREATE INDEX IF NOT EXISTS idx_agregados_vitorias
+    ON agregados (vitorias DESC, ordem);
+CREATE INDEX IF NOT EXISTS idx_agregados_melhor
+    ON agregados (melhor_pontuacao DESC, ordem);
+CREATE INDEX IF NOT EXISTS idx_agregados_menor
+    ON agregados (menor_tentativas, ordem);
+
+CREATE TABLE IF NOT EXISTS agregados_dia (
+    data             TEXT NOT NULL,
+    usuario          TEXT NOT NULL,
+    total            INTEGER NOT NULL,
+    vitorias         INTEGER NOT NULL,
+    soma_pontuacao   INTEGER NOT NULL,
+    soma_tentativas  INTEGER NOT NULL,
+    melhor_pontuacao INTEGER NOT NULL,
+    menor_tentativas INTEGER,
+    PRIMARY KEY (data, usuario)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS agregados_config (
+    config           TEXT NOT NULL,
+    usuario          TEXT NOT NULL,
+    total            INTEGER NOT NULL,
+    vitorias         INTEGER NOT NULL,
+    soma_pontuacao   INTEGER NOT NULL,
+    soma_tentativas  INTEGER NOT NULL,
+    melhor_pontuacao INTEGER NOT NULL,
+    menor_tentativas INTEGER,
+    PRIMARY KEY (config, usuario)
+) WITHOUT ROWID;
+
+-- geracao: incrementada a cada repontuação (versão do cache de relatórios)
+CREATE TABLE IF NOT EXISTS meta (
+    chave TEXT PRIMARY KEY,
+    valor INTEGER NOT NULL
+) WITHOUT ROWID;
+INSERT OR IGNORE INTO meta VALUES ('geracao', 0);
+""".replace("{config_padrao}", CONFIG_PADRAO)
+
+_CONTADORES = (
+    "total",
+    "vitorias",
+    "soma_pontuacao",
+    "soma_tentativas",
+    "melhor_pontuacao",
+    "menor_tentativas",
+)
+
+_COLUNAS_PARTIDA = (
+    "id, jogador, numero_secreto, tentativas, total_tentativas, "
+    "pontuacao, resultado, data, config"
+)
+
+
+# PRAGMA synchronous para cada nível de JOGO_DURABILIDADE (ver persistencia)
+SINCRONIZACAO = {"nenhuma": "OFF", "arquivo": "NORMAL", "completa": "FULL"}
+
+
+def _partida_de_linha(linha: Tuple) -> Dict:
+    """Converte uma linha da tabela partidas no dict usado pelo jogo."""
+    return {
+        "id": linha[0],
+        "jogador": linha[1],
+        "numero_secreto": linha[2],
+        "tentativas": json.loads(linha[3]),
+        "total_tentativas": linha[4],
+        "pontuacao": linha[5],
+        "resultado": linha[6],
+        "data": linha[7],
+        "config": linha[8],
+    }
+
+
+class BancoSQLite:
+    """Acesso ao banco SQLite com as operações usadas pelo jogo."""
+
+    def __init__(self, caminho: str, durabilidade: str = "arquivo") -> None:
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute(f"PRAGMA synchronous={SINCRONIZACAO.get(durabilidade, 'NORMAL')}")
+        existentes = {
+            nome for (nome,) in self.conexao.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        self.conexao.executescript(ESQUEMA)
+        if "partidas" in existentes:  # banco de uma versão anterior: completa uma vez
+            colunas = {linha[1] for linha in self.conexao.execute("PRAGMA table_info(partidas)")}
+            with self.conexao:
+                if "config" not in colunas:
+                    self.conexao.execute(
+                        "ALTER TABLE partidas ADD COLUMN config TEXT NOT NULL "
+                        f"DEFAULT '{CONFIG_PADRAO}'"
+                    )
+                if "agregados_dia" not in existentes:
+                    self._recalcular_agregados_por("agregados_dia", "data")
+                if "agregados_config" not in existentes:
+                    self._recalcular_agregados_por("agregados_config", "config")
+
+    def fechar(self) -> None:
+        self.conexao.close()
+
+    def vazio(self) -> bool:
+        """True se ainda não há jogadores nem partidas no banco."""
+        cur = self.conexao.execute(
+            "SELECT (SELECT COUNT(*) FROM jogadores) + (SELECT COUNT(*) FROM partidas)"
+        )
+        return cur.fetchone()[0] == 0
+
+    # ---------------- jogadores ----------------
+
+    def cadastrar_jogador(self, jogador: Dict) -> None:
+        """Insere um jogador; ValueError se o usuário já existe."""
+        try:
+            with self.conexao:
+                cur = self.conexao.execute(
+                    "INSERT INTO jogadores (usuario, nome, data_cadastro) VALUES (?, ?, ?)",
+                    (jogador["usuario"], jogador["nome"], jogador["data_cadastro"]),
+                )
+                self.conexao.execute(
+                    "INSERT INTO agregados (usuario, ordem) VALUES (?, ?)",
+                    (jogador["usuario"], cur.lastrowid),
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError("Usuário já cadastrado.") from None
+
+    def obter_jogador(self, usuario: str) -> Optional[Dict]:
+        cur = self.conexao.execute(
+            "SELECT nome, usuario, data_cadastro FROM jogadores WHERE usuario = ?",
+            (usuario,),
+        )
+        linha = cur.fetchone()
+        if linha is None:
+            return None
+        return {"nome": linha[0], "usuario": linha[1], "data_cadastro": linha[2]}
+
+    def usuarios(self) -> List[str]:
+        """Usuários na ordem de cadastro."""
+        cur = self.conexao.execute("SELECT usuario FROM jogadores ORDER BY ordem")
+        return [u for (u,) in cur]
+
+    def cadastrar_jogadores(self, lote: Iterable[Dict]) -> None:
+        """Insere vários jogadores em uma transação; ValueError (e nada é
+        gravado) se algum usuário já existe."""
+        try:
+            with self.conexao:
+                for jogador in lote:
+                    cur = self.conexao.execute(
+                        "INSERT INTO jogadores (usuario, nome, data_cadastro) VALUES (?, ?, ?)",
+                        (jogador["usuario"], jogador["nome"], jogador["data_cadastro"]),
+                    )
+                    self.conexao.execute(
+                        "INSERT INTO agregados (usuario, ordem) VALUES (?, ?)",
+                        (jogador["usuario"], cur.lastrowid),
+                    )
+        except sqlite3.IntegrityError:
+            raise ValueError("Usuário já cadastrado.") from None
+
+    def iterar_jogadores(self, bloco: int = 10_000) -> Iterator[Dict]:
+        """Jogadores na ordem de cadastro, lidos do cursor em blocos."""
+        cur = self.conexao.execute(
+            "SELECT nome, usuario, data_cadastro FROM jogadores ORDER BY ordem"
+        )
+        while True:
+            linhas = cur.fetchmany(bloco)
+            if not linhas:
+                return
+            for nome, usuario, data_cadastro in linhas:
+                yield {"nome": nome, "usuario": usuario, "data_cadastro": data_cadastro}
+
+    # ---------------- partidas ----------------
+
+    def inserir_partidas(self, lote: Iterable[Dict]) -> None:
+        """Grava partidas e atualiza os agregados em uma única transação."""
+        with self.conexao:
+            for partida in lote:
+                self._inserir_partida(partida)
+
+    def _inserir_partida(self, partida: Dict) -> None:
+        vitoria = partida["resultado"] == "Vitória"
+        self.conexao.execute(
+            f"INSERT INTO partidas ({_COLUNAS_PARTIDA}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                partida["id"],
+                partida["jogador"],
+                partida["numero_secreto"],
+                json.dumps(partida["tentativas"]),
+                partida["total_tentativas"],
+                partida["pontuacao"],
+                partida["resultado"],
+                partida["data"],
+                partida.get("config") or CONFIG_PADRAO,
+            ),
+        )
+        self.conexao.execute(
+            """
+            UPDATE agregados SET
+                total = total + 1,
+                vitorias = vitorias + ?,
+                soma_pontuacao = soma_pontuacao + ?,
+                soma_tentativas = soma_tentativas + ?,
+                melhor_pontuacao = MAX(melhor_pontuacao, ?),
+                menor_tentativas = CASE
+                    WHEN ? = 0 THEN menor_tentativas
+                    ELSE MIN(COALESCE(menor_tentativas, ?), ?) END
+            WHERE usuario = ?
+            """,
+            (
+                int(vitoria),
+                partida["pontuacao"],
+                partida["total_tentativas"],
+                partida["pontuacao"],
+                int(vitoria),
+                partida["total_tentativas"],
+                partida["total_tentativas"],
+                partida["jogador"],
+            ),
+        )
+        self._atualizar_media(partida["jogador"])
+        self._somar_por("agregados_dia", "data", partida["data"], partida, vitoria)
+        config = partida.get("config") or CONFIG_PADRAO
+        self._somar_por("agregados_config", "config", config, partida, vitoria)
+
+    def _somar_por(self, tabela: str, coluna: str, chave: str, partida: Dict, vitoria: bool) -> None:
+        """Soma a partida à linha (chave, jogador) de agregados_dia/agregados_config."""
+        self.conexao.execute(
+            f"""
+            INSERT INTO {tabela} VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+            ON CONFLICT ({coluna}, usuario) DO UPDATE SET
+                total = total + 1,
+                vitorias = vitorias + excluded.vitorias,
+                soma_pontuacao = soma_pontuacao + excluded.soma_pontuacao,
+                soma_tentativas = soma_tentativas + excluded.soma_tentativas,
+                melhor_pontuacao = MAX(melhor_pontuacao, excluded.melhor_pontuacao),
+                menor_tentativas = CASE
+                    WHEN excluded.menor_tentativas IS NULL THEN menor_tentativas
+                    ELSE MIN(COALESCE(menor_tentativas, excluded.menor_tentativas),
+                             excluded.menor_tentativas) END
+            """,
+            (
+                chave,
+                partida["jogador"],
+                int(vitoria),
+                partida["pontuacao"],
+                partida["total_tentativas"],
+                partida["pontuacao"],
+                partida["total_tentativas"] if vitoria else None,
+            ),
+        )
+
+    def _atualizar_media(self, usuario: str) -> None:
+        # média arredondada em Python, igual ao ranking em memória
+        linha = self.conexao.execute(
+            "SELECT soma_pontuacao, total FROM agregados WHERE usuario = ?",
+            (usuario,),
+        ).fetchone()
+        if linha and linha[1]:
+            self.conexao.execute(
+                "UPDATE agregados SET media = ? WHERE usuario = ?",
+                (round(linha[0] / linha[1], 2), usuario),
+            )
+
+    def partidas_do_usuario(self, usuario: str) -> List[Dict]:
+        cur = self.conexao.execute(
+            f"SELECT {_COLUNAS_PARTIDA} FROM partidas WHERE jogador = ? ORDER BY id",
+            (usuario,),
+        )
+        return [_partida_de_linha(linha) for linha in cur]
+
+    def historico(self, usuario: str, limite: int) -> List[Dict]:
+        """Últimas partidas por (data, id) decrescente, via índice."""
+        cur = self.conexao.execute(
+            f"""
+            SELECT {_COLUNAS_PARTIDA} FROM partidas
+            WHERE jogador = ?
+            ORDER BY data DESC, id DESC
+            LIMIT ?
+            """,
+            (usuario, limite),
+        )
+        return [_partida_de_linha(linha) for linha in cur]
+
+    def partidas_no_periodo(
+        self, inicio: str, fim: str, usuario: Optional[str] = None
+    ) -> List[Dict]:
+        """Partidas com data entre inicio e fim (inclusivo), por (data, id)."""
+        filtro = "data BETWEEN ? AND ?"
+        parametros: Tuple = (inicio, fim)
+        if usuario is not None:
+            filtro = "jogador = ? AND " + filtro
+            parametros = (usuario, inicio, fim)
+        cur = self.conexao.execute(
+            f"SELECT {_COLUNAS_PARTIDA} FROM partidas WHERE {filtro} ORDER BY data, id",
+            parametros,
+        )
+        return [_partida_de_linha(linha) for linha in cur]
+
+    def iterar_partidas(self, bloco: int = 10_000) -> Iterator[Dict]:
+        """Todas as partidas por id, lidas do cursor em blocos."""
+        cur = self.conexao.execute(f"SELECT {_COLUNAS_PARTIDA} FROM partidas ORDER BY id")
+        while True:
+            linhas = cur.fetchmany(bloco)
+            if not linhas:
+                return
+            for linha in linhas:
+                yield _partida_de_linha(linha)
+
+    def proximo_id(self) -> int:
+        cur = self.conexao.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM partidas")
+        return cur.fetchone()[0]
+
+    def datas(self) -> set:
+        return {d for (d,) in self.conexao.execute("SELECT DISTINCT data FROM partidas")}
+
+    def maior_total_tentativas(self) -> int:
+        cur = self.conexao.execute("SELECT COALESCE(MAX(total_tentativas), 0) FROM partidas")
+        return cur.fetchone()[0]
+
+    # ---------------- estatísticas e rankings ----------------
+
+    def agregado(self, usuario: str) -> Optional[Dict]:
+        cur = self.conexao.execute(
+            """
+            SELECT total, vitorias, soma_pontuacao, soma_tentativas,
+                   melhor_pontuacao, menor_tentativas
+            FROM agregados WHERE usuario = ?
+            """,
+            (usuario,),
+        )
+        linha = cur.fetchone()
+        if linha is None:
+            return None
+        chaves = (
+            "total",
+            "vitorias",
+            "soma_pontuacao",
+            "soma_tentativas",
+            "melhor_pontuacao",
+            "menor_tentativas",
+        )
+        return dict(zip(chaves, linha))
+
+    def agregados_no_periodo(self, inicio: str, fim: str) -> Dict[str, Dict]:
+        """Agregados por jogador somando os dias entre inicio e fim (inclusivo).
+
+        Só jogadores cadastrados com partidas no período, na ordem de cadastro.
+        """
+        cur = self.conexao.execute(
+            """
+            SELECT d.usuario, SUM(d.total), SUM(d.vitorias), SUM(d.soma_pontuacao),
+                   SUM(d.soma_tentativas), MAX(d.melhor_pontuacao), MIN(d.menor_tentativas)
+            FROM agregados_dia d JOIN jogadores j ON j.usuario = d.usuario
+            WHERE d.data BETWEEN ? AND ?
+            GROUP BY d.usuario
+            ORDER BY MIN(j.ordem)
+            """,
+            (inicio, fim),
+        )
+        return {linha[0]: dict(zip(_CONTADORES, linha[1:])) for linha in cur}
+
+    def agregados_da_configuracao(self, config: str) -> Dict[str, Dict]:
+        """Agregados por jogador só com as partidas da configuração, na ordem de cadastro."""
+        cur = self.conexao.execute(
+            f"""
+            SELECT c.usuario, {", ".join("c." + k for k in _CONTADORES)}
+            FROM agregados_config c JOIN jogadores j ON j.usuario = c.usuario
+            WHERE c.config = ?
+            ORDER BY j.ordem
+            """,
+            (config,),
+        )
+        return {linha[0]: dict(zip(_CONTADORES, linha[1:])) for linha in cur}
+
+    def configuracoes(self) -> set:
+        """Configurações com partidas registradas."""
+        return {c for (c,) in self.conexao.execute("SELECT DISTINCT config FROM agregados_config")}
+
+    def descartar_dias_antes(self, data: str) -> None:
+        """Remove os agregados diários anteriores a `data`."""
+        with self.conexao:
+            self.conexao.execute("DELETE FROM agregados_dia WHERE data < ?", (data,))
+
+    def totais_por_jogador(self) -> Dict[str, int]:
+        cur = self.conexao.execute("SELECT usuario, total FROM agregados ORDER BY ordem")
+        return dict(cur.fetchall())
+
+    def versao_dados(self) -> Tuple[int, int]:
+        """(nº de jogadores, geração das pontuações), para o cache de relatórios."""
+        cur = self.conexao.execute(
+            "SELECT (SELECT COUNT(*) FROM jogadores), "
+            "(SELECT valor FROM meta WHERE chave = 'geracao')"
+        )
+        return tuple(cur.fetchone())
+
+    def _avancar_geracao(self) -> None:
+        """Chamar dentro da transação que altera pontuações já gravadas."""
+        self.conexao.execute("UPDATE meta SET valor = valor + 1 WHERE chave = 'geracao'")
+
+    def ranking_pontuacao_media(self, limite: int) -> List[Tuple[str, float]]:
+        cur = self.conexao.execute(
+            """
+            SELECT usuario, media FROM agregados
+            WHERE total > 0
+            ORDER BY media DESC, ordem
+            LIMIT ?
+            """,
+            (limite,),
+        )
+        return cur.fetchall()
+
+    def ranking_vitorias(self, limite: int) -> List[Tuple[str, int]]:
+        cur = self.conexao.execute(
+            "SELECT usuario, vitorias FROM agregados ORDER BY vitorias DESC, ordem LIMIT ?",
+            (limite,),
+        )
+        return cur.fetchall()
+
+    def ranking_melhor_pontuacao(self, limite: int) -> List[Tuple[str, int]]:
+        cur = self.conexao.execute(
+            """
+            SELECT usuario, melhor_pontuacao FROM agregados
+            ORDER BY melhor_pontuacao DESC, ordem
+            LIMIT ?
+            """,
+            (limite,),
+        )
+        return cur.fetchall()
+
+    def ranking_menor_tentativas(
+        self, limite: int, max_tentativas: int
+    ) -> List[Tuple[str, int]]:
+        # Quem nunca venceu conta como o limite de tentativas atual. Ordenar
+        # por COALESCE(...) ordenaria a tabela inteira; cada faixa abaixo
+        # sai já ordenada de idx_agregados_menor, e só 3 * limite linhas
+        # passam pela ordenação final.
+        cur = self.conexao.execute(
+            """
+            SELECT usuario, menor FROM (
+                SELECT * FROM (
+                    SELECT usuario, menor_tentativas AS menor, ordem FROM agregados
+                    WHERE menor_tentativas < :maximo
+                    ORDER BY menor_tentativas, ordem LIMIT :limite)
+                UNION ALL
+                SELECT * FROM (
+                    SELECT usuario, :maximo, ordem FROM agregados
+                    WHERE menor_tentativas IS NULL
+                    ORDER BY menor_tentativas, ordem LIMIT :limite)
+                UNION ALL
+                SELECT * FROM (
+                    SELECT usuario, menor_tentativas, ordem FROM agregados
+                    WHERE menor_tentativas >= :maximo
+                    ORDER BY menor_tentativas, ordem LIMIT :limite)
+            )
+            ORDER BY menor, ordem
+            LIMIT :limite
+            """,
+            {"maximo": max_tentativas, "limite": limite},
+        )
+        return cur.fetchall()
+
+    def posicao_ranking(self, usuario: str, max_tentativas: int) -> Dict[str, Optional[int]]:
+        """Posição (1 = primeiro) em cada ranking, contando quem vem antes.
+
+        Cada contagem é um intervalo dos índices dos agregados (mesma ordem
+        e desempate por `ordem` das consultas de ranking acima).
+        """
+        linha = self.conexao.execute(
+            "SELECT ordem, total, media, vitorias, melhor_pontuacao, menor_tentativas "
+            "FROM agregados WHERE usuario = ?",
+            (usuario,),
+        ).fetchone()
+        if linha is None:
+            return dict.fromkeys(
+                (
+                    "ranking_pontuacao_media",
+                    "ranking_vitorias",
+                    "ranking_melhor_pontuacao",
+                    "ranking_menor_tentativas",
+                )
+            )
+        ordem, total, media, vitorias, melhor, menor = linha
+
+        def contar(condicao: str, *parametros) -> int:
+            cur = self.conexao.execute(f"SELECT COUNT(*) FROM agregados WHERE {condicao}", parametros)
+            return cur.fetchone()[0]
+
+        pos_media = None
+        if total:
+            pos_media = 1 + contar(
+                "total > 0 AND (media > ? OR (media = ? AND ordem < ?))", media, media, ordem
+            )
+        # quem nunca venceu conta como max_tentativas (ver ranking_menor_tentativas)
+        valor = max_tentativas if menor is None else menor
+        antes = contar("menor_tentativas < ?", valor) + contar(
+            "menor_tentativas = ? AND ordem < ?", valor, ordem
+        )
+        if valor > max_tentativas:
+            antes += contar("menor_tentativas IS NULL")
+        elif valor == max_tentativas:
+            antes += contar("menor_tentativas IS NULL AND ordem < ?", ordem)
+        return {
+            "ranking_pontuacao_media": pos_media,
+            "ranking_vitorias": 1 + contar(
+                "vitorias > ? OR (vitorias = ? AND ordem < ?)", vitorias, vitorias, ordem
+            ),
+            "ranking_melhor_pontuacao": 1 + contar(
+                "melhor_pontuacao > ? OR (melhor_pontuacao = ? AND ordem < ?)", melhor, melhor, ordem
+            ),
+            "ranking_menor_tentativas": antes + 1,
+        }
+
+    # ---------------- importação ----------------
+
+    def importar(self, jogadores: Dict[str, Dict], partidas: Iterable[Dict]) -> Tuple[int, int]:
+        """Importa jogadores e partidas dos arquivos do jogo em uma transação.
+
+        Retorna (jogadores importados, partidas importadas); linhas já
+        existentes no banco são ignoradas e não entram na contagem.
+        """
+        with self.conexao:
+            cur = self.conexao.executemany(
+                "INSERT OR IGNORE INTO jogadores (usuario, nome, data_cadastro) VALUES (?, ?, ?)",
+                (
+                    (u, d.get("nome", u), d.get("data_cadastro", ""))
+                    for u, d in jogadores.items()
+                ),
+            )
+            n_jogadores = cur.rowcount
+            cur = self.conexao.executemany(
+                f"INSERT OR IGNORE INTO partidas ({_COLUNAS_PARTIDA}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        p.get("id"),
+                        p.get("jogador"),
+                        p.get("numero_secreto", 0),
+                        json.dumps(p.get("tentativas", [])),
+                        p.get("total_tentativas", 0),
+                        p.get("pontuacao", 0),
+                        p.get("resultado", "Derrota"),
+                        p.get("data", ""),
+                        p.get("config") or CONFIG_PADRAO,
+                    )
+                    for p in partidas
+                ),
+            )
+            n_partidas = cur.rowcount
+            self._recalcular_agregados()
+        return n_jogadores, n_partidas
+
+    def _recalcular_agregados(self) -> None:
+        """Recalcula a tabela agregados inteira a partir de partidas."""
+        self.conexao.execute("DELETE FROM agregados")
+        self.conexao.execute(
+            """
+            INSERT INTO agregados (
+                usuario, ordem, total, vitorias, soma_pontuacao,
+                soma_tentativas, melhor_pontuacao, menor_tentativas
+            )
+            SELECT j.usuario, j.ordem,
+                   COUNT(p.id),
+                   COALESCE(SUM(p.resultado = 'Vitória'), 0),
+                   COALESCE(SUM(p.pontuacao), 0),
+                   COALESCE(SUM(p.total_tentativas), 0),
+                   COALESCE(MAX(p.pontuacao), 0),
+                   MIN(CASE WHEN p.resultado = 'Vitória' THEN p.total_tentativas END)
+            FROM jogadores j
+            LEFT JOIN partidas p ON p.jogador = j.usuario
+            GROUP BY j.usuario
+            """
+        )
+        medias = [
+            (round(soma / total, 2), usuario)
+            for usuario, soma, total in self.conexao.execute(
+                "SELECT usuario, soma_pontuacao, total FROM agregados WHERE total > 0"
+            )
+        ]
+        self.conexao.executemany("UPDATE agregados SET media = ? WHERE usuario = ?", medias)
+        self._recalcular_agregados_por("agregados_dia", "data")
+        self._recalcular_agregados_por("agregados_config", "config")
+
+    def _recalcular_agregados_por(self, tabela: str, coluna: str) -> None:
+        """Recalcula agregados_dia (por data) ou agregados_config (por config)."""
+        self.conexao.execute(f"DELETE FROM {tabela}")
+        self.conexao.execute(
+            f"""
+            INSERT INTO {tabela}
+            SELECT {coluna}, jogador, COUNT(*), SUM(resultado = 'Vitória'), SUM(pontuacao),
+                   SUM(total_tentativas), MAX(pontuacao),
+                   MIN(CASE WHEN resultado = 'Vitória' THEN total_tentativas END)
+            FROM partidas
+            GROUP BY {coluna}, jogador
+            """
+        )
+
+    def repontuar(
+        self,
+        config: str,
+        pontos_vitoria: List[int],
+        inicio: Optional[str] = None,
+        fim: Optional[str] = None,
+        usuario: Optional[str] = None,
+    ) -> int:
+        """Marca partidas com `config` e recalcula a pontuação por tabela.
+
+        `pontos_vitoria[t]` é a pontuação de uma vitória em t tentativas
+        (derrota vale 0); deve cobrir o maior total_tentativas. Filtra por
+        período (datas ISO, inclusivo) e/ou jogador. Retorna quantas
+        partidas foram alteradas; os agregados são recalculados.
+        """
+        filtros = []
+        parametros: List = []
+        if inicio is not None:
+            filtros.append("data >= ?")
+            parametros.append(inicio)
+        if fim is not None:
+            filtros.append("data <= ?")
+            parametros.append(fim)
+        if usuario is not None:
+            filtros.append("jogador = ?")
+            parametros.append(usuario)
+        onde = ("WHERE " + " AND ".join(filtros)) if filtros else ""
+        with self.conexao:
+            self.conexao.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS pontos_vitoria "
+                "(tentativas INTEGER PRIMARY KEY, pontos INTEGER NOT NULL)"
+            )
+            self.conexao.execute("DELETE FROM pontos_vitoria")
+            self.conexao.executemany(
+                "INSERT INTO pontos_vitoria VALUES (?, ?)", enumerate(pontos_vitoria)
+            )
+            cur = self.conexao.execute(
+                f"""
+                UPDATE partidas SET
+                    config = ?,
+                    pontuacao = CASE WHEN resultado = 'Vitória' THEN (
+                        SELECT pontos FROM pontos_vitoria WHERE tentativas = total_tentativas
+                    ) ELSE 0 END
+                {onde}
+                """,
+                [config, *parametros],
+            )
+            alteradas = cur.rowcount
+            self._recalcular_agregados()
+            self._avancar_geracao()
+        return alteradas
+
+    def colunas_de_pontuacao(self) -> Iterator[Tuple[str, int, int]]:
+        """(config, total_tentativas, vitória 0/1) de cada partida, por id."""
+        return self.conexao.execute(
+            "SELECT config, total_tentativas, resultado = 'Vitória' FROM partidas ORDER BY id"
+        )
+
+    def repontuar_por_configuracao(self, pontos_vitoria: Dict[str, List[int]]) -> int:
+        """Recalcula a pontuação de todas as partidas pela tabela da sua configuração.
+
+        `pontos_vitoria[config][t]` é a pontuação de uma vitória em t
+        tentativas naquela configuração (derrota vale 0). Retorna quantas
+        partidas foram regravadas; os agregados são recalculados.
+        """
+        with self.conexao:
+            self.conexao.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS pontos_config (config TEXT NOT NULL, "
+                "tentativas INTEGER NOT NULL, pontos INTEGER NOT NULL, "
+                "PRIMARY KEY (config, tentativas))"
+            )
+            self.conexao.execute("DELETE FROM pontos_config")
+            self.conexao.executemany(
+                "INSERT INTO pontos_config VALUES (?, ?, ?)",
+                (
+                    (config, t, pontos)
+                    for config, tabela in pontos_vitoria.items()
+                    for t, pontos in enumerate(tabela)
+                ),
+            )
+            cur = self.conexao.execute(
+                """
+                UPDATE partidas SET
+                    pontuacao = CASE WHEN resultado = 'Vitória' THEN COALESCE((
+                        SELECT pontos FROM pontos_config c
+                        WHERE c.config = partidas.config AND c.tentativas = partidas.total_tentativas
+                    ), 0) ELSE 0 END
+                """
+            )
+            alteradas = cur.rowcount
+            self._recalcular_agregados()
+            self._avancar_geracao()
+        return alteradas
+
+
+def main() -> None:
+    """Importa dados/jogadores.txt e o histórico de partidas para o banco."""
+    import sys
+
+    import jogo_adivinhacao as jogo
+
+    if len(sys.argv) < 2 or sys.argv[1] != "importar":
+        print("Uso: python armazenamento_sqlite.py importar")
+        return
+
+    # lê os arquivos .txt/.jsonl, independente de JOGO_BACKEND
+    jogo._garantir_pastas()
+    jogo._carregar_dados_arquivo()
+    banco = BancoSQLite(jogo.ARQ_BANCO, jogo.DURABILIDADE)
+    n_jog, n_part = banco.importar(jogo.jogadores, jogo.partidas)
+    banco.fechar()
+    print(f"✅ Importados {n_jog} jogadores e {n_part} partidas para {jogo.ARQ_BANCO}")
+
+
+if __name__ == "__main__":
+    main()
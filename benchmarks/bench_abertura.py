@@ -0,0 +1,111 @@
+"""
+Benchmark de abertura do histórico por backend
+----------------------------------------------
+
+Gera dados sintéticos (gerar_dados.py) numa pasta temporária, faz a
+importação única de cada backend e então mede, num processo novo por
+backend, o tempo de `_carregar_arquivos` e a memória do processo: o pico
+de RSS e a memória privada (sem as páginas de arquivo mapeadas, que são
+page cache compartilhado). Também mede um histórico_partidas logo após
+abrir (primeira consulta, sem nada em cache).
+
+  arquivo       -> lê o log JSONL inteiro para a TabelaPartidas
+  particionado  -> percorre os segmentos para montar os contadores
+  mmap          -> lê só os cabeçalhos e agregados.bin
+  sqlite        -> abre o banco (nada na memória)
+
+Uso:
+  python benchmarks/bench_abertura.py --partidas 1000000 --jogadores 10000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+
+from comum import RAIZ, apontar_jogo_para
+from gerar_dados import gerar_dados
+
+BACKENDS = ("arquivo", "particionado", "mmap", "sqlite")
+
+# executado num interpretador novo: só a abertura entra na medida
+_MEDICAO = """
+import json, resource, sys, time
+def memoria_kib():
+    # VmHWM: pico do processo (ru_maxrss herda o pico do pai no Linux);
+    # RssAnon: memória privada, sem as páginas de arquivo (mmap/page cache)
+    campos = {{}}
+    try:
+        with open("/proc/self/status") as f:
+            for linha in f:
+                nome, _, valor = linha.partition(":")
+                if nome in ("VmHWM", "RssAnon"):
+                    campos[nome] = int(valor.split()[0])
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return campos.get("VmHWM", maxrss), campos.get("RssAnon", maxrss)
+sys.path.insert(0, {benchmarks!r})
+import comum
+jogo = comum.jogo
+inicio = time.perf_counter()
+comum.apontar_jogo_para({pasta!r}, {backend!r})
+abertura = time.perf_counter() - inicio
+inicio = time.perf_counter()
+jogo.historico_partidas("jogador0000000")
+historico = time.perf_counter() - inicio
+pico, privada = memoria_kib()
+print(json.dumps({{
+    "abertura_s": abertura,
+    "historico_s": historico,
+    "pico_kib": pico,
+    "privada_kib": privada,
+}}))
+"""
+
+
+def _medir(pasta: str, backend: str) -> Dict[str, float]:
+    codigo = _MEDICAO.format(
+        benchmarks=os.path.join(RAIZ, "benchmarks"), pasta=pasta, backend=backend
+    )
+    saida = subprocess.run(
+        [sys.executable, "-c", codigo], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(saida.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--partidas", type=int, default=200_000)
+    parser.add_argument("--jogadores", type=int, default=1_000)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        gerar_dados(pasta, args.partidas, args.jogadores, args.semente)
+        print(f"{args.partidas} partidas / {args.jogadores} jogadores\n")
+        print(f"{'backend':<13} | {'importação (s)':>14} | {'abertura (ms)':>13} | "
+              f"{'1º histórico (ms)':>17} | {'pico RSS (MiB)':>14} | {'privada (MiB)':>13}")
+        for backend in (b.strip() for b in args.backends.split(",") if b.strip()):
+            # importação única (conversão do log), fora da medida
+            inicio = time.perf_counter()
+            apontar_jogo_para(pasta, backend)
+            importacao = time.perf_counter() - inicio
+            medidas = [_medir(pasta, backend) for _ in range(args.repeticoes)]
+            melhor = min(medidas, key=lambda m: m["abertura_s"])
+            print(
+                f"{backend:<13} | {importacao:>14.2f} | {melhor['abertura_s'] * 1000:>13.1f} | "
+                f"{min(m['historico_s'] for m in medidas) * 1000:>17.2f} | "
+                f"{melhor['pico_kib'] / 1024:>14.1f} | {melhor['privada_kib'] / 1024:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark de durabilidade: gravação imediata x group commit
+-----------------------------------------------------------
+
+Várias threads registram partidas (e, de vez em quando, cadastram um
+jogador) e só seguem depois que o evento está gravado. Compara, para
+cada nível de durabilidade (ver persistencia.py):
+
+  - imediato: cada evento faz a sua própria gravação (com fsync)
+  - grupo: eventos que chegam durante uma gravação dividem a seguinte
+    (jogo_adivinhacao.ativar_confirmacao_em_grupo)
+
+Roda numa pasta temporária, sem tocar em dados/.
+
+Uso:
+  python benchmarks/bench_durabilidade.py --threads 16 --eventos 200 --janela 0.002
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from typing import Tuple
+
+from comum import apontar_jogo_para, jogo
+from persistencia import DURABILIDADES
+
+
+def _executar(threads: int, eventos: int, cadastro_a_cada: int, semente: int) -> float:
+    """Roda a carga e retorna os segundos gastos."""
+    trava = threading.Lock()  # o estado em memória do jogo não é thread-safe
+
+    def trabalhador(indice: int) -> None:
+        rng = random.Random(semente + indice)
+        for i in range(eventos):
+            with trava:
+                if i % cadastro_a_cada == 0:
+                    usuario = f"t{indice}_{i}"
+                    jogo.cadastrar_jogador(usuario, usuario)
+                partida = jogo.registrar_partida(
+                    f"t{indice}_0", rng.randint(1, 100), [rng.randint(1, 100)], rng.random() < 0.5,
+                    persistir=False,
+                )
+                lote = jogo.persistir_partidas([partida])
+            jogo.aguardar_gravacao(lote)  # só segue com o evento no disco
+
+    inicio = time.perf_counter()
+    grupo = [threading.Thread(target=trabalhador, args=(t,)) for t in range(threads)]
+    for t in grupo:
+        t.start()
+    for t in grupo:
+        t.join()
+    return time.perf_counter() - inicio
+
+
+def _medir(args, durabilidade: str, em_grupo: bool) -> Tuple[float, int]:
+    """Retorna (eventos por segundo, gravações feitas)."""
+    with tempfile.TemporaryDirectory() as pasta:
+        apontar_jogo_para(pasta, args.backend, durabilidade)
+        if em_grupo:
+            jogo.ativar_confirmacao_em_grupo(args.janela)
+            confirmacao = jogo._confirmacao
+        segundos = _executar(args.threads, args.eventos, args.cadastro_a_cada, args.semente)
+        if em_grupo:
+            jogo.desativar_confirmacao_em_grupo()
+            gravacoes = confirmacao.escritas
+        else:
+            cadastros = -(-args.eventos // args.cadastro_a_cada)  # teto
+            gravacoes = args.threads * (args.eventos + cadastros)
+
+        # tudo o que foi confirmado tem de estar no disco
+        apontar_jogo_para(pasta, args.backend, durabilidade)
+        esperado = args.threads * args.eventos
+        if jogo.contador_partidas - 1 != esperado:
+            raise SystemExit(f"Esperadas {esperado} partidas gravadas, há {jogo.contador_partidas - 1}")
+    eventos = args.threads * args.eventos
+    return eventos / segundos, gravacoes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--eventos", type=int, default=100, help="partidas por thread")
+    parser.add_argument("--cadastro-a-cada", type=int, default=20, help="um cadastro a cada N partidas")
+    parser.add_argument("--janela", type=float, default=0.0, help="janela extra do group commit (s)")
+    parser.add_argument("--backend", choices=("arquivo", "particionado"), default="arquivo")
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads x {args.eventos} partidas, backend {args.backend}\n")
+    print(f"{'durabilidade':<12} | {'modo':<9} | {'eventos/s':>10} | {'gravações':>9} | ganho")
+    for durabilidade in DURABILIDADES:
+        base = None
+        for em_grupo in (False, True):
+            taxa, gravacoes = _medir(args, durabilidade, em_grupo)
+            base = base or taxa
+            modo = "grupo" if em_grupo else "imediato"
+            print(f"{durabilidade:<12} | {modo:<9} | {taxa:>10.0f} | {gravacoes:>9} | {taxa / base:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark de inicialização (cold start) dos scripts
+---------------------------------------------------
+
+Importa cada módulo num interpretador novo com `python -X importtime` e
+compara o tempo cumulativo do import com um orçamento. Também confere que
+as bibliotecas pesadas (numpy, pandas, matplotlib, seaborn) não são
+carregadas só por importar o módulo. Sai com código 1 se algum módulo
+estourar o orçamento.
+
+O bytecode é compilado numa rodada de aquecimento (numa pasta temporária,
+via PYTHONPYCACHEPREFIX), então a medição não inclui a compilação.
+
+Uso:
+  python benchmarks/bench_inicializacao.py --repeticoes 7
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Set, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# módulo -> (orçamento do import em ms, módulos que não podem ser importados)
+ORCAMENTOS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "analise_dado": (60.0, ("numpy", "pandas", "matplotlib", "seaborn")),
+    "jogo_adivinhacao": (60.0, ("sqlite3", "numpy")),
+}
+
+
+def _ambiente(pasta_cache: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = pasta_cache
+    env["PYTHONPATH"] = RAIZ + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _importar(modulo: str, env: Dict[str, str], pasta: str) -> Tuple[float, float, Set[str]]:
+    """Importa `modulo` num processo novo.
+
+    Returns:
+        (import cumulativo em ms, tempo total do processo em ms, módulos importados)
+    """
+    inicio = time.perf_counter()
+    saida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=pasta,  # os scripts usam o diretório atual para dados/ e relatórios
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_ms = (time.perf_counter() - inicio) * 1000
+
+    cumulativo_ms = 0.0
+    importados: Set[str] = set()
+    for linha in saida.stderr.splitlines():
+        if not linha.startswith("import time:") or "imported package" in linha:
+            continue
+        _, cumulativo, nome = linha.split("|")
+        importados.add(nome.strip())
+        # o módulo medido é o único no nível mais externo (sem recuo)
+        if nome.strip() == modulo and not nome[1:].startswith(" "):
+            cumulativo_ms = int(cumulativo) / 1000
+    return cumulativo_ms, total_ms, importados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    falhas: List[str] = []
+    with tempfile.TemporaryDirectory() as pasta:
+        env = _ambiente(os.path.join(pasta, "pycache"))
+        vazio = [_importar("sys", env, pasta)[1] for _ in range(args.repeticoes)]
+        base_ms = statistics.median(vazio)
+        print(f"Interpretador vazio: {base_ms:.1f} ms\n")
+        print(f"{'módulo':<18} | {'import (ms)':>11} | {'orçamento':>9} | {'processo (ms)':>13} | pesados importados")
+
+        for modulo, (orcamento, proibidos) in ORCAMENTOS.items():
+            _importar(modulo, env, pasta)  # aquecimento: compila o bytecode
+            medidas = [_importar(modulo, env, pasta) for _ in range(args.repeticoes)]
+            import_ms = statistics.median(m[0] for m in medidas)
+            total_ms = statistics.median(m[1] for m in medidas)
+            pesados = sorted(p for p in proibidos if p in medidas[-1][2])
+
+            print(
+                f"{modulo:<18} | {import_ms:>11.1f} | {orcamento:>9.0f} | "
+                f"{total_ms:>13.1f} | {', '.join(pesados) or '-'}"
+            )
+            if import_ms > orcamento:
+                falhas.append(f"{modulo}: {import_ms:.1f} ms > {orcamento:.0f} ms")
+            if pesados:
+                falhas.append(f"{modulo}: importa {', '.join(pesados)} na inicialização")
+
+    if falhas:
+        raise SystemExit("\nOrçamento de inicialização estourado:\n  " + "\n  ".join(falhas))
+    print("\n✅ Inicialização dentro do orçamento.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark de memória: lista de dicts x tabela compacta de partidas
+------------------------------------------------------------------
+
+Gera um log sintético (pasta temporária) e mede com tracemalloc a memória
+para manter as partidas carregadas:
+
+  - layout antigo: uma lista de dicts (json.loads por linha) e o índice
+    por jogador com listas de referências às partidas
+  - layout atual: TabelaPartidas (colunas `array`) e o índice por jogador
+    com arrays de posições, como carregado por jogo_adivinhacao
+
+Uso:
+  python benchmarks/bench_memoria.py --partidas 1000000 --jogadores 1000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jogo_adivinhacao as jogo  # noqa: E402
+import simulacao  # noqa: E402
+
+
+def _gerar_log(caminho: str, partidas: int, jogadores: int, semente: int) -> None:
+    """Grava um log de partidas simuladas em vários jogadores e dias."""
+    rng = random.Random(semente)
+    estrategia = simulacao.Aleatoria(random.Random(semente))
+    with open(caminho, "w", encoding="utf-8") as f:
+        for p in simulacao.simular_partidas(partidas, estrategia, "", semente):
+            p["jogador"] = f"jogador{rng.randrange(jogadores)}"
+            p["data"] = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            f.write(json.dumps(p, ensure_ascii=False) + "\n")
+
+
+def _carregar_dicts(caminho: str) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+    """Layout antigo: lista de dicts + índice com listas de referências."""
+    with open(caminho, "rb") as f:
+        partidas = [json.loads(linha) for linha in f]
+    indice: Dict[str, List[Dict]] = {}
+    for p in partidas:
+        indice.setdefault(p["jogador"], []).append(p)
+    return partidas, indice
+
+
+def _carregar_compacto(caminho: str):
+    """Layout atual: como _carregar_dados_arquivo monta partidas e índice."""
+    jogo.partidas = jogo._ler_log_partidas(caminho)
+    jogo._reconstruir_indice()
+    return jogo.partidas, jogo.indice_jogadores
+
+
+def _medir(carregar: Callable, caminho: str) -> Tuple[int, float, object]:
+    """Retorna (bytes alocados que continuam vivos, segundos, resultado)."""
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = carregar(caminho)
+    segundos = time.perf_counter() - inicio
+    gc.collect()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return atual, segundos, resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--partidas", type=int, default=200_000)
+    parser.add_argument("--jogadores", type=int, default=1_000)
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        log = os.path.join(pasta, "partidas.jsonl")
+        _gerar_log(log, args.partidas, args.jogadores, args.semente)
+        print(f"Log sintético: {args.partidas} partidas, {os.path.getsize(log) / 2**20:.1f} MiB\n")
+
+        antigo, t_antigo, (dicts, _) = _medir(_carregar_dicts, log)
+        novo, t_novo, (tabela, _) = _medir(_carregar_compacto, log)
+
+        # as duas representações têm de ser equivalentes
+        for i in range(0, len(dicts), max(1, len(dicts) // 1000)):
+            if dict(tabela[i]) != dicts[i]:
+                raise SystemExit(f"Partida {i} difere entre os layouts!")
+
+    n = max(1, args.partidas)
+    print(f"{'layout':<26} | {'memória (MiB)':>13} | {'bytes/partida':>13} | {'carga (s)':>9}")
+    for nome, memoria, segundos in (
+        ("lista de dicts (antigo)", antigo, t_antigo),
+        ("TabelaPartidas (atual)", novo, t_novo),
+    ):
+        print(f"{nome:<26} | {memoria / 2**20:>13.1f} | {memoria / n:>13.0f} | {segundos:>9.2f}")
+    print("(tempos de carga medidos com o tracemalloc ativo)")
+    print(f"\nRedução de memória: {antigo / max(1, novo):.1f}x")
+    print(f"Buffers das colunas: {tabela.nbytes() / n:.0f} bytes/partida")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark de escalabilidade do modo paralelo (paralelo.py)
+----------------------------------------------------------
+
+Mede simulação e estatísticas de todos os jogadores com 1..N workers e
+mostra o ganho (speedup) em relação a 1 worker. As estatísticas usam um
+log sintético gerado numa pasta temporária, sem tocar em dados/.
+
+Uso:
+  python benchmarks/bench_paralelo.py --workers 8 --jogos 2000000 --partidas 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jogo_adivinhacao as jogo  # noqa: E402
+import paralelo  # noqa: E402
+import simulacao  # noqa: E402
+
+
+def _gerar_log(caminho: str, partidas: int, jogadores: int, semente: int) -> None:
+    """Grava um log de partidas simuladas distribuídas entre vários jogadores."""
+    rng = random.Random(semente)
+    estrategia = simulacao.BuscaBinaria()
+    with open(caminho, "w", encoding="utf-8") as f:
+        for p in simulacao.simular_partidas(partidas, estrategia, "", semente):
+            p["jogador"] = f"jogador{rng.randrange(jogadores)}"
+            f.write(json.dumps(p, ensure_ascii=False) + "\n")
+
+
+def _medir(executar) -> float:
+    inicio = time.perf_counter()
+    executar()
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--jogos", type=int, default=1_000_000, help="partidas simuladas")
+    parser.add_argument("--partidas", type=int, default=500_000, help="tamanho do log")
+    parser.add_argument("--jogadores", type=int, default=1_000)
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Núcleos disponíveis: {os.cpu_count()}")
+    with tempfile.TemporaryDirectory() as pasta:
+        log = os.path.join(pasta, "partidas.jsonl")
+        _gerar_log(log, args.partidas, args.jogadores, args.semente)
+        jogo.jogadores = {f"jogador{i}": {"nome": f"jogador{i}"} for i in range(args.jogadores)}
+        jogo.ARQ_PARTIDAS_LOG = log
+
+        print(f"\n{'workers':>7} | {'simulação (s)':>13} | {'speedup':>7} | {'estatísticas (s)':>16} | {'speedup':>7}")
+        base_sim = base_est = None
+        referencia = None
+        for w in range(1, args.workers + 1):
+            t_sim = _medir(lambda: paralelo.simular_paralelo(args.jogos, semente=args.semente, workers=w))
+            resultado = {}
+            t_est = _medir(lambda: resultado.update(paralelo.estatisticas_paralelas(w)))
+            if referencia is None:
+                referencia = resultado
+            elif resultado != referencia:
+                raise SystemExit(f"Resultado com {w} workers difere do sequencial!")
+            base_sim = base_sim or t_sim
+            base_est = base_est or t_est
+            print(
+                f"{w:>7} | {t_sim:>13.2f} | {base_sim / t_sim:>6.2f}x | "
+                f"{t_est:>16.2f} | {base_est / t_est:>6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Utilidades compartilhadas pelos benchmarks
+------------------------------------------
+
+Os caminhos de jogo_adivinhacao são calculados na importação a partir do
+diretório atual; os benchmarks usam `apontar_jogo_para` para trabalhar
+numa pasta temporária sem tocar em dados/.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from typing import Optional
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+import jogo_adivinhacao as jogo  # noqa: E402
+
+
+def apontar_jogo_para(
+    pasta: str, backend: str = "arquivo", durabilidade: Optional[str] = None
+) -> None:
+    """Redireciona os arquivos do jogo para `pasta` e recarrega o estado."""
+    jogo.BASE_DADOS = os.path.join(pasta, "dados")
+    jogo.BASE_RELATORIOS = os.path.join(pasta, "relatorios")
+    jogo.ARQ_JOGADORES = os.path.join(jogo.BASE_DADOS, "jogadores.txt")
+    jogo.ARQ_PARTIDAS = os.path.join(jogo.BASE_DADOS, "partidas.txt")
+    jogo.ARQ_PARTIDAS_LOG = os.path.join(jogo.BASE_DADOS, "partidas.jsonl")
+    jogo.ARQ_BANCO = os.path.join(jogo.BASE_DADOS, "jogo.db")
+    jogo.PASTA_PARTICOES = os.path.join(jogo.BASE_DADOS, "partidas")
+    jogo.PASTA_MMAP = os.path.join(jogo.BASE_DADOS, "mmap")
+    jogo.ARQ_TRAVA = os.path.join(jogo.BASE_DADOS, ".trava")
+    jogo.ARQ_SEQUENCIA = os.path.join(jogo.BASE_DADOS, ".sequencia")
+    jogo.ARQ_SNAPSHOT = os.path.join(jogo.BASE_DADOS, "visoes.snapshot")
+    jogo.BACKEND_ARMAZENAMENTO = backend
+    if durabilidade is not None:
+        jogo.DURABILIDADE = durabilidade
+    jogo._armazem = None
+    jogo._banco = None
+    jogo._carregar_arquivos()
@@ -0,0 +1,113 @@
+"""
+Gerador de dados sintéticos (reprodutível) para os benchmarks
+-------------------------------------------------------------
+
+Grava, numa pasta de destino, os mesmos arquivos que o jogo usa:
+
+  <destino>/dados/jogadores.txt    -> N jogadores (jogador0000000, ...)
+  <destino>/dados/partidas.jsonl   -> M partidas no formato do log
+
+Mesma semente => mesmos arquivos, byte a byte. As partidas seguem as
+regras atuais (intervalo, MAX_TENTATIVAS e calcular_pontuacao): cerca de
+75% de vitórias, com o acerto no último palpite, espalhadas por um ano.
+
+Uso:
+  python benchmarks/gerar_dados.py --partidas 1000000 --jogadores 10000 --destino /tmp/jogo
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from comum import jogo
+
+TAXA_VITORIA = 0.75
+DATA_INICIAL = date(2024, 1, 1)
+DIAS = 365
+
+
+def _usuario(indice: int) -> str:
+    return f"jogador{indice:07d}"
+
+
+def gerar_jogadores(caminho: str, jogadores: int) -> None:
+    cadastro = DATA_INICIAL.isoformat()
+    dados = {
+        _usuario(i): {"nome": f"Jogador {i}", "usuario": _usuario(i), "data_cadastro": cadastro}
+        for i in range(jogadores)
+    }
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+
+
+def gerar_partidas(caminho: str, partidas: int, jogadores: int, semente: int) -> None:
+    rng = random.Random(semente)
+    minimo, maximo, limite = jogo.MIN_NUMERO, jogo.MAX_NUMERO, jogo.MAX_TENTATIVAS
+    datas = [(DATA_INICIAL + timedelta(days=d)).isoformat() for d in range(DIAS)]
+    # encoder reaproveitado: mesma saída de json.dumps(p, ensure_ascii=False)
+    codificar = json.JSONEncoder(ensure_ascii=False).encode
+
+    with open(caminho, "w", encoding="utf-8") as f:
+        linhas = []
+        for pid in range(1, partidas + 1):
+            segredo = rng.randint(minimo, maximo)
+            vitoria = rng.random() < TAXA_VITORIA
+            total = rng.randint(1, limite) if vitoria else limite
+            tentativas = []
+            for _ in range(total - 1 if vitoria else total):
+                palpite = rng.randint(minimo, maximo)
+                if palpite == segredo:  # erro: nunca o número secreto
+                    palpite = palpite + 1 if palpite < maximo else minimo
+                tentativas.append(palpite)
+            if vitoria:
+                tentativas.append(segredo)
+            linhas.append(
+                codificar(
+                    {
+                        "id": pid,
+                        "jogador": _usuario(rng.randrange(jogadores)),
+                        "numero_secreto": segredo,
+                        "tentativas": tentativas,
+                        "total_tentativas": total,
+                        "pontuacao": jogo.calcular_pontuacao(total, vitoria),
+                        "resultado": "Vitória" if vitoria else "Derrota",
+                        "data": datas[rng.randrange(DIAS)],
+                    }
+                )
+            )
+            if len(linhas) >= 100_000:
+                f.write("\n".join(linhas) + "\n")
+                linhas = []
+        if linhas:
+            f.write("\n".join(linhas) + "\n")
+
+
+def gerar_dados(destino: str, partidas: int, jogadores: int, semente: int = 42) -> str:
+    """Gera jogadores e partidas em <destino>/dados. Retorna a pasta dados."""
+    pasta = os.path.join(destino, "dados")
+    os.makedirs(pasta, exist_ok=True)
+    gerar_jogadores(os.path.join(pasta, "jogadores.txt"), jogadores)
+    gerar_partidas(os.path.join(pasta, "partidas.jsonl"), partidas, jogadores, semente)
+    return pasta
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--partidas", type=int, default=100_000)
+    parser.add_argument("--jogadores", type=int, default=1_000)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--destino", required=True, help="pasta onde criar dados/")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    pasta = gerar_dados(args.destino, args.partidas, args.jogadores, args.semente)
+    print(f"✅ {args.partidas} partidas e {args.jogadores} jogadores em {pasta} "
+          f"({time.perf_counter() - inicio:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
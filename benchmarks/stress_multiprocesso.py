@@ -0,0 +1,143 @@
+"""
+Teste de estresse: vários processos gravando na mesma pasta de dados
+--------------------------------------------------------------------
+
+Sobe N processos (jogo_adivinhacao no backend arquivo) apontados para a
+mesma pasta temporária. Cada um cadastra seus jogadores e registra
+partidas, chamando atualizar_do_disco de tempos em tempos, como o menu
+faz antes de cada ação. No fim confere:
+
+  - o log tem todas as partidas de todos os processos, sem id repetido
+  - jogadores.txt tem todos os cadastros de todos os processos
+  - cada processo, após uma última atualização, vê o mesmo total
+
+Com --sem-travas os processos rodam fora do modo multiprocesso, para
+mostrar o que se perde sem ele (ids repetidos e cadastros sobrescritos).
+
+Uso:
+  python benchmarks/stress_multiprocesso.py --processos 8 --partidas 500
+  python benchmarks/stress_multiprocesso.py --grupo        (group commit)
+  python benchmarks/stress_multiprocesso.py --sem-travas
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List
+
+from comum import apontar_jogo_para, jogo
+
+
+def _trabalhador(
+    indice: int, pasta: str, args: argparse.Namespace, barreira, resultados
+) -> None:
+    jogo.MULTIPROCESSO = not args.sem_travas
+    jogo.DURABILIDADE = "nenhuma"  # o que interessa aqui é a concorrência
+    apontar_jogo_para(pasta)
+    if args.grupo:
+        jogo.ativar_confirmacao_em_grupo()
+    rng = random.Random(indice)
+    usuarios = [f"p{indice:02d}_{k:03d}" for k in range(args.cadastros)]
+
+    barreira.wait()
+    inicio = time.perf_counter()
+    erro = None
+    try:
+        for usuario in usuarios:
+            jogo.cadastrar_jogador(f"Jogador {usuario}", usuario)
+        for n in range(args.partidas):
+            segredo = rng.randint(jogo.MIN_NUMERO, jogo.MAX_NUMERO)
+            tentativas = [
+                rng.randint(jogo.MIN_NUMERO, jogo.MAX_NUMERO) for _ in range(rng.randint(1, 5))
+            ]
+            jogo.registrar_partida(rng.choice(usuarios), segredo, tentativas, tentativas[-1] == segredo)
+            if n % 10 == 0:
+                jogo.atualizar_do_disco()
+        jogo.desativar_confirmacao_em_grupo()
+    except Exception as e:  # sem travas, gravações concorrentes podem falhar
+        erro = repr(e)
+    segundos = time.perf_counter() - inicio
+
+    barreira.wait()  # todos terminaram de gravar
+    jogo.atualizar_do_disco()
+    resultados.put(
+        {
+            "indice": indice,
+            "segundos": segundos,
+            "erro": erro,
+            "partidas_vistas": len(jogo.partidas),
+            "jogadores_vistos": len(jogo.jogadores),
+        }
+    )
+
+
+def _conferir(pasta: str, args: argparse.Namespace, vistos: List[Dict]) -> List[str]:
+    """Retorna os problemas encontrados nos arquivos e nas visões dos processos."""
+    esperadas = args.processos * args.partidas
+    esperados = args.processos * args.cadastros
+    with open(os.path.join(pasta, "dados", "partidas.jsonl"), "rb") as f:
+        ids = [json.loads(linha)["id"] for linha in f]
+    with open(os.path.join(pasta, "dados", "jogadores.txt"), "r", encoding="utf-8") as f:
+        cadastrados = json.load(f)
+
+    problemas = []
+    if len(ids) != esperadas:
+        problemas.append(f"log com {len(ids)} partidas (esperadas {esperadas})")
+    repetidos = sum(n - 1 for n in Counter(ids).values() if n > 1)
+    if repetidos:
+        problemas.append(f"{repetidos} ids repetidos no log")
+    if len(cadastrados) != esperados:
+        problemas.append(f"jogadores.txt com {len(cadastrados)} cadastros (esperados {esperados})")
+    for visto in vistos:
+        if visto["erro"]:
+            problemas.append(f"processo {visto['indice']} falhou: {visto['erro']}")
+        if (visto["partidas_vistas"], visto["jogadores_vistos"]) != (esperadas, esperados):
+            problemas.append(
+                f"processo {visto['indice']} vê {visto['partidas_vistas']} partidas e "
+                f"{visto['jogadores_vistos']} jogadores"
+            )
+    return problemas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processos", type=int, default=8)
+    parser.add_argument("--partidas", type=int, default=300, help="partidas por processo")
+    parser.add_argument("--cadastros", type=int, default=20, help="jogadores por processo")
+    parser.add_argument("--grupo", action="store_true", help="liga o group commit nos processos")
+    parser.add_argument("--sem-travas", action="store_true", help="roda fora do modo multiprocesso")
+    args = parser.parse_args()
+
+    contexto = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as pasta:
+        barreira = contexto.Barrier(args.processos)
+        resultados = contexto.Queue()
+        processos = [
+            contexto.Process(target=_trabalhador, args=(i, pasta, args, barreira, resultados))
+            for i in range(args.processos)
+        ]
+        for processo in processos:
+            processo.start()
+        vistos = sorted((resultados.get() for _ in processos), key=lambda v: v["indice"])
+        for processo in processos:
+            processo.join()
+        problemas = _conferir(pasta, args, vistos)
+
+    total = args.processos * args.partidas
+    mais_lento = max(v["segundos"] for v in vistos)
+    modo = "sem travas" if args.sem_travas else "multiprocesso" + (" + group commit" if args.grupo else "")
+    print(f"{args.processos} processos x {args.partidas} partidas ({modo}): "
+          f"{total / mais_lento:.0f} partidas/s no total")
+    if problemas:
+        raise SystemExit("❌ Inconsistências:\n  " + "\n  ".join(problemas))
+    print("✅ Nenhuma partida ou cadastro perdido; ids únicos; todos os processos veem o mesmo estado.")
+
+
+if __name__ == "__main__":
+    main()
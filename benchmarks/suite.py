@@ -0,0 +1,217 @@
+"""
+Suíte de benchmarks dos caminhos quentes, com comparação a uma baseline
+-----------------------------------------------------------------------
+
+Para cada cenário gera dados sintéticos (gerar_dados.py, semente fixa)
+numa pasta temporária e mede:
+
+  - _carregar_arquivos e _salvar_partidas
+  - cada ranking_* e calcular_estatisticas_jogador / historico_partidas
+    (numa amostra fixa de jogadores; tempo por chamada)
+  - os rankings por janela (dia/semana/mês), com "hoje" fixado no último
+    dia dos dados gerados, e a reconstrução dos baldes diários
+  - o pipeline de analise_dado.py (processo novo): primeira execução
+    (sem snapshot nem gráficos) e execução seguinte (tudo em cache)
+
+Os resultados vão para benchmarks/resultados/ultimo.json e são comparados
+com benchmarks/baseline.json: uma medida (tempo mínimo) mais lenta que a
+baseline além da tolerância é uma regressão (código de saída 1).
+
+Uso:
+  python benchmarks/suite.py                                 (pequeno e medio)
+  python benchmarks/suite.py --cenarios grande --repeticoes 3
+  python benchmarks/suite.py --salvar-baseline               (grava a baseline)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from comum import RAIZ, apontar_jogo_para, jogo
+from gerar_dados import DATA_INICIAL, DIAS, gerar_dados
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+ARQ_BASELINE = os.path.join(PASTA, "baseline.json")
+ARQ_RESULTADO = os.path.join(PASTA, "resultados", "ultimo.json")
+
+# nome -> (partidas, jogadores)
+CENARIOS: Dict[str, Tuple[int, int]] = {
+    "pequeno": (1_000, 10),
+    "medio": (100_000, 1_000),
+    "grande": (1_000_000, 10_000),
+    "enorme": (10_000_000, 1_000_000),
+}
+
+AMOSTRA_JOGADORES = 100
+# diferenças abaixo disso (por chamada) são ruído, nunca regressão
+PISO_S = 0.0005
+
+
+def _cronometrar(funcao: Callable[[], object], repeticoes: int, por: int = 1) -> Dict[str, float]:
+    """Mediana e mínimo do tempo de uma chamada (estilo timeit.autorange)."""
+    temporizador = timeit.Timer(funcao)
+    vezes, _ = temporizador.autorange()
+    tempos = [t / (vezes * por) for t in temporizador.repeat(repeat=repeticoes, number=vezes)]
+    return {"mediana_s": statistics.median(tempos), "min_s": min(tempos)}
+
+
+def _medir_jogo(pasta: str, repeticoes: int, semente: int) -> Dict[str, Dict[str, float]]:
+    medidas: Dict[str, Dict[str, float]] = {}
+    # as janelas contam a partir de hoje: fixa hoje no fim dos dados gerados
+    ultimo_dia = DATA_INICIAL.toordinal() + DIAS - 1
+    jogo._hoje = lambda: ultimo_dia
+    apontar_jogo_para(pasta)
+    medidas["_carregar_arquivos"] = _cronometrar(jogo._carregar_arquivos, repeticoes)
+    medidas["_salvar_partidas"] = _cronometrar(jogo._salvar_partidas, repeticoes)
+
+    for nome in (
+        "ranking_pontuacao_media",
+        "ranking_vitorias",
+        "ranking_melhor_pontuacao",
+        "ranking_menor_tentativas",
+    ):
+        medidas[nome] = _cronometrar(getattr(jogo, nome), repeticoes)
+    for janela in jogo.JANELAS_RANKING:
+        medidas[f"rankings_janela_{janela}"] = _cronometrar(
+            lambda: jogo.rankings_janela(janela), repeticoes
+        )
+    medidas["_reconstruir_baldes"] = _cronometrar(jogo._reconstruir_baldes, repeticoes)
+
+    usuarios = sorted(jogo.jogadores)
+    amostra = random.Random(semente).sample(usuarios, min(AMOSTRA_JOGADORES, len(usuarios)))
+    for nome in ("calcular_estatisticas_jogador", "historico_partidas"):
+        funcao = getattr(jogo, nome)
+        medidas[nome] = _cronometrar(
+            lambda: [funcao(u) for u in amostra], repeticoes, por=len(amostra)
+        )
+    return medidas
+
+
+def _medir_analise(pasta: str, repeticoes: int) -> Dict[str, Dict[str, float]]:
+    """Pipeline de analise_dado.py num processo novo, com a pasta como cwd."""
+    env = dict(os.environ, MPLBACKEND="Agg", PYTHONPATH=RAIZ)
+
+    def executar() -> float:
+        inicio = timeit.default_timer()
+        subprocess.run(
+            [sys.executable, os.path.join(RAIZ, "analise_dado.py")],
+            cwd=pasta,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        return timeit.default_timer() - inicio
+
+    fria = executar()
+    quentes = [executar() for _ in range(repeticoes)]
+    return {
+        "analise_primeira_execucao": {"mediana_s": fria, "min_s": fria},
+        "analise_em_cache": {"mediana_s": statistics.median(quentes), "min_s": min(quentes)},
+    }
+
+
+def executar_cenario(
+    nome: str, partidas: int, jogadores: int, repeticoes: int, semente: int, analise: bool
+) -> Dict:
+    with tempfile.TemporaryDirectory() as pasta:
+        inicio = timeit.default_timer()
+        gerar_dados(pasta, partidas, jogadores, semente)
+        print(f"[{nome}] {partidas} partidas / {jogadores} jogadores gerados "
+              f"em {timeit.default_timer() - inicio:.1f}s", flush=True)
+        medidas = _medir_jogo(pasta, repeticoes, semente)
+        if analise:
+            medidas.update(_medir_analise(pasta, repeticoes))
+    return {"partidas": partidas, "jogadores": jogadores, "medidas": medidas}
+
+
+def comparar(resultado: Dict, baseline: Dict, tolerancia: float) -> List[str]:
+    """Imprime a comparação e retorna as regressões encontradas."""
+    regressoes: List[str] = []
+    print(f"\n{'cenário/medida':<46} | {'baseline (ms)':>13} | {'atual (ms)':>11} | variação")
+    for cenario, dados in resultado["cenarios"].items():
+        base = baseline.get("cenarios", {}).get(cenario)
+        if base is None or (base["partidas"], base["jogadores"]) != (dados["partidas"], dados["jogadores"]):
+            print(f"{cenario:<46} | {'-':>13} | {'-':>11} | sem baseline comparável")
+            continue
+        for medida, valores in dados["medidas"].items():
+            anterior = base["medidas"].get(medida)
+            if anterior is None:
+                continue
+            # o mínimo é o menos sensível a ruído da máquina
+            atual, antes = valores["min_s"], anterior["min_s"]
+            variacao = atual / antes - 1 if antes else 0.0
+            marca = ""
+            if atual > antes * (1 + tolerancia) and atual - antes > PISO_S:
+                marca = "  ⚠️ regressão"
+                regressoes.append(f"{cenario}/{medida}: {antes * 1000:.3f} -> {atual * 1000:.3f} ms")
+            print(
+                f"{cenario + '/' + medida:<46} | {antes * 1000:>13.3f} | {atual * 1000:>11.3f} | "
+                f"{variacao:+.0%}{marca}"
+            )
+    return regressoes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cenarios", default="pequeno,medio", help=f"entre {', '.join(CENARIOS)}")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--sem-analise", action="store_true", help="não mede analise_dado.py")
+    parser.add_argument("--saida", default=ARQ_RESULTADO)
+    parser.add_argument("--baseline", default=ARQ_BASELINE)
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="fração aceita acima da baseline")
+    parser.add_argument("--salvar-baseline", action="store_true", help="grava o resultado como baseline")
+    args = parser.parse_args()
+
+    nomes = [n.strip() for n in args.cenarios.split(",") if n.strip()]
+    desconhecidos = [n for n in nomes if n not in CENARIOS]
+    if desconhecidos:
+        parser.error(f"cenários desconhecidos: {', '.join(desconhecidos)}")
+
+    resultado = {
+        "versao": 1,
+        "gerado_em": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semente": args.semente,
+        "cenarios": {},
+    }
+    for nome in nomes:
+        partidas, jogadores = CENARIOS[nome]
+        resultado["cenarios"][nome] = executar_cenario(
+            nome, partidas, jogadores, args.repeticoes, args.semente, not args.sem_analise
+        )
+
+    destinos = [args.saida] + ([args.baseline] if args.salvar_baseline else [])
+    for destino in destinos:
+        os.makedirs(os.path.dirname(os.path.abspath(destino)), exist_ok=True)
+        with open(destino, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados: {args.saida}")
+    if args.salvar_baseline:
+        print(f"Baseline atualizada: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("Sem baseline para comparar (use --salvar-baseline).")
+        return
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressoes = comparar(resultado, baseline, args.tolerancia)
+    if regressoes:
+        raise SystemExit("\nRegressões de desempenho:\n  " + "\n  ".join(regressoes))
+    print("\n✅ Nenhuma regressão acima da tolerância.")
+
+
+if __name__ == "__main__":
+    main()
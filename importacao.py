@@ -0,0 +1,480 @@
+"""
+Importação e exportação em massa (CSV / JSON Lines)
+---------------------------------------------------
+
+Importa jogadores e partidas de arquivos .csv ou .jsonl sem carregá-los
+inteiros: os registros são lidos em lotes, cada lote é validado num pool
+de processos (paralelo._executar_em_fluxo) e gravado com uma única
+escrita/transação do backend configurado (JOGO_BACKEND).
+
+Validação (nos workers, sem acesso ao cadastro):
+  jogadores -> usuário e nome não vazios (sem os espaços das pontas, a
+               mesma regra de cadastrar_jogador) e data_cadastro ISO
+               (padrão: hoje)
+  partidas  -> configuração legível (padrão: CONFIG_PADRAO), número
+               secreto e tentativas no intervalo dela, como em
+               validar_numero; total_tentativas = len(tentativas), até o
+               máximo da configuração; nada depois do acerto; resultado e
+               pontuação iguais aos que registrar_partida calcularia
+
+Campos ausentes (total_tentativas, pontuacao, resultado, data) são
+calculados; presentes, precisam bater. No processo principal, que conhece
+o cadastro, são conferidos usuário repetido (jogadores) e jogador
+inexistente (partidas). As partidas recebem ids novos, como em
+registrar_partida: o id do arquivo é ignorado.
+
+Registros rejeitados não interrompem a importação: entram no resumo
+(linha e motivo) e, com --rejeitados, num arquivo JSONL.
+
+A exportação percorre o backend registro a registro (cursor no SQLite,
+blocos no mmap, segmentos no particionado) e grava à medida que lê, sem
+montar o histórico inteiro na memória.
+
+No CSV as colunas são as chaves do JSON; `tentativas` vai separada por
+";" (ex.: 50;25;37).
+
+Exemplos:
+  python importacao.py importar jogadores novos.csv
+  python importacao.py importar partidas historico.jsonl --workers 4 --rejeitados rej.jsonl
+  python importacao.py exportar partidas saida.csv
+  python importacao.py exportar jogadores saida.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import time
+from datetime import date
+from itertools import islice
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import jogo_adivinhacao as jogo
+import paralelo
+from armazenamento_compacto import (
+    CHAVES_PARTIDA,
+    CONFIG_PADRAO,
+    DERROTA,
+    VITORIA,
+    ler_configuracao,
+    ordinal_iso,
+)
+from persistencia import gravar_atomico
+
+TIPOS = ("jogadores", "partidas")
+FORMATOS = ("csv", "jsonl")
+CHAVES_JOGADOR = ("usuario", "nome", "data_cadastro")
+
+LOTE_PADRAO = 5_000  # registros por lote (= por gravação)
+MAX_ERROS_RESUMO = 20  # rejeições guardadas no resumo (as demais só contam)
+
+# (linha no arquivo, registro lido: dict do CSV ou texto da linha JSONL)
+Registro = Tuple[int, Union[Dict, str]]
+
+
+def _formato(caminho: str, formato: Optional[str]) -> str:
+    """Formato explícito ou deduzido da extensão do arquivo."""
+    if formato is None:
+        extensao = os.path.splitext(caminho)[1].lower()
+        formato = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}.get(extensao)
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato não reconhecido para {caminho} (use --formato csv ou jsonl).")
+    return formato
+
+
+# ============================================
+# LEITURA EM LOTES
+# ============================================
+
+def ler_registros(caminho: str, formato: Optional[str] = None) -> Iterator[Registro]:
+    """Registros do arquivo, um a um, com o número da linha.
+
+    Linhas JSONL saem como texto (o json.loads fica para os workers);
+    linhas CSV saem como dict coluna -> valor.
+    """
+    formato = _formato(caminho, formato)
+    if formato == "csv":
+        with open(caminho, "r", encoding="utf-8-sig", newline="") as f:
+            leitor = csv.DictReader(f)
+            for registro in leitor:
+                yield leitor.line_num, registro
+    else:
+        with open(caminho, "r", encoding="utf-8") as f:
+            for numero, linha in enumerate(f, 1):
+                if linha.strip():
+                    yield numero, linha
+
+
+def em_lotes(registros: Iterable, tamanho: int) -> Iterator[List]:
+    """Agrupa um iterável em listas de até `tamanho` itens, sob demanda."""
+    registros = iter(registros)
+    while True:
+        lote = list(islice(registros, tamanho))
+        if not lote:
+            return
+        yield lote
+
+
+# ============================================
+# VALIDAÇÃO (executada nos workers)
+# ============================================
+
+def _texto(registro: Dict, chave: str) -> str:
+    valor = registro.get(chave)
+    return valor.strip() if isinstance(valor, str) else ""
+
+
+def _inteiro(valor, campo: str) -> int:
+    """Inteiro de um valor JSON ou de uma célula CSV; ValueError se não for."""
+    if type(valor) is int:
+        return valor
+    if isinstance(valor, bool) or not isinstance(valor, (int, str)):
+        raise ValueError(f"{campo} inválido: {valor!r}")
+    try:
+        return int(valor)
+    except ValueError:
+        raise ValueError(f"{campo} inválido: {valor!r}") from None
+
+
+def _vazio(valor) -> bool:
+    return valor is None or valor == ""
+
+
+def _data(registro: Dict, chave: str) -> str:
+    """Data ISO do registro (hoje, se ausente); ValueError se malformada."""
+    valor = registro.get(chave)
+    if _vazio(valor):
+        return date.today().isoformat()
+    if ordinal_iso(valor) is None:
+        raise ValueError(f"{chave} inválida: {valor!r} (use AAAA-MM-DD)")
+    return valor
+
+
+def _tentativas(valor) -> List[int]:
+    """Lista de tentativas (lista JSON ou texto "a;b;c" do CSV)."""
+    if isinstance(valor, str):
+        valor = [t for t in valor.split(";") if t.strip()]
+    if not isinstance(valor, list):
+        raise ValueError(f"tentativas inválidas: {valor!r}")
+    return [_inteiro(t, "tentativa") for t in valor]
+
+
+def validar_jogador(registro: Dict) -> Dict:
+    """Jogador pronto para cadastrar_jogadores; ValueError se inválido."""
+    usuario = _texto(registro, "usuario")
+    if not usuario:
+        raise ValueError("usuário é obrigatório")
+    nome = _texto(registro, "nome")
+    if not nome:
+        raise ValueError("nome é obrigatório")
+    return {"nome": nome, "usuario": usuario, "data_cadastro": _data(registro, "data_cadastro")}
+
+
+def validar_partida(registro: Dict) -> Dict:
+    """Partida normalizada (sem id) a partir de um registro lido.
+
+    Levanta ValueError com o motivo se o registro é inválido ou
+    incoerente (ver o docstring do módulo).
+    """
+    jogador = _texto(registro, "jogador")
+    if not jogador:
+        raise ValueError("jogador é obrigatório")
+    config = _texto(registro, "config") or CONFIG_PADRAO
+    minimo, maximo, max_tentativas = ler_configuracao(config)
+
+    numero_secreto = _inteiro(registro.get("numero_secreto"), "numero_secreto")
+    if not minimo <= numero_secreto <= maximo:
+        raise ValueError(f"numero_secreto {numero_secreto} fora de {minimo}..{maximo}")
+    tentativas = _tentativas(registro.get("tentativas", []))
+    fora = [t for t in tentativas if not minimo <= t <= maximo]
+    if fora:
+        raise ValueError(f"tentativa {fora[0]} fora de {minimo}..{maximo}")
+    total = len(tentativas)
+    if total > max_tentativas:
+        raise ValueError(f"{total} tentativas (máximo {max_tentativas} em {config})")
+    if numero_secreto in tentativas[:-1]:
+        raise ValueError("há tentativas depois do acerto")
+    vitoria = bool(tentativas) and tentativas[-1] == numero_secreto
+
+    informado = registro.get("total_tentativas")
+    if not _vazio(informado) and _inteiro(informado, "total_tentativas") != total:
+        raise ValueError(f"total_tentativas {informado} != {total} tentativas")
+    resultado = VITORIA if vitoria else DERROTA
+    informado = registro.get("resultado")
+    if not _vazio(informado) and informado != resultado:
+        raise ValueError(f"resultado {informado!r} incoerente com as tentativas ({resultado})")
+    pontuacao = jogo.calcular_pontuacao(total, vitoria, config)
+    informado = registro.get("pontuacao")
+    if not _vazio(informado) and _inteiro(informado, "pontuacao") != pontuacao:
+        raise ValueError(f"pontuacao {informado} != {pontuacao} calculada para {config}")
+
+    return {
+        "jogador": jogador,
+        "numero_secreto": numero_secreto,
+        "tentativas": tentativas,
+        "total_tentativas": total,
+        "pontuacao": pontuacao,
+        "resultado": resultado,
+        "data": _data(registro, "data"),
+        "config": config,
+    }
+
+
+_VALIDADORES = {"jogadores": validar_jogador, "partidas": validar_partida}
+
+
+def _validar_lote(
+    tipo: str, lote: List[Registro], config: Dict[str, int]
+) -> List[Tuple[int, Union[Dict, str], Optional[str]]]:
+    """Worker: (linha, registro, motivo) de cada registro do lote.
+
+    Sem motivo (None), o registro é o validado; com motivo, é o original
+    (para o arquivo de rejeitados).
+    """
+    paralelo._aplicar_config(config)  # pontuação com a mesma base do processo principal
+    validar = _VALIDADORES[tipo]
+    resultado = []
+    for linha, original in lote:
+        try:
+            registro = json.loads(original) if isinstance(original, str) else original
+            if not isinstance(registro, dict):
+                raise ValueError("registro não é um objeto JSON")
+            resultado.append((linha, validar(registro), None))
+        except ValueError as e:  # json.JSONDecodeError também
+            resultado.append((linha, original, str(e)))
+    return resultado
+
+
+# ============================================
+# IMPORTAÇÃO
+# ============================================
+
+def _jogadores_novos(validos: List[Tuple[int, Dict]], rejeitar) -> List[Dict]:
+    """Descarta (rejeitando) usuários já cadastrados ou repetidos no lote."""
+    novos: Dict[str, Dict] = {}
+    for linha, jogador in validos:
+        usuario = jogador["usuario"]
+        if usuario in novos or jogo.login_jogador(usuario) is not None:
+            rejeitar(linha, f"usuário {usuario!r} já cadastrado", jogador)
+        else:
+            novos[usuario] = jogador
+    return list(novos.values())
+
+
+def _registrar_partidas(
+    validos: List[Tuple[int, Dict]], rejeitar, conhecidos: set
+) -> List[Dict]:
+    """Registra (sem gravar) as partidas de jogadores cadastrados."""
+    lote = []
+    for linha, p in validos:
+        usuario = p["jogador"]
+        if usuario not in conhecidos:
+            if jogo.login_jogador(usuario) is None:
+                rejeitar(linha, f"jogador {usuario!r} não cadastrado", p)
+                continue
+            conhecidos.add(usuario)
+        lote.append(
+            jogo.registrar_partida(
+                usuario,
+                p["numero_secreto"],
+                p["tentativas"],
+                p["resultado"] == VITORIA,
+                data=p["data"],
+                persistir=False,
+                config=p["config"],
+            )
+        )
+    return lote
+
+
+def importar(
+    tipo: str,
+    caminho: str,
+    formato: Optional[str] = None,
+    lote: int = LOTE_PADRAO,
+    workers: int = 1,
+    rejeitados: Optional[str] = None,
+) -> Dict:
+    """Importa jogadores ou partidas de um arquivo CSV/JSONL, em lotes.
+
+    Cada lote é validado nos workers e gravado numa única escrita (uma
+    transação no SQLite). Com o group commit ativo, espera a gravação de
+    cada lote antes de seguir.
+
+    Args:
+        tipo: "jogadores" ou "partidas"
+        caminho: arquivo de entrada
+        formato: "csv" ou "jsonl" (padrão: pela extensão)
+        lote: registros por lote
+        workers: processos de validação (1 = no próprio processo)
+        rejeitados: arquivo JSONL para os registros rejeitados
+
+    Returns:
+        dict: lidos, importados, rejeitados, lotes e `erros` (as primeiras
+        MAX_ERROS_RESUMO rejeições, como (linha, motivo))
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo desconhecido: {tipo} (use {', '.join(TIPOS)})")
+    resumo: Dict = {"lidos": 0, "importados": 0, "rejeitados": 0, "lotes": 0, "erros": []}
+    saida_rejeitados: Optional[IO] = None
+
+    def rejeitar(linha: int, motivo: str, registro: Union[Dict, str]) -> None:
+        resumo["rejeitados"] += 1
+        if len(resumo["erros"]) < MAX_ERROS_RESUMO:
+            resumo["erros"].append((linha, motivo))
+        if saida_rejeitados is not None:
+            if isinstance(registro, str):
+                registro = registro.rstrip("\n")
+            saida_rejeitados.write(
+                json.dumps({"linha": linha, "motivo": motivo, "registro": registro}, ensure_ascii=False)
+                + "\n"
+            )
+
+    lotes = em_lotes(ler_registros(caminho, formato), lote)
+    config = paralelo._config_jogo()
+    conhecidos: set = set()  # jogadores já conferidos no cadastro
+    if rejeitados is not None:
+        saida_rejeitados = open(rejeitados, "w", encoding="utf-8")
+    try:
+        validados = paralelo._executar_em_fluxo(
+            _validar_lote, ((tipo, l, config) for l in lotes), workers
+        )
+        for resultado in validados:
+            jogo.atualizar_do_disco()  # cadastros/partidas de outros processos
+            validos = []
+            for linha, registro, motivo in resultado:
+                if motivo is None:
+                    validos.append((linha, registro))
+                else:
+                    rejeitar(linha, motivo, registro)
+            if tipo == "jogadores":
+                novos = _jogadores_novos(validos, rejeitar)
+                jogo.cadastrar_jogadores(novos)
+                jogo.aguardar_gravacao()
+            else:
+                novos = _registrar_partidas(validos, rejeitar, conhecidos)
+                jogo.aguardar_gravacao(jogo.persistir_partidas(novos))
+            resumo["lidos"] += len(resultado)
+            resumo["importados"] += len(novos)
+            resumo["lotes"] += 1
+    finally:
+        if saida_rejeitados is not None:
+            saida_rejeitados.close()
+    return resumo
+
+
+# ============================================
+# EXPORTAÇÃO
+# ============================================
+
+def iterar_jogadores() -> Iterator[Dict]:
+    """Jogadores do backend configurado, na ordem de cadastro."""
+    if jogo._banco is not None:
+        yield from jogo._banco.iterar_jogadores()
+    else:
+        yield from list(jogo.jogadores.values())  # cópia rasa: o dict pode mudar
+
+
+def iterar_partidas() -> Iterator[Dict]:
+    """Partidas do backend configurado, uma a uma, na ordem gravada."""
+    if jogo._banco is not None:
+        yield from jogo._banco.iterar_partidas()
+    elif jogo._armazem is not None:
+        yield from jogo._armazem.iterar()
+    else:
+        # as visões são convertidas uma a uma (a tabela já está na memória)
+        for posicao in range(len(jogo.partidas)):
+            yield dict(jogo.partidas[posicao])
+
+
+def _linha_csv(registro: Dict, chaves: Tuple[str, ...]) -> List:
+    linha = [registro.get(chave, "") for chave in chaves]
+    if "tentativas" in chaves:
+        i = chaves.index("tentativas")
+        linha[i] = ";".join(map(str, linha[i]))
+    return linha
+
+
+def exportar(tipo: str, caminho: str, formato: Optional[str] = None) -> int:
+    """Exporta jogadores ou partidas para CSV/JSONL, em fluxo.
+
+    O arquivo é escrito ao lado e trocado no fim (gravar_atomico): uma
+    exportação interrompida não deixa um arquivo pela metade.
+
+    Returns:
+        int: registros exportados
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo desconhecido: {tipo} (use {', '.join(TIPOS)})")
+    formato = _formato(caminho, formato)
+    registros = iterar_jogadores() if tipo == "jogadores" else iterar_partidas()
+    chaves = CHAVES_JOGADOR if tipo == "jogadores" else CHAVES_PARTIDA
+    total = 0
+
+    def escrever(f: IO) -> None:
+        nonlocal total
+        if formato == "csv":
+            escritor = csv.writer(f, lineterminator="\n")
+            escritor.writerow(chaves)
+            for registro in registros:
+                escritor.writerow(_linha_csv(registro, chaves))
+                total += 1
+        else:
+            for bloco in em_lotes(registros, 10_000):
+                f.write(
+                    "".join(
+                        json.dumps({c: r.get(c) for c in chaves}, ensure_ascii=False) + "\n"
+                        for r in bloco
+                    )
+                )
+                total += len(bloco)
+
+    gravar_atomico(caminho, escrever, jogo.DURABILIDADE)
+    return total
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Importação e exportação em massa (CSV/JSONL)")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_imp = sub.add_parser("importar", help="importa jogadores ou partidas de um arquivo")
+    p_imp.add_argument("tipo", choices=TIPOS)
+    p_imp.add_argument("arquivo")
+    p_imp.add_argument("--formato", choices=FORMATOS, default=None)
+    p_imp.add_argument("--lote", type=int, default=LOTE_PADRAO, help="registros por gravação")
+    p_imp.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    p_imp.add_argument("--rejeitados", default=None, help="arquivo JSONL para os rejeitados")
+
+    p_exp = sub.add_parser("exportar", help="exporta jogadores ou partidas para um arquivo")
+    p_exp.add_argument("tipo", choices=TIPOS)
+    p_exp.add_argument("arquivo")
+    p_exp.add_argument("--formato", choices=FORMATOS, default=None)
+
+    args = parser.parse_args(argv)
+    jogo._carregar_arquivos()
+    inicio = time.perf_counter()
+
+    if args.comando == "importar":
+        resumo = importar(
+            args.tipo, args.arquivo, args.formato, args.lote, args.workers, args.rejeitados
+        )
+        segundos = time.perf_counter() - inicio
+        print(
+            f"\n📥 {args.tipo}: {resumo['importados']} de {resumo['lidos']} registros importados "
+            f"em {resumo['lotes']} lote(s) | {args.workers} worker(s) | {segundos:.2f}s"
+        )
+        if resumo["rejeitados"]:
+            print(f"⚠️  {resumo['rejeitados']} rejeitados:")
+            for linha, motivo in resumo["erros"]:
+                print(f"  linha {linha}: {motivo}")
+            if resumo["rejeitados"] > len(resumo["erros"]):
+                print(f"  ... e mais {resumo['rejeitados'] - len(resumo['erros'])}")
+    else:
+        total = exportar(args.tipo, args.arquivo, args.formato)
+        segundos = time.perf_counter() - inicio
+        print(f"\n📤 {args.tipo}: {total} registros exportados para {args.arquivo} em {segundos:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
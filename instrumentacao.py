@@ -0,0 +1,369 @@
+"""
+Instrumentação (tempos, contadores e perfis) do jogo e dos relatórios
+---------------------------------------------------------------------
+
+Desligada por padrão e sem custo nenhum: as funções dos pontos quentes
+só são trocadas por versões medidas quando `ativar()` é chamado. Ativa,
+coleta por função chamadas, tempo total/médio/p99 e, nas funções de
+gravação (persistencia.py e a escrita do backend mmap), os bytes
+gravados. Os backends são importados só ao carregar os dados; o jogo chama
+`instrumentar_importados()` depois disso para medi-los também.
+
+Com um perfil escolhido, cada ação do menu também é capturada:
+  cprofile    -> funções com maior tempo acumulado na ação
+  tracemalloc -> pico de memória e linhas que mais alocaram na ação
+
+Ao sair, tudo vai para relatorios/metricas_AAAAMMDD_HHMMSS.json.
+
+Ativação:
+  JOGO_METRICAS=1 python jogo_adivinhacao.py          (ou --metricas)
+  JOGO_PERFIL=cprofile python jogo_adivinhacao.py     (ou --perfil cprofile)
+  python analise_dado.py --metricas
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import random
+import sys
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+PERFIS = ("cprofile", "tracemalloc")
+
+# módulo -> funções medidas (só módulos já importados são instrumentados);
+# "Classe.metodo" troca o método na classe
+PONTOS_QUENTES: Dict[str, Tuple[str, ...]] = {
+    "jogo_adivinhacao": (
+        "_carregar_arquivos",
+        "_salvar_jogadores",
+        "_salvar_partidas",
+        "_anexar_partidas",
+        "persistir_partidas",
+        "registrar_partida",
+        "registrar_partidas",
+        "_reconstruir_indice",
+        "_reconstruir_placares",
+        "salvar_snapshot",
+        "_restaurar_snapshot",
+        "rankings_gerais",
+        "rankings_janela",
+        "rankings_configuracao",
+        "_reconstruir_baldes",
+        "historico_partidas",
+        "exibir_ranking",
+        "exibir_estatisticas_jogador",
+        "regenerar_relatorios_jogadores",
+    ),
+    "analise_dado": (
+        "atualizar_snapshot",
+        "carregar_snapshot",
+        "carregar_partidas_limpas",
+        "estatisticas_por_jogador",
+        "agregar_blocos",
+        "renderizar_graficos",
+        "analise_em_memoria",
+        "analise_em_streaming",
+    ),
+    "armazenamento_sqlite": (
+        "BancoSQLite.inserir_partidas",
+        "BancoSQLite.cadastrar_jogador",
+        "BancoSQLite.cadastrar_jogadores",
+        "BancoSQLite.importar",
+    ),
+    "armazenamento_particionado": (
+        "ArmazemParticionado.anexar",
+        "ArmazemParticionado.importar",
+    ),
+    "armazenamento_mmap": (
+        "ArmazemMmap.anexar",
+        "ArmazemMmap.importar",
+    ),
+}
+
+# funções de gravação -> como contar os bytes gravados por chamada
+_BYTES_GRAVADOS: Dict[str, Callable] = {
+    "gravar_atomico": lambda args, kwargs: os.path.getsize(args[0]),
+    "anexar_duravel": lambda args, kwargs: len(args[1].encode("utf-8")),
+}
+
+# gravações próprias de um backend (não passam por persistencia)
+_BYTES_GRAVADOS_BACKEND: Dict[str, Dict[str, Callable]] = {
+    "armazenamento_mmap": {"ArmazemMmap._escrever": lambda args, kwargs: len(args[2])},
+}
+
+MODULOS_COM_GRAVACAO = (
+    "persistencia",
+    "jogo_adivinhacao",
+    "armazenamento_particionado",
+    "armazenamento_mmap",
+)
+
+# latências guardadas por função (amostragem de reservatório acima disso)
+LIMITE_AMOSTRAS = 10_000
+
+
+class Medidor:
+    """Chamadas, tempos e bytes gravados de uma função."""
+
+    __slots__ = ("nome", "chamadas", "total", "amostras", "bytes", "_rng")
+
+    def __init__(self, nome: str) -> None:
+        self.nome = nome
+        self.chamadas = 0
+        self.total = 0.0
+        self.amostras = array("d")
+        self.bytes = 0
+        self._rng = random.Random(0)
+
+    def registrar(self, segundos: float) -> None:
+        self.chamadas += 1
+        self.total += segundos
+        if len(self.amostras) < LIMITE_AMOSTRAS:
+            self.amostras.append(segundos)
+        else:
+            posicao = self._rng.randrange(self.chamadas)
+            if posicao < LIMITE_AMOSTRAS:
+                self.amostras[posicao] = segundos
+
+    def resumo(self) -> Dict[str, float]:
+        ordenadas = sorted(self.amostras)
+        p99 = ordenadas[min(len(ordenadas) - 1, int(0.99 * len(ordenadas)))] if ordenadas else 0.0
+        resumo = {
+            "chamadas": self.chamadas,
+            "total_ms": round(self.total * 1000, 3),
+            "media_ms": round(self.total * 1000 / self.chamadas, 4) if self.chamadas else 0.0,
+            "p99_ms": round(p99 * 1000, 4),
+        }
+        if self.bytes:
+            resumo["bytes_gravados"] = self.bytes
+        return resumo
+
+
+_ativa = False
+_perfil: Optional[str] = None
+_pasta = os.path.join(os.getcwd(), "relatorios")
+_medidores: Dict[str, Medidor] = {}
+_contadores: Dict[str, int] = {}
+_perfis: List[Dict] = []
+_originais: List[Tuple[object, str, Callable]] = []
+_instrumentados: set = set()  # módulos já trocados desde o último ativar()
+
+
+def ativa() -> bool:
+    return _ativa
+
+
+# ============================================
+# ATIVAÇÃO
+# ============================================
+
+def _medir_funcao(nome: str, funcao: Callable, contar_bytes: Optional[Callable] = None) -> Callable:
+    medidor = _medidores.setdefault(nome, Medidor(nome))
+    relogio = time.perf_counter
+
+    @functools.wraps(funcao)
+    def medida(*args, **kwargs):
+        inicio = relogio()
+        try:
+            resultado = funcao(*args, **kwargs)
+        finally:
+            medidor.registrar(relogio() - inicio)
+        if contar_bytes is not None:
+            medidor.bytes += contar_bytes(args, kwargs)
+        return resultado
+
+    return medida
+
+
+def _modulo(nome: str):
+    """Módulo já importado, inclusive o script em execução (__main__)."""
+    modulo = sys.modules.get(nome)
+    if modulo is None:
+        principal = sys.modules.get("__main__")
+        arquivo = getattr(principal, "__file__", None) or ""
+        if os.path.splitext(os.path.basename(arquivo))[0] == nome:
+            modulo = principal
+    return modulo
+
+
+def _trocar(modulo, atributo: str, nome: str, contar_bytes: Optional[Callable] = None) -> None:
+    """Troca `modulo.atributo` (ou `modulo.Classe.metodo`) pela versão medida."""
+    alvo = modulo
+    if "." in atributo:
+        classe, atributo = atributo.split(".", 1)
+        alvo = getattr(modulo, classe, None)
+    bruto = vars(alvo).get(atributo) if alvo is not None else None
+    if bruto is None:
+        return
+    _originais.append((alvo, atributo, bruto))
+    if isinstance(bruto, staticmethod):
+        setattr(alvo, atributo, staticmethod(_medir_funcao(nome, bruto.__func__, contar_bytes)))
+    else:
+        setattr(alvo, atributo, _medir_funcao(nome, bruto, contar_bytes))
+
+
+def _instrumentar_importados() -> None:
+    for nome_modulo, funcoes in PONTOS_QUENTES.items():
+        modulo = _modulo(nome_modulo)
+        if modulo is not None and nome_modulo not in _instrumentados:
+            _instrumentados.add(nome_modulo)
+            for funcao in funcoes:
+                _trocar(modulo, funcao, f"{nome_modulo}.{funcao}")
+            for funcao, contar_bytes in _BYTES_GRAVADOS_BACKEND.get(nome_modulo, {}).items():
+                _trocar(modulo, funcao, f"{nome_modulo}.{funcao}", contar_bytes)
+    # gravações: as funções de persistencia, onde quer que tenham sido importadas
+    for nome_modulo in MODULOS_COM_GRAVACAO:
+        chave = f"{nome_modulo}:gravacao"
+        modulo = _modulo(nome_modulo)
+        if modulo is not None and chave not in _instrumentados:
+            _instrumentados.add(chave)
+            for funcao, contar_bytes in _BYTES_GRAVADOS.items():
+                _trocar(modulo, funcao, f"persistencia.{funcao}", contar_bytes)
+
+
+def ativar(perfil: Optional[str] = None, pasta: Optional[str] = None) -> None:
+    """Liga a instrumentação nos módulos já importados.
+
+    As chamadas internas dos módulos passam pelo nome global, então trocar
+    o atributo do módulo já mede também as chamadas feitas de dentro dele.
+    """
+    global _ativa, _perfil, _pasta
+    if perfil is not None and perfil not in PERFIS:
+        raise ValueError(f"Perfil desconhecido: {perfil} (use {', '.join(PERFIS)})")
+    _perfil = perfil
+    _pasta = pasta or _pasta
+    if _ativa:
+        return
+    _ativa = True
+    _instrumentar_importados()
+    atexit.register(exportar)
+
+
+def instrumentar_importados() -> None:
+    """Instrumenta os módulos importados depois de `ativar()` (ex.: backends).
+
+    Cada módulo é trocado uma vez só; desligada, não faz nada.
+    """
+    if _ativa:
+        _instrumentar_importados()
+
+
+def ativar_pelo_ambiente(metricas: bool = False, perfil: Optional[str] = None, pasta: Optional[str] = None) -> None:
+    """Liga a instrumentação se pedida por flag ou por JOGO_METRICAS/JOGO_PERFIL."""
+    perfil = perfil or os.environ.get("JOGO_PERFIL") or None
+    if metricas or perfil or os.environ.get("JOGO_METRICAS", "") not in ("", "0"):
+        ativar(perfil, pasta)
+
+
+def desativar() -> None:
+    """Restaura as funções originais (as medidas coletadas continuam)."""
+    global _ativa
+    while _originais:
+        modulo, atributo, original = _originais.pop()
+        setattr(modulo, atributo, original)
+    _instrumentados.clear()
+    _ativa = False
+    atexit.unregister(exportar)
+
+
+def contar(nome: str, quantidade: int = 1) -> None:
+    """Contador livre (só conta com a instrumentação ativa)."""
+    if _ativa:
+        _contadores[nome] = _contadores.get(nome, 0) + quantidade
+
+
+# ============================================
+# PERFIL POR AÇÃO
+# ============================================
+
+def perfil(acao: str):
+    """Contexto que captura o perfil da ação (nada é feito se desligado)."""
+    if _perfil is None:
+        return nullcontext()
+    return _capturar_perfil(acao)
+
+
+@contextmanager
+def _capturar_perfil(acao: str):
+    inicio = time.perf_counter()
+    if _perfil == "cprofile":
+        import cProfile
+        import pstats
+
+        perfilador = cProfile.Profile()
+        perfilador.enable()
+        try:
+            yield
+        finally:
+            perfilador.disable()
+        estatisticas = pstats.Stats(perfilador).stats
+        mais_lentas = sorted(estatisticas.items(), key=lambda item: item[1][3], reverse=True)[:20]
+        detalhes = [
+            {
+                "funcao": f"{os.path.basename(arquivo)}:{linha}({nome})",
+                "chamadas": chamadas,
+                "proprio_ms": round(proprio * 1000, 3),
+                "acumulado_ms": round(acumulado * 1000, 3),
+            }
+            for (arquivo, linha, nome), (_, chamadas, proprio, acumulado, _) in mais_lentas
+        ]
+    else:
+        import tracemalloc
+
+        ja_rodando = tracemalloc.is_tracing()
+        if not ja_rodando:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            foto = tracemalloc.take_snapshot()
+            _, pico = tracemalloc.get_traced_memory()
+            if not ja_rodando:
+                tracemalloc.stop()
+        detalhes = [
+            {"local": str(stat.traceback[0]), "bytes": stat.size, "blocos": stat.count}
+            for stat in foto.statistics("lineno")[:15]
+        ]
+        detalhes.insert(0, {"pico_bytes": pico})
+    _perfis.append(
+        {
+            "acao": acao,
+            "tipo": _perfil,
+            "duracao_ms": round((time.perf_counter() - inicio) * 1000, 3),
+            "detalhes": detalhes,
+        }
+    )
+
+
+# ============================================
+# EXPORTAÇÃO
+# ============================================
+
+def metricas() -> Dict:
+    """Tudo o que foi coletado até agora, como dict serializável."""
+    return {
+        "gerado_em": datetime.now().isoformat(timespec="seconds"),
+        "perfil": _perfil,
+        "funcoes": {nome: m.resumo() for nome, m in sorted(_medidores.items()) if m.chamadas},
+        "contadores": dict(_contadores),
+        "perfis": list(_perfis),
+    }
+
+
+def exportar() -> Optional[str]:
+    """Grava as métricas em relatorios/metricas_<data>.json e retorna o caminho."""
+    if not _medidores and not _contadores and not _perfis:
+        return None
+    os.makedirs(_pasta, exist_ok=True)
+    caminho = os.path.join(_pasta, f"metricas_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(metricas(), f, ensure_ascii=False, indent=2)
+    print(f"📊 Métricas gravadas em {caminho}")
+    return caminho
@@ -9,17 +9,71 @@ Como executar:
 
 Arquivos gerados (persistência simples usando JSON em .txt):
   dados/jogadores.txt    -> dicionário {usuario: {...}}
-  dados/partidas.txt     -> lista de partidas [{...}, ...]
+  dados/partidas.jsonl   -> log de partidas, uma partida JSON por linha
   relatorios/            -> relatórios em texto (ranking e estatísticas)
+
+O antigo dados/partidas.txt (lista JSON) é migrado automaticamente para o
+log na primeira execução; o arquivo original é mantido intacto.
+
+Backend opcional SQLite (consultas indexadas, sem carregar tudo na memória):
+  JOGO_BACKEND=sqlite python jogo_adivinhacao.py   -> dados/jogo.db
+
+Backend opcional particionado por mês (só os agregados ficam na memória;
+histórico e períodos leem apenas os segmentos necessários):
+  JOGO_BACKEND=particionado python jogo_adivinhacao.py   -> dados/partidas/
+
+Backend opcional mapeado em memória (registros de largura fixa; abrir não
+decodifica partidas, só os contadores por jogador gravados à parte):
+  JOGO_BACKEND=mmap python jogo_adivinhacao.py   -> dados/mmap/
+
+Várias instâncias sobre a mesma pasta dados/ (backends arquivo e sqlite):
+  JOGO_MULTIPROCESSO=1 python jogo_adivinhacao.py
+Gravações sob trava fcntl (dados/.trava), ids de dados/.sequencia e, antes
+de cada ação do menu, leitura só do que os outros processos gravaram.
+
+Rankings do dia, da semana e do mês (menu 10, ranking_janela): somam
+contadores por (dia, jogador) em vez de varrer as partidas.
+
+Cada partida guarda a configuração em que foi jogada ("MIN..MAX/TENTATIVAS",
+ver _configuracoes); a pontuação usa a tabela da configuração e há rankings
+por configuração (menu 11, ranking_configuracao).
+
+Métricas de desempenho (ver instrumentacao.py):
+  python jogo_adivinhacao.py --metricas [--perfil cprofile|tracemalloc]
 """
 from __future__ import annotations
 
+import atexit
+import heapq
 import json
 import os
 import random
-from datetime import datetime
+import sys
+from array import array
+from bisect import bisect_left, insort
+from contextlib import nullcontext
+from datetime import date, datetime
 from functools import reduce
-from typing import Dict, List, Tuple, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
+
+import instrumentacao
+from armazenamento_compacto import (
+    CONFIG_PADRAO,
+    TabelaPartidas,
+    formatar_configuracao,
+    ler_configuracao,
+    normalizar_partida,
+    ordinal_iso,
+)
+from persistencia import (
+    ConfirmacaoEmGrupo,
+    anexar_duravel,
+    gravar_atomico,
+    reservar_sequencia,
+    sincronizar_pasta,
+    travar,
+)
 
 # ============================================
 # Configurações do jogo
@@ -29,6 +83,9 @@ MAX_NUMERO = 100
 MAX_TENTATIVAS = 10
 PONTUACAO_BASE = 100
 PENALIDADE_TENTATIVA = 10  # desconto por tentativa usada (após a primeira)
+# True: a base escala com o tamanho do intervalo (ver tabela_pontuacao);
+# muda os placares gerais, que misturam configurações
+PONTUACAO_ESCALADA = False
 
 # Exemplo de uso de tuple (Módulo 1)
 INTERVALO_PADRAO: Tuple[int, int] = (MIN_NUMERO, MAX_NUMERO)
@@ -37,13 +94,71 @@ INTERVALO_PADRAO: Tuple[int, int] = (MIN_NUMERO, MAX_NUMERO)
 BASE_DADOS = os.path.join(os.getcwd(), "dados")
 BASE_RELATORIOS = os.path.join(os.getcwd(), "relatorios")
 ARQ_JOGADORES = os.path.join(BASE_DADOS, "jogadores.txt")
-ARQ_PARTIDAS = os.path.join(BASE_DADOS, "partidas.txt")
-
-# Estruturas em memória
+ARQ_PARTIDAS = os.path.join(BASE_DADOS, "partidas.txt")  # formato legado (lista JSON)
+ARQ_PARTIDAS_LOG = os.path.join(BASE_DADOS, "partidas.jsonl")  # log append-only
+ARQ_BANCO = os.path.join(BASE_DADOS, "jogo.db")
+PASTA_PARTICOES = os.path.join(BASE_DADOS, "partidas")  # segmentos mensais
+PASTA_MMAP = os.path.join(BASE_DADOS, "mmap")  # registros de largura fixa
+ARQ_TRAVA = os.path.join(BASE_DADOS, ".trava")  # trava entre processos
+ARQ_SEQUENCIA = os.path.join(BASE_DADOS, ".sequencia")  # próximo id de partida
+ARQ_SNAPSHOT = os.path.join(BASE_DADOS, "visoes.snapshot")  # visões + posição no log
+ARQ_GERACAO = os.path.join(BASE_DADOS, ".geracao")  # muda a cada regravação do histórico
+
+# Novo snapshot das visões a cada tantas partidas desde o último (a carga
+# só reaplica as partidas do log posteriores ao snapshot)
+SNAPSHOT_A_CADA = 10_000
+
+# Durabilidade das gravações: "nenhuma", "arquivo" (fsync) ou "completa"
+# (fsync do arquivo e da pasta) — ver persistencia.py
+DURABILIDADE = os.environ.get("JOGO_DURABILIDADE", "arquivo")
+
+# Backend de armazenamento: "arquivo" (JSON/JSONL em memória), "sqlite",
+# "particionado" (segmentos mensais + manifesto) ou "mmap" (registros de
+# largura fixa lidos sob demanda)
+BACKEND_ARMAZENAMENTO = os.environ.get("JOGO_BACKEND", "arquivo")
+
+# Várias instâncias sobre a mesma pasta dados/ (JOGO_MULTIPROCESSO=1):
+# gravações sob trava fcntl, ids de uma sequência compartilhada e leitura
+# incremental do que os outros processos gravaram (ver atualizar_do_disco)
+MULTIPROCESSO = os.environ.get("JOGO_MULTIPROCESSO", "") not in ("", "0")
+
+# Estruturas em memória (partidas em colunas compactas; cada item é uma
+# visão dict-like da partida, ver armazenamento_compacto.py)
 jogadores: Dict[str, Dict] = {}
-partidas: List[Dict] = []
+partidas: TabelaPartidas = TabelaPartidas()
 contador_partidas: int = 1
 
+# Índice por jogador com agregados mantidos incrementalmente:
+# {usuario: {"partidas": array(posições em `partidas`), "total": int, ...}}
+indice_jogadores: Dict[str, Dict] = {}
+
+# Datas com partidas (visão mantida pelos eventos; backend arquivo)
+_datas_partidas: set = set()
+
+# Conexão com o banco quando BACKEND_ARMAZENAMENTO == "sqlite"
+_banco = None
+
+# Armazém de partidas quando BACKEND_ARMAZENAMENTO é "particionado" ou "mmap"
+_armazem = None
+
+# Group commit ativo (ativar_confirmacao_em_grupo), ou None: grava na hora
+_confirmacao: Optional[ConfirmacaoEmGrupo] = None
+
+# Posição no log: (inode, bytes já lidos) e quantas partidas há até ali
+# (todas na memória). No modo multiprocesso, também a assinatura de
+# jogadores.txt na última leitura e os ids que este processo gravou no
+# log (a leitura incremental os pula: já estão na memória)
+_log_visto: Tuple[int, int] = (0, 0)
+_linhas_vistas: int = 0
+_jogadores_vistos: Optional[Tuple[int, int, int]] = None
+_ids_proprios: set = set()
+# Geração do histórico (ARQ_GERACAO) na última leitura: se outro processo
+# regravou o log desde então, a leitura incremental não basta
+_geracao_vista: int = 0
+
+# Partidas cobertas pelo último snapshot gravado ou carregado
+_linhas_snapshot: int = 0
+
 # ============================================
 # Utilitários de persistência
 # ============================================
@@ -55,58 +170,619 @@ def _garantir_pastas() -> None:
 
 
 def _carregar_arquivos() -> None:
-    """Carrega jogadores e partidas dos arquivos JSON simples."""
-    global jogadores, partidas, contador_partidas
+    """Carrega os dados do backend de armazenamento configurado."""
     _garantir_pastas()
+    if MULTIPROCESSO and BACKEND_ARMAZENAMENTO in ("particionado", "mmap"):
+        raise ValueError(
+            f"O backend {BACKEND_ARMAZENAMENTO} não suporta JOGO_MULTIPROCESSO "
+            "(use arquivo ou sqlite)."
+        )
+    if BACKEND_ARMAZENAMENTO == "sqlite":
+        _abrir_banco()
+    elif BACKEND_ARMAZENAMENTO == "particionado":
+        _abrir_particoes()
+    elif BACKEND_ARMAZENAMENTO == "mmap":
+        _abrir_mmap()
+    else:
+        _carregar_dados_arquivo()
+    # os backends acabaram de ser importados: medi-los se a instrumentação está ligada
+    instrumentacao.instrumentar_importados()
 
-    if os.path.exists(ARQ_JOGADORES):
-        try:
-            with open(ARQ_JOGADORES, "r", encoding="utf-8") as f:
-                jogadores = json.load(f)
-        except Exception:
-            # Tratamento simples: se der erro, começa vazio
-            jogadores = {}
+
+def _carregar_dados_arquivo() -> None:
+    """Carrega jogadores e partidas dos arquivos JSON simples."""
+    global jogadores, partidas, contador_partidas, _linhas_snapshot
+
+    # exclusiva: a leitura pode migrar o legado ou truncar uma linha cortada
+    with _trava():
+        jogadores = _ler_jogadores()
+
+        if not os.path.exists(ARQ_PARTIDAS_LOG) and os.path.exists(ARQ_PARTIDAS):
+            migrar_partidas_legado()
+
+        # com snapshot válido, só as partidas posteriores a ele são lidas
+        restaurado = _restaurar_snapshot()
+        if not restaurado:
+            partidas = _ler_log_partidas(ARQ_PARTIDAS_LOG)
+            _marcar_visto()
+
+    if not restaurado:
+        # Atualiza contador de partidas
+        if partidas:
+            contador_partidas = max(partidas.id) + 1
+        else:
+            contador_partidas = 1
+        _linhas_snapshot = 0
+        _reconstruir_indice()
+    _talvez_salvar_snapshot()
+
+
+def _ler_jogadores() -> Dict[str, Dict]:
+    """Lê o dicionário de jogadores do arquivo (vazio se não existir)."""
+    if not os.path.exists(ARQ_JOGADORES):
+        return {}
+    try:
+        with open(ARQ_JOGADORES, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        # Arquivo ilegível: começa vazio, mas move o original para o lado
+        # antes, para a próxima gravação não apagar o cadastro de vez
+        copia = ARQ_JOGADORES + ".corrompido"
+        os.replace(ARQ_JOGADORES, copia)
+        print(f"⚠️  {ARQ_JOGADORES} ilegível; o conteúdo foi preservado em {copia}")
+        return {}
+
+
+def _abrir_banco() -> None:
+    """Abre o banco SQLite; na primeira vez importa os arquivos existentes."""
+    global _banco, jogadores, partidas, contador_partidas
+    from armazenamento_sqlite import BancoSQLite
+
+    if _banco is not None:
+        _banco.fechar()
+    _banco = BancoSQLite(ARQ_BANCO, DURABILIDADE)
+    if _banco.vazio() and (
+        os.path.exists(ARQ_JOGADORES)
+        or os.path.exists(ARQ_PARTIDAS_LOG)
+        or os.path.exists(ARQ_PARTIDAS)
+    ):
+        _carregar_dados_arquivo()
+        _banco.importar(jogadores, partidas)
+
+    # no modo SQLite nada fica carregado em memória
+    jogadores = {}
+    partidas = TabelaPartidas()
+    indice_jogadores.clear()
+    contador_partidas = _banco.proximo_id()
+    _reconstruir_baldes()
+
+
+def _abrir_particoes() -> None:
+    """Abre os segmentos mensais; na primeira vez distribui o log existente.
+
+    Só os agregados por jogador (contadores) ficam na memória; as partidas
+    são lidas dos segmentos sob demanda. Ao abrir, as da maior janela de
+    ranking são lidas uma vez para refazer os baldes diários.
+    """
+    from armazenamento_particionado import ArmazemParticionado
+
+    _abrir_armazem(ArmazemParticionado(PASTA_PARTICOES, DURABILIDADE))
+
+
+def _abrir_mmap() -> None:
+    """Abre os registros mapeados em memória; na primeira vez importa o log.
+
+    Os contadores por jogador vêm gravados (agregados.bin); abrir só
+    decodifica as partidas da maior janela de ranking (JANELAS_RANKING),
+    para refazer os baldes diários.
+    """
+    from armazenamento_mmap import ArmazemMmap
+
+    if _armazem is not None and hasattr(_armazem, "fechar"):
+        _armazem.fechar()
+    _abrir_armazem(ArmazemMmap(PASTA_MMAP, DURABILIDADE))
+
+
+def _abrir_armazem(armazem) -> None:
+    """Passa a usar `armazem` para as partidas (backends particionado e mmap)."""
+    global _armazem, jogadores, partidas, contador_partidas
+
+    _armazem = armazem
+    if _armazem.vazio() and (os.path.exists(ARQ_PARTIDAS_LOG) or os.path.exists(ARQ_PARTIDAS)):
+        _carregar_dados_arquivo()
+        _armazem.importar(partidas)
+
+    jogadores = _ler_jogadores()
+    partidas = TabelaPartidas()
+    indice_jogadores.clear()
+    if hasattr(_armazem, "agregados"):
+        for usuario, contadores in _armazem.agregados().items():
+            agg = indice_jogadores[usuario] = _novo_agregado()
+            agg.update(contadores)
     else:
-        jogadores = {}
+        for p in _armazem.iterar():
+            _indexar_partida(p)
+    _reconstruir_placares()
+    _reconstruir_baldes()
+    _descartar_agregados_config()
+    contador_partidas = _armazem.proximo_id()
 
-    if os.path.exists(ARQ_PARTIDAS):
-        try:
-            with open(ARQ_PARTIDAS, "r", encoding="utf-8") as f:
-                partidas = json.load(f)
-        except Exception:
-            partidas = []
+
+def _salvar_jogadores(dados: Optional[Dict[str, Dict]] = None) -> None:
+    """Salva o dicionário de jogadores em arquivo.
+
+    Args:
+        dados: cópia a gravar (padrão: o dicionário global `jogadores`);
+            permite gravar fora da thread que altera o dicionário.
+    """
+    dados = jogadores if dados is None else dados
+    with _trava():
+        if MULTIPROCESSO:
+            # merge: mantém os cadastros que outros processos gravaram
+            # (um usuário cadastrado nos dois fica com a versão do disco)
+            disco = _ler_jogadores()
+            dados = {**dados, **disco}
+        gravar_atomico(
+            ARQ_JOGADORES,
+            lambda f: json.dump(dados, f, ensure_ascii=False, indent=2),
+            DURABILIDADE,
+        )
+
+
+def _linha_partida(partida: Dict) -> str:
+    """Serializa uma partida como uma linha do log (JSON Lines)."""
+    return json.dumps(partida, ensure_ascii=False) + "\n"
+
+
+def _ler_log_partidas(caminho: str) -> TabelaPartidas:
+    """Lê o log de partidas, recuperando uma possível linha final incompleta.
+
+    Uma queda durante a escrita pode deixar a última linha pela metade
+    (sem o "\n" final ou com JSON truncado). Nesse caso o arquivo é
+    truncado de volta ao fim da última linha válida, para que a próxima
+    partida não seja anexada colada ao lixo.
+
+    Um JSON completo com um campo de tipo errado (p.ex. "numero_secreto":
+    "sete") é ignorado na carga e avisado, mas fica no arquivo.
+    """
+    lidas = TabelaPartidas()
+    if not os.path.exists(caminho):
+        return lidas
+
+    fim_valido = 0  # offset logo após a última linha válida
+    posicao = 0
+    ignoradas = 0
+    with open(caminho, "rb") as f:
+        for linha in f:
+            posicao += len(linha)
+            if not linha.endswith(b"\n"):
+                break  # linha final incompleta
+            try:
+                partida = json.loads(linha)
+            except ValueError:
+                continue  # linha corrompida: descartada (truncada se for a última)
+            fim_valido = posicao
+            if not _anexar_lida(lidas, partida):
+                ignoradas += 1
+        tamanho = posicao
+
+    if fim_valido < tamanho:
+        with open(caminho, "r+b") as f:
+            f.truncate(fim_valido)
+    if ignoradas:
+        print(f"⚠️  {ignoradas} partida(s) com campos inválidos em {caminho} foram ignoradas")
+    return lidas
+
+
+def _anexar_lida(tabela: TabelaPartidas, partida) -> bool:
+    """Anexa uma partida lida do log; False (nada anexado) se for inválida."""
+    if not isinstance(partida, dict):
+        return False
+    try:
+        tabela.append(partida)
+    except ValueError:
+        return False
+    return True
+
+
+def _anexar_partidas(lote: List[Dict]) -> None:
+    """Anexa partidas ao log em uma única escrita (independe do histórico)."""
+    global _log_visto, _linhas_vistas
+    texto = "".join(_linha_partida(p) for p in lote)
+    with _trava():
+        if MULTIPROCESSO:
+            _ids_proprios.update(p["id"] for p in lote)
+        anexar_duravel(ARQ_PARTIDAS_LOG, texto, DURABILIDADE)
+        if not MULTIPROCESSO:
+            # único escritor: o log continua igual à memória
+            log = _assinatura(ARQ_PARTIDAS_LOG)
+            _log_visto = (log[0], log[1])
+            _linhas_vistas += len(lote)
+
+
+def _anexar_partida(partida: Dict) -> None:
+    """Anexa uma única partida ao log (custo O(1), independe do histórico)."""
+    _anexar_partidas([partida])
+
+
+def _salvar_partidas() -> None:
+    """Reescreve o log completo de partidas (compactação).
+
+    O caminho normal de uma partida nova é `_anexar_partida`; esta função
+    só é necessária quando a lista em memória é alterada como um todo.
+    No modo multiprocesso, o que outros processos anexaram entra antes.
+    """
+    global _linhas_snapshot
+    with _trava():
+        if MULTIPROCESSO:
+            _ler_partidas_novas()
+        gravar_atomico(
+            ARQ_PARTIDAS_LOG,
+            lambda f: f.writelines(_linha_partida(dict(p)) for p in partidas),
+            DURABILIDADE,
+        )
+        _marcar_visto()
+        _linhas_snapshot = 0  # o snapshot anterior não vale para o log novo
+        _avancar_geracao()
+
+
+def _geracao() -> int:
+    """Quantas vezes o histórico foi regravado (repontuação/compactação)."""
+    try:
+        with open(ARQ_GERACAO, "r", encoding="utf-8") as f:
+            return int(f.read() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def _avancar_geracao() -> None:
+    """Invalida os relatórios em cache: pontuações podem ter mudado sem
+    mudar o próximo id, os jogadores nem a soma das pontuações."""
+    global _geracao_vista
+    _geracao_vista = _geracao() + 1
+    gravar_atomico(ARQ_GERACAO, lambda f: f.write(str(_geracao_vista)), DURABILIDADE)
+
+
+def migrar_partidas_legado() -> int:
+    """Migração única de dados/partidas.txt (lista JSON) para o log JSONL.
+
+    O arquivo legado não é alterado. Retorna o número de partidas migradas.
+    Se ele estiver ilegível, o log não é criado (senão a migração nunca
+    mais seria tentada) e o original vai para o lado, como em
+    _ler_jogadores: corrigido e renomeado de volta antes da primeira
+    partida nova, é migrado na próxima carga.
+    """
+    try:
+        with open(ARQ_PARTIDAS, "r", encoding="utf-8") as f:
+            legado = json.load(f)
+    except Exception:
+        copia = ARQ_PARTIDAS + ".corrompido"
+        os.replace(ARQ_PARTIDAS, copia)
+        print(f"⚠️  {ARQ_PARTIDAS} ilegível; o histórico antigo não foi migrado e foi preservado em {copia}")
+        return 0
+
+    gravar_atomico(
+        ARQ_PARTIDAS_LOG, lambda f: f.writelines(_linha_partida(p) for p in legado), DURABILIDADE
+    )
+    return len(legado)
+
+
+# ============================================
+# EVENTOS, VISÕES E SNAPSHOTS
+# ============================================
+# Cada cadastro e cada partida finalizada é um evento; as visões (índice
+# por jogador com os agregados, placares e datas com partidas) só mudam
+# consumindo eventos. O log de partidas é o fluxo persistido dos eventos
+# de partida; o snapshot guarda as visões e a posição no log até onde
+# elas valem, e a carga reaplica só o que veio depois.
+
+EVENTO_CADASTRO = "jogador_cadastrado"
+EVENTO_PARTIDA = "partida_finalizada"
+
+VERSAO_SNAPSHOT = 2
+_CONTADORES = (
+    "total",
+    "vitorias",
+    "soma_pontuacao",
+    "soma_tentativas",
+    "melhor_pontuacao",
+    "menor_tentativas",
+)
+
+
+def _consumir_evento(evento: str, dados: Dict) -> None:
+    """Aplica um evento às visões materializadas (backends em memória)."""
+    if evento == EVENTO_CADASTRO:
+        jogadores[dados["usuario"]] = dados
+        _atualizar_placares(dados["usuario"])
+    elif evento == EVENTO_PARTIDA:
+        _aplicar_partida(dados)
+        _atualizar_placares(dados.get("jogador"))
     else:
-        partidas = []
+        raise ValueError(f"Evento desconhecido: {evento}")
 
-    # Atualiza contador de partidas
-    if partidas:
-        contador_partidas = max(p.get("id", 0) for p in partidas) + 1
+
+def _aplicar_partida(dados: Dict) -> None:
+    """Partida nas visões, menos os placares (ver registrar_partidas)."""
+    if _armazem is None:
+        partidas.append(dados)
+        posicao = len(partidas) - 1
+        _indexar_partida(dados, posicao)
+        _datas_partidas.add(partidas.valor(posicao, "data"))
     else:
-        contador_partidas = 1
+        _indexar_partida(dados)
+    _somar_ao_balde(dados)
+    _somar_a_configuracao(dados)
+
+
+def _fim_do_log(bytes_lidos: int) -> str:
+    """Últimos bytes consumidos do log (confere que o log não foi trocado)."""
+    with open(ARQ_PARTIDAS_LOG, "rb") as f:
+        f.seek(max(0, bytes_lidos - 64))
+        return f.read(bytes_lidos - f.tell()).hex()
+
+
+def _snapshot_consistente() -> bool:
+    """True se a memória é exatamente o log até _log_visto (nada pendente)."""
+    return (
+        _banco is None
+        and _armazem is None
+        and _confirmacao is None
+        and not _ids_proprios
+        and len(partidas) == _linhas_vistas
+    )
 
 
-def _salvar_jogadores() -> None:
-    """Salva o dicionário de jogadores em arquivo."""
-    with open(ARQ_JOGADORES, "w", encoding="utf-8") as f:
-        json.dump(jogadores, f, ensure_ascii=False, indent=2)
+def _talvez_salvar_snapshot() -> None:
+    """Grava um snapshot se já passaram SNAPSHOT_A_CADA partidas desde o último."""
+    if len(partidas) - _linhas_snapshot >= SNAPSHOT_A_CADA and _snapshot_consistente():
+        salvar_snapshot()
 
 
-def _salvar_partidas() -> None:
-    """Salva a lista de partidas em arquivo."""
-    with open(ARQ_PARTIDAS, "w", encoding="utf-8") as f:
-        json.dump(partidas, f, ensure_ascii=False, indent=2)
+def salvar_snapshot() -> bool:
+    """Grava as visões e a posição no log em ARQ_SNAPSHOT.
+
+    Formato: uma linha JSON (posição no log, contadores por jogador,
+    datas, textos internados, tipo e tamanho de cada coluna) seguida dos
+    bytes das colunas da tabela e das posições de cada jogador. Retorna
+    False se há partidas na memória fora do log (nada é gravado).
+    """
+    global _linhas_snapshot
+    with _trava():
+        if not _snapshot_consistente():
+            return False
+        inode, lido = _log_visto
+        posicoes = array("I")
+        contadores = []
+        for usuario in partidas.usuarios:
+            agg = indice_jogadores[usuario]
+            posicoes.extend(agg["partidas"])
+            contadores.append([agg[chave] for chave in _CONTADORES])
+        colunas = partidas.colunas()
+        colunas["posicoes"] = posicoes
+        cabecalho = {
+            "versao": VERSAO_SNAPSHOT,
+            "ordem_bytes": sys.byteorder,
+            "log": {"inode": inode, "bytes": lido, "fim": _fim_do_log(lido) if lido else ""},
+            "linhas": _linhas_vistas,
+            "contador_partidas": contador_partidas,
+            "textos": partidas.textos(),
+            "agregados": contadores,
+            "datas": sorted(_datas_partidas),
+            "colunas": [[nome, c.typecode, len(c)] for nome, c in colunas.items()],
+        }
+
+        def escrever(f) -> None:
+            f.write(json.dumps(cabecalho, ensure_ascii=False).encode("utf-8") + b"\n")
+            for coluna in colunas.values():
+                coluna.tofile(f)
+
+        gravar_atomico(ARQ_SNAPSHOT, escrever, DURABILIDADE, binario=True)
+        _linhas_snapshot = _linhas_vistas
+    return True
+
+
+def _restaurar_snapshot() -> bool:
+    """Carrega as visões do snapshot e reaplica as partidas posteriores do log.
+
+    Chamar sob trava. Retorna False (nada muda) se não há snapshot ou se
+    ele não corresponde ao log atual: o log foi reescrito, encolheu ou o
+    snapshot é de outra versão/plataforma.
+    """
+    global partidas, contador_partidas, _log_visto, _linhas_vistas, _linhas_snapshot
+    log = _assinatura(ARQ_PARTIDAS_LOG)
+    if log is None or not os.path.exists(ARQ_SNAPSHOT):
+        return False
+    try:
+        with open(ARQ_SNAPSHOT, "rb") as f:
+            cabecalho = json.loads(f.readline())
+            dados = memoryview(f.read())
+        posicao_log = cabecalho["log"]
+        if (
+            cabecalho["versao"] != VERSAO_SNAPSHOT
+            or cabecalho["ordem_bytes"] != sys.byteorder
+            or posicao_log["inode"] != log[0]
+            or posicao_log["bytes"] > log[1]
+            or _fim_do_log(posicao_log["bytes"]) != posicao_log["fim"]
+        ):
+            return False
+        colunas = {}
+        inicio = 0
+        for nome, tipo, tamanho in cabecalho["colunas"]:
+            coluna = array(tipo)
+            fim = inicio + tamanho * coluna.itemsize
+            coluna.frombytes(dados[inicio:fim])
+            colunas[nome] = coluna
+            inicio = fim
+        if inicio != len(dados):
+            return False  # gravação incompleta
+    except (OSError, ValueError, KeyError, TypeError):
+        return False  # snapshot danificado: carga completa pelo log
+
+    partidas = TabelaPartidas.restaurar(colunas, cabecalho["textos"])
+    indice_jogadores.clear()
+    posicoes = colunas["posicoes"]
+    inicio = 0
+    for usuario, valores in zip(partidas.usuarios, cabecalho["agregados"]):
+        agg = indice_jogadores[usuario] = _novo_agregado()
+        agg.update(zip(_CONTADORES, valores))
+        agg["partidas"] = posicoes[inicio : inicio + agg["total"]]
+        inicio += agg["total"]
+    _datas_partidas.clear()
+    _datas_partidas.update(cabecalho["datas"])
+    contador_partidas = cabecalho["contador_partidas"]
+    _log_visto = (posicao_log["inode"], posicao_log["bytes"])
+    _linhas_vistas = _linhas_snapshot = cabecalho["linhas"]
+    _ids_proprios.clear()
+
+    _ler_partidas_novas()
+    if _log_visto[1] < _assinatura(ARQ_PARTIDAS_LOG)[1]:
+        # linha final cortada por uma queda (como em _ler_log_partidas)
+        with open(ARQ_PARTIDAS_LOG, "r+b") as f:
+            f.truncate(_log_visto[1])
+    _marcar_visto()
+    _reconstruir_placares()
+    _reconstruir_baldes()
+    _descartar_agregados_config()
+    return True
+
+
+# ============================================
+# VÁRIOS PROCESSOS (JOGO_MULTIPROCESSO)
+# ============================================
+
+def _trava(exclusiva: bool = True):
+    """Trava de arquivo entre processos (nada é feito fora do modo multiprocesso)."""
+    if not MULTIPROCESSO:
+        return nullcontext()
+    return travar(ARQ_TRAVA, exclusiva)
+
+
+def _assinatura(caminho: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, tamanho, mtime) do arquivo, ou None se não existe."""
+    try:
+        st = os.stat(caminho)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _marcar_visto() -> None:
+    """Registra log e jogadores.txt atuais como já lidos (chamar sob trava)."""
+    global _log_visto, _linhas_vistas, _jogadores_vistos, _geracao_vista
+    log = _assinatura(ARQ_PARTIDAS_LOG)
+    _log_visto = (log[0], log[1]) if log else (0, 0)
+    _linhas_vistas = len(partidas)
+    _jogadores_vistos = _assinatura(ARQ_JOGADORES)
+    _geracao_vista = _geracao()
+    _ids_proprios.clear()
+
+
+def _proximo_id_partida() -> int:
+    """Aloca o id da próxima partida (atômico entre processos no modo multiprocesso)."""
+    return _reservar_ids(1)
+
+
+def _reservar_ids(quantidade: int) -> int:
+    """Aloca `quantidade` ids seguidos de uma vez; retorna o primeiro."""
+    global contador_partidas
+    if MULTIPROCESSO:
+        pid = reservar_sequencia(ARQ_SEQUENCIA, contador_partidas, quantidade)
+    else:
+        pid = contador_partidas
+    contador_partidas = pid + quantidade
+    return pid
+
+
+def _ler_partidas_novas() -> int:
+    """Consome as partidas do log depois do ponto já visto (outros processos
+    ou, na carga, as posteriores ao snapshot).
+
+    Uma linha final sem "\n" fica para a próxima leitura. Chamar sob
+    trava. Retorna quantas entraram na memória.
+    """
+    global _log_visto, _linhas_vistas, contador_partidas
+    _, lido = _log_visto
+    if not os.path.exists(ARQ_PARTIDAS_LOG):
+        return 0
+    with open(ARQ_PARTIDAS_LOG, "rb") as f:
+        inode = os.fstat(f.fileno()).st_ino  # o log pode ter sido criado agora
+        f.seek(lido)
+        novos = f.read()
+    fim = novos.rfind(b"\n") + 1
+    lidas = 0
+    for linha in novos[:fim].splitlines():
+        try:
+            partida = normalizar_partida(json.loads(linha))
+        except (ValueError, TypeError):
+            continue  # mesma regra de _ler_log_partidas
+        _linhas_vistas += 1
+        pid = partida.get("id", 0)
+        if pid in _ids_proprios:
+            _ids_proprios.discard(pid)  # gravada por este processo
+            continue
+        _consumir_evento(EVENTO_PARTIDA, partida)
+        contador_partidas = max(contador_partidas, pid + 1)
+        lidas += 1
+    _log_visto = (inode, lido + fim)
+    return lidas
+
+
+def atualizar_do_disco() -> bool:
+    """Traz para a memória o que outros processos gravaram (modo multiprocesso).
+
+    Sem mudanças custa um os.stat do log e outro de jogadores.txt. Do log
+    só os bytes novos são lidos; se ele foi regravado por outro processo
+    (compactação ou repontuação: outra geração, outro inode ou menor que o
+    já lido), tudo é recarregado. Retorna True se algo mudou.
+    """
+    global _jogadores_vistos
+    if not MULTIPROCESSO or _banco is not None or _armazem is not None:
+        return False
+    log = _assinatura(ARQ_PARTIDAS_LOG)
+    inode, lido = _log_visto
+    log_mudou = log is not None and (log[0], log[1]) != (inode, lido)
+    if not log_mudou and _assinatura(ARQ_JOGADORES) == _jogadores_vistos:
+        return False
+
+    with _trava(exclusiva=False):
+        # sob a trava, log e geração são da mesma gravação. O inode sozinho
+        # não basta: se o log não existia na carga, não há inode a comparar
+        log = _assinatura(ARQ_PARTIDAS_LOG)
+        regravado = _geracao() != _geracao_vista or (
+            log is not None and inode and (log[0] != inode or log[1] < lido)
+        )
+        if not regravado:
+            assinatura = _assinatura(ARQ_JOGADORES)
+            if assinatura != _jogadores_vistos:
+                # cadastros só são acrescentados: entra quem ainda não está aqui
+                for usuario, jogador in _ler_jogadores().items():
+                    if usuario not in jogadores:
+                        _consumir_evento(EVENTO_CADASTRO, jogador)
+                _jogadores_vistos = assinatura
+            _ler_partidas_novas()
+    if regravado:
+        # recarrega do zero (a trava não é reentrante: fora do bloco acima);
+        # partidas ainda na fila do group commit deste processo só voltam
+        # na próxima carga
+        _carregar_dados_arquivo()
+        return True
+    _talvez_salvar_snapshot()
+    return True
 
 
 # ============================================
 # FUNÇÕES DE JOGADORES
 # ============================================
 
-def cadastrar_jogador(nome: str, usuario: str) -> Dict:
+def cadastrar_jogador(nome: str, usuario: str, persistir: bool = True) -> Dict:
     """Cadastra um novo jogador.
 
     Args:
         nome: Nome completo
         usuario: Nome de usuário único
+        persistir: False adia a gravação de jogadores.txt (quem chama
+            grava depois, p.ex. agrupando vários cadastros)
 
     Returns:
         dict: dados do jogador
@@ -114,6 +790,7 @@ def cadastrar_jogador(nome: str, usuario: str) -> Dict:
     if not usuario or not nome:
         raise ValueError("Nome e usuário são obrigatórios.")
 
+    atualizar_do_disco()  # cadastros feitos por outros processos
     if usuario in jogadores:
         raise ValueError("Usuário já cadastrado.")
 
@@ -122,13 +799,42 @@ def cadastrar_jogador(nome: str, usuario: str) -> Dict:
         "usuario": usuario,
         "data_cadastro": datetime.now().date().isoformat(),
     }
-    jogadores[usuario] = jogador
-    _salvar_jogadores()
+    if _banco is not None:
+        _banco.cadastrar_jogador(jogador)  # ValueError se já existir
+        return jogador
+
+    _consumir_evento(EVENTO_CADASTRO, jogador)
+    if persistir:
+        if _confirmacao is not None:
+            _confirmacao.marcar_jogadores()
+        else:
+            _salvar_jogadores()
     return jogador
 
 
+def cadastrar_jogadores(lote: List[Dict]) -> None:
+    """Cadastra vários jogadores já montados com uma única gravação.
+
+    Cada item tem nome, usuario e data_cadastro. Quem chama garante que
+    nenhum usuário já existe (no SQLite, um repetido desfaz o lote todo).
+    """
+    if not lote:
+        return
+    if _banco is not None:
+        _banco.cadastrar_jogadores(lote)
+        return
+    for jogador in lote:
+        _consumir_evento(EVENTO_CADASTRO, jogador)
+    if _confirmacao is not None:
+        _confirmacao.marcar_jogadores()
+    else:
+        _salvar_jogadores()
+
+
 def login_jogador(usuario: str) -> Optional[Dict]:
     """Retorna dados do jogador se existir."""
+    if _banco is not None:
+        return _banco.obter_jogador(usuario)
     return jogadores.get(usuario)
 
 
@@ -136,9 +842,14 @@ def login_jogador(usuario: str) -> Optional[Dict]:
 # FUNÇÕES DE JOGO
 # ============================================
 
-def gerar_numero_secreto() -> int:
-    """Gera um número aleatório no intervalo configurado."""
-    return random.randint(MIN_NUMERO, MAX_NUMERO)
+def gerar_numero_secreto(rng: Optional[random.Random] = None) -> int:
+    """Gera um número aleatório no intervalo configurado.
+
+    Args:
+        rng: gerador próprio (simulações reprodutíveis); padrão é o
+            gerador global do módulo random.
+    """
+    return (rng or random).randint(MIN_NUMERO, MAX_NUMERO)
 
 
 essa_entrada_invalida = "Entrada inválida. Digite um número inteiro no intervalo."
@@ -159,23 +870,88 @@ def validar_numero(entrada: str) -> Optional[int]:
         return None
 
 
+DICA_MAIOR = "maior"
+DICA_MENOR = "menor"
+
+
+def calcular_dica(numero_escolhido: int, numero_secreto: int) -> Optional[str]:
+    """Retorna DICA_MAIOR/DICA_MENOR para o próximo palpite, ou None se acertou."""
+    if numero_escolhido < numero_secreto:
+        return DICA_MAIOR
+    if numero_escolhido > numero_secreto:
+        return DICA_MENOR
+    return None
+
+
 def exibir_dica(numero_escolhido: int, numero_secreto: int) -> None:
     """Exibe dica simples se o número é maior ou menor que o secreto."""
-    if numero_escolhido < numero_secreto:
+    dica = calcular_dica(numero_escolhido, numero_secreto)
+    if dica == DICA_MAIOR:
         print("➡️  Tente um número MAIOR.")
-    elif numero_escolhido > numero_secreto:
+    elif dica == DICA_MENOR:
         print("⬅️  Tente um número MENOR.")
 
 
-def calcular_pontuacao(total_tentativas: int, vitoria: bool) -> int:
-    """Calcula pontuação da partida.
+def configuracao_atual() -> str:
+    """Configuração em vigor ("MIN..MAX/MAX_TENTATIVAS"), gravada em cada partida."""
+    return formatar_configuracao(MIN_NUMERO, MAX_NUMERO, MAX_TENTATIVAS)
+
+
+# (configuração, base, penalidade, escalada) -> pontos por nº de tentativas
+_tabelas_pontuacao: Dict[Tuple[str, int, int, bool], Tuple[int, ...]] = {}
+
+
+def _palpites_busca_binaria(minimo: int, maximo: int) -> int:
+    """Palpites de uma busca binária no pior caso (ceil(log2 n)), no mínimo 1."""
+    return max(1, (maximo - minimo).bit_length())
+
+
+def tabela_pontuacao(
+    config: Optional[str] = None,
+    ate: int = 0,
+    base: Optional[int] = None,
+    penalidade: Optional[int] = None,
+    escalada: Optional[bool] = None,
+) -> Tuple[int, ...]:
+    """Pontos de uma vitória em t tentativas (índice t) numa configuração.
 
-    Pontuação: 100 - (tentativas-1)*10. Derrota => 0. Mínimo 0.
+    A fórmula é a de sempre (base - (t-1)*penalidade, mínimo 0) com
+    PONTUACAO_BASE em qualquer intervalo; a configuração só define até
+    quantas tentativas a tabela vai (ou `ate`, se maior). A tabela fica
+    em cache.
+
+    Com escalada=True (padrão: PONTUACAO_ESCALADA) a base é multiplicada
+    pelos palpites que uma busca binária precisa no intervalo, relativos
+    ao intervalo padrão: 1..10000 vale o dobro, 1..10 pouco mais da metade.
+    """
+    config = config or configuracao_atual()
+    base = PONTUACAO_BASE if base is None else base
+    penalidade = PENALIDADE_TENTATIVA if penalidade is None else penalidade
+    escalada = PONTUACAO_ESCALADA if escalada is None else escalada
+    chave = (config, base, penalidade, escalada)
+    tabela = _tabelas_pontuacao.get(chave)
+    if tabela is None or len(tabela) <= ate:
+        minimo, maximo, tentativas = ler_configuracao(config)
+        if escalada:
+            padrao = ler_configuracao(CONFIG_PADRAO)
+            base = round(
+                base * _palpites_busca_binaria(minimo, maximo) / _palpites_busca_binaria(*padrao[:2])
+            )
+        tabela = _tabelas_pontuacao[chave] = tuple(
+            max(0, base - max(0, t - 1) * penalidade) for t in range(max(tentativas, ate) + 1)
+        )
+    return tabela
+
+
+def calcular_pontuacao(total_tentativas: int, vitoria: bool, config: Optional[str] = None) -> int:
+    """Calcula pontuação da partida (na configuração atual, se não informada).
+
+    Pontuação: base - (tentativas-1)*10 (ver tabela_pontuacao). Derrota => 0.
+    Mínimo 0.
     """
     if not vitoria:
         return 0
-    pontos = PONTUACAO_BASE - max(0, total_tentativas - 1) * PENALIDADE_TENTATIVA
-    return max(0, pontos)
+    return tabela_pontuacao(config, ate=total_tentativas)[total_tentativas]
 
 
 def jogar_partida(usuario: str) -> Dict:
@@ -187,9 +963,7 @@ def jogar_partida(usuario: str) -> Dict:
     Returns:
         dict: dados da partida jogada
     """
-    global contador_partidas
-
-    if usuario not in jogadores:
+    if login_jogador(usuario) is None:
         raise ValueError("Usuário não cadastrado. Cadastre-se antes de jogar.")
 
     numero_secreto = gerar_numero_secreto()
@@ -213,65 +987,316 @@ def jogar_partida(usuario: str) -> Dict:
         else:
             exibir_dica(numero, numero_secreto)
 
+    partida = registrar_partida(usuario, numero_secreto, tentativas, vitoria)
+    pontuacao = partida["pontuacao"]
+
+    print(f"\nResultado: {partida['resultado']} | Pontuação: {pontuacao}")
+    return partida
+
+
+def registrar_partida(
+    usuario: str,
+    numero_secreto: int,
+    tentativas: List[int],
+    vitoria: bool,
+    data: Optional[str] = None,
+    persistir: bool = True,
+    config: Optional[str] = None,
+) -> Dict:
+    """Monta, indexa e (opcionalmente) persiste uma partida finalizada.
+
+    Usado pelo jogo interativo e por motores não interativos (simulação).
+    Com persistir=False a partida só entra na memória/índices; grave depois
+    em lote com `persistir_partidas`. A partida fica marcada com a
+    configuração atual (ou `config`).
+    """
     total_tentativas = len(tentativas)
-    pontuacao = calcular_pontuacao(total_tentativas, vitoria)
+    config = config or configuracao_atual()
+    pontuacao = calcular_pontuacao(total_tentativas, vitoria, config)
 
     partida = {
-        "id": contador_partidas,
+        "id": _proximo_id_partida(),
         "jogador": usuario,
         "numero_secreto": numero_secreto,
         "tentativas": tentativas,
         "total_tentativas": total_tentativas,
         "pontuacao": pontuacao,
         "resultado": "Vitória" if vitoria else "Derrota",
-        "data": datetime.now().date().isoformat(),
+        "data": data or datetime.now().date().isoformat(),
+        "config": config,
     }
 
-    partidas.append(partida)
-    contador_partidas += 1
-    _salvar_partidas()
-
-    print(f"\nResultado: {partida['resultado']} | Pontuação: {pontuacao}")
+    if _banco is None:
+        _consumir_evento(EVENTO_PARTIDA, partida)
+    if persistir:
+        persistir_partidas([partida])
     return partida
 
 
+def registrar_partidas(lote: List[Dict], persistir: bool = True) -> List[Dict]:
+    """Registra de uma vez partidas já montadas e pontuadas (simulação em lote).
+
+    Os ids são reservados num só bloco (substituem os do lote). As visões
+    recebem o lote agrupado: cada partida é somada uma vez a um agregado
+    parcial por (jogador, dia, configuração), que entra no índice, nos
+    baldes diários e nos agregados por configuração; cada jogador é
+    reposicionado nos placares uma vez. A gravação é única. Retorna o
+    próprio lote.
+    """
+    if not lote:
+        return lote
+    primeiro = _reservar_ids(len(lote))
+    for i, partida in enumerate(lote):
+        partida["id"] = primeiro + i
+    if _banco is None:
+        _aplicar_lote(lote)
+    if persistir:
+        persistir_partidas(lote)
+    return lote
+
+
+def _aplicar_lote(lote: List[Dict]) -> None:
+    """_aplicar_partida de várias partidas, somando por grupo (ver registrar_partidas)."""
+    inicio = len(partidas)
+    if _armazem is None:
+        partidas.extend(lote)
+        _datas_partidas.update(partidas.datas(inicio))
+    grupos: Dict[Tuple, Tuple[Dict, Dict]] = {}  # (jogador, data, config) -> (partida, agregado)
+    posicoes: Dict[str, array] = {}
+    for i, partida in enumerate(lote, inicio):
+        usuario = partida.get("jogador")
+        chave = (usuario, partida.get("data"), partida.get("config"))
+        grupo = grupos.get(chave)
+        if grupo is None:
+            grupo = grupos[chave] = (partida, _novo_agregado(com_partidas=False))
+        _somar_partida(grupo[1], partida)
+        if _armazem is None:
+            posicoes.setdefault(usuario, array("I")).append(i)
+
+    for partida, agregado in grupos.values():
+        usuario = partida.get("jogador")
+        agg = indice_jogadores.get(usuario)
+        if agg is None:
+            agg = indice_jogadores[usuario] = _novo_agregado()
+        _combinar_agregados(agg, agregado)
+        _somar_ao_balde(partida, agregado)
+        _somar_a_configuracao(partida, agregado)
+    for usuario, novas in posicoes.items():
+        indice_jogadores[usuario]["partidas"].extend(novas)
+    for usuario in {partida.get("jogador") for partida, _ in grupos.values()}:
+        _atualizar_placares(usuario)
+
+
+def persistir_partidas(lote: List[Dict]) -> Optional[int]:
+    """Grava, em uma única escrita/transação, partidas já registradas.
+
+    Com o group commit ativo, só enfileira e retorna o número do lote
+    (use aguardar_gravacao para esperar a gravação).
+    """
+    if not lote:
+        return None
+    if _confirmacao is not None:
+        return _confirmacao.adicionar_partidas(list(lote))
+    _gravar_partidas(lote)
+    _talvez_salvar_snapshot()
+    return None
+
+
+def _gravar_partidas(lote: List[Dict]) -> None:
+    if _banco is not None:
+        _banco.inserir_partidas(lote)  # também atualiza os agregados
+    elif _armazem is not None:
+        _armazem.anexar(lote)
+    else:
+        _anexar_partidas(lote)
+
+
+def _gravar_grupo(lote: List[Dict], jogadores_alterados: bool) -> None:
+    """Gravação de um grupo: cadastro (se mudou) e depois as partidas."""
+    if jogadores_alterados:
+        _salvar_jogadores(dict(jogadores))  # cópia: outra thread pode cadastrar
+    if lote:
+        _gravar_partidas(lote)
+
+
+def ativar_confirmacao_em_grupo(janela: float = 0.0, max_lote: int = 1000) -> None:
+    """Liga o group commit: eventos simultâneos viram uma só gravação.
+
+    Vale para os backends de arquivo; no SQLite cada lote já é uma
+    transação e a conexão não pode ser usada pela thread de gravação.
+    """
+    global _confirmacao
+    if _banco is not None:
+        raise ValueError("Group commit não se aplica ao backend SQLite.")
+    desativar_confirmacao_em_grupo()
+    _confirmacao = ConfirmacaoEmGrupo(_gravar_grupo, janela, max_lote)
+    atexit.unregister(desativar_confirmacao_em_grupo)
+    atexit.register(desativar_confirmacao_em_grupo)
+
+
+def desativar_confirmacao_em_grupo() -> None:
+    """Grava o que estiver pendente e volta à gravação imediata."""
+    global _confirmacao
+    if _confirmacao is not None:
+        confirmacao, _confirmacao = _confirmacao, None
+        confirmacao.fechar()
+        _talvez_salvar_snapshot()
+
+
+def aguardar_gravacao(lote: Optional[int] = None) -> None:
+    """Espera o lote (padrão: tudo o que foi enfileirado) chegar ao disco."""
+    if _confirmacao is not None:
+        _confirmacao.aguardar(lote)
+
+
 # ============================================
 # ESTATÍSTICAS
 # ============================================
 
+def _novo_agregado(com_partidas: bool = True) -> Dict:
+    """Cria a entrada vazia do índice de um jogador.
+
+    Com com_partidas=False o agregado guarda só os contadores (útil para
+    agregados parciais calculados fora do processo principal).
+    """
+    agg = {
+        "total": 0,
+        "vitorias": 0,
+        "soma_pontuacao": 0,
+        "soma_tentativas": 0,
+        "melhor_pontuacao": 0,
+        "menor_tentativas": None,  # menor nº de tentativas em vitórias
+    }
+    if com_partidas:
+        agg["partidas"] = array("I")  # posições em `partidas`
+    return agg
+
+
+_AGREGADO_VAZIO = _novo_agregado()
+
+
+def _indexar_partida(partida: Dict, posicao: Optional[int] = None) -> None:
+    """Atualiza os agregados do jogador com uma nova partida (O(1)).
+
+    `posicao` é o índice da partida em `partidas`; sem ela (backend
+    particionado) só os contadores são atualizados.
+    """
+    usuario = partida.get("jogador")
+    agg = indice_jogadores.get(usuario)
+    if agg is None:
+        agg = indice_jogadores[usuario] = _novo_agregado()
+    if posicao is not None:
+        agg["partidas"].append(posicao)
+    _somar_partida(agg, partida)
+
+
+def _somar_partida(agg: Dict, partida: Dict) -> None:
+    """Soma uma partida aos contadores de um agregado."""
+    vitoria = partida.get("resultado") == "Vitória"
+    _somar(
+        agg,
+        partida.get("pontuacao", 0),
+        partida.get("total_tentativas", 0),
+        vitoria,
+    )
+
+
+def _somar(agg: Dict, pontuacao: int, total_tentativas: int, vitoria: bool) -> None:
+    agg["total"] += 1
+    agg["soma_pontuacao"] += pontuacao
+    agg["soma_tentativas"] += total_tentativas
+    if pontuacao > agg["melhor_pontuacao"]:
+        agg["melhor_pontuacao"] = pontuacao
+    if vitoria:
+        agg["vitorias"] += 1
+        if agg["menor_tentativas"] is None or total_tentativas < agg["menor_tentativas"]:
+            agg["menor_tentativas"] = total_tentativas
+
+
+def _combinar_agregados(destino: Dict, origem: Dict) -> None:
+    """Soma os contadores de `origem` em `destino` (merge de agregados parciais)."""
+    for chave in ("total", "vitorias", "soma_pontuacao", "soma_tentativas"):
+        destino[chave] += origem[chave]
+    destino["melhor_pontuacao"] = max(destino["melhor_pontuacao"], origem["melhor_pontuacao"])
+    if origem["menor_tentativas"] is not None and (
+        destino["menor_tentativas"] is None
+        or origem["menor_tentativas"] < destino["menor_tentativas"]
+    ):
+        destino["menor_tentativas"] = origem["menor_tentativas"]
+
+
+def _reconstruir_indice() -> None:
+    """Reconstrói o índice por jogador a partir de `partidas` (uma passada).
+
+    Percorre as colunas da tabela diretamente, sem montar visões.
+    """
+    indice_jogadores.clear()
+    por_codigo: List[Dict] = []
+    for usuario in partidas.usuarios:
+        agg = indice_jogadores.get(usuario)
+        if agg is None:
+            agg = indice_jogadores[usuario] = _novo_agregado()
+        por_codigo.append(agg)
+    for posicao, (codigo, pontuacao, total, vitoria) in enumerate(
+        zip(partidas.jogador, partidas.pontuacao, partidas.total_tentativas, partidas.resultado)
+    ):
+        agg = por_codigo[codigo]
+        agg["partidas"].append(posicao)
+        _somar(agg, pontuacao, total, vitoria)
+    _datas_partidas.clear()
+    _datas_partidas.update(partidas.datas())
+    _reconstruir_placares()
+    _reconstruir_baldes()
+    _descartar_agregados_config()
+
+
+def _agregado(usuario: str) -> Dict:
+    """Retorna os agregados de um jogador (entrada vazia se não jogou)."""
+    if _banco is not None:
+        return _banco.agregado(usuario) or _AGREGADO_VAZIO
+    return indice_jogadores.get(usuario, _AGREGADO_VAZIO)
+
+
 def _partidas_do_usuario(usuario: str) -> List[Dict]:
-    """Retorna todas as partidas de um usuário (list comprehension)."""
-    return [p for p in partidas if p.get("jogador") == usuario]
+    """Retorna todas as partidas de um usuário (via índice por jogador)."""
+    if _banco is not None:
+        return _banco.partidas_do_usuario(usuario)
+    if _armazem is not None:
+        return _armazem.partidas_do_usuario(usuario)
+    return [partidas[i] for i in _agregado(usuario)["partidas"]]
 
 
 def calcular_taxa_vitoria(usuario: str) -> float:
     """Calcula taxa de vitórias (%) de um jogador."""
-    ps = _partidas_do_usuario(usuario)
-    if not ps:
+    agg = _agregado(usuario)
+    if not agg["total"]:
         return 0.0
-    vitorias = sum(1 for p in ps if p.get("resultado") == "Vitória")
-    return (vitorias / len(ps)) * 100
+    return (agg["vitorias"] / agg["total"]) * 100
 
 
 def media_tentativas(usuario: str) -> float:
     """Calcula média de tentativas por partida de um jogador."""
-    ps = _partidas_do_usuario(usuario)
-    if not ps:
+    agg = _agregado(usuario)
+    if not agg["total"]:
         return 0.0
-    return sum(p.get("total_tentativas", 0) for p in ps) / len(ps)
+    return agg["soma_tentativas"] / agg["total"]
 
 
 def calcular_estatisticas_jogador(usuario: str) -> Dict:
     """Calcula estatísticas completas de um jogador."""
-    ps = _partidas_do_usuario(usuario)
-    dados = jogadores.get(usuario, {})
-    total = len(ps)
-    vitorias = sum(1 for p in ps if p.get("resultado") == "Vitória")
+    return _estatisticas_de_agregado(usuario, _agregado(usuario), login_jogador(usuario))
+
+
+def _estatisticas_de_agregado(usuario: str, agg: Dict, dados: Optional[Dict]) -> Dict:
+    """Monta o dict de estatísticas de um jogador a partir do seu agregado."""
+    dados = dados or {}
+    total = agg["total"]
+    vitorias = agg["vitorias"]
     derrotas = total - vitorias
     taxa = (vitorias / total) * 100 if total else 0.0
-    media = sum(p.get("total_tentativas", 0) for p in ps) / total if total else 0.0
-    melhor = max((p.get("pontuacao", 0) for p in ps), default=0)
-    soma = sum(p.get("pontuacao", 0) for p in ps)
+    media = agg["soma_tentativas"] / total if total else 0.0
+    melhor = agg["melhor_pontuacao"]
+    soma = agg["soma_pontuacao"]
 
     return {
         usuario: {
@@ -292,13 +1317,26 @@ def estatisticas_resumidas() -> Dict[str, int]:
 
     Retorna {usuario: total_partidas}
     """
-    return {user: len(_partidas_do_usuario(user)) for user in jogadores}
+    if _banco is not None:
+        return _banco.totais_por_jogador()
+    return {user: _agregado(user)["total"] for user in jogadores}
 
 
 def estatisticas_funcionais(usuario: str) -> Dict[str, float]:
+    """Informações funcionais sobre as pontuações do usuário.
+
+    Lidas da visão de agregados do jogador, sem percorrer as partidas; a
+    versão com map/filter/reduce sobre as partidas está em
+    `estatisticas_funcionais_partidas`.
+    """
+    return _funcionais_de_agregado(_agregado(usuario))
+
+
+def estatisticas_funcionais_partidas(usuario: str) -> Dict[str, float]:
     """Demonstra uso de map, filter, reduce e lambda.
 
-    Retorna informações funcionais sobre as pontuações do usuário.
+    Mesmo resultado de estatisticas_funcionais, calculado a partir das
+    partidas do usuário.
     """
     ps = _partidas_do_usuario(usuario)
 
@@ -326,71 +1364,646 @@ def estatisticas_funcionais(usuario: str) -> Dict[str, float]:
 # RANKINGS
 # ============================================
 
+class Placar:
+    """Ranking mantido sempre ordenado (lista ordenada + bisect).
+
+    Cada entrada é (chave, ordem, usuario): `chave` é o valor do critério
+    (negado quando o ranking é decrescente) e `ordem` a posição de cadastro
+    do jogador, que desempata como o `sort` estável sobre `jogadores`.
+
+    - atualizar/remover: busca O(log N), mas inserir/apagar na lista
+      desloca O(N) entradas (um memmove; barato até centenas de milhares)
+    - topo(k): O(k)
+    - posicao(usuario): O(log N)
+    """
+
+    def __init__(self, decrescente: bool = True) -> None:
+        self.decrescente = decrescente
+        self._entradas: List[Tuple] = []
+        self._por_usuario: Dict[str, Tuple] = {}
+        self._valores: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __contains__(self, usuario: str) -> bool:
+        return usuario in self._por_usuario
+
+    def entradas(self) -> Iterator[Tuple]:
+        """Itera as entradas internas (chave, ordem, usuario) em ordem."""
+        return iter(self._entradas)
+
+    def valor(self, usuario: str) -> Optional[float]:
+        return self._valores.get(usuario)
+
+    def atualizar(self, usuario: str, valor: float, ordem: int) -> None:
+        """Insere ou reposiciona um jogador com o novo valor."""
+        chave = -valor if self.decrescente else valor
+        entrada = (chave, ordem, usuario)
+        if self._por_usuario.get(usuario) == entrada:
+            return
+        self.remover(usuario)
+        insort(self._entradas, entrada)
+        self._por_usuario[usuario] = entrada
+        self._valores[usuario] = valor
+
+    def remover(self, usuario: str) -> None:
+        entrada = self._por_usuario.pop(usuario, None)
+        if entrada is None:
+            return
+        del self._entradas[bisect_left(self._entradas, entrada)]
+        del self._valores[usuario]
+
+    def limpar(self) -> None:
+        self._entradas.clear()
+        self._por_usuario.clear()
+        self._valores.clear()
+
+    def topo(self, k: int) -> List[Tuple[str, float]]:
+        """Retorna os k primeiros como [(usuario, valor), ...]."""
+        return [(u, self._valores[u]) for _, _, u in self._entradas[:k]]
+
+    def antes_de(self, entrada: Tuple) -> int:
+        """Quantas entradas vêm antes de `entrada` na ordem do ranking."""
+        return bisect_left(self._entradas, entrada)
+
+    def posicao(self, usuario: str) -> Optional[int]:
+        """Posição (1 = primeiro) do jogador, ou None se não está no ranking."""
+        entrada = self._por_usuario.get(usuario)
+        if entrada is None:
+            return None
+        return bisect_left(self._entradas, entrada) + 1
+
+
+# Ordem de cadastro (desempate dos rankings) e placares incrementais
+_ordem_cadastro: Dict[str, int] = {}
+placar_pontuacao_media = Placar(decrescente=True)
+placar_vitorias = Placar(decrescente=True)
+placar_melhor_pontuacao = Placar(decrescente=True)
+# Menor nº de tentativas: só quem já venceu. Quem nunca venceu entra com
+# MAX_TENTATIVAS na hora da consulta, pois esse limite pode mudar em
+# _configuracoes; por isso fica numa lista separada, ordenada por cadastro.
+placar_menor_tentativas = Placar(decrescente=False)
+_sem_vitoria: List[Tuple[int, str]] = []
+
+
+def _atualizar_placares(usuario: str) -> None:
+    """Reposiciona um jogador cadastrado nos placares após uma mudança."""
+    if usuario not in jogadores:
+        return
+    ordem = _ordem_cadastro.get(usuario)
+    if ordem is None:
+        ordem = _ordem_cadastro[usuario] = len(_ordem_cadastro)
+
+    agg = _agregado(usuario)
+    if agg["total"]:
+        media = round(agg["soma_pontuacao"] / agg["total"], 2)
+        placar_pontuacao_media.atualizar(usuario, media, ordem)
+    placar_vitorias.atualizar(usuario, agg["vitorias"], ordem)
+    placar_melhor_pontuacao.atualizar(usuario, agg["melhor_pontuacao"], ordem)
+
+    item = (ordem, usuario)
+    i = bisect_left(_sem_vitoria, item)
+    registrado = i < len(_sem_vitoria) and _sem_vitoria[i] == item
+    if agg["menor_tentativas"] is None:
+        if not registrado:
+            _sem_vitoria.insert(i, item)
+    else:
+        if registrado:
+            del _sem_vitoria[i]
+        placar_menor_tentativas.atualizar(usuario, agg["menor_tentativas"], ordem)
+
+
+def _reconstruir_placares() -> None:
+    """Reconstrói todos os placares a partir de `jogadores` e do índice."""
+    _ordem_cadastro.clear()
+    for placar in (
+        placar_pontuacao_media,
+        placar_vitorias,
+        placar_melhor_pontuacao,
+        placar_menor_tentativas,
+    ):
+        placar.limpar()
+    _sem_vitoria.clear()
+    for usuario in jogadores:
+        _atualizar_placares(usuario)
+
+
 def ranking_pontuacao_media(limite: int = 10) -> List[Tuple[str, float]]:
     """Gera ranking por pontuação média."""
-    resultados: List[Tuple[str, float]] = []
-    for usuario in jogadores.keys():
-        ps = _partidas_do_usuario(usuario)
-        if not ps:
-            continue
-        media = sum(p["pontuacao"] for p in ps) / len(ps)
-        resultados.append((usuario, round(media, 2)))
-    resultados.sort(key=lambda x: x[1], reverse=True)
-    return resultados[:limite]
+    if _banco is not None:
+        return _banco.ranking_pontuacao_media(limite)
+    return placar_pontuacao_media.topo(limite)
 
 
 def ranking_vitorias(limite: int = 10) -> List[Tuple[str, int]]:
     """Gera ranking por número de vitórias."""
-    resultados: List[Tuple[str, int]] = []
-    for usuario in jogadores.keys():
-        ps = _partidas_do_usuario(usuario)
-        vitorias = sum(1 for p in ps if p["resultado"] == "Vitória")
-        resultados.append((usuario, vitorias))
-    resultados.sort(key=lambda x: x[1], reverse=True)
-    return resultados[:limite]
+    if _banco is not None:
+        return _banco.ranking_vitorias(limite)
+    return placar_vitorias.topo(limite)
 
 
 def ranking_melhor_pontuacao(limite: int = 10) -> List[Tuple[str, int]]:
     """Gera ranking por melhor pontuação única."""
-    resultados: List[Tuple[str, int]] = []
-    for usuario in jogadores.keys():
-        melhor = max(
-            (p.get("pontuacao", 0) for p in _partidas_do_usuario(usuario)),
-            default=0,
-        )
-        resultados.append((usuario, melhor))
-    resultados.sort(key=lambda x: x[1], reverse=True)
-    return resultados[:limite]
+    if _banco is not None:
+        return _banco.ranking_melhor_pontuacao(limite)
+    return placar_melhor_pontuacao.topo(limite)
 
 
 def ranking_menor_tentativas(limite: int = 10) -> List[Tuple[str, int]]:
-    """Gera ranking por menor número de tentativas nas vitórias."""
-    resultados: List[Tuple[str, int]] = []
-    for usuario in jogadores.keys():
-        melhor = min(
-            (
-                p.get("total_tentativas", MAX_TENTATIVAS)
-                for p in _partidas_do_usuario(usuario)
-                if p.get("resultado") == "Vitória"
-            ),
-            default=MAX_TENTATIVAS,
+    """Gera ranking por menor número de tentativas nas vitórias.
+
+    Intercala (heapq.merge) os vencedores com quem nunca venceu, que
+    conta como MAX_TENTATIVAS; custo O(limite).
+    """
+    if _banco is not None:
+        return _banco.ranking_menor_tentativas(limite, MAX_TENTATIVAS)
+    vencedores = placar_menor_tentativas.entradas()
+    sem_vitoria = ((MAX_TENTATIVAS, ordem, u) for ordem, u in _sem_vitoria)
+    return [
+        (u, valor)
+        for valor, _, u in islice(heapq.merge(vencedores, sem_vitoria), limite)
+    ]
+
+
+def posicao_ranking(usuario: str) -> Dict[str, Optional[int]]:
+    """Posição do jogador (1 = primeiro) em cada ranking (None se fora dele).
+
+    Em memória é uma busca binária nos placares, O(log N); no SQLite,
+    contagens sobre os índices dos agregados.
+    """
+    if _banco is not None:
+        return _banco.posicao_ranking(usuario, MAX_TENTATIVAS)
+    pos_menor: Optional[int] = None
+    if usuario in _ordem_cadastro:
+        ordem = _ordem_cadastro[usuario]
+        valor = placar_menor_tentativas.valor(usuario)
+        if valor is None:
+            valor = MAX_TENTATIVAS
+        entrada = (valor, ordem, usuario)
+        # vencedores antes + quem nunca venceu (valor MAX_TENTATIVAS) antes
+        if valor < MAX_TENTATIVAS:
+            sem_vitoria_antes = 0
+        elif valor > MAX_TENTATIVAS:
+            sem_vitoria_antes = len(_sem_vitoria)
+        else:
+            sem_vitoria_antes = bisect_left(_sem_vitoria, (ordem, usuario))
+        pos_menor = placar_menor_tentativas.antes_de(entrada) + sem_vitoria_antes + 1
+    return {
+        "ranking_pontuacao_media": placar_pontuacao_media.posicao(usuario),
+        "ranking_vitorias": placar_vitorias.posicao(usuario),
+        "ranking_melhor_pontuacao": placar_melhor_pontuacao.posicao(usuario),
+        "ranking_menor_tentativas": pos_menor,
+    }
+
+
+def rankings_gerais(limite: int = 10) -> Dict[str, List[Tuple[str, float]]]:
+    """Calcula os quatro rankings uma única vez (exibição e relatório)."""
+    return {
+        "ranking_pontuacao_media": ranking_pontuacao_media(limite),
+        "ranking_vitorias": ranking_vitorias(limite),
+        "ranking_melhor_pontuacao": ranking_melhor_pontuacao(limite),
+        "ranking_menor_tentativas": ranking_menor_tentativas(limite),
+    }
+
+
+# ============================================
+# RANKINGS POR JANELA (dia / semana / mês)
+# ============================================
+# Baldes diários: contadores por (dia, jogador) mantidos pelos eventos de
+# partida. O ranking da semana soma 7 baldes em vez de varrer partidas, e
+# a soma de cada janela fica em cache até virar o dia (partidas novas são
+# somadas nela também). Só ficam os dias da maior janela; ao virar o dia,
+# os baldes que saíram de todas as janelas são descartados. No SQLite os
+# baldes são a tabela agregados_dia.
+
+JANELAS_RANKING: Dict[str, int] = {"diario": 1, "semanal": 7, "mensal": 30}
+CRITERIOS_RANKING = ("pontuacao_media", "vitorias", "melhor_pontuacao", "menor_tentativas")
+
+_baldes_diarios: Dict[int, Dict[str, Dict]] = {}  # ordinal do dia -> {usuario: contadores}
+_dia_baldes: int = 0  # ordinal de "hoje" na última poda
+_janelas_em_cache: Dict[Tuple[int, int], Dict[str, Dict]] = {}  # (dias, hoje) -> soma
+
+
+def _hoje() -> int:
+    return datetime.now().date().toordinal()
+
+
+def _primeiro_dia_guardado(hoje: int) -> int:
+    return hoje - max(JANELAS_RANKING.values()) + 1
+
+
+def _somar_ao_balde(partida: Dict, agregado: Optional[Dict] = None) -> None:
+    """Soma uma partida ao balde do seu dia e às janelas em cache que a cobrem.
+
+    Com `agregado`, soma-o no lugar da partida (várias partidas do mesmo
+    dia e jogador; a partida só informa o dia e o jogador).
+    """
+    dia = ordinal_iso(partida.get("data"))
+    if dia is None or dia < _primeiro_dia_guardado(_dia_baldes):
+        return
+    usuario = partida.get("jogador")
+    destinos = [_baldes_diarios.setdefault(dia, {})]
+    destinos.extend(
+        agregados
+        for (dias, hoje), agregados in _janelas_em_cache.items()
+        if hoje - dias < dia <= hoje
+    )
+    for agregados in destinos:
+        agg = agregados.get(usuario)
+        if agg is None:
+            agg = agregados[usuario] = _novo_agregado(com_partidas=False)
+        if agregado is None:
+            _somar_partida(agg, partida)
+        else:
+            _combinar_agregados(agg, agregado)
+
+
+def _rolar_baldes() -> int:
+    """Descarta os baldes fora de todas as janelas se o dia virou; retorna hoje."""
+    global _dia_baldes
+    hoje = _hoje()
+    if hoje != _dia_baldes:
+        _dia_baldes = hoje
+        corte = _primeiro_dia_guardado(hoje)
+        for dia in [d for d in _baldes_diarios if d < corte]:
+            del _baldes_diarios[dia]
+        _janelas_em_cache.clear()
+        if _banco is not None:
+            _banco.descartar_dias_antes(date.fromordinal(corte).isoformat())
+    return hoje
+
+
+def _reconstruir_baldes() -> None:
+    """Refaz os baldes diários a partir das partidas guardadas (só a maior janela)."""
+    global _dia_baldes
+    _baldes_diarios.clear()
+    _janelas_em_cache.clear()
+    _dia_baldes = 0
+    hoje = _rolar_baldes()  # no SQLite, só a poda
+    if _banco is not None:
+        return
+    corte = _primeiro_dia_guardado(hoje)
+    if _armazem is not None:
+        inicio = date.fromordinal(corte).isoformat()
+        for p in _armazem.partidas_no_periodo(inicio, date.max.isoformat()):
+            _somar_ao_balde(p)
+        return
+    # backend arquivo: direto das colunas (datas fora do ISO têm código < 0)
+    for posicao, dia in enumerate(partidas.data):
+        if dia >= corte:
+            balde = _baldes_diarios.setdefault(dia, {})
+            usuario = partidas.usuarios[partidas.jogador[posicao]]
+            agg = balde.get(usuario)
+            if agg is None:
+                agg = balde[usuario] = _novo_agregado(com_partidas=False)
+            _somar(
+                agg,
+                partidas.pontuacao[posicao],
+                partidas.total_tentativas[posicao],
+                partidas.resultado[posicao],
+            )
+
+
+def _agregados_janela(janela: str) -> Dict[str, Dict]:
+    """Contadores por jogador nos últimos dias da janela (somando os baldes)."""
+    dias = JANELAS_RANKING.get(janela)
+    if dias is None:
+        raise ValueError(f"Janela desconhecida: {janela} (use {', '.join(JANELAS_RANKING)})")
+    hoje = _rolar_baldes()
+    if _banco is not None:
+        return _banco.agregados_no_periodo(
+            date.fromordinal(hoje - dias + 1).isoformat(), date.fromordinal(hoje).isoformat()
         )
-        resultados.append((usuario, melhor))
-    resultados.sort(key=lambda x: x[1])
-    return resultados[:limite]
+    agregados = _janelas_em_cache.get((dias, hoje))
+    if agregados is None:
+        agregados = {}
+        for dia in range(hoje - dias + 1, hoje + 1):
+            for usuario, agg in _baldes_diarios.get(dia, {}).items():
+                destino = agregados.get(usuario)
+                if destino is None:
+                    destino = agregados[usuario] = _novo_agregado(com_partidas=False)
+                _combinar_agregados(destino, agg)
+        _janelas_em_cache[(dias, hoje)] = agregados
+    return agregados
+
+
+def _valor_criterio(agg: Dict, criterio: str, max_tentativas: Optional[int] = None) -> float:
+    if criterio == "pontuacao_media":
+        return round(agg["soma_pontuacao"] / agg["total"], 2)
+    if criterio == "menor_tentativas":
+        menor = agg["menor_tentativas"]
+        if menor is None:
+            return MAX_TENTATIVAS if max_tentativas is None else max_tentativas
+        return menor
+    return agg[criterio]
+
+
+def _ranquear(
+    agregados: Dict[str, Dict], criterio: str, limite: int, max_tentativas: Optional[int] = None
+) -> List[Tuple[str, float]]:
+    """Top `limite` de agregados parciais, com o desempate dos rankings gerais.
+
+    Entram só os jogadores cadastrados; do SQLite os agregados já vêm só
+    com eles, na ordem de cadastro.
+    """
+    if criterio not in CRITERIOS_RANKING:
+        raise ValueError(f"Critério desconhecido: {criterio}")
+    if _banco is not None:
+        ordem = {u: i for i, u in enumerate(agregados)}
+    else:
+        ordem = _ordem_cadastro
+    sinal = 1 if criterio == "menor_tentativas" else -1
+    candidatos = []
+    for u, agg in agregados.items():
+        if u in ordem:
+            valor = _valor_criterio(agg, criterio, max_tentativas)
+            candidatos.append((sinal * valor, ordem[u], u, valor))
+    return [(u, valor) for _, _, u, valor in heapq.nsmallest(limite, candidatos)]
+
+
+def ranking_janela(
+    janela: str, criterio: str = "pontuacao_media", limite: int = 10
+) -> List[Tuple[str, float]]:
+    """Ranking só com as partidas da janela ("diario", "semanal" ou "mensal").
+
+    Mesmos critérios e desempate (ordem de cadastro) dos rankings gerais,
+    mas entram só os jogadores cadastrados que jogaram na janela; quem não
+    venceu nela conta como MAX_TENTATIVAS em menor_tentativas.
+    """
+    return _ranquear(_agregados_janela(janela), criterio, limite)
+
+
+def rankings_janela(janela: str, limite: int = 10) -> Dict[str, List[Tuple[str, float]]]:
+    """Os quatro rankings de uma janela, nas chaves de rankings_gerais."""
+    return {f"ranking_{c}": ranking_janela(janela, c, limite) for c in CRITERIOS_RANKING}
+
+
+# ============================================
+# RANKINGS POR CONFIGURAÇÃO
+# ============================================
+# Contadores por (configuração, jogador): montados na primeira consulta
+# (uma passada pelas partidas) e depois mantidos pelos eventos de partida.
+# No SQLite são a tabela agregados_config.
+
+_agregados_config: Optional[Dict[str, Dict[str, Dict]]] = None  # config -> {usuario: contadores}
+
+
+def _descartar_agregados_config() -> None:
+    """Invalida os contadores por configuração (remontados na próxima consulta)."""
+    global _agregados_config
+    _agregados_config = None
+
+
+def _somar_a_configuracao(partida: Dict, agregado: Optional[Dict] = None) -> None:
+    if _agregados_config is None:
+        return
+    por_usuario = _agregados_config.setdefault(partida.get("config") or CONFIG_PADRAO, {})
+    agg = por_usuario.get(partida.get("jogador"))
+    if agg is None:
+        agg = por_usuario[partida.get("jogador")] = _novo_agregado(com_partidas=False)
+    if agregado is None:
+        _somar_partida(agg, partida)
+    else:
+        _combinar_agregados(agg, agregado)
+
+
+def _agregados_por_configuracao() -> Dict[str, Dict[str, Dict]]:
+    global _agregados_config
+    if _agregados_config is None:
+        _agregados_config = {}
+        if _armazem is not None:
+            for p in _armazem.iterar():
+                _somar_a_configuracao(p)
+            return _agregados_config
+        # backend arquivo: direto das colunas
+        por_codigo: Dict[Tuple[int, int], Dict] = {}
+        for chave, pontuacao, total, vitoria in zip(
+            zip(partidas.config, partidas.jogador),
+            partidas.pontuacao,
+            partidas.total_tentativas,
+            partidas.resultado,
+        ):
+            agg = por_codigo.get(chave)
+            if agg is None:
+                por_usuario = _agregados_config.setdefault(partidas.configs[chave[0]], {})
+                agg = por_codigo[chave] = por_usuario[partidas.usuarios[chave[1]]] = _novo_agregado(
+                    com_partidas=False
+                )
+            _somar(agg, pontuacao, total, vitoria)
+    return _agregados_config
+
+
+def configuracoes_registradas() -> set:
+    """Configurações com partidas registradas."""
+    if _banco is not None:
+        return _banco.configuracoes()
+    return {c for c, por_usuario in _agregados_por_configuracao().items() if por_usuario}
+
+
+def ranking_configuracao(
+    criterio: str = "pontuacao_media", limite: int = 10, config: Optional[str] = None
+) -> List[Tuple[str, float]]:
+    """Ranking só com as partidas de uma configuração (padrão: a atual).
+
+    Em menor_tentativas, quem não venceu nela conta com o máximo de
+    tentativas da própria configuração, não com o MAX_TENTATIVAS atual.
+    """
+    config = config or configuracao_atual()
+    _, _, max_tentativas = ler_configuracao(config)
+    if _banco is not None:
+        agregados = _banco.agregados_da_configuracao(config)
+    else:
+        agregados = _agregados_por_configuracao().get(config, {})
+    return _ranquear(agregados, criterio, limite, max_tentativas)
+
+
+def rankings_configuracao(
+    config: Optional[str] = None, limite: int = 10
+) -> Dict[str, List[Tuple[str, float]]]:
+    """Os quatro rankings de uma configuração, nas chaves de rankings_gerais."""
+    return {
+        f"ranking_{c}": ranking_configuracao(c, limite, config) for c in CRITERIOS_RANKING
+    }
 
 
 # ============================================
 # RELATÓRIOS
 # ============================================
+# Cada arquivo de relatorios/ fica associado à versão dos dados com que foi
+# gerado (relatorios/.versoes.json). Enquanto a versão não muda, o conteúdo
+# já gravado é servido sem recalcular nem regravar:
+#   - ranking_geral.txt: [próximo id de partida, nº de jogadores, geração
+#     do histórico, MAX_TENTATIVAS] — muda com partidas novas, cadastros,
+#     repontuação (que avança a geração: dados/.geracao, ou a tabela meta
+#     no SQLite) e mudança do limite de tentativas
+#   - estatisticas_<usuario>.txt: nome e contadores do agregado do jogador,
+#     então só os jogadores com partidas novas (ou repontuadas) regeneram
+
+ARQ_VERSOES_RELATORIOS = ".versoes.json"
+
+_versoes_relatorios: Dict[str, Dict[str, list]] = {}  # caminho do índice -> versões
+_relatorios_em_memoria: Dict[str, Tuple[list, Dict]] = {}  # caminho -> (versão, conteúdo)
+
+
+def _caminho_versoes() -> str:
+    return os.path.join(BASE_RELATORIOS, ARQ_VERSOES_RELATORIOS)
+
+
+def _versoes() -> Dict[str, list]:
+    """Versões dos relatórios gravados (lidas do disco uma vez)."""
+    caminho = _caminho_versoes()
+    versoes = _versoes_relatorios.get(caminho)
+    if versoes is None:
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                versoes = json.load(f)
+        except (OSError, ValueError):
+            versoes = {}
+        _versoes_relatorios[caminho] = versoes
+    return versoes
+
+
+def _salvar_versoes() -> None:
+    versoes = _versoes()
+    gravar_atomico(_caminho_versoes(), lambda f: json.dump(versoes, f, ensure_ascii=False), DURABILIDADE)
+
+
+def versao_dados() -> list:
+    """Versão global dos dados: [próximo id, nº de jogadores, geração do histórico]."""
+    if _banco is not None:
+        return [contador_partidas, *_banco.versao_dados()]
+    return [contador_partidas, len(jogadores), _geracao()]
+
+
+def _versao_jogador(usuario: str) -> list:
+    """Versão do relatório de um jogador: nome + contadores do agregado."""
+    agg = _agregado(usuario)
+    dados = login_jogador(usuario) or {}
+    return [
+        dados.get("nome", usuario),
+        agg["total"],
+        agg["vitorias"],
+        agg["soma_pontuacao"],
+        agg["soma_tentativas"],
+        agg["melhor_pontuacao"],
+        agg["menor_tentativas"],
+    ]
+
+
+def _relatorio_em_cache(arquivo: str, versao: list, gerar: Callable[[], Dict]) -> Dict:
+    """Conteúdo do relatório: do cache se a versão bate, senão gera e grava."""
+    caminho = os.path.join(BASE_RELATORIOS, arquivo)
+    em_memoria = _relatorios_em_memoria.get(caminho)
+    if em_memoria is not None and em_memoria[0] == versao:
+        return em_memoria[1]
+
+    conteudo = None
+    versoes = _versoes()
+    if versoes.get(arquivo) == versao:
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                conteudo = json.load(f)
+        except (OSError, ValueError):
+            pass  # apagado ou corrompido: gera de novo
+    if conteudo is None:
+        conteudo = gerar()
+        _garantir_pastas()
+        gravar_atomico(
+            caminho, lambda f: json.dump(conteudo, f, ensure_ascii=False, indent=2), DURABILIDADE
+        )
+        versoes[arquivo] = versao
+        _salvar_versoes()
+    _relatorios_em_memoria[caminho] = (versao, conteudo)
+    return conteudo
+
+
+def _funcionais_de_agregado(agg: Dict) -> Dict[str, float]:
+    """Estatísticas funcionais (soma, média, maior, vitórias) de um agregado."""
+    total = agg["total"]
+    soma = agg["soma_pontuacao"]
+    return {
+        "soma_total": soma,
+        "media_pontuacao": round(soma / total, 1) if total else 0,
+        "maior_pontuacao": agg["melhor_pontuacao"],
+        "total_vitorias": agg["vitorias"],
+    }
+
+
+def _conteudo_relatorio_jogador(usuario: str) -> Dict:
+    return {
+        "estatisticas": calcular_estatisticas_jogador(usuario),
+        "funcionais": _funcionais_de_agregado(_agregado(usuario)),
+    }
+
+
+def relatorio_jogador(usuario: str) -> Dict:
+    """Relatório individual (estatisticas_<usuario>.txt), regenerado só se mudou."""
+    return _relatorio_em_cache(
+        f"estatisticas_{usuario}.txt",
+        _versao_jogador(usuario),
+        lambda: _conteudo_relatorio_jogador(usuario),
+    )
+
+
+def relatorio_ranking() -> Dict:
+    """Relatório geral (ranking_geral.txt), regenerado só se os dados mudaram."""
+    # MAX_TENTATIVAS entra na versão: é o valor de quem nunca venceu
+    return _relatorio_em_cache("ranking_geral.txt", versao_dados() + [MAX_TENTATIVAS], rankings_gerais)
+
+
+def _gravar_relatorio_em_lote(caminho: str, dados: bytes) -> None:
+    """Troca atômica com fsync só deste arquivo; a pasta (durabilidade
+    completa) é sincronizada uma vez no fim do lote."""
+    temporario = caminho + ".tmp"
+    fd = os.open(temporario, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, dados)
+        if DURABILIDADE != "nenhuma":
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temporario, caminho)
+
+
+def regenerar_relatorios_jogadores(todos: bool = False) -> int:
+    """Regrava os relatórios individuais desatualizados (ou todos, com todos=True).
+
+    Em lote: o conteúdo sai dos agregados (sem percorrer partidas), cada
+    arquivo é gravado numa única escrita (fsync só dele) e a pasta, com
+    durabilidade completa, é sincronizada uma vez antes de gravar o
+    índice de versões.
+    Retorna quantos relatórios foram gravados.
+    """
+    _garantir_pastas()
+    versoes = _versoes()
+    usuarios = _banco.usuarios() if _banco is not None else list(jogadores)
+    gravados = 0
+    for usuario in usuarios:
+        arquivo = f"estatisticas_{usuario}.txt"
+        versao = _versao_jogador(usuario)
+        if not todos and versoes.get(arquivo) == versao:
+            continue
+        conteudo = _conteudo_relatorio_jogador(usuario)
+        caminho = os.path.join(BASE_RELATORIOS, arquivo)
+        _gravar_relatorio_em_lote(
+            caminho, json.dumps(conteudo, ensure_ascii=False, indent=2).encode("utf-8")
+        )
+        versoes[arquivo] = versao
+        _relatorios_em_memoria[caminho] = (versao, conteudo)
+        gravados += 1
+    if gravados:
+        # relatórios no disco antes do índice que os declara válidos
+        if DURABILIDADE == "completa":
+            sincronizar_pasta(_caminho_versoes())
+        _salvar_versoes()
+    return gravados
+
 
 def exibir_estatisticas_jogador(usuario: str) -> None:
-    """Exibe e salva estatísticas detalhadas de um jogador."""
-    stats = calcular_estatisticas_jogador(usuario)
-    if not stats.get(usuario):
-        print("Nenhum dado para este jogador.")
-        return
-    s = stats[usuario]
+    """Exibe as estatísticas detalhadas de um jogador (relatório em cache)."""
+    relatorio = relatorio_jogador(usuario)
+    s = relatorio["estatisticas"][usuario]
     print("\n📈 Estatísticas —", s["nome"])
     print(f"Total de partidas: {s['total_partidas']}")
     print(f"Vitórias: {s['vitorias']} | Derrotas: {s['derrotas']}")
@@ -399,70 +2012,103 @@ def exibir_estatisticas_jogador(usuario: str) -> None:
     print(f"Melhor pontuação: {s['melhor_pontuacao']}")
     print(f"Pontuação total: {s['pontuacao_total']}")
 
-    # Exemplo de uso das estatísticas funcionais (lambda/map/filter/reduce)
-    func = estatisticas_funcionais(usuario)
+    # posições ao vivo: dependem dos outros jogadores, não entram no relatório
+    posicoes = posicao_ranking(usuario)
+    print("\n🏆 Posição nos rankings:")
+    for chave, titulo in (
+        ("ranking_pontuacao_media", "Pontuação média"),
+        ("ranking_vitorias", "Número de vitórias"),
+        ("ranking_melhor_pontuacao", "Melhor pontuação única"),
+        ("ranking_menor_tentativas", "Menor nº de tentativas"),
+    ):
+        posicao = posicoes[chave]
+        print(f"{titulo}: {'—' if posicao is None else f'{posicao}º'}")
+
+    # Estatísticas funcionais lidas do agregado do jogador (a versão com
+    # lambda/map/filter/reduce sobre as partidas é estatisticas_funcionais_partidas)
+    func = relatorio["funcionais"]
     print("\n📊 Estatísticas funcionais:")
     print(f"Soma total das pontuações: {func['soma_total']}")
     print(f"Média de pontuação: {func['media_pontuacao']}")
     print(f"Maior pontuação: {func['maior_pontuacao']}")
     print(f"Total de vitórias (filter): {func['total_vitorias']}")
 
-    # salva relatório individual
-    _garantir_pastas()
-    caminho = os.path.join(BASE_RELATORIOS, f"estatisticas_{usuario}.txt")
-    with open(caminho, "w", encoding="utf-8") as f:
-        json.dump(
-            {"estatisticas": stats, "funcionais": func},
-            f,
-            ensure_ascii=False,
-            indent=2,
-        )
-
 
 def exibir_ranking() -> None:
-    """Exibe rankings principais e salva em relatório geral."""
-    print("\n🏆 Ranking — Pontuação média")
-    for i, (u, m) in enumerate(ranking_pontuacao_media(), start=1):
+    """Exibe rankings principais (relatório geral em cache)."""
+    _exibir_rankings(relatorio_ranking())
+
+
+def exibir_ranking_janela(janela: str) -> None:
+    """Exibe os rankings de uma janela (diario, semanal ou mensal)."""
+    _exibir_rankings(rankings_janela(janela), f" ({janela})")
+
+
+def exibir_ranking_configuracao(config: Optional[str] = None) -> None:
+    """Exibe os rankings de uma configuração (padrão: a atual)."""
+    config = config or configuracao_atual()
+    _exibir_rankings(rankings_configuracao(config), f" ({config})")
+
+
+def _exibir_rankings(rel: Dict, sufixo: str = "") -> None:
+    print(f"\n🏆 Ranking — Pontuação média{sufixo}")
+    for i, (u, m) in enumerate(rel["ranking_pontuacao_media"], start=1):
         print(f"{i:2d}. {u:12s}  {m:>6.2f}")
 
-    print("\n🏆 Ranking — Número de vitórias")
-    for i, (u, v) in enumerate(ranking_vitorias(), start=1):
+    print(f"\n🏆 Ranking — Número de vitórias{sufixo}")
+    for i, (u, v) in enumerate(rel["ranking_vitorias"], start=1):
         print(f"{i:2d}. {u:12s}  {v}")
 
-    print("\n🏆 Ranking — Melhor pontuação única")
-    for i, (u, p) in enumerate(ranking_melhor_pontuacao(), start=1):
+    print(f"\n🏆 Ranking — Melhor pontuação única{sufixo}")
+    for i, (u, p) in enumerate(rel["ranking_melhor_pontuacao"], start=1):
         print(f"{i:2d}. {u:12s}  {p}")
 
-    print("\n🏆 Ranking — Menor nº de tentativas (vitórias)")
-    for i, (u, t) in enumerate(ranking_menor_tentativas(), start=1):
+    print(f"\n🏆 Ranking — Menor nº de tentativas (vitórias){sufixo}")
+    for i, (u, t) in enumerate(rel["ranking_menor_tentativas"], start=1):
         print(f"{i:2d}. {u:12s}  {t}")
 
-    # salvar relatório geral
-    rel = {
-        "ranking_pontuacao_media": ranking_pontuacao_media(),
-        "ranking_vitorias": ranking_vitorias(),
-        "ranking_melhor_pontuacao": ranking_melhor_pontuacao(),
-        "ranking_menor_tentativas": ranking_menor_tentativas(),
-    }
-    _garantir_pastas()
-    caminho = os.path.join(BASE_RELATORIOS, "ranking_geral.txt")
-    with open(caminho, "w", encoding="utf-8") as f:
-        json.dump(rel, f, ensure_ascii=False, indent=2)
-
 
 def historico_partidas(usuario: str, limite: int = 10) -> List[Dict]:
     """Retorna histórico recente de partidas de um jogador (ordenado)."""
+    if _banco is not None:
+        return _banco.historico(usuario, limite)
+    if _armazem is not None:
+        return _armazem.historico(usuario, limite)
     ps = _partidas_do_usuario(usuario)
     # Ordena por data e id (mais recentes primeiro)
     ps_ordenadas = sorted(
         ps, key=lambda p: (p.get("data", ""), p.get("id", 0)), reverse=True
     )
-    return ps_ordenadas[:limite]
+    return [dict(p) for p in ps_ordenadas[:limite]]
 
 
 def datas_disponiveis() -> set:
     """Exemplo de uso de set: retorna conjunto de datas com partidas."""
-    return {p.get("data") for p in partidas}
+    if _banco is not None:
+        return _banco.datas()
+    if _armazem is not None:
+        return _armazem.datas()  # só o manifesto
+    return set(_datas_partidas)
+
+
+def partidas_no_periodo(
+    inicio: str, fim: str, usuario: Optional[str] = None
+) -> List[Dict]:
+    """Partidas com data entre `inicio` e `fim` (ISO, inclusivo), por (data, id).
+
+    No backend particionado só os meses do período são lidos.
+    """
+    if _banco is not None:
+        return _banco.partidas_no_periodo(inicio, fim, usuario)
+    if _armazem is not None:
+        return _armazem.partidas_no_periodo(inicio, fim, usuario)
+    if usuario is not None:
+        ps = _partidas_do_usuario(usuario)
+    else:
+        ps = partidas
+    selecionadas = [p for p in ps if inicio <= p.get("data", "") <= fim]
+    selecionadas.sort(key=lambda p: (p.get("data", ""), p.get("id", 0)))
+    return [dict(p) for p in selecionadas]
 
 
 # ============================================
@@ -480,6 +2126,9 @@ def _menu() -> None:
     print("6) Histórico de partidas")
     print("7) Configurações (intervalo/limites)")
     print("8) Datas disponíveis (exemplo de set)")
+    print("9) Regenerar relatórios de todos os jogadores")
+    print("10) Ranking do dia / da semana / do mês")
+    print("11) Ranking por configuração (intervalo/limite)")
     print("0) Sair")
 
 
@@ -487,17 +2136,17 @@ def _configuracoes() -> None:
     """Permite alterar intervalo de números e limite de tentativas."""
     global MIN_NUMERO, MAX_NUMERO, MAX_TENTATIVAS
     try:
-        print(f"Intervalo atual: {MIN_NUMERO}..{MAX_NUMERO} | Máx tentativas: {MAX_TENTATIVAS}")
+        print(f"Intervalo atual: {MIN_NUMERO}..{MAX_NUMERO} | Máx tentativas: {MAX_TENTATIVAS}"
+              f" | Configuração: {configuracao_atual()}")
         a = input("Novo mínimo (Enter para manter): ").strip()
         b = input("Novo máximo (Enter para manter): ").strip()
         c = input("Novo máximo de tentativas (Enter para manter): ").strip()
-        if a:
-            MIN_NUMERO = int(a)
-        if b:
-            MAX_NUMERO = int(b)
-        if c:
-            MAX_TENTATIVAS = max(1, int(c))
-        print("Configurações atualizadas!")
+        minimo = int(a) if a else MIN_NUMERO
+        maximo = int(b) if b else MAX_NUMERO
+        tentativas = max(1, int(c)) if c else MAX_TENTATIVAS
+        ler_configuracao(formatar_configuracao(minimo, maximo, tentativas))  # valida (mín <= máx)
+        MIN_NUMERO, MAX_NUMERO, MAX_TENTATIVAS = minimo, maximo, tentativas
+        print(f"Configurações atualizadas! Novas partidas ficam marcadas com {configuracao_atual()}.")
     except Exception:
         print("Valores inválidos. Nenhuma alteração feita.")
 
@@ -506,84 +2155,127 @@ def _configuracoes() -> None:
 # FUNÇÃO PRINCIPAL
 # ============================================
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """Função principal: laço do menu interativo."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sistema de Jogo de Adivinhação")
+    parser.add_argument(
+        "--metricas", action="store_true", help="mede os pontos quentes (relatorios/metricas_*.json)"
+    )
+    parser.add_argument(
+        "--perfil", choices=instrumentacao.PERFIS, help="captura um perfil de cada ação do menu"
+    )
+    parser.add_argument(
+        "--regenerar-relatorios",
+        action="store_true",
+        help="regrava os relatórios desatualizados de todos os jogadores e sai",
+    )
+    args = parser.parse_args(argv)
+    instrumentacao.ativar_pelo_ambiente(args.metricas, args.perfil, BASE_RELATORIOS)
+
     _carregar_arquivos()
+    if args.regenerar_relatorios:
+        print(f"✅ {regenerar_relatorios_jogadores()} relatórios regenerados.")
+        return
     usuario_logado: Optional[str] = None
 
     while True:
         _menu()
         op = input("Escolha uma opção: ").strip()
+        atualizar_do_disco()
+
+        with instrumentacao.perfil(f"menu {op}"):
+            if op == "1":
+                nome = input("Nome completo: ").strip()
+                usuario = input("Usuário (apelido): ").strip()
+                try:
+                    cadastrar_jogador(nome, usuario)
+                    print("✅ Cadastro realizado!")
+                except ValueError as e:
+                    print("Erro:", e)
+
+            elif op == "2":
+                usuario = input("Usuário: ").strip()
+                if login_jogador(usuario):
+                    usuario_logado = usuario
+                    print(f"👤 Logado como: {usuario_logado}")
+                else:
+                    print("Usuário não encontrado. Cadastre-se primeiro.")
+
+            elif op == "3":
+                if not usuario_logado:
+                    print("Faça login antes de jogar.")
+                    continue
+                try:
+                    jogar_partida(usuario_logado)
+                except ValueError as e:
+                    print("Erro:", e)
+
+            elif op == "4":
+                if not usuario_logado:
+                    print("Faça login para ver estatísticas.")
+                    continue
+                exibir_estatisticas_jogador(usuario_logado)
+
+            elif op == "5":
+                exibir_ranking()
+
+            elif op == "6":
+                if not usuario_logado:
+                    print("Faça login para ver histórico.")
+                    continue
+                hist = historico_partidas(usuario_logado, limite=10)
+                if not hist:
+                    print("Sem partidas registradas.")
+                else:
+                    print("\n🕑 Últimas partidas:")
+                    for p in hist:
+                        print(
+                            f"#{p['id']:03d} | {p['data']} | {p['resultado']:<7} | "
+                            f"tentativas={p['total_tentativas']:>2} | pontos={p['pontuacao']:>3}"
+                        )
+
+            elif op == "7":
+                _configuracoes()
+
+            elif op == "8":
+                # Exemplo de uso de set no menu
+                datas = datas_disponiveis()
+                if not datas:
+                    print("Nenhuma partida registrada ainda.")
+                else:
+                    print("📅 Datas com partidas registradas:")
+                    for d in sorted(datas):
+                        print("-", d)
+
+            elif op == "9":
+                total = regenerar_relatorios_jogadores(todos=True)
+                print(f"✅ {total} relatórios regenerados em {BASE_RELATORIOS}")
+
+            elif op == "10":
+                janela = input("Janela (diario/semanal/mensal): ").strip() or "diario"
+                try:
+                    exibir_ranking_janela(janela)
+                except ValueError as e:
+                    print("Erro:", e)
+
+            elif op == "11":
+                registradas = sorted(configuracoes_registradas())
+                if registradas:
+                    print("Configurações com partidas:", ", ".join(registradas))
+                config = input(f"Configuração (Enter para {configuracao_atual()}): ").strip()
+                try:
+                    exibir_ranking_configuracao(config or None)
+                except ValueError as e:
+                    print("Erro:", e)
+
+            elif op == "0":
+                print("Até logo! 👋")
+                break
 
-        if op == "1":
-            nome = input("Nome completo: ").strip()
-            usuario = input("Usuário (apelido): ").strip()
-            try:
-                cadastrar_jogador(nome, usuario)
-                print("✅ Cadastro realizado!")
-            except ValueError as e:
-                print("Erro:", e)
-
-        elif op == "2":
-            usuario = input("Usuário: ").strip()
-            if login_jogador(usuario):
-                usuario_logado = usuario
-                print(f"👤 Logado como: {usuario_logado}")
-            else:
-                print("Usuário não encontrado. Cadastre-se primeiro.")
-
-        elif op == "3":
-            if not usuario_logado:
-                print("Faça login antes de jogar.")
-                continue
-            try:
-                jogar_partida(usuario_logado)
-            except ValueError as e:
-                print("Erro:", e)
-
-        elif op == "4":
-            if not usuario_logado:
-                print("Faça login para ver estatísticas.")
-                continue
-            exibir_estatisticas_jogador(usuario_logado)
-
-        elif op == "5":
-            exibir_ranking()
-
-        elif op == "6":
-            if not usuario_logado:
-                print("Faça login para ver histórico.")
-                continue
-            hist = historico_partidas(usuario_logado, limite=10)
-            if not hist:
-                print("Sem partidas registradas.")
             else:
-                print("\n🕑 Últimas partidas:")
-                for p in hist:
-                    print(
-                        f"#{p['id']:03d} | {p['data']} | {p['resultado']:<7} | "
-                        f"tentativas={p['total_tentativas']:>2} | pontos={p['pontuacao']:>3}"
-                    )
-
-        elif op == "7":
-            _configuracoes()
-
-        elif op == "8":
-            # Exemplo de uso de set no menu
-            datas = datas_disponiveis()
-            if not datas:
-                print("Nenhuma partida registrada ainda.")
-            else:
-                print("📅 Datas com partidas registradas:")
-                for d in sorted(datas):
-                    print("-", d)
-
-        elif op == "0":
-            print("Até logo! 👋")
-            break
-
-        else:
-            print("Opção inválida.")
+                print("Opção inválida.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,284 @@
+"""
+Execução paralela (pool de processos) para trabalhos em lote
+------------------------------------------------------------
+
+Distribui o trabalho pesado entre vários núcleos:
+
+  - simulação: as partidas são divididas em fragmentos por faixa de id;
+    cada fragmento tem seu próprio gerador random.Random derivado de
+    (semente, índice do fragmento), então o resultado é reprodutível e
+    não depende do número de workers
+  - estatísticas: o log dados/partidas.jsonl é dividido em faixas de
+    bytes (linhas inteiras, em qualquer ordem de id: no modo
+    multiprocesso os ids chegam fora de ordem e as somas não dependem
+    disso); cada worker calcula agregados parciais por jogador, que são
+    somados no final
+  - importação: os lotes lidos de CSV/JSONL são validados nos workers
+    (importacao.py), com no máximo 2 lotes por worker em andamento
+
+Exemplos:
+  python paralelo.py simular --jogos 2000000 --workers 4 --semente 42
+  python paralelo.py estatisticas --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import jogo_adivinhacao as jogo
+import simulacao
+from armazenamento_compacto import normalizar_partida
+
+# Tamanho fixo do fragmento de simulação: com ele fixo, os mesmos
+# fragmentos (e sementes) são gerados para qualquer número de workers.
+PARTIDAS_POR_FRAGMENTO = 50_000
+
+_CHAVES_CONFIG = (
+    "MIN_NUMERO",
+    "MAX_NUMERO",
+    "MAX_TENTATIVAS",
+    "PONTUACAO_BASE",
+    "PENALIDADE_TENTATIVA",
+    "PONTUACAO_ESCALADA",
+)
+
+
+def _config_jogo() -> Dict[str, int]:
+    """Configuração atual do jogo, para repassar aos workers."""
+    return {chave: getattr(jogo, chave) for chave in _CHAVES_CONFIG}
+
+
+def _aplicar_config(config: Dict[str, int]) -> None:
+    for chave, valor in config.items():
+        setattr(jogo, chave, valor)
+
+
+def gerador_do_fragmento(semente: Optional[int], indice: int, fluxo: str) -> random.Random:
+    """Gerador independente e reprodutível para um fragmento.
+
+    random.Random aceita strings como semente (hash SHA-512), então cada
+    par (semente, fragmento, fluxo) produz uma sequência própria. Sem
+    semente, cada fragmento usa entropia do sistema.
+    """
+    if semente is None:
+        return random.Random()
+    return random.Random(f"{semente}:{indice}:{fluxo}")
+
+
+def _executar(
+    tarefa: Callable, argumentos: Iterable[Tuple], workers: int
+) -> List:
+    """Executa `tarefa` para cada tupla de argumentos, em paralelo se workers > 1."""
+    argumentos = list(argumentos)
+    if workers <= 1:
+        return [tarefa(*a) for a in argumentos]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(tarefa, *zip(*argumentos)))
+
+
+def _executar_em_fluxo(
+    tarefa: Callable, argumentos: Iterable[Tuple], workers: int
+) -> Iterator:
+    """Como _executar, mas consome `argumentos` sob demanda e entrega os
+    resultados na ordem, à medida que ficam prontos.
+
+    No máximo 2 * workers tarefas ficam em andamento: a memória não cresce
+    com o tamanho da entrada (leitura de arquivos em lotes).
+    """
+    if workers <= 1:
+        for a in argumentos:
+            yield tarefa(*a)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pendentes: deque = deque()
+        for a in argumentos:
+            pendentes.append(pool.submit(tarefa, *a))
+            if len(pendentes) >= 2 * workers:
+                yield pendentes.popleft().result()
+        while pendentes:
+            yield pendentes.popleft().result()
+
+
+# ============================================
+# SIMULAÇÃO PARALELA
+# ============================================
+
+
+def _simular_fragmento(
+    indice: int,
+    quantidade: int,
+    nome_estrategia: str,
+    n: int,
+    semente: Optional[int],
+    config: Dict[str, int],
+) -> Dict:
+    """Worker: simula um fragmento e devolve só o resumo agregado."""
+    _aplicar_config(config)
+    rng = gerador_do_fragmento(semente, indice, "segredo")
+    estrategia = simulacao.criar_estrategia(
+        nome_estrategia, gerador_do_fragmento(semente, indice, "estrategia"), n
+    )
+    resumo = {
+        "partidas": 0,
+        "vitorias": 0,
+        "pontos": 0,
+        "soma_tentativas": 0,
+        "por_tentativas": [0] * (config["MAX_TENTATIVAS"] + 1),
+    }
+    for _ in range(quantidade):
+        _, tentativas, vitoria = simulacao.simular_partida(estrategia, rng)
+        total = len(tentativas)
+        resumo["partidas"] += 1
+        resumo["vitorias"] += vitoria
+        resumo["pontos"] += jogo.calcular_pontuacao(total, vitoria)
+        resumo["soma_tentativas"] += total
+        resumo["por_tentativas"][total] += 1
+    return resumo
+
+
+def _combinar_resumos(resumos: List[Dict]) -> Dict:
+    total: Dict = {"partidas": 0, "vitorias": 0, "pontos": 0, "soma_tentativas": 0}
+    por_tentativas: List[int] = []
+    for r in resumos:
+        for chave in total:
+            total[chave] += r[chave]
+        if len(r["por_tentativas"]) > len(por_tentativas):
+            por_tentativas.extend([0] * (len(r["por_tentativas"]) - len(por_tentativas)))
+        for i, c in enumerate(r["por_tentativas"]):
+            por_tentativas[i] += c
+    total["por_tentativas"] = por_tentativas
+    return total
+
+
+def simular_paralelo(
+    total: int,
+    nome_estrategia: str = simulacao.BuscaBinaria.nome,
+    n: int = 1,
+    semente: Optional[int] = None,
+    workers: int = 1,
+) -> Dict:
+    """Simula `total` partidas em fragmentos distribuídos entre workers."""
+    config = _config_jogo()
+    argumentos = []
+    for indice, inicio in enumerate(range(0, total, PARTIDAS_POR_FRAGMENTO)):
+        quantidade = min(PARTIDAS_POR_FRAGMENTO, total - inicio)
+        argumentos.append((indice, quantidade, nome_estrategia, n, semente, config))
+    return _combinar_resumos(_executar(_simular_fragmento, argumentos, workers))
+
+
+# ============================================
+# ESTATÍSTICAS PARALELAS (fragmentos do log)
+# ============================================
+
+
+def faixas_do_arquivo(caminho: str, partes: int) -> List[Tuple[int, int]]:
+    """Divide o arquivo em `partes` faixas de bytes [inicio, fim)."""
+    tamanho = os.path.getsize(caminho) if os.path.exists(caminho) else 0
+    if tamanho == 0:
+        return []
+    partes = max(1, min(partes, tamanho))
+    passo = -(-tamanho // partes)
+    return [(i, min(i + passo, tamanho)) for i in range(0, tamanho, passo)]
+
+
+def _agregar_faixa(caminho: str, inicio: int, fim: int) -> Dict[str, Dict]:
+    """Worker: agregados parciais por jogador das linhas que começam na faixa."""
+    agregados: Dict[str, Dict] = {}
+    with open(caminho, "rb") as f:
+        if inicio > 0:
+            f.seek(inicio - 1)
+            if f.read(1) != b"\n":
+                f.readline()  # linha começou na faixa anterior
+        while f.tell() < fim:
+            linha = f.readline()
+            if not linha.endswith(b"\n"):
+                break  # linha final incompleta
+            try:
+                partida = normalizar_partida(json.loads(linha))
+            except (ValueError, TypeError):
+                continue  # mesma regra da carga do jogo (_ler_log_partidas)
+            usuario = partida.get("jogador")
+            agg = agregados.get(usuario)
+            if agg is None:
+                agg = agregados[usuario] = jogo._novo_agregado(com_partidas=False)
+            jogo._somar_partida(agg, partida)
+    return agregados
+
+
+def agregados_paralelos(caminho: Optional[str] = None, workers: int = 1) -> Dict[str, Dict]:
+    """Agregados por jogador de todo o log, calculados em paralelo."""
+    caminho = caminho or jogo.ARQ_PARTIDAS_LOG
+    # mais fragmentos que workers equilibra a carga entre processos
+    faixas = faixas_do_arquivo(caminho, workers * 4 if workers > 1 else 1)
+    parciais = _executar(_agregar_faixa, ((caminho, a, b) for a, b in faixas), workers)
+
+    combinados: Dict[str, Dict] = {}
+    for parcial in parciais:
+        for usuario, agg in parcial.items():
+            if usuario in combinados:
+                jogo._combinar_agregados(combinados[usuario], agg)
+            else:
+                combinados[usuario] = agg
+    return combinados
+
+
+def estatisticas_paralelas(workers: int = 1) -> Dict[str, Dict]:
+    """calcular_estatisticas_jogador para todos os jogadores, em paralelo.
+
+    Lê o log diretamente (não precisa de `jogo.partidas` carregado); só o
+    dicionário de jogadores é usado para nomes e ordem.
+    """
+    agregados = agregados_paralelos(workers=workers)
+    vazio = jogo._novo_agregado(com_partidas=False)
+    resultado: Dict[str, Dict] = {}
+    for usuario, dados in jogo.jogadores.items():
+        resultado.update(
+            jogo._estatisticas_de_agregado(usuario, agregados.get(usuario, vazio), dados)
+        )
+    return resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Execução paralela de trabalhos em lote")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_sim = sub.add_parser("simular", help="simulação de partidas em paralelo")
+    p_sim.add_argument("--jogos", type=int, default=1_000_000)
+    p_sim.add_argument(
+        "--estrategia", choices=simulacao.ESTRATEGIAS, default=simulacao.BuscaBinaria.nome
+    )
+    p_sim.add_argument("--n", type=int, default=1)
+    p_sim.add_argument("--semente", type=int, default=None)
+    p_sim.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
+    p_est = sub.add_parser("estatisticas", help="estatísticas de todos os jogadores")
+    p_est.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
+    args = parser.parse_args()
+    inicio = time.perf_counter()
+
+    if args.comando == "simular":
+        resumo = simular_paralelo(args.jogos, args.estrategia, args.n, args.semente, args.workers)
+        segundos = time.perf_counter() - inicio
+        print(f"\n🤖 {resumo['partidas']} partidas | {args.workers} worker(s) | {segundos:.2f}s")
+        print(f"⏱️  {resumo['partidas'] / segundos:,.0f} partidas/s")
+        print(
+            f"Taxa de vitória: {resumo['vitorias'] / resumo['partidas'] * 100:.1f}% | "
+            f"Pontuação média: {resumo['pontos'] / resumo['partidas']:.2f}"
+        )
+    else:
+        jogo.jogadores = jogo._ler_jogadores()  # o log é lido pelos workers
+        stats = estatisticas_paralelas(args.workers)
+        segundos = time.perf_counter() - inicio
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+        print(f"\n⏱️  {len(stats)} jogadores em {segundos:.2f}s ({args.workers} worker(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Camada de gravação durável (escrita atômica + group commit)
+-----------------------------------------------------------
+
+  - gravar_atomico: grava num arquivo temporário, faz fsync e troca com
+    os.replace; uma queda no meio da escrita deixa o arquivo antigo
+    intacto (nunca um arquivo truncado)
+  - anexar_duravel: anexa texto a um log numa única escrita
+  - ConfirmacaoEmGrupo: "group commit" — cadastros e partidas que chegam
+    ao mesmo tempo (durante uma gravação) viram uma única gravação (uma regravação
+    de jogadores.txt + um append no log, com um fsync cada)
+  - travar / reservar_sequencia: trava consultiva (fcntl.flock) e
+    sequência de ids compartilhada, para vários processos sobre a mesma
+    pasta de dados
+
+Níveis de durabilidade (JOGO_DURABILIDADE):
+  nenhuma   -> sem fsync (o sistema operacional decide quando gravar)
+  arquivo   -> fsync do arquivo gravado (padrão)
+  completa  -> fsync do arquivo e da pasta (a troca de nome também
+               sobrevive a uma queda de energia)
+
+Medição: python benchmarks/bench_durabilidade.py
+"""
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import IO, Callable, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem travas consultivas
+    fcntl = None
+
+DURABILIDADES = ("nenhuma", "arquivo", "completa")
+
+
+def _validar(durabilidade: str) -> None:
+    if durabilidade not in DURABILIDADES:
+        raise ValueError(f"Durabilidade desconhecida: {durabilidade} (use {', '.join(DURABILIDADES)})")
+
+
+def sincronizar_pasta(caminho: str) -> None:
+    """fsync da pasta de `caminho`, para persistir a entrada de diretório (POSIX)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows: não há fsync de diretório
+    fd = os.open(os.path.dirname(os.path.abspath(caminho)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def gravar_atomico(
+    caminho: str,
+    escrever: Callable[[IO], None],
+    durabilidade: str = "arquivo",
+    binario: bool = False,
+) -> None:
+    """Substitui `caminho` pelo conteúdo gerado por `escrever(f)`, atomicamente.
+
+    `f` é um arquivo texto UTF-8, ou binário com binario=True.
+    """
+    _validar(durabilidade)
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") if binario else open(temporario, "w", encoding="utf-8") as f:
+        escrever(f)
+        f.flush()
+        if durabilidade != "nenhuma":
+            os.fsync(f.fileno())
+    os.replace(temporario, caminho)
+    if durabilidade == "completa":
+        sincronizar_pasta(caminho)
+
+
+def anexar_duravel(caminho: str, texto: str, durabilidade: str = "arquivo") -> None:
+    """Anexa `texto` ao arquivo numa única escrita."""
+    _validar(durabilidade)
+    novo = not os.path.exists(caminho)
+    with open(caminho, "a", encoding="utf-8") as f:
+        f.write(texto)
+        f.flush()
+        if durabilidade != "nenhuma":
+            os.fsync(f.fileno())
+    if novo and durabilidade == "completa":
+        sincronizar_pasta(caminho)
+
+
+def _abrir_travado(caminho: str, exclusiva: bool) -> int:
+    if fcntl is None:
+        raise RuntimeError("Travas de arquivo (fcntl) indisponíveis nesta plataforma.")
+    fd = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusiva else fcntl.LOCK_SH)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+@contextmanager
+def travar(caminho: str, exclusiva: bool = True) -> Iterator[None]:
+    """Trava consultiva sobre `caminho` (criado se preciso) durante o bloco.
+
+    Exclusiva para quem grava; compartilhada para quem só lê e não pode
+    ver uma gravação pela metade. Só coordena quem também usa a trava, e
+    não é reentrante: o mesmo processo não deve travar duas vezes.
+    """
+    fd = _abrir_travado(caminho, exclusiva)
+    try:
+        yield
+    finally:
+        os.close(fd)  # fechar o descritor libera a trava
+
+
+def reservar_sequencia(caminho: str, minimo: int, quantidade: int = 1) -> int:
+    """Reserva `quantidade` números seguidos de uma sequência guardada em arquivo.
+
+    Retorna o primeiro reservado (nunca menor que `minimo`). Leitura e
+    gravação acontecem sob trava exclusiva do próprio arquivo, então
+    processos concorrentes nunca recebem o mesmo número.
+    """
+    fd = _abrir_travado(caminho, exclusiva=True)
+    try:
+        try:
+            atual = int(os.read(fd, 32) or 0)
+        except ValueError:
+            atual = 0  # arquivo danificado: `minimo` (vindo dos dados) decide
+        primeiro = max(atual, minimo)
+        # largura fixa: regrava no lugar, sem truncar
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, b"%20d\n" % (primeiro + quantidade))
+        return primeiro
+    finally:
+        os.close(fd)
+
+
+class ConfirmacaoEmGrupo:
+    """Group commit de partidas e cadastros numa thread de gravação.
+
+    `adicionar_partidas`/`marcar_jogadores` só enfileiram e devolvem um
+    número de lote; quem precisa da garantia de durabilidade chama
+    `aguardar(lote)`, que retorna quando aquele lote já foi gravado. A
+    thread grava assim que há algo pendente: o que chega enquanto uma
+    gravação (e seu fsync) está em andamento entra no grupo seguinte, então
+    eventos simultâneos dividem o mesmo fsync. Em discos com fsync lento,
+    uma `janela` > 0 segura o grupo um pouco mais para juntar mais eventos.
+
+    Se uma gravação falha, a thread para e o erro é levantado para quem
+    aguarda, para `fechar` e para quem tentar enfileirar depois (nada é
+    aceito sem poder ser gravado).
+
+    Args:
+        gravar: função que grava (partidas, jogadores_alterados) de uma vez.
+        janela: segundos extras que a thread espera por eventos antes de gravar.
+        max_lote: grava imediatamente ao atingir este número de partidas.
+    """
+
+    def __init__(
+        self,
+        gravar: Callable[[List[Dict], bool], None],
+        janela: float = 0.0,
+        max_lote: int = 1000,
+    ) -> None:
+        self.gravar = gravar
+        self.janela = janela
+        self.max_lote = max_lote
+        self._condicao = threading.Condition()
+        self._partidas: List[Dict] = []
+        self._jogadores_alterados = False
+        self._lote_aberto = 1  # lote que recebe os próximos eventos
+        self._gravado = 0  # último lote já gravado
+        self._erro: Optional[BaseException] = None
+        self._fechado = False
+        self.escritas = 0
+        self._thread = threading.Thread(target=self._executar, name="confirmacao-em-grupo", daemon=True)
+        self._thread.start()
+
+    # ---------- produtores ----------
+
+    def _enfileirar(self, partidas: List[Dict], jogadores: bool) -> int:
+        with self._condicao:
+            if self._fechado:
+                raise RuntimeError("ConfirmacaoEmGrupo já foi fechada")
+            if self._erro is not None:
+                raise self._erro  # a thread parou: o evento nunca seria gravado
+            self._partidas.extend(partidas)
+            self._jogadores_alterados = self._jogadores_alterados or jogadores
+            self._condicao.notify_all()
+            return self._lote_aberto
+
+    def adicionar_partidas(self, partidas: List[Dict]) -> int:
+        return self._enfileirar(partidas, False)
+
+    def marcar_jogadores(self) -> int:
+        return self._enfileirar([], True)
+
+    def aguardar(self, lote: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        """Espera o lote (padrão: tudo o que já foi enfileirado) ser gravado."""
+        with self._condicao:
+            alvo = self._lote_aberto if lote is None else lote
+            if lote is None and not self._partidas and not self._jogadores_alterados:
+                alvo -= 1  # nada pendente no lote aberto
+            concluido = self._condicao.wait_for(
+                lambda: self._gravado >= alvo or self._erro is not None, timeout
+            )
+            if self._erro is not None:
+                raise self._erro
+            return concluido
+
+    def fechar(self) -> None:
+        """Grava o que estiver pendente e encerra a thread."""
+        with self._condicao:
+            if self._fechado:
+                return
+            self._fechado = True
+            self._condicao.notify_all()
+        self._thread.join()
+        if self._erro is not None:
+            raise self._erro
+
+    # ---------- thread de gravação ----------
+
+    def _executar(self) -> None:
+        while True:
+            with self._condicao:
+                self._condicao.wait_for(
+                    lambda: self._partidas or self._jogadores_alterados or self._fechado
+                )
+                if not self._partidas and not self._jogadores_alterados:
+                    return  # fechado e nada pendente
+                if self.janela > 0 and not self._fechado and len(self._partidas) < self.max_lote:
+                    # janela do grupo: junta quem chegar nesse intervalo
+                    self._condicao.wait_for(
+                        lambda: len(self._partidas) >= self.max_lote or self._fechado,
+                        self.janela,
+                    )
+                partidas, self._partidas = self._partidas, []
+                jogadores, self._jogadores_alterados = self._jogadores_alterados, False
+                lote = self._lote_aberto
+                self._lote_aberto += 1
+            try:
+                self.gravar(partidas, jogadores)
+            except BaseException as erro:  # repassado a quem aguarda
+                with self._condicao:
+                    self._erro = erro
+                    self._condicao.notify_all()
+                return
+            with self._condicao:
+                self._gravado = lote
+                self.escritas += 1
+                self._condicao.notify_all()
@@ -0,0 +1,386 @@
+"""
+Servidor assíncrono de partidas (asyncio + TCP local)
+-----------------------------------------------------
+
+Atende muitas sessões de jogo simultâneas, cada uma equivalente a um
+jogar_partida, por um protocolo de linhas (UTF-8) em localhost:
+
+  CADASTRAR <usuario> <nome completo>  -> OK | ERRO <mensagem>
+  LOGIN <usuario>                      -> OK | ERRO <mensagem>
+  NOVO                                 -> JOGO <min> <max> <max_tentativas>
+  PALPITE <numero>                     -> MAIOR | MENOR | INVALIDO
+                                          | ACERTOU <pontuacao> | FIM <numero_secreto>
+  RANKING                              -> RANKING <json>
+  SAIR                                 -> TCHAU
+
+Jogadores, partidas, índices e placares são os do módulo do jogo e só são
+alterados na thread do event loop (mutações serializadas). A gravação em
+disco é agrupada: partidas e cadastros acumulam num GravadorEmLote, que
+grava tudo de uma vez a cada `intervalo` segundos numa thread separada
+(no SQLite, na própria thread do loop: a conexão não pode mudar de thread).
+
+Exemplos:
+  python servidor.py servir --porta 5050
+  python servidor.py carga --porta 5050 --sessoes 200 --partidas 20
+  python servidor.py carga --embutido --sessoes 500   (servidor no mesmo processo)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+import jogo_adivinhacao as jogo
+
+HOST_PADRAO = "127.0.0.1"
+PORTA_PADRAO = 5050
+
+# ============================================
+# PERSISTÊNCIA AGRUPADA
+# ============================================
+
+
+class GravadorEmLote:
+    """Agrupa gravações de partidas e cadastros em escritas periódicas.
+
+    Em vez de uma escrita (e fsync) por partida finalizada, as partidas
+    pendentes são gravadas juntas com persistir_partidas, e vários
+    cadastros viram uma única regravação de jogadores.txt. Se a gravação
+    falha (disco cheio, por exemplo), o lote volta para a fila e é tentado
+    de novo no próximo ciclo; o laço não para.
+    """
+
+    def __init__(self, intervalo: float = 0.05, max_lote: int = 1000) -> None:
+        self.intervalo = intervalo
+        self.max_lote = max_lote
+        self._partidas: List[Dict] = []
+        self._jogadores_alterados = False
+        self._acordar = asyncio.Event()
+        self._trava = asyncio.Lock()
+        self._parar = False
+        self.escritas = 0
+        self.falhas = 0
+
+    def adicionar_partida(self, partida: Dict) -> None:
+        self._partidas.append(partida)
+        if len(self._partidas) >= self.max_lote:
+            self._acordar.set()
+
+    def marcar_jogadores(self) -> None:
+        self._jogadores_alterados = True
+
+    async def executar(self) -> None:
+        """Laço de gravação: descarrega a cada intervalo ou lote cheio."""
+        while not self._parar:
+            try:
+                await asyncio.wait_for(self._acordar.wait(), self.intervalo)
+            except asyncio.TimeoutError:
+                pass
+            self._acordar.clear()
+            if not await self.descarregar():
+                await asyncio.sleep(self.intervalo)  # não insiste a cada partida nova
+
+    def parar(self) -> None:
+        """Encerra o laço de `executar` depois da gravação em andamento e de
+        uma última descarga do que estiver pendente."""
+        self._parar = True
+        self._acordar.set()
+
+    def pendentes(self) -> int:
+        return len(self._partidas)
+
+    async def descarregar(self) -> bool:
+        """Grava o que está pendente; False se a gravação falhou (lote mantido)."""
+        async with self._trava:
+            if not self._partidas and not self._jogadores_alterados:
+                return True
+            lote, self._partidas = self._partidas, []
+            jogadores_alterados, self._jogadores_alterados = self._jogadores_alterados, False
+            try:
+                if jogo._banco is not None:
+                    # cadastros já estão no banco; a conexão SQLite só pode ser
+                    # usada pela thread que a criou (a do loop)
+                    self._gravar(lote, None)
+                else:
+                    # cópia tirada na thread do loop: a gravação roda em outra thread
+                    copia_jogadores = dict(jogo.jogadores) if jogadores_alterados else None
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self._gravar, lote, copia_jogadores
+                    )
+            except Exception as erro:
+                # de volta à fila, antes das partidas que chegaram enquanto isso
+                self._partidas[:0] = lote
+                self._jogadores_alterados = self._jogadores_alterados or jogadores_alterados
+                self.falhas += 1
+                print(
+                    f"⚠️  Falha ao gravar {len(lote)} partidas ({erro!r}); nova tentativa em seguida",
+                    file=sys.stderr,
+                )
+                return False
+            self.escritas += 1
+            return True
+
+    @staticmethod
+    def _gravar(lote: List[Dict], copia_jogadores: Optional[Dict]) -> None:
+        if copia_jogadores is not None:
+            jogo._salvar_jogadores(copia_jogadores)
+        jogo.persistir_partidas(lote)
+
+
+# ============================================
+# SESSÕES
+# ============================================
+
+
+class SessaoJogo:
+    """Estado de uma conexão: usuário logado e partida em andamento."""
+
+    def __init__(self, gravador: GravadorEmLote) -> None:
+        self.gravador = gravador
+        self.usuario: Optional[str] = None
+        self.numero_secreto: Optional[int] = None
+        self.tentativas: List[int] = []
+        self.usadas = 0  # tentativas consumidas, incluindo entradas inválidas
+
+    def processar(self, linha: str) -> str:
+        """Executa um comando do protocolo e devolve a resposta (sem \\n)."""
+        partes = linha.strip().split(maxsplit=2)
+        if not partes:
+            return "ERRO comando vazio"
+        comando = partes[0].upper()
+
+        if comando == "PALPITE":
+            return self._palpite(partes[1] if len(partes) > 1 else "")
+        if comando == "NOVO":
+            return self._novo()
+        if comando == "LOGIN":
+            if len(partes) < 2 or jogo.login_jogador(partes[1]) is None:
+                return "ERRO Usuário não encontrado. Cadastre-se primeiro."
+            self.usuario = partes[1]
+            return "OK"
+        if comando == "CADASTRAR":
+            if len(partes) < 3:
+                return "ERRO uso: CADASTRAR <usuario> <nome completo>"
+            try:
+                jogo.cadastrar_jogador(partes[2], partes[1], persistir=False)
+            except ValueError as e:
+                return f"ERRO {e}"
+            self.gravador.marcar_jogadores()
+            return "OK"
+        if comando == "RANKING":
+            return "RANKING " + json.dumps(jogo.rankings_gerais(), ensure_ascii=False)
+        return f"ERRO comando desconhecido: {comando}"
+
+    def _novo(self) -> str:
+        if self.usuario is None:
+            return "ERRO Faça login antes de jogar."
+        self.numero_secreto = jogo.gerar_numero_secreto()
+        self.tentativas = []
+        self.usadas = 0
+        return f"JOGO {jogo.MIN_NUMERO} {jogo.MAX_NUMERO} {jogo.MAX_TENTATIVAS}"
+
+    def _palpite(self, entrada: str) -> str:
+        if self.numero_secreto is None:
+            return "ERRO Nenhuma partida em andamento (use NOVO)."
+        self.usadas += 1
+        numero = jogo.validar_numero(entrada)
+        if numero is not None:
+            self.tentativas.append(numero)
+            if jogo.calcular_dica(numero, self.numero_secreto) is None:
+                partida = self._finalizar(vitoria=True)
+                return f"ACERTOU {partida['pontuacao']}"
+        if self.usadas >= jogo.MAX_TENTATIVAS:
+            secreto = self.numero_secreto
+            self._finalizar(vitoria=False)
+            return f"FIM {secreto}"
+        if numero is None:
+            return "INVALIDO"
+        return jogo.calcular_dica(numero, self.numero_secreto).upper()
+
+    def _finalizar(self, vitoria: bool) -> Dict:
+        partida = jogo.registrar_partida(
+            self.usuario, self.numero_secreto, self.tentativas, vitoria, persistir=False
+        )
+        self.gravador.adicionar_partida(partida)
+        self.numero_secreto = None
+        return partida
+
+
+async def _atender(
+    leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter, gravador: GravadorEmLote
+) -> None:
+    sessao = SessaoJogo(gravador)
+    try:
+        while True:
+            linha = await leitor.readline()
+            if not linha:
+                break
+            texto = linha.decode("utf-8", errors="replace")
+            if texto.strip().upper() == "SAIR":
+                escritor.write(b"TCHAU\n")
+                break
+            escritor.write((sessao.processar(texto) + "\n").encode("utf-8"))
+            await escritor.drain()
+    except ConnectionError:
+        pass
+    finally:
+        escritor.close()
+
+
+async def iniciar_servidor(
+    host: str = HOST_PADRAO, porta: int = PORTA_PADRAO, intervalo: float = 0.05
+):
+    """Carrega os dados e abre o servidor; retorna (servidor, gravador, tarefa)."""
+    jogo._carregar_arquivos()
+    gravador = GravadorEmLote(intervalo)
+    tarefa = asyncio.create_task(gravador.executar())
+    servidor = await asyncio.start_server(
+        lambda r, w: _atender(r, w, gravador), host, porta
+    )
+    return servidor, gravador, tarefa
+
+
+async def encerrar_servidor(servidor, gravador: GravadorEmLote, tarefa) -> None:
+    servidor.close()
+    await servidor.wait_closed()
+    # não cancela a tarefa: uma gravação em andamento termina antes
+    gravador.parar()
+    await tarefa
+    if not await gravador.descarregar():
+        print(f"⚠️  {gravador.pendentes()} partidas não puderam ser gravadas", file=sys.stderr)
+
+
+async def servir(host: str, porta: int, intervalo: float) -> None:
+    servidor, gravador, tarefa = await iniciar_servidor(host, porta, intervalo)
+    print(f"🎮 Servidor ouvindo em {host}:{porta} (Ctrl+C para sair)")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        await encerrar_servidor(servidor, gravador, tarefa)
+
+
+# ============================================
+# GERADOR DE CARGA
+# ============================================
+
+
+async def _cliente(
+    host: str, porta: int, usuario: str, partidas: int, latencias: List[float]
+) -> None:
+    """Uma sessão: cadastra/loga e joga `partidas` com busca binária."""
+    leitor, escritor = await asyncio.open_connection(host, porta)
+
+    async def enviar(comando: str) -> str:
+        escritor.write((comando + "\n").encode("utf-8"))
+        await escritor.drain()
+        return (await leitor.readline()).decode("utf-8").strip()
+
+    await enviar(f"CADASTRAR {usuario} Carga {usuario}")
+    await enviar(f"LOGIN {usuario}")
+    for _ in range(partidas):
+        _, minimo, maximo, _ = (await enviar("NOVO")).split()
+        minimo, maximo = int(minimo), int(maximo)
+        while True:
+            palpite = (minimo + maximo) // 2
+            inicio = time.perf_counter()
+            resposta = await enviar(f"PALPITE {palpite}")
+            latencias.append(time.perf_counter() - inicio)
+            if resposta == "MAIOR":
+                minimo = palpite + 1
+            elif resposta == "MENOR":
+                maximo = palpite - 1
+            elif resposta != "INVALIDO":
+                break  # ACERTOU ou FIM
+    await enviar("SAIR")
+    escritor.close()
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+async def gerar_carga(
+    host: str,
+    porta: int,
+    sessoes: int,
+    partidas: int,
+    concorrencia: int,
+    embutido: bool = False,
+) -> Dict[str, float]:
+    """Abre `sessoes` clientes (até `concorrencia` ao mesmo tempo) e mede latências."""
+    servidor = None
+    if embutido:
+        servidor, gravador, tarefa = await iniciar_servidor(host, 0)
+        porta = servidor.sockets[0].getsockname()[1]
+
+    latencias: List[float] = []
+    limite = asyncio.Semaphore(concorrencia)
+    prefixo = f"carga{int(time.time() * 1000) % 1_000_000}_"
+
+    async def sessao(i: int) -> None:
+        async with limite:
+            await _cliente(host, porta, f"{prefixo}{i}", partidas, latencias)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(sessao(i) for i in range(sessoes)))
+    duracao = time.perf_counter() - inicio
+
+    if servidor is not None:
+        await encerrar_servidor(servidor, gravador, tarefa)
+
+    return {
+        "sessoes": sessoes,
+        "partidas": sessoes * partidas,
+        "palpites": len(latencias),
+        "duracao_s": duracao,
+        "sessoes_por_s": sessoes / duracao,
+        "partidas_por_s": sessoes * partidas / duracao,
+        "p50_ms": _percentil(latencias, 50) * 1000,
+        "p99_ms": _percentil(latencias, 99) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor assíncrono do jogo")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_srv = sub.add_parser("servir", help="inicia o servidor")
+    p_srv.add_argument("--host", default=HOST_PADRAO)
+    p_srv.add_argument("--porta", type=int, default=PORTA_PADRAO)
+    p_srv.add_argument("--intervalo", type=float, default=0.05, help="janela de gravação (s)")
+
+    p_carga = sub.add_parser("carga", help="gerador de carga local")
+    p_carga.add_argument("--host", default=HOST_PADRAO)
+    p_carga.add_argument("--porta", type=int, default=PORTA_PADRAO)
+    p_carga.add_argument("--sessoes", type=int, default=100)
+    p_carga.add_argument("--partidas", type=int, default=10, help="partidas por sessão")
+    p_carga.add_argument("--concorrencia", type=int, default=100)
+    p_carga.add_argument(
+        "--embutido", action="store_true", help="sobe o servidor no mesmo processo"
+    )
+
+    args = parser.parse_args()
+    if args.comando == "servir":
+        try:
+            asyncio.run(servir(args.host, args.porta, args.intervalo))
+        except KeyboardInterrupt:
+            print("\nServidor encerrado.")
+        return
+
+    r = asyncio.run(
+        gerar_carga(
+            args.host, args.porta, args.sessoes, args.partidas, args.concorrencia, args.embutido
+        )
+    )
+    print(f"\n📡 {r['sessoes']} sessões | {r['partidas']} partidas | {r['palpites']} palpites")
+    print(f"⏱️  {r['duracao_s']:.2f}s — {r['sessoes_por_s']:,.1f} sessões/s | {r['partidas_por_s']:,.1f} partidas/s")
+    print(f"Latência por palpite: p50 = {r['p50_ms']:.3f} ms | p99 = {r['p99_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Simulação em lote (sem input/print) do Sistema de Jogo de Adivinhação
+---------------------------------------------------------------------
+
+Joga partidas automaticamente com estratégias "plugáveis" de palpite,
+reaproveitando as regras do jogo (gerar_numero_secreto, validar_numero,
+calcular_dica/exibir_dica e calcular_pontuacao). Serve para testes de
+carga da pontuação e dos rankings.
+
+Exemplos:
+  python simulacao.py --jogos 1000000 --estrategia binaria
+  python simulacao.py --jogos 100000 --estrategia erra-por-n --n 3 --saida sim.jsonl
+  python simulacao.py --jogos 5000 --estrategia aleatoria --persistir bot_aleatorio
+  python simulacao.py --jogos 10000000 --estrategia binaria --vetorizado   (NumPy)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import jogo_adivinhacao as jogo
+
+# ============================================
+# ESTRATÉGIAS DE PALPITE
+# ============================================
+
+
+class Estrategia:
+    """Interface de uma estratégia de palpite.
+
+    A cada partida o motor chama `iniciar`, depois alterna `palpite` e
+    `receber_dica` (DICA_MAIOR/DICA_MENOR) até o acerto ou o fim das
+    tentativas.
+    """
+
+    nome = "base"
+
+    def iniciar(self, minimo: int, maximo: int) -> None:
+        self.minimo = minimo
+        self.maximo = maximo
+
+    def palpite(self) -> int:
+        raise NotImplementedError
+
+    def receber_dica(self, palpite: int, dica: str) -> None:
+        # estreita o intervalo conhecido conforme a dica
+        if dica == jogo.DICA_MAIOR:
+            self.minimo = max(self.minimo, palpite + 1)
+        else:
+            self.maximo = min(self.maximo, palpite - 1)
+
+
+class BuscaBinaria(Estrategia):
+    """Sempre chuta o meio do intervalo ainda possível."""
+
+    nome = "binaria"
+
+    def palpite(self) -> int:
+        return (self.minimo + self.maximo) // 2
+
+
+class Aleatoria(Estrategia):
+    """Chuta um número aleatório dentro do intervalo ainda possível."""
+
+    nome = "aleatoria"
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self.rng = rng or random.Random()
+
+    def palpite(self) -> int:
+        if self.minimo > self.maximo:
+            return self.minimo
+        return self.rng.randint(self.minimo, self.maximo)
+
+
+class ErraPorN(Estrategia):
+    """Busca binária com palpites deslocados em N (jogador impreciso).
+
+    O palpite é o meio do intervalo somado a N, limitado ao intervalo;
+    com N = 0 equivale à busca binária.
+    """
+
+    nome = "erra-por-n"
+
+    def __init__(self, n: int = 1) -> None:
+        self.n = n
+
+    def palpite(self) -> int:
+        meio = (self.minimo + self.maximo) // 2 + self.n
+        return min(max(meio, self.minimo), self.maximo)
+
+
+def criar_estrategia(nome: str, rng: Optional[random.Random] = None, n: int = 1) -> Estrategia:
+    """Instancia uma estratégia pelo nome usado na linha de comando."""
+    if nome == BuscaBinaria.nome:
+        return BuscaBinaria()
+    if nome == Aleatoria.nome:
+        return Aleatoria(rng)
+    if nome == ErraPorN.nome:
+        return ErraPorN(n)
+    raise ValueError(f"Estratégia desconhecida: {nome}")
+
+
+ESTRATEGIAS = (BuscaBinaria.nome, Aleatoria.nome, ErraPorN.nome)
+
+# ============================================
+# MOTOR DE SIMULAÇÃO
+# ============================================
+
+
+def simular_partida(
+    estrategia: Estrategia, rng: Optional[random.Random] = None
+) -> Tuple[int, List[int], bool]:
+    """Joga uma partida sem interação.
+
+    Returns:
+        (numero_secreto, tentativas, vitoria)
+    """
+    numero_secreto = jogo.gerar_numero_secreto(rng)
+    tentativas: List[int] = []
+    vitoria = False
+
+    estrategia.iniciar(jogo.MIN_NUMERO, jogo.MAX_NUMERO)
+    for _ in range(jogo.MAX_TENTATIVAS):
+        numero = jogo.validar_numero(estrategia.palpite())
+        if numero is None:
+            continue  # palpite fora do intervalo gasta a tentativa, como no jogo
+        tentativas.append(numero)
+        dica = jogo.calcular_dica(numero, numero_secreto)
+        if dica is None:
+            vitoria = True
+            break
+        estrategia.receber_dica(numero, dica)
+
+    return numero_secreto, tentativas, vitoria
+
+
+def simular_partidas(
+    total: int,
+    estrategia: Estrategia,
+    usuario: str,
+    semente: Optional[int] = None,
+    id_inicial: int = 1,
+) -> Iterator[Dict]:
+    """Gera `total` partidas simuladas no mesmo formato do log do jogo."""
+    rng = random.Random(semente)
+    data = datetime.now().date().isoformat()
+    config = jogo.configuracao_atual()
+    for i in range(id_inicial, id_inicial + total):
+        numero_secreto, tentativas, vitoria = simular_partida(estrategia, rng)
+        total_tentativas = len(tentativas)
+        yield {
+            "id": i,
+            "jogador": usuario,
+            "numero_secreto": numero_secreto,
+            "tentativas": tentativas,
+            "total_tentativas": total_tentativas,
+            "pontuacao": jogo.calcular_pontuacao(total_tentativas, vitoria, config),
+            "resultado": "Vitória" if vitoria else "Derrota",
+            "data": data,
+            "config": config,
+        }
+
+
+def gravar_arquivo(partidas: Iterator[Dict], caminho: str, lote: int = 10_000) -> int:
+    """Grava partidas em JSON Lines, em blocos; retorna a quantidade gravada."""
+    quantidade = 0
+    buffer: List[str] = []
+    with open(caminho, "w", encoding="utf-8") as f:
+        for p in partidas:
+            buffer.append(json.dumps(p, ensure_ascii=False))
+            if len(buffer) >= lote:
+                f.write("\n".join(buffer) + "\n")
+                quantidade += len(buffer)
+                buffer.clear()
+        if buffer:
+            f.write("\n".join(buffer) + "\n")
+            quantidade += len(buffer)
+    return quantidade
+
+
+def alimentar_jogo(
+    total: int,
+    estrategia: Estrategia,
+    usuario: str,
+    semente: Optional[int] = None,
+    lote: int = 10_000,
+) -> int:
+    """Registra partidas simuladas na persistência normal do jogo.
+
+    As partidas entram em `partidas`/índices/placares via registrar_partida
+    e são gravadas em lotes com persistir_partidas. O usuário é cadastrado
+    se ainda não existir.
+    """
+    jogo._carregar_arquivos()
+    if jogo.login_jogador(usuario) is None:
+        jogo.cadastrar_jogador(f"Simulação ({estrategia.nome})", usuario)
+
+    rng = random.Random(semente)
+    pendentes: List[Dict] = []
+    for _ in range(total):
+        numero_secreto, tentativas, vitoria = simular_partida(estrategia, rng)
+        pendentes.append(
+            jogo.registrar_partida(
+                usuario, numero_secreto, tentativas, vitoria, persistir=False
+            )
+        )
+        if len(pendentes) >= lote:
+            jogo.persistir_partidas(pendentes)
+            pendentes = []
+    jogo.persistir_partidas(pendentes)
+    return total
+
+
+def medir(executar: Callable[[], int]) -> Tuple[int, float]:
+    """Executa e retorna (quantidade de partidas, segundos decorridos)."""
+    inicio = time.perf_counter()
+    quantidade = executar()
+    return quantidade, time.perf_counter() - inicio
+
+
+def _resumo(partidas: Iterator[Dict], acumulado: Dict[str, int]) -> Iterator[Dict]:
+    # conta vitórias/pontos de passagem, sem guardar as partidas
+    for p in partidas:
+        acumulado["vitorias"] += p["resultado"] == "Vitória"
+        acumulado["pontos"] += p["pontuacao"]
+        yield p
+
+
+def _executar_vetorizado(args: argparse.Namespace, estrategia: Estrategia) -> Tuple[int, float, Dict[str, int]]:
+    """Roda a simulação pelo caminho NumPy (estratégias determinísticas)."""
+    import simulacao_numpy as vet
+
+    deslocamento = args.n if isinstance(estrategia, ErraPorN) else 0
+    acumulado = {"vitorias": 0, "pontos": 0}
+    data = datetime.now().date().isoformat()
+
+    def executar() -> int:
+        com_palpites = bool(args.saida or args.persistir)
+        if args.persistir:
+            jogo._carregar_arquivos()
+            if jogo.login_jogador(args.persistir) is None:
+                jogo.cadastrar_jogador(f"Simulação ({estrategia.nome})", args.persistir)
+        saida = open(args.saida, "w", encoding="utf-8") if args.saida else None
+        quantidade = 0
+        try:
+            for lote in vet.simular_em_blocos(
+                args.jogos, deslocamento, args.semente, com_palpites=com_palpites
+            ):
+                acumulado["vitorias"] += int(lote["vitoria"].sum())
+                acumulado["pontos"] += int(lote["pontuacao"].sum())
+                if saida is not None:
+                    geradas = vet.partidas_do_bloco(lote, "simulacao", quantidade + 1, data)
+                    saida.write("".join(json.dumps(p, ensure_ascii=False) + "\n" for p in geradas))
+                elif args.persistir:
+                    # ids reservados pelo jogo; pontuação já vem do bloco
+                    jogo.registrar_partidas(vet.partidas_do_bloco(lote, args.persistir, 0, data))
+                quantidade += lote["numero_secreto"].shape[0]
+        finally:
+            if saida is not None:
+                saida.close()
+        return quantidade
+
+    quantidade, segundos = medir(executar)
+    return quantidade, segundos, acumulado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulação em lote de partidas")
+    parser.add_argument("--jogos", type=int, default=100_000)
+    parser.add_argument("--estrategia", choices=ESTRATEGIAS, default=BuscaBinaria.nome)
+    parser.add_argument("--n", type=int, default=1, help="deslocamento da estratégia erra-por-n")
+    parser.add_argument("--semente", type=int, default=None)
+    gravacao = parser.add_mutually_exclusive_group()
+    gravacao.add_argument("--saida", help="grava as partidas neste arquivo JSONL")
+    gravacao.add_argument(
+        "--persistir",
+        metavar="USUARIO",
+        help="registra as partidas no jogo (dados/) em nome deste usuário",
+    )
+    parser.add_argument(
+        "--vetorizado",
+        action="store_true",
+        help="usa o caminho NumPy (apenas estratégias determinísticas)",
+    )
+    args = parser.parse_args()
+
+    rng_estrategia = random.Random(None if args.semente is None else args.semente + 1)
+    estrategia = criar_estrategia(args.estrategia, rng_estrategia, args.n)
+    acumulado = {"vitorias": 0, "pontos": 0}
+
+    if args.vetorizado:
+        if isinstance(estrategia, Aleatoria):
+            parser.error("--vetorizado só aceita estratégias determinísticas")
+        quantidade, segundos, acumulado = _executar_vetorizado(args, estrategia)
+        destino = args.saida or (
+            f"dados/ (usuário {args.persistir})" if args.persistir else "(sem gravação)"
+        )
+    elif args.persistir:
+        quantidade, segundos = medir(
+            lambda: alimentar_jogo(args.jogos, estrategia, args.persistir, args.semente)
+        )
+        destino = f"dados/ (usuário {args.persistir})"
+    else:
+        geradas = _resumo(
+            simular_partidas(args.jogos, estrategia, "simulacao", args.semente), acumulado
+        )
+        if args.saida:
+            quantidade, segundos = medir(lambda: gravar_arquivo(geradas, args.saida))
+            destino = args.saida
+        else:
+            quantidade, segundos = medir(lambda: sum(1 for _ in geradas))
+            destino = "(sem gravação)"
+
+    print(f"\n🤖 Estratégia: {estrategia.nome} | Partidas: {quantidade} | Destino: {destino}")
+    print(f"⏱️  {segundos:.2f}s — {quantidade / segundos if segundos else 0:,.0f} partidas/s")
+    if quantidade and (args.vetorizado or not args.persistir):
+        print(
+            f"Taxa de vitória: {acumulado['vitorias'] / quantidade * 100:.1f}% | "
+            f"Pontuação média: {acumulado['pontos'] / quantidade:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+Caminho vetorizado (NumPy) para simulação e repontuação em massa
+----------------------------------------------------------------
+
+Processa milhões de partidas de uma vez com operações em arrays:
+
+  - sortear_segredos: números secretos como array para um intervalo
+  - resolver_tentativas: joga em paralelo (array) estratégias
+    determinísticas — busca binária e "erra por N" de simulacao.py
+  - calcular_pontuacoes: versão vetorizada de calcular_pontuacao
+  - repontuar_historico: recalcula a pontuação de todo o histórico após
+    mudar PONTUACAO_BASE/PENALIDADE_TENTATIVA, cada partida pela tabela
+    de pontos da sua configuração
+  - repontuar_configuracao: marca partidas históricas (todas, um período
+    e/ou um jogador) com uma configuração e as repontua pela tabela dela
+
+As pontuações saem de tabelas pré-calculadas (jogo.tabela_pontuacao):
+uma matriz configuração x tentativas indexada pelas colunas, sem laço.
+
+Uso pela linha de comando: python simulacao.py --vetorizado ...
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+import jogo_adivinhacao as jogo
+from armazenamento_compacto import ordinal_iso
+
+
+def _intervalo_atual(intervalo: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+    return intervalo or (jogo.MIN_NUMERO, jogo.MAX_NUMERO)
+
+
+def sortear_segredos(
+    quantidade: int,
+    rng: np.random.Generator,
+    intervalo: Optional[Tuple[int, int]] = None,
+) -> np.ndarray:
+    """Sorteia `quantidade` números secretos no intervalo (inclusivo)."""
+    minimo, maximo = _intervalo_atual(intervalo)
+    return rng.integers(minimo, maximo + 1, size=quantidade, dtype=np.int64)
+
+
+def tabelas_pontuacao(
+    configs: List[str],
+    ate: int = 0,
+    base: Optional[int] = None,
+    penalidade: Optional[int] = None,
+) -> np.ndarray:
+    """Matriz (configuração x tentativas) de pontos de vitória.
+
+    Linha i = jogo.tabela_pontuacao(configs[i]), todas com ao menos
+    `ate` + 1 colunas.
+    """
+    tabelas = [jogo.tabela_pontuacao(c, ate, base, penalidade) for c in configs]
+    largura = max((len(t) for t in tabelas), default=ate + 1)
+    matriz = np.zeros((len(tabelas), largura), dtype=np.int64)
+    for i, tabela in enumerate(tabelas):
+        matriz[i, : len(tabela)] = tabela
+    return matriz
+
+
+def _pontuar(
+    matriz: np.ndarray, configs: np.ndarray, total_tentativas: np.ndarray, vitorias: np.ndarray
+) -> np.ndarray:
+    """Pontos de cada partida: matriz[config, tentativas] nas vitórias, 0 nas derrotas."""
+    t = np.clip(np.asarray(total_tentativas, dtype=np.int64), 0, None)
+    return np.where(np.asarray(vitorias, dtype=bool), matriz[configs, t], 0)
+
+
+def calcular_pontuacoes(
+    total_tentativas: np.ndarray,
+    vitorias: np.ndarray,
+    base: Optional[int] = None,
+    penalidade: Optional[int] = None,
+    config: Optional[str] = None,
+) -> np.ndarray:
+    """Versão vetorizada de calcular_pontuacao para arrays inteiros.
+
+    Derrota => 0; vitória => pontos da tabela da configuração (a atual,
+    se não informada) para o nº de tentativas.
+    """
+    t = np.asarray(total_tentativas, dtype=np.int64)
+    ate = int(t.max()) if t.size else 0
+    matriz = tabelas_pontuacao([config or jogo.configuracao_atual()], ate, base, penalidade)
+    return _pontuar(matriz, np.zeros(t.shape, dtype=np.intp), t, vitorias)
+
+
+def resolver_tentativas(
+    segredos: np.ndarray,
+    deslocamento: int = 0,
+    intervalo: Optional[Tuple[int, int]] = None,
+    max_tentativas: Optional[int] = None,
+    com_palpites: bool = False,
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """Joga todas as partidas do array com busca binária deslocada em N.
+
+    Reproduz exatamente BuscaBinaria (deslocamento 0) e ErraPorN de
+    simulacao.py: o palpite é o meio do intervalo possível + N, limitado
+    ao intervalo. Cada passo do laço trata todas as partidas ainda em
+    andamento de uma vez (no máximo max_tentativas passos).
+
+    Returns:
+        (total_tentativas, vitorias, palpites) — `palpites` é uma matriz
+        (partidas x max_tentativas) preenchida com -1 após o fim da
+        partida, ou None se com_palpites=False.
+    """
+    minimo, maximo = _intervalo_atual(intervalo)
+    max_tentativas = jogo.MAX_TENTATIVAS if max_tentativas is None else max_tentativas
+
+    n = segredos.shape[0]
+    lo = np.full(n, minimo, dtype=np.int64)
+    hi = np.full(n, maximo, dtype=np.int64)
+    total = np.zeros(n, dtype=np.int64)
+    vitorias = np.zeros(n, dtype=bool)
+    ativos = np.ones(n, dtype=bool)
+    palpites = np.full((n, max_tentativas), -1, dtype=np.int64) if com_palpites else None
+
+    for passo in range(max_tentativas):
+        if not ativos.any():
+            break
+        palpite = np.clip((lo + hi) // 2 + deslocamento, lo, hi)
+        total += ativos
+        if palpites is not None:
+            palpites[:, passo] = np.where(ativos, palpite, -1)
+
+        acertou = ativos & (palpite == segredos)
+        vitorias |= acertou
+        maior = ativos & (palpite < segredos)
+        menor = ativos & (palpite > segredos)
+        lo = np.where(maior, palpite + 1, lo)
+        hi = np.where(menor, palpite - 1, hi)
+        ativos &= ~acertou
+
+    return total, vitorias, palpites
+
+
+def simular_em_blocos(
+    quantidade: int,
+    deslocamento: int = 0,
+    semente: Optional[int] = None,
+    bloco: int = 1_000_000,
+    com_palpites: bool = False,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """Simula `quantidade` partidas em blocos de arrays (memória limitada).
+
+    Cada bloco é um dict com os arrays numero_secreto, total_tentativas,
+    vitoria e pontuacao (e a matriz palpites, se com_palpites=True).
+    """
+    rng = np.random.default_rng(semente)
+    restantes = quantidade
+    while restantes > 0:
+        n = min(bloco, restantes)
+        segredos = sortear_segredos(n, rng)
+        total, vitorias, palpites = resolver_tentativas(
+            segredos, deslocamento, com_palpites=com_palpites
+        )
+        lote = {
+            "numero_secreto": segredos,
+            "total_tentativas": total,
+            "vitoria": vitorias,
+            "pontuacao": calcular_pontuacoes(total, vitorias),
+        }
+        if palpites is not None:
+            lote["palpites"] = palpites
+        yield lote
+        restantes -= n
+
+
+def simular_vetorizado(
+    quantidade: int, deslocamento: int = 0, semente: Optional[int] = None
+) -> Dict[str, float]:
+    """Simula em blocos e devolve só o resumo (vitórias e pontuação)."""
+    vitorias = 0
+    pontos = 0
+    for lote in simular_em_blocos(quantidade, deslocamento, semente):
+        vitorias += int(lote["vitoria"].sum())
+        pontos += int(lote["pontuacao"].sum())
+    return {"partidas": quantidade, "vitorias": vitorias, "pontos": pontos}
+
+
+def partidas_do_bloco(
+    lote: Dict[str, np.ndarray], usuario: str, id_inicial: int, data: str
+) -> List[Dict]:
+    """Converte um bloco de arrays nos dicts de partida usados pelo jogo.
+
+    A lista de tentativas só é preenchida se o bloco tiver a matriz de
+    palpites (simular_em_blocos(..., com_palpites=True)).
+    """
+    n = lote["numero_secreto"].shape[0]
+    config = jogo.configuracao_atual()
+    if "palpites" in lote:
+        linhas = lote["palpites"].tolist()
+        tentativas = [linha[:t] for linha, t in zip(linhas, lote["total_tentativas"].tolist())]
+    else:
+        tentativas = [[] for _ in range(n)]
+    return [
+        {
+            "id": id_inicial + i,
+            "jogador": usuario,
+            "numero_secreto": s,
+            "tentativas": tent,
+            "total_tentativas": t,
+            "pontuacao": p,
+            "resultado": "Vitória" if v else "Derrota",
+            "data": data,
+            "config": config,
+        }
+        for i, (s, tent, t, v, p) in enumerate(
+            zip(
+                lote["numero_secreto"].tolist(),
+                tentativas,
+                lote["total_tentativas"].tolist(),
+                lote["vitoria"].tolist(),
+                lote["pontuacao"].tolist(),
+            )
+        )
+    ]
+
+
+def repontuar_historico(
+    base: Optional[int] = None,
+    penalidade: Optional[int] = None,
+    aplicar: bool = False,
+) -> np.ndarray:
+    """Recalcula a pontuação de todo o histórico (em ordem de id).
+
+    Cada partida é pontuada pela tabela da sua configuração. Com
+    aplicar=True grava as novas pontuações: no backend arquivo troca a
+    coluna, reconstrói índice/placares e reescreve o log; no SQLite, um
+    UPDATE com as tabelas de pontos. Retorna o array de pontuações.
+    """
+    if jogo._armazem is not None:
+        raise ValueError("Repontuação disponível só nos backends arquivo e sqlite")
+    if jogo._banco is not None:
+        configs, total, vitorias, codigos = _colunas_do_banco()
+    else:
+        tabela = jogo.partidas
+        configs = tabela.configs
+        total, vitorias, codigos = _colunas(tabela)
+    matriz = tabelas_pontuacao(configs, _maior(total), base, penalidade)
+    pontuacoes = _pontuar(matriz, codigos, total, vitorias)
+
+    if aplicar and jogo._banco is not None:
+        jogo._banco.repontuar_por_configuracao(
+            {config: matriz[i].tolist() for i, config in enumerate(configs)}
+        )
+    elif aplicar and len(tabela):  # log vazio: nada a reescrever
+        tabela.substituir_coluna("pontuacao", pontuacoes.tolist())
+        jogo._reconstruir_indice()
+        jogo._salvar_partidas()
+    return pontuacoes
+
+
+def _colunas_do_banco() -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """(configurações, total_tentativas, vitórias, códigos) lidos do SQLite por id."""
+    configs: List[str] = []
+    codigo: Dict[str, int] = {}
+    total: List[int] = []
+    vitorias: List[int] = []
+    codigos: List[int] = []
+    for config, t, v in jogo._banco.colunas_de_pontuacao():
+        c = codigo.get(config)
+        if c is None:
+            c = codigo[config] = len(configs)
+            configs.append(config)
+        total.append(t)
+        vitorias.append(v)
+        codigos.append(c)
+    return (
+        configs,
+        np.array(total, dtype=np.int64),
+        np.array(vitorias, dtype=bool),
+        np.array(codigos, dtype=np.intp),
+    )
+
+
+def repontuar_configuracao(
+    config: str,
+    inicio: Optional[str] = None,
+    fim: Optional[str] = None,
+    usuario: Optional[str] = None,
+) -> int:
+    """Marca partidas históricas com `config` e as repontua pela tabela dela.
+
+    Seleciona todas as partidas, ou as de um período (datas ISO, inclusivo)
+    e/ou de um jogador. Backend arquivo: troca as colunas de configuração e
+    pontuação, reconstrói índice/placares e reescreve o log. Backend
+    SQLite: um UPDATE com a tabela de pontos. Retorna quantas partidas
+    foram marcadas.
+    """
+    jogo.ler_configuracao(config)  # valida antes de tocar em qualquer partida
+    if jogo._banco is not None:
+        pontos = jogo.tabela_pontuacao(config, jogo._banco.maior_total_tentativas())
+        return jogo._banco.repontuar(config, list(pontos), inicio, fim, usuario)
+    if jogo._armazem is not None:
+        raise ValueError("Repontuação disponível só nos backends arquivo e sqlite")
+
+    tabela = jogo.partidas
+    total, vitorias, configs = _colunas(tabela)
+    selecao = np.ones(len(tabela), dtype=bool)
+    datas = np.frombuffer(tabela.data, dtype=tabela.data.typecode)
+    for limite, comparar in ((inicio, np.greater_equal), (fim, np.less_equal)):
+        if limite is not None:
+            ordinal = ordinal_iso(limite)
+            if ordinal is None:
+                raise ValueError(f"Data inválida: {limite!r} (use AAAA-MM-DD)")
+            selecao &= (datas >= 0) & comparar(datas, ordinal)
+    if usuario is not None:
+        codigo = tabela._codigo_usuario.get(usuario)
+        if codigo is None:
+            selecao[:] = False
+        else:
+            selecao &= np.frombuffer(tabela.jogador, dtype=tabela.jogador.typecode) == codigo
+
+    codigo_config = tabela.codigo_config(config)
+    novas_configs = np.where(selecao, codigo_config, configs)
+    matriz = tabelas_pontuacao(tabela.configs, _maior(total))
+    pontuacoes = _pontuar(matriz, novas_configs, total, vitorias)
+
+    tabela.substituir_coluna("config", novas_configs.tolist())
+    tabela.substituir_coluna("pontuacao", pontuacoes.tolist())
+    jogo._reconstruir_indice()
+    jogo._salvar_partidas()
+    return int(selecao.sum())
+
+
+def _colunas(tabela) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(total_tentativas, vitorias, códigos de configuração), sem cópia das colunas."""
+    total = np.frombuffer(tabela.total_tentativas, dtype=tabela.total_tentativas.typecode)
+    vitorias = np.frombuffer(tabela.resultado, dtype=tabela.resultado.typecode).astype(bool)
+    configs = np.frombuffer(tabela.config, dtype=tabela.config.typecode).astype(np.intp)
+    return total, vitorias, configs
+
+
+def _maior(coluna: np.ndarray) -> int:
+    return int(coluna.max()) if coluna.size else 0
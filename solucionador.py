@@ -0,0 +1,353 @@
+"""
+Solucionador ótimo e qualidade dos palpites registrados
+-------------------------------------------------------
+
+Com a dica de `exibir_dica` (maior/menor), cada palpite divide os números
+ainda possíveis em "abaixo", "acerto" e "acima". A árvore de decisão ótima
+é a busca pelo meio do intervalo:
+
+  - pior caso ótimo: ceil(log2(n + 1)) palpites para n números possíveis
+  - média ótima: soma[n] / n, onde soma[n] é o total de palpites somado
+    sobre os n segredos possíveis (soma[n] = n + soma[k] + soma[n-1-k],
+    mínimo no k do meio)
+
+Essas tabelas só dependem do tamanho do intervalo, então são calculadas
+uma vez por tamanho (memoizadas) e cada palpite gravado é avaliado em
+O(1) — uma partida em O(tentativas):
+
+  - tentativas desperdiçadas: quantas tentativas a mais, em média, o
+    palpite custa em relação ao palpite ótimo (fora do intervalo ainda
+    possível ou repetido = 1 tentativa inteira)
+  - bits desperdiçados: informação (entropia da dica) que o palpite ótimo
+    daria menos a que o palpite deu
+
+O modo em massa (anotar_historico) avalia todo o histórico com NumPy,
+passo a passo em todas as partidas ao mesmo tempo. Cada partida é
+avaliada no intervalo da sua configuração (coluna `config`).
+
+Exemplos:
+  python solucionador.py otimo
+  python solucionador.py anotar
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import time
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import jogo_adivinhacao as jogo
+from armazenamento_compacto import CONFIG_PADRAO, TabelaPartidas, ler_configuracao
+
+ARQ_ANOTACOES = os.path.join(jogo.BASE_DADOS, "qualidade_palpites.npz")
+ARQ_RESUMO = os.path.join(jogo.BASE_RELATORIOS, "qualidade_palpites.json")
+
+# ============================================
+# ÁRVORE DE DECISÃO ÓTIMA
+# ============================================
+
+
+class ArvoreOtima:
+    """Tabelas da busca ótima para intervalos com até `tamanho` números.
+
+    - soma[n]: total de palpites, somado sobre os n segredos, da árvore ótima
+    - entropia_max[n]: bits da dica do palpite ótimo com n possíveis
+    - xlogx[m]: m * log2(m), para a entropia de qualquer palpite em O(1)
+    """
+
+    def __init__(self, tamanho: int) -> None:
+        self.tamanho = tamanho
+        self.soma = array("q", [0]) * (tamanho + 1)
+        self.xlogx = array("d", [0.0]) * (tamanho + 1)
+        self.entropia_max = array("d", [0.0]) * (tamanho + 1)
+        for n in range(1, tamanho + 1):
+            abaixo = (n - 1) // 2  # palpite do meio
+            self.soma[n] = n + self.soma[abaixo] + self.soma[n - 1 - abaixo]
+            self.xlogx[n] = n * math.log2(n)
+            self.entropia_max[n] = self.entropia(n, abaixo)
+        self._numpy: Optional[Dict] = None
+
+    def palpite_otimo(self, minimo: int, maximo: int) -> int:
+        """Nó da árvore para o intervalo [minimo, maximo]: o meio."""
+        return (minimo + maximo) // 2
+
+    def pior_caso(self, n: int) -> int:
+        return n.bit_length()  # = ceil(log2(n + 1))
+
+    def media(self, n: int) -> float:
+        return self.soma[n] / n if n else 0.0
+
+    def entropia(self, n: int, abaixo: int) -> float:
+        """Bits da dica de um palpite com `abaixo` possíveis menores que ele."""
+        acima = n - 1 - abaixo
+        return math.log2(n) - (self.xlogx[abaixo] + self.xlogx[acima]) / n
+
+    def desperdicio(self, n: int, abaixo: int) -> Tuple[float, float]:
+        """(tentativas, bits) desperdiçados por um palpite dentro do intervalo."""
+        acima = n - 1 - abaixo
+        tentativas = (n + self.soma[abaixo] + self.soma[acima] - self.soma[n]) / n
+        return tentativas, self.entropia_max[n] - self.entropia(n, abaixo)
+
+    def tabelas_numpy(self) -> Dict:
+        """As mesmas tabelas como arrays NumPy (para o modo em massa)."""
+        if self._numpy is None:
+            import numpy as np
+
+            self._numpy = {
+                "soma": np.frombuffer(self.soma, dtype=np.int64),
+                "xlogx": np.frombuffer(self.xlogx, dtype=np.float64),
+                "entropia_max": np.frombuffer(self.entropia_max, dtype=np.float64),
+            }
+        return self._numpy
+
+
+@lru_cache(maxsize=None)
+def arvore_otima(tamanho: int) -> ArvoreOtima:
+    """Árvore ótima memoizada por tamanho de intervalo."""
+    return ArvoreOtima(tamanho)
+
+
+def _intervalo(intervalo: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+    return intervalo or (jogo.MIN_NUMERO, jogo.MAX_NUMERO)
+
+
+def _intervalo_da_configuracao(config: Optional[str]) -> Tuple[int, int]:
+    """(mínimo, máximo) em que a partida foi jogada; vazio (1, 0) se a
+    configuração gravada é ilegível."""
+    try:
+        minimo, maximo, _ = ler_configuracao(config or CONFIG_PADRAO)
+    except ValueError:
+        return 1, 0
+    return minimo, maximo
+
+
+def tentativas_otimas(intervalo: Optional[Tuple[int, int]] = None) -> Dict[str, float]:
+    """Pior caso e média de palpites da estratégia ótima no intervalo."""
+    minimo, maximo = _intervalo(intervalo)
+    n = maximo - minimo + 1
+    arvore = arvore_otima(n)
+    return {"pior_caso": arvore.pior_caso(n), "media": arvore.media(n)}
+
+
+# ============================================
+# AVALIAÇÃO DE PARTIDAS
+# ============================================
+
+def avaliar_partida(partida, intervalo: Optional[Tuple[int, int]] = None) -> Optional[Dict]:
+    """Desperdício de cada palpite de uma partida, em O(tentativas).
+
+    O intervalo é o da configuração da partida, salvo se `intervalo` for
+    informado. Retorna None se o número secreto estiver fora dele.
+    """
+    if intervalo is None:
+        intervalo = _intervalo_da_configuracao(partida.get("config"))
+    minimo, maximo = intervalo
+    segredo = partida["numero_secreto"]
+    if not minimo <= segredo <= maximo:
+        return None
+    arvore = arvore_otima(maximo - minimo + 1)
+
+    tentativas: List[float] = []
+    bits: List[float] = []
+    for palpite in partida["tentativas"]:
+        n = maximo - minimo + 1
+        if minimo <= palpite <= maximo:
+            t, b = arvore.desperdicio(n, palpite - minimo)
+        else:
+            t, b = 1.0, arvore.entropia_max[n]  # nada de novo a aprender
+        tentativas.append(t)
+        bits.append(b)
+        if palpite == segredo:
+            break
+        if palpite < segredo:
+            minimo = max(minimo, palpite + 1)
+        else:
+            maximo = min(maximo, palpite - 1)
+
+    return {
+        "tentativas_desperdicadas": tentativas,
+        "bits_desperdicados": bits,
+        "total_tentativas_desperdicadas": sum(tentativas),
+        "total_bits_desperdicados": sum(bits),
+        "palpites_otimos": sum(1 for t in tentativas if t == 0),
+    }
+
+
+# ============================================
+# MODO EM MASSA (NumPy)
+# ============================================
+
+def _tabela_historico() -> TabelaPartidas:
+    """Histórico completo como tabela compacta, para qualquer backend."""
+    if jogo._armazem is not None:
+        return TabelaPartidas(jogo._armazem.iterar())
+    if jogo._banco is not None:
+        return TabelaPartidas(
+            p for u in jogo._banco.usuarios() for p in jogo._banco.partidas_do_usuario(u)
+        )
+    return jogo.partidas
+
+
+def anotar_historico(
+    tabela: Optional[TabelaPartidas] = None, intervalo: Optional[Tuple[int, int]] = None
+) -> Dict:
+    """Avalia todas as partidas da tabela de uma vez.
+
+    Percorre os palpites por posição (1º de todas as partidas, 2º, ...):
+    o laço em Python tem no máximo MAX_TENTATIVAS voltas e cada volta é
+    uma operação vetorizada sobre as partidas ainda em andamento.
+
+    Cada partida começa no intervalo da sua configuração (ou em
+    `intervalo`, para todas); as tabelas da árvore do maior intervalo
+    servem para todos os menores.
+
+    Returns:
+        arrays por partida (id, jogador, tentativas_desperdicadas,
+        bits_desperdicados, palpites_otimos, total_palpites) e `usuarios`
+        (código de jogador -> nome). Partidas fora do intervalo ficam com
+        desperdício NaN.
+    """
+    import numpy as np
+
+    tabela = _tabela_historico() if tabela is None else tabela
+    if intervalo is not None:
+        limites = np.array([intervalo] * len(tabela.configs), dtype=np.int64)
+    else:
+        limites = np.array(
+            [_intervalo_da_configuracao(c) for c in tabela.configs], dtype=np.int64
+        ).reshape(-1, 2)
+    codigos = np.frombuffer(tabela.config, dtype=tabela.config.typecode).astype(np.intp)
+    minimos = limites[codigos, 0]
+    maximos = limites[codigos, 1]
+    arvore = arvore_otima(int((limites[:, 1] - limites[:, 0]).max()) + 1)
+    t = arvore.tabelas_numpy()
+
+    palpites = np.frombuffer(tabela.palpites, dtype=tabela.palpites.typecode).astype(np.int64)
+    inicio = np.frombuffer(tabela.inicio_palpites, dtype=np.uint64).astype(np.int64)
+    segredos = np.frombuffer(tabela.numero_secreto, dtype=tabela.numero_secreto.typecode).astype(np.int64)
+    quantidade = len(segredos)
+    contagem = np.diff(inicio)
+
+    desperdicio = np.zeros(quantidade)
+    bits = np.zeros(quantidade)
+    otimos = np.zeros(quantidade, dtype=np.int64)
+    avaliados = np.zeros(quantidade, dtype=np.int64)
+
+    validos = (segredos >= minimos) & (segredos <= maximos)
+    ativos = np.flatnonzero(validos & (contagem > 0))
+    baixo = minimos[ativos]
+    alto = maximos[ativos]
+    passo = 0
+    while len(ativos):
+        palpite = palpites[inicio[ativos] + passo]
+        segredo = segredos[ativos]
+        n = alto - baixo + 1
+        dentro = (palpite >= baixo) & (palpite <= alto)
+        abaixo = np.where(dentro, palpite - baixo, 0)
+        acima = n - 1 - abaixo
+        custo = np.where(
+            dentro, (n + t["soma"][abaixo] + t["soma"][acima] - t["soma"][n]) / n, 1.0
+        )
+        entropia = np.log2(n) - (t["xlogx"][abaixo] + t["xlogx"][acima]) / n
+        perdido = t["entropia_max"][n] - np.where(dentro, entropia, 0.0)
+
+        desperdicio[ativos] += custo
+        bits[ativos] += perdido
+        otimos[ativos] += custo == 0
+        avaliados[ativos] += 1
+
+        baixo = np.where(palpite < segredo, np.maximum(baixo, palpite + 1), baixo)
+        alto = np.where(palpite > segredo, np.minimum(alto, palpite - 1), alto)
+        passo += 1
+        continua = (palpite != segredo) & (contagem[ativos] > passo)
+        ativos, baixo, alto = ativos[continua], baixo[continua], alto[continua]
+
+    desperdicio[~validos] = np.nan
+    bits[~validos] = np.nan
+    return {
+        "id": np.frombuffer(tabela.id, dtype=np.int64),
+        "jogador": np.frombuffer(tabela.jogador, dtype=np.uint32),
+        "tentativas_desperdicadas": desperdicio,
+        "bits_desperdicados": bits,
+        "palpites_otimos": otimos,
+        "total_palpites": avaliados,
+        "usuarios": list(tabela.usuarios),
+    }
+
+
+def resumo_por_jogador(anotacoes: Dict) -> Dict[str, Dict[str, float]]:
+    """Médias por jogador das anotações de anotar_historico."""
+    import numpy as np
+
+    validos = ~np.isnan(anotacoes["tentativas_desperdicadas"])
+    codigos = anotacoes["jogador"][validos]
+    tamanho = len(anotacoes["usuarios"])
+
+    def somar(coluna: str):
+        return np.bincount(codigos, weights=anotacoes[coluna][validos], minlength=tamanho)
+
+    partidas = np.bincount(codigos, minlength=tamanho)
+    desperdicio = somar("tentativas_desperdicadas")
+    bits = somar("bits_desperdicados")
+    otimos = somar("palpites_otimos")
+    palpites = somar("total_palpites")
+
+    resumo: Dict[str, Dict[str, float]] = {}
+    for codigo in np.flatnonzero(partidas):
+        resumo[anotacoes["usuarios"][codigo]] = {
+            "partidas": int(partidas[codigo]),
+            "tentativas_desperdicadas_media": round(float(desperdicio[codigo] / partidas[codigo]), 4),
+            "bits_desperdicados_media": round(float(bits[codigo] / partidas[codigo]), 4),
+            "palpites_otimos_pct": round(float(100 * otimos[codigo] / max(1, palpites[codigo])), 2),
+        }
+    return resumo
+
+
+def salvar_anotacoes(anotacoes: Dict, resumo: Dict) -> None:
+    """Grava as anotações por partida (.npz) e o resumo por jogador (.json)."""
+    import numpy as np
+
+    os.makedirs(os.path.dirname(ARQ_ANOTACOES), exist_ok=True)
+    os.makedirs(os.path.dirname(ARQ_RESUMO), exist_ok=True)
+    colunas = {k: v for k, v in anotacoes.items() if k not in ("jogador", "usuarios")}
+    np.savez(ARQ_ANOTACOES, **colunas)
+    with open(ARQ_RESUMO, "w", encoding="utf-8") as f:
+        json.dump(
+            {"otimo": tentativas_otimas(), "jogadores": resumo}, f, ensure_ascii=False, indent=2
+        )
+
+
+# ============================================
+# LINHA DE COMANDO
+# ============================================
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Solucionador ótimo e qualidade dos palpites")
+    parser.add_argument("comando", choices=("otimo", "anotar"))
+    args = parser.parse_args()
+
+    if args.comando == "otimo":
+        otimo = tentativas_otimas()
+        print(
+            f"Intervalo {jogo.MIN_NUMERO}..{jogo.MAX_NUMERO}: pior caso ótimo "
+            f"{otimo['pior_caso']} palpites, média ótima {otimo['media']:.3f}"
+        )
+        return
+
+    jogo._carregar_arquivos()
+    inicio = time.perf_counter()
+    anotacoes = anotar_historico()
+    resumo = resumo_por_jogador(anotacoes)
+    segundos = time.perf_counter() - inicio
+    salvar_anotacoes(anotacoes, resumo)
+    print(f"✅ {len(anotacoes['id'])} partidas anotadas em {segundos:.2f}s")
+    print(f"   por partida: {ARQ_ANOTACOES}")
+    print(f"   por jogador: {ARQ_RESUMO}")
+
+
+if __name__ == "__main__":
+    main()
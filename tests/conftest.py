@@ -0,0 +1,48 @@
+"""Fixtures compartilhadas: o jogo carregado numa pasta dados/ temporária."""
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jogo_adivinhacao  # noqa: E402
+
+
+def _fechar(jogo) -> None:
+    jogo.desativar_confirmacao_em_grupo()
+    if jogo._banco is not None:
+        jogo._banco.fechar()
+    if jogo._armazem is not None and hasattr(jogo._armazem, "fechar"):
+        jogo._armazem.fechar()
+
+
+@pytest.fixture
+def abrir_jogo(tmp_path, monkeypatch):
+    """Fábrica: recarrega jogo_adivinhacao com dados/ em tmp_path.
+
+    As pastas e o backend são lidos na importação, então cada chamada
+    recarrega o módulo (com as variáveis JOGO_* dadas) e carrega os dados.
+    `carregar=False` só recarrega, para preparar arquivos antes da carga.
+    """
+    monkeypatch.chdir(tmp_path)
+
+    def abrir(backend: str = "arquivo", carregar: bool = True, **ambiente):
+        _fechar(jogo_adivinhacao)
+        monkeypatch.setenv("JOGO_BACKEND", backend)
+        monkeypatch.setenv("JOGO_DURABILIDADE", "nenhuma")
+        for nome, valor in ambiente.items():
+            monkeypatch.setenv(f"JOGO_{nome.upper()}", str(valor))
+        jogo = importlib.reload(jogo_adivinhacao)
+        os.makedirs(jogo.BASE_DADOS, exist_ok=True)
+        if carregar:
+            jogo._carregar_arquivos()
+        return jogo
+
+    yield abrir
+    _fechar(jogo_adivinhacao)
+    monkeypatch.undo()
+    importlib.reload(jogo_adivinhacao)
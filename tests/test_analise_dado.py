@@ -0,0 +1,141 @@
+"""Testes do snapshot colunar de analise_dado."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analise_dado  # noqa: E402
+
+pytest.importorskip("pandas")  # analise_dado importa pandas sob demanda
+
+
+def _partida(pid, jogador="ana"):
+    return {
+        "id": pid,
+        "jogador": jogador,
+        "numero_secreto": 50,
+        "tentativas": [50],
+        "total_tentativas": 1,
+        "pontuacao": 100,
+        "resultado": "Vitória",
+        "data": "2026-01-01",
+    }
+
+
+def _anexar(caminho, ids):
+    with open(caminho, "a", encoding="utf-8") as f:
+        for pid in ids:
+            f.write(json.dumps(_partida(pid), ensure_ascii=False) + "\n")
+
+
+@pytest.fixture
+def log(tmp_path, monkeypatch):
+    pasta = tmp_path / "cache_analise"
+    monkeypatch.setattr(analise_dado, "PASTA_SNAPSHOT", str(pasta))
+    monkeypatch.setattr(analise_dado, "ARQ_SNAPSHOT_META", str(pasta / "meta.json"))
+    return str(tmp_path / "partidas.jsonl")
+
+
+def test_ids_fora_de_ordem_na_carga_inicial(log):
+    # vários processos gravando: ids chegam fora de ordem no log
+    _anexar(log, [1, 2, 3, 5, 4, 7, 6])
+    df = analise_dado.carregar_snapshot(log)
+    assert sorted(df["id"]) == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_id_menor_anexado_depois_do_snapshot(log):
+    _anexar(log, [1, 2, 3, 5])
+    assert len(analise_dado.carregar_snapshot(log)) == 4
+    _anexar(log, [4])
+    df = analise_dado.carregar_snapshot(log)
+    assert sorted(df["id"]) == [1, 2, 3, 4, 5]
+
+
+def test_blocos_pequenos_nao_perdem_partidas(log):
+    ids = [i for par in zip(range(2, 200, 2), range(1, 200, 2)) for i in par]
+    _anexar(log, ids)
+    meta = analise_dado.atualizar_snapshot(log, tamanho_bloco=7)
+    assert meta["linhas"] == len(ids)
+
+
+def test_streaming_ignora_linha_repetida_como_o_modo_em_memoria(log):
+    # lote regravado após uma queda: as mesmas linhas aparecem duas vezes
+    _anexar(log, [1, 2, 3, 2, 3, 4])
+    df = analise_dado.carregar_snapshot(log)
+    agregados = analise_dado.agregar_blocos(analise_dado.ler_partidas_em_blocos(log))
+
+    assert agregados["n"] == len(df) == 4
+    esperado = analise_dado.estatisticas_por_jogador(df)
+    obtido = analise_dado.stats_por_jogador_de_agregados(agregados)
+    assert obtido.loc["ana", ("pontuacao", "sum")] == esperado.loc["ana", ("pontuacao", "sum")]
+    assert obtido.loc["ana", ("vitoria_bin", "sum")] == esperado.loc["ana", ("vitoria_bin", "sum")]
+    assert agregados["contagem_pontuacao"].to_dict() == {100: 4}
+
+
+def _em_memoria(caminho):
+    import pandas as pd
+
+    df = analise_dado.limpar_partidas(pd.DataFrame(list(analise_dado.iterar_partidas(caminho))))
+    df["vitoria_bin"] = (df["resultado"] == "Vitória").astype(int)
+    return df
+
+
+@pytest.mark.parametrize("tamanho_bloco", [2, 3, 1000])
+def test_streaming_nao_depende_do_tamanho_do_bloco(log, tamanho_bloco):
+    # o lote [3, 4, 5] foi regravado depois de outras partidas
+    _anexar(log, [1, 2, 3, 4, 5, 6, 3, 4, 5, 7])
+    with open(log, "a", encoding="utf-8") as f:
+        derrota = dict(_partida(8, "bia"), total_tentativas=6, pontuacao=40, resultado="Derrota")
+        f.write(json.dumps(derrota) + "\n")
+    agregados = analise_dado.agregar_blocos(analise_dado.ler_partidas_em_blocos(log, tamanho_bloco))
+    df = _em_memoria(log)
+
+    assert agregados["n"] == len(df) == 8
+    streaming = analise_dado.entradas_dos_graficos(
+        agregados["contagem_pontuacao"],
+        analise_dado.stats_por_jogador_de_agregados(agregados)[("vitoria_bin", "sum")],
+        analise_dado.correlacao_de_agregados(agregados),
+    )
+    # mesmo hash de entrada = o gráfico não é redesenhado ao trocar de modo
+    em_memoria = analise_dado.entradas_do_dataframe(df)
+    for nome, entrada in streaming.items():
+        assert analise_dado._hash_entrada(nome, entrada) == analise_dado._hash_entrada(
+            nome, em_memoria[nome]
+        )
+
+
+def test_lote_regravado_depois_do_snapshot_nao_duplica(log):
+    _anexar(log, [1, 2, 3])
+    assert len(analise_dado.carregar_snapshot(log)) == 3
+    _anexar(log, [2, 3, 4])  # lote regravado após uma queda, mais uma nova
+    df = analise_dado.carregar_snapshot(log)
+    assert sorted(df["id"]) == [1, 2, 3, 4]
+    assert len(df) == len(_em_memoria(log))
+
+
+def test_snapshot_de_versao_anterior_e_recriado(log):
+    _anexar(log, [1, 2])
+    meta = analise_dado.atualizar_snapshot(log)
+    del meta["versao"]
+    analise_dado._salvar_meta_snapshot(meta)
+    _anexar(log, [2])
+    assert sorted(analise_dado.carregar_snapshot(log)["id"]) == [1, 2]
+
+
+def test_renderizar_no_processo_nao_troca_o_backend(tmp_path):
+    matplotlib = pytest.importorskip("matplotlib")
+    pytest.importorskip("seaborn")
+    antes = matplotlib.get_backend()
+    matplotlib.use("svg")  # backend escolhido por quem importou o módulo
+    try:
+        entrada = {"valores": [1, 2], "frequencias": [3, 4]}
+        analise_dado._renderizar("hist_pontuacoes", entrada, str(tmp_path / "h.png"))
+        assert matplotlib.get_backend() == "svg"
+    finally:
+        matplotlib.use(antes)
+    assert (tmp_path / "h.png").exists()
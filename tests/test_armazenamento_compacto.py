@@ -0,0 +1,86 @@
+"""Testes da TabelaPartidas (armazenamento colunar das partidas)."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from armazenamento_compacto import TabelaPartidas  # noqa: E402
+
+PARTIDA = {
+    "id": 1,
+    "jogador": "ana",
+    "numero_secreto": 7,
+    "tentativas": [50, 7],
+    "total_tentativas": 2,
+    "pontuacao": 90,
+    "resultado": "Vitória",
+    "data": "2026-01-01",
+}
+
+
+def _tamanhos(tabela):
+    colunas = tabela.colunas()
+    return {len(c) for n, c in colunas.items() if n not in ("palpites", "inicio_palpites")} | {
+        len(colunas["inicio_palpites"]) - 1
+    }
+
+
+def test_campos_como_texto_ou_float_inteiro_sao_convertidos():
+    tabela = TabelaPartidas()
+    tabela.append(dict(PARTIDA, numero_secreto="7", tentativas=[50.0, "7"]))
+    assert tabela[0]["numero_secreto"] == 7
+    assert tabela[0]["tentativas"] == [50, 7]
+
+
+@pytest.mark.parametrize(
+    "campo, valor",
+    [("numero_secreto", "sete"), ("tentativas", [1.5]), ("pontuacao", [1]), ("id", 1 << 70)],
+)
+def test_campo_invalido_nao_altera_a_tabela(campo, valor):
+    tabela = TabelaPartidas([PARTIDA])
+    with pytest.raises(ValueError):
+        tabela.append({**PARTIDA, "id": 2, campo: valor})
+    assert len(tabela) == 1 and _tamanhos(tabela) == {1}
+    assert dict(tabela[0]) == dict(PARTIDA, config="1..100/10")
+
+
+def test_chaves_extras_sao_preservadas_e_serializaveis():
+    tabela = TabelaPartidas([dict(PARTIDA, origem="importado")])
+    copia = TabelaPartidas.restaurar(tabela.colunas(), tabela.textos())
+    assert json.loads(json.dumps(dict(copia[0])))["origem"] == "importado"
+
+
+@pytest.mark.parametrize("config", [7, ["1..100/10"], 1.5])
+def test_config_que_nao_e_texto_e_rejeitada(config):
+    tabela = TabelaPartidas([PARTIDA])
+    with pytest.raises(ValueError):
+        tabela.append({**PARTIDA, "id": 2, "config": config})
+    assert len(tabela) == 1 and _tamanhos(tabela) == {1}
+    assert tabela.configs == ["1..100/10"]
+
+
+def test_partida_rejeitada_nao_deixa_textos_internados():
+    tabela = TabelaPartidas([PARTIDA])
+    with pytest.raises(ValueError):
+        tabela.append(
+            {
+                **PARTIDA,
+                "id": 2,
+                "jogador": "zz",
+                "data": "ontem",
+                "config": "1..50/5",
+                "numero_secreto": "sete",
+            }
+        )
+    assert tabela.usuarios == ["ana"]
+    assert tabela.textos()["datas_texto"] == []
+    assert tabela.configs == ["1..100/10"]
+    # os códigos seguintes continuam densos
+    tabela.append({**PARTIDA, "id": 3, "jogador": "bia", "config": "1..50/5"})
+    assert tabela.usuarios == ["ana", "bia"] and tabela[1]["jogador"] == "bia"
+    assert tabela[1]["config"] == "1..50/5"
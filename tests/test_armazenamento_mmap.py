@@ -0,0 +1,99 @@
+"""Testes do ArmazemMmap: lote rejeitado e recuperação após queda."""
+from __future__ import annotations
+
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from armazenamento_mmap import CABECALHO_AGREGADOS, TAMANHO_CABECALHO, ArmazemMmap  # noqa: E402
+
+
+def _partida(pid, jogador, **campos):
+    partida = {
+        "id": pid,
+        "jogador": jogador,
+        "numero_secreto": 7,
+        "tentativas": [50, 7],
+        "total_tentativas": 2,
+        "pontuacao": 90,
+        "resultado": "Vitória",
+        "data": "2026-01-01",
+    }
+    partida.update(campos)
+    return partida
+
+
+def test_lote_rejeitado_nao_interna_codigos(tmp_path):
+    pasta = str(tmp_path / "mmap")
+    armazem = ArmazemMmap(pasta, "nenhuma")
+    armazem.anexar([_partida(1, "ana")])
+
+    with pytest.raises(struct.error):
+        armazem.anexar(
+            [_partida(2, "bia", data="ontem", config="dificil", numero_secreto=2**63)]
+        )
+    assert armazem.usuarios == ["ana"]
+    assert armazem.total == 1
+
+    armazem.anexar([_partida(3, "caio", data="hoje", config="facil")])
+    esperado = armazem.partidas_do_usuario("caio")
+    armazem.fechar()
+
+    reaberto = ArmazemMmap(pasta, "nenhuma")
+    try:
+        assert reaberto.usuarios == ["ana", "caio"]
+        assert reaberto.partidas_do_usuario("caio") == esperado
+        assert esperado[0]["data"] == "hoje" and esperado[0]["config"] == "facil"
+        assert set(reaberto.agregados()) == {"ana", "caio"}
+    finally:
+        reaberto.fechar()
+
+
+def test_registros_nao_confirmados_sao_descartados_ao_abrir(tmp_path):
+    pasta = str(tmp_path / "mmap")
+    armazem = ArmazemMmap(pasta, "nenhuma")
+    armazem.anexar([_partida(1, "ana"), _partida(2, "bia")])
+    armazem.fechar()
+
+    # queda no meio de um lote: registro e palpites gravados, cabeçalho não
+    with open(os.path.join(pasta, "partidas.bin"), "ab") as f:
+        f.write(b"\xff" * 64)
+    with open(os.path.join(pasta, "palpites.bin"), "ab") as f:
+        f.write(b"\x01" * 24)
+
+    reaberto = ArmazemMmap(pasta, "nenhuma")
+    try:
+        assert reaberto.total == 2
+        assert os.path.getsize(os.path.join(pasta, "partidas.bin")) == TAMANHO_CABECALHO + 2 * 64
+        assert [p["id"] for p in reaberto.iterar()] == [1, 2]
+        reaberto.anexar([_partida(3, "ana", tentativas=[1, 2, 7], total_tentativas=3)])
+        assert reaberto.partidas_do_usuario("ana")[-1]["tentativas"] == [1, 2, 7]
+    finally:
+        reaberto.fechar()
+
+
+def test_agregados_atrasados_sao_recalculados(tmp_path):
+    pasta = str(tmp_path / "mmap")
+    armazem = ArmazemMmap(pasta, "nenhuma")
+    armazem.anexar([_partida(1, "ana"), _partida(2, "bia")])
+    armazem.anexar([_partida(3, "ana", pontuacao=40, resultado="Derrota")])
+    esperado = armazem.agregados()
+    armazem.fechar()
+
+    # queda entre a confirmação das partidas e a dos agregados
+    with open(os.path.join(pasta, "agregados.bin"), "r+b") as f:
+        f.seek(TAMANHO_CABECALHO)
+        f.write(b"\0" * 64)
+        f.seek(CABECALHO_AGREGADOS.size - 8)
+        f.write(struct.pack("<Q", 2))
+
+    reaberto = ArmazemMmap(pasta, "nenhuma")
+    try:
+        assert reaberto.agregados() == esperado
+        assert [p["id"] for p in reaberto.partidas_do_usuario("ana")] == [1, 3]
+    finally:
+        reaberto.fechar()
@@ -0,0 +1,105 @@
+"""Testes do ArmazemParticionado: poda de partições e recuperação."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from armazenamento_particionado import ARQ_MANIFESTO, ArmazemParticionado  # noqa: E402
+
+# ana joga de janeiro a junho; bia em fevereiro, maio e numa data fora do padrão
+DATAS = [f"2026-{mes:02d}-{dia:02d}" for mes in range(1, 7) for dia in (3, 17)]
+
+
+def _partidas():
+    partidas = []
+    for i, data in enumerate(DATAS):
+        jogador = "bia" if data[5:7] in ("02", "05") and i % 2 else "ana"
+        partidas.append(
+            {
+                "id": i + 1,
+                "jogador": jogador,
+                "numero_secreto": 7,
+                "tentativas": [7],
+                "total_tentativas": 1,
+                "pontuacao": 100,
+                "resultado": "Vitória",
+                "data": data,
+                "config": "1-100/10",
+            }
+        )
+    partidas.append(dict(partidas[0], id=len(partidas) + 1, jogador="bia", data="ontem"))
+    return partidas
+
+
+@pytest.fixture
+def armazem(tmp_path):
+    armazem = ArmazemParticionado(str(tmp_path / "partidas"), "nenhuma")
+    armazem.importar(_partidas(), lote=5)
+    return armazem
+
+
+@pytest.fixture
+def abertos(armazem, monkeypatch):
+    """Segmentos abertos pelas consultas (na ordem em que foram lidos)."""
+    lidos = []
+    ler = armazem._ler_segmento
+
+    def espiao(chave, *args, **kwargs):
+        lidos.append(chave)
+        return ler(chave, *args, **kwargs)
+
+    monkeypatch.setattr(armazem, "_ler_segmento", espiao)
+    return lidos
+
+
+def test_periodo_abre_so_os_meses_que_o_cobrem(armazem, abertos):
+    partidas = armazem.partidas_no_periodo("2026-02-10", "2026-03-05")
+    assert abertos == ["2026-02", "2026-03"]
+    assert [p["data"] for p in partidas] == ["2026-02-17", "2026-03-03"]
+
+    abertos.clear()
+    assert armazem.partidas_no_periodo("2026-03-01", "2026-06-30", usuario="bia")
+    assert abertos == ["2026-05"]  # bia não jogou nos outros meses do período
+
+
+def test_historico_le_so_os_meses_mais_recentes(armazem, abertos):
+    historico = armazem.historico("ana", 3)
+    assert [p["data"] for p in historico] == ["2026-06-17", "2026-06-03", "2026-05-03"]
+    assert abertos == ["2026-06", "2026-05"]
+
+    esperado = sorted(
+        (p for p in _partidas() if p["jogador"] == "ana"),
+        key=lambda p: (p["data"], p["id"]),
+        reverse=True,
+    )
+    assert armazem.historico("ana", 100) == esperado
+
+
+def test_datas_e_proximo_id_vem_do_manifesto(armazem, abertos):
+    assert armazem.datas() == set(DATAS) | {"ontem"}
+    assert armazem.proximo_id() == len(DATAS) + 2
+    assert abertos == []
+
+
+def test_segmento_fora_do_manifesto_e_recalculado_ao_abrir(armazem, tmp_path):
+    pasta = str(tmp_path / "partidas")
+    extra = dict(_partidas()[0], id=500, jogador="caio", data="2026-07-01")
+    # queda entre o segmento e o manifesto: partida gravada, manifesto antigo
+    with open(os.path.join(pasta, "2026-07.jsonl"), "a") as f:
+        f.write(json.dumps(extra) + "\n")
+    with open(os.path.join(pasta, "2026-01.jsonl"), "a") as f:
+        f.write('{"id": 501, "jogador": "ana", "da')  # linha cortada
+
+    reaberto = ArmazemParticionado(pasta, "nenhuma")
+    assert reaberto.proximo_id() == 501
+    assert reaberto.partidas_no_periodo("2026-07-01", "2026-07-31") == [extra]
+    assert len(reaberto.partidas_no_periodo("2026-01-01", "2026-01-31")) == 2
+    with open(os.path.join(pasta, ARQ_MANIFESTO)) as f:
+        manifesto = json.load(f)["particoes"]
+    assert manifesto["2026-01"]["bytes"] == os.path.getsize(os.path.join(pasta, "2026-01.jsonl"))
+    assert manifesto["2026-07"]["jogadores"] == ["caio"]
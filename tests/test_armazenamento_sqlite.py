@@ -0,0 +1,76 @@
+"""Testes do BancoSQLite: durabilidade, importação e ranking de tentativas."""
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from armazenamento_sqlite import BancoSQLite  # noqa: E402
+
+
+@pytest.fixture
+def banco(tmp_path):
+    banco = BancoSQLite(str(tmp_path / "jogo.db"), "nenhuma")
+    yield banco
+    banco.fechar()
+
+
+def _partida(pid, jogador, tentativas, vitoria=True):
+    return {
+        "id": pid,
+        "jogador": jogador,
+        "numero_secreto": 7,
+        "tentativas": list(range(tentativas)),
+        "total_tentativas": tentativas,
+        "pontuacao": 50,
+        "resultado": "Vitória" if vitoria else "Derrota",
+        "data": "2026-01-01",
+    }
+
+
+@pytest.mark.parametrize("durabilidade, nivel", [("nenhuma", 0), ("arquivo", 1), ("completa", 2)])
+def test_synchronous_segue_a_durabilidade(tmp_path, durabilidade, nivel):
+    banco = BancoSQLite(str(tmp_path / "jogo.db"), durabilidade)
+    try:
+        assert banco.conexao.execute("PRAGMA synchronous").fetchone()[0] == nivel
+    finally:
+        banco.fechar()
+
+
+def test_importar_conta_so_linhas_novas(banco):
+    jogadores = {u: {"nome": u, "data_cadastro": "2026-01-01"} for u in ("ana", "bia")}
+    assert banco.importar(jogadores, [_partida(1, "ana", 3)]) == (2, 1)
+    jogadores["caio"] = {"nome": "caio", "data_cadastro": "2026-01-02"}
+    assert banco.importar(jogadores, [_partida(1, "ana", 3), _partida(2, "caio", 4)]) == (1, 1)
+
+
+def test_ranking_menor_tentativas_igual_a_ordenacao_completa(banco):
+    valores = [None, 3, 12, 5, None, 10, 3, 7, 10, None, 15, 1]
+    jogadores = {f"j{i:02d}": {"nome": "x", "data_cadastro": "2026-01-01"} for i in range(len(valores))}
+    partidas = [
+        _partida(i + 1, f"j{i:02d}", menor or 4, vitoria=menor is not None)
+        for i, menor in enumerate(valores)
+    ]
+    banco.importar(jogadores, partidas)
+    for maximo in (2, 5, 10, 11, 20):
+        for limite in (1, 3, 5, len(valores)):
+            esperado = banco.conexao.execute(
+                "SELECT usuario, COALESCE(menor_tentativas, ?) AS menor FROM agregados "
+                "ORDER BY menor, ordem LIMIT ?",
+                (maximo, limite),
+            ).fetchall()
+            assert banco.ranking_menor_tentativas(limite, maximo) == esperado
+
+
+def test_ranking_menor_tentativas_usa_o_indice(banco):
+    plano = " ".join(
+        linha[3]
+        for linha in banco.conexao.execute(
+            "EXPLAIN QUERY PLAN SELECT usuario FROM agregados WHERE menor_tentativas < 5 "
+            "ORDER BY menor_tentativas, ordem LIMIT 3"
+        )
+    )
+    assert "idx_agregados_menor" in plano and "TEMP B-TREE" not in plano
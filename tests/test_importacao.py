@@ -0,0 +1,32 @@
+"""Testes da importação em massa (validação dos registros)."""
+from __future__ import annotations
+
+import json
+
+import importacao
+
+
+def test_importa_usuarios_que_o_cadastro_aceita(abrir_jogo, tmp_path):
+    jogo = abrir_jogo()
+    jogo.cadastrar_jogador("Ana Maria", "ana maria")  # o cadastro aceita espaços
+    entrada = tmp_path / "jogadores.jsonl"
+    registros = [
+        {"usuario": "joão da silva", "nome": "João"},
+        {"usuario": "  bia  ", "nome": "Bia"},
+        {"usuario": "   ", "nome": "Ninguém"},
+        {"usuario": "ana maria", "nome": "Repetida"},
+    ]
+    entrada.write_text("".join(json.dumps(r) + "\n" for r in registros), encoding="utf-8")
+
+    resumo = importacao.importar("jogadores", str(entrada))
+    assert (resumo["importados"], resumo["rejeitados"]) == (2, 2)
+    assert [linha for linha, _ in resumo["erros"]] == [3, 4]
+    assert jogo.login_jogador("joão da silva")["nome"] == "João"
+    assert jogo.login_jogador("bia") is not None
+
+    partidas = tmp_path / "partidas.jsonl"
+    partidas.write_text(
+        json.dumps({"jogador": "ana maria", "numero_secreto": 7, "tentativas": [7]}) + "\n",
+        encoding="utf-8",
+    )
+    assert importacao.importar("partidas", str(partidas))["importados"] == 1
@@ -0,0 +1,67 @@
+"""Testes da carga, da persistência e dos rankings do jogo."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+
+def _partida_legada(pid):
+    return {
+        "id": pid,
+        "jogador": "ana",
+        "numero_secreto": 7,
+        "tentativas": [7],
+        "total_tentativas": 1,
+        "pontuacao": 100,
+        "resultado": "Vitória",
+        "data": "2026-01-01",
+    }
+
+
+def test_legado_ilegivel_nao_cria_log_e_e_migrado_depois_de_corrigido(abrir_jogo):
+    jogo = abrir_jogo(carregar=False)
+    conteudo = json.dumps([_partida_legada(1), _partida_legada(2)])
+    with open(jogo.ARQ_PARTIDAS, "w", encoding="utf-8") as f:
+        f.write(conteudo[:-10])  # truncado
+
+    jogo._carregar_arquivos()
+    assert len(jogo.partidas) == 0
+    assert not os.path.exists(jogo.ARQ_PARTIDAS_LOG)
+    assert os.path.exists(jogo.ARQ_PARTIDAS + ".corrompido")
+
+    with open(jogo.ARQ_PARTIDAS, "w", encoding="utf-8") as f:
+        f.write(conteudo)
+    jogo = abrir_jogo()
+    assert sorted(jogo.partidas.id) == [1, 2]
+
+
+@pytest.mark.parametrize("backend", ["arquivo", "sqlite"])
+def test_posicao_ranking_confere_com_os_rankings(abrir_jogo, capsys, backend):
+    jogo = abrir_jogo(backend)
+    jogo.MAX_TENTATIVAS = 3
+    jogadas = {
+        "ana": [([7], True)],
+        "bia": [([1, 2, 7], True), ([1, 2, 3], False)],
+        "caio": [([1, 2, 3], False)],
+        "davi": [([1, 2, 3, 4, 7], True)],
+        "eva": [],
+        "fabi": [([2, 7], True), ([7], True)],
+    }
+    for usuario, partidas in jogadas.items():
+        jogo.cadastrar_jogador(usuario.title(), usuario)
+        for tentativas, vitoria in partidas:
+            jogo.registrar_partida(usuario, 7, tentativas, vitoria)
+
+    rankings = jogo.rankings_gerais(limite=len(jogadas))
+    for usuario in jogadas:
+        posicoes = jogo.posicao_ranking(usuario)
+        for chave, ranking in rankings.items():
+            usuarios = [u for u, _ in ranking]
+            esperado = usuarios.index(usuario) + 1 if usuario in usuarios else None
+            assert posicoes[chave] == esperado, (usuario, chave)
+    assert set(jogo.posicao_ranking("ninguem").values()) == {None}
+
+    jogo.exibir_estatisticas_jogador("davi")
+    assert "Menor nº de tentativas: 6º" in capsys.readouterr().out
@@ -0,0 +1,124 @@
+"""Testes do modo multiprocesso: reserva de ids e atualização incremental."""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from persistencia import reservar_sequencia
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _reservar_varias(caminho: str, vezes: int) -> list:
+    return [reservar_sequencia(caminho, 0, 3) for _ in range(vezes)]
+
+
+def _em_outro_processo(codigo: str) -> None:
+    """Roda `codigo` com o jogo carregado em outro processo, na mesma pasta dados/."""
+    ambiente = dict(
+        os.environ,
+        JOGO_BACKEND="arquivo",
+        JOGO_DURABILIDADE="nenhuma",
+        JOGO_MULTIPROCESSO="1",
+        PYTHONPATH=RAIZ,
+    )
+    preparo = "import jogo_adivinhacao as jogo\njogo._carregar_arquivos()\n"
+    subprocess.run([sys.executable, "-c", preparo + codigo], env=ambiente, check=True)
+
+
+def test_reserva_de_ids_entre_processos_nao_repete(tmp_path):
+    caminho = str(tmp_path / ".sequencia")
+    with ProcessPoolExecutor(4) as pool:
+        reservas = [r for lote in pool.map(_reservar_varias, [caminho] * 4, [50] * 4) for r in lote]
+    assert sorted(reservas) == list(range(0, 600, 3))
+    assert reservar_sequencia(caminho, 0) == 600
+
+
+def test_reserva_respeita_o_minimo_e_sequencia_danificada(tmp_path):
+    caminho = str(tmp_path / ".sequencia")
+    assert reservar_sequencia(caminho, 10, 5) == 10
+    assert reservar_sequencia(caminho, 0) == 15
+    with open(caminho, "w") as f:
+        f.write("lixo")
+    assert reservar_sequencia(caminho, 42) == 42  # o mínimo vem dos dados
+
+
+def test_partidas_de_outro_processo_chegam_sem_recarregar(abrir_jogo, monkeypatch):
+    jogo = abrir_jogo(multiprocesso=1)
+    jogo.cadastrar_jogador("Ana", "ana")
+    primeira = jogo.registrar_partida("ana", 7, [7], True)
+
+    _em_outro_processo(
+        'jogo.cadastrar_jogador("Bia", "bia")\n'
+        'jogo.registrar_partida("bia", 7, [3, 7], True)\n'
+        'jogo.registrar_partida("ana", 7, [1, 2], False)\n'
+    )
+
+    def sem_recarga():
+        raise AssertionError("recarga completa inesperada")
+
+    monkeypatch.setattr(jogo, "_carregar_dados_arquivo", sem_recarga)
+    assert jogo.atualizar_do_disco() is True
+    assert jogo.login_jogador("bia") is not None
+    ids = [p["id"] for p in jogo.partidas]
+    assert len(ids) == len(set(ids)) == 3 and ids[0] == primeira["id"]
+    assert jogo.calcular_estatisticas_jogador("ana")["ana"]["total_partidas"] == 2
+
+    # a partida deste processo ganha um id que o outro não usou
+    assert jogo.registrar_partida("bia", 7, [7], True)["id"] not in ids
+    jogo.atualizar_do_disco()  # a própria linha no log não entra de novo
+    assert len(jogo.partidas) == 4
+    assert jogo.atualizar_do_disco() is False
+
+
+def test_linha_final_incompleta_fica_para_a_proxima_leitura(abrir_jogo):
+    jogo = abrir_jogo(multiprocesso=1)
+    jogo.cadastrar_jogador("Ana", "ana")
+    jogo.registrar_partida("ana", 7, [7], True)
+    outra = dict(jogo.partidas[0], id=99, tentativas=[3, 7], total_tentativas=2)
+    linha = json.dumps(outra)
+
+    with open(jogo.ARQ_PARTIDAS_LOG, "a") as f:
+        f.write(linha[:10])  # outro processo no meio da escrita
+    jogo.atualizar_do_disco()
+    assert len(jogo.partidas) == 1
+
+    with open(jogo.ARQ_PARTIDAS_LOG, "a") as f:
+        f.write(linha[10:] + "\n")
+    assert jogo.atualizar_do_disco() is True
+    assert [p["id"] for p in jogo.partidas] == [1, 99]
+    assert jogo.contador_partidas == 100
+
+
+@pytest.mark.parametrize("ja_atualizado", [False, True])
+def test_log_regravado_por_outro_processo_recarrega_tudo(abrir_jogo, ja_atualizado):
+    jogo = abrir_jogo(multiprocesso=1)  # sem log na carga: nenhum inode visto
+    jogo.cadastrar_jogador("Ana", "ana")
+    for tentativas in ([7], [3, 7]):
+        jogo.registrar_partida("ana", 7, tentativas, True)
+    if ja_atualizado:
+        assert jogo.atualizar_do_disco() is True  # só as próprias partidas
+        assert len(jogo.partidas) == 2
+
+    # outro processo repontua e regrava o log (mesmas partidas, mesmo tamanho)
+    _em_outro_processo(
+        "for i in range(len(jogo.partidas)):\n"
+        '    jogo.partidas.definir(i, "pontuacao", 1)\n'
+        "jogo._reconstruir_indice()\n"
+        "jogo._salvar_partidas()\n"
+    )
+
+    assert jogo.atualizar_do_disco() is True
+    assert len(jogo.partidas) == 2
+    assert jogo.calcular_estatisticas_jogador("ana")["ana"]["melhor_pontuacao"] == 1
+    assert jogo.atualizar_do_disco() is False
+
+
+def test_backends_com_estado_em_memoria_recusam_o_modo(abrir_jogo):
+    with pytest.raises(ValueError):
+        abrir_jogo("mmap", multiprocesso=1)
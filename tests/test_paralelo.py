@@ -0,0 +1,39 @@
+"""Testes das estatísticas paralelas sobre o log de partidas."""
+from __future__ import annotations
+
+import json
+
+import paralelo
+
+
+def _linha(pid, jogador, pontuacao, resultado="Vitória"):
+    return json.dumps(
+        {
+            "id": pid,
+            "jogador": jogador,
+            "numero_secreto": 7,
+            "tentativas": [3, 7],
+            "total_tentativas": 2,
+            "pontuacao": pontuacao,
+            "resultado": resultado,
+            "data": "2026-01-01",
+        },
+        ensure_ascii=False,
+    ) + "\n"
+
+
+def test_campos_como_texto_e_linhas_invalidas_como_na_carga(abrir_jogo):
+    jogo = abrir_jogo(carregar=False)
+    with open(jogo.ARQ_JOGADORES, "w", encoding="utf-8") as f:
+        json.dump({u: {"nome": u.title(), "usuario": u} for u in ("ana", "bia")}, f)
+    # ids fora de ordem (modo multiprocesso), pontuação como texto e uma
+    # linha com campo inválido
+    linhas = [_linha(pid, "ana" if pid % 2 else "bia", 90) for pid in range(200, 0, -1)]
+    linhas[10] = _linha(190, "ana", "7")
+    linhas.append(_linha(500, "bia", "sete"))
+    with open(jogo.ARQ_PARTIDAS_LOG, "w", encoding="utf-8") as f:
+        f.writelines(linhas)
+
+    jogo._carregar_arquivos()
+    esperado = {u: jogo.calcular_estatisticas_jogador(u)[u] for u in ("ana", "bia")}
+    assert paralelo.estatisticas_paralelas(workers=2) == esperado
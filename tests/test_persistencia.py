@@ -0,0 +1,97 @@
+"""Testes da camada de gravação durável (escrita atômica e group commit)."""
+from __future__ import annotations
+
+import errno
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from persistencia import ConfirmacaoEmGrupo, gravar_atomico  # noqa: E402
+
+
+def _disco_cheio():
+    return OSError(errno.ENOSPC, "No space left on device")
+
+
+def test_falha_no_meio_da_escrita_preserva_o_arquivo(tmp_path):
+    caminho = str(tmp_path / "jogadores.txt")
+    gravar_atomico(caminho, lambda f: f.write("antigo"), "nenhuma")
+
+    def escrever(f):
+        f.write("nov")
+        raise _disco_cheio()
+
+    with pytest.raises(OSError):
+        gravar_atomico(caminho, escrever, "nenhuma")
+    with open(caminho) as f:
+        assert f.read() == "antigo"
+
+
+def test_eventos_durante_uma_gravacao_viram_um_grupo():
+    comecou, liberar = threading.Event(), threading.Event()
+    gravados = []
+
+    def gravar(partidas, jogadores):
+        comecou.set()
+        liberar.wait(5)
+        gravados.append((len(partidas), jogadores))
+
+    confirmacao = ConfirmacaoEmGrupo(gravar)
+    try:
+        primeiro = confirmacao.adicionar_partidas([{"id": 1}])
+        assert comecou.wait(5)
+        assert confirmacao.aguardar(primeiro, timeout=0.01) is False  # gravação presa
+        lotes = {confirmacao.adicionar_partidas([{"id": i}]) for i in range(2, 6)}
+        lotes.add(confirmacao.marcar_jogadores())
+        assert len(lotes) == 1 and primeiro not in lotes
+        liberar.set()
+        assert confirmacao.aguardar(lotes.pop(), timeout=5)
+    finally:
+        confirmacao.fechar()
+    assert gravados == [(1, False), (4, True)]
+    assert confirmacao.escritas == 2
+
+
+def test_erro_de_gravacao_chega_a_quem_aguarda_e_a_quem_enfileira():
+    tentativas = []
+
+    def gravar(partidas, jogadores):
+        tentativas.append(len(partidas))
+        raise _disco_cheio()
+
+    confirmacao = ConfirmacaoEmGrupo(gravar)
+    lote = confirmacao.adicionar_partidas([{"id": 1}, {"id": 2}])
+    with pytest.raises(OSError) as erro:
+        confirmacao.aguardar(lote, timeout=5)
+    assert erro.value.errno == errno.ENOSPC
+    with pytest.raises(OSError):
+        confirmacao.adicionar_partidas([{"id": 3}])  # ninguém mais gravaria
+    with pytest.raises(OSError):
+        confirmacao.fechar()
+    assert tentativas == [2]
+
+
+def test_erro_no_group_commit_do_jogo(abrir_jogo, monkeypatch):
+    jogo = abrir_jogo()
+    jogo.cadastrar_jogador("Ana", "ana")
+    jogo.ativar_confirmacao_em_grupo()
+
+    def falha(lote, jogadores_alterados):
+        raise _disco_cheio()
+
+    monkeypatch.setattr(jogo._confirmacao, "gravar", falha)
+    jogo.registrar_partida("ana", 7, [7], True)
+    with pytest.raises(OSError):
+        jogo.aguardar_gravacao()
+    with pytest.raises(OSError):
+        jogo.registrar_partida("ana", 7, [3, 7], True)
+    with pytest.raises(OSError):
+        jogo.desativar_confirmacao_em_grupo()
+    assert jogo._confirmacao is None  # de volta à gravação imediata
+
+    jogo.registrar_partida("ana", 7, [5, 7], True)
+    assert [p["tentativas"] for p in abrir_jogo().partidas] == [[5, 7]]
@@ -0,0 +1,51 @@
+"""Testes do cache de relatórios (versão dos dados)."""
+from __future__ import annotations
+
+import pytest
+
+
+def _lider(jogo):
+    return jogo.relatorio_ranking()["ranking_melhor_pontuacao"][0][0]
+
+
+def _duas_partidas(jogo):
+    jogo.cadastrar_jogador("Ana", "ana")
+    jogo.cadastrar_jogador("Bia", "bia")
+    ana = jogo.registrar_partida("ana", 7, [7], True)
+    bia = jogo.registrar_partida("bia", 7, [3, 7], True)
+    assert ana["pontuacao"] > bia["pontuacao"]
+    return ana["pontuacao"], bia["pontuacao"]
+
+
+def test_repontuacao_com_a_mesma_soma_invalida_o_ranking(abrir_jogo):
+    jogo = abrir_jogo()
+    pontos_ana, pontos_bia = _duas_partidas(jogo)
+    assert _lider(jogo) == "ana"
+
+    # troca as pontuações entre os jogadores: a soma total não muda
+    jogo.partidas.definir(0, "pontuacao", pontos_bia)
+    jogo.partidas.definir(1, "pontuacao", pontos_ana)
+    jogo._reconstruir_indice()
+    jogo._salvar_partidas()
+    assert _lider(jogo) == "bia"
+    assert _lider(abrir_jogo()) == "bia"  # outro processo: o arquivo em cache não vale
+
+
+def test_repontuacao_no_sqlite_invalida_o_ranking(abrir_jogo):
+    jogo = abrir_jogo("sqlite")
+    pontos_ana, pontos_bia = _duas_partidas(jogo)
+    assert _lider(jogo) == "ana"
+
+    tabela = [0, pontos_bia, pontos_ana]  # vitória em 1 tentativa vale o que valia em 2
+    jogo._banco.repontuar_por_configuracao({jogo.configuracao_atual(): tabela})
+    assert _lider(jogo) == "bia"
+
+
+@pytest.mark.parametrize("durabilidade", ["arquivo", "completa"])
+def test_relatorios_em_lote_sem_sync_global(abrir_jogo, monkeypatch, durabilidade):
+    jogo = abrir_jogo()
+    monkeypatch.setattr(jogo, "DURABILIDADE", durabilidade)
+    _duas_partidas(jogo)
+    monkeypatch.delattr("os.sync", raising=False)
+    assert jogo.regenerar_relatorios_jogadores(todos=True) == 2
+    assert jogo.regenerar_relatorios_jogadores() == 0
@@ -0,0 +1,44 @@
+"""Testes do GravadorEmLote do servidor (gravação agrupada)."""
+from __future__ import annotations
+
+import asyncio
+import errno
+
+import servidor
+
+
+def test_falha_de_gravacao_devolve_o_lote_e_o_laco_continua(abrir_jogo, monkeypatch, capsys):
+    jogo = abrir_jogo()
+    jogo.cadastrar_jogador("Ana", "ana")
+    gravar = jogo.persistir_partidas
+    tentativas = []
+
+    def disco_cheio_na_primeira(lote):
+        tentativas.append(len(lote))
+        if len(tentativas) == 1:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        return gravar(lote)
+
+    monkeypatch.setattr(jogo, "persistir_partidas", disco_cheio_na_primeira)
+
+    async def cenario():
+        gravador = servidor.GravadorEmLote(intervalo=0.01)
+        tarefa = asyncio.create_task(gravador.executar())
+        gravador.adicionar_partida(jogo.registrar_partida("ana", 7, [7], True, persistir=False))
+        while gravador.falhas == 0:
+            await asyncio.sleep(0.005)
+        gravador.adicionar_partida(jogo.registrar_partida("ana", 7, [3, 7], True, persistir=False))
+        while gravador.escritas == 0:
+            await asyncio.sleep(0.005)
+        assert not tarefa.done()
+        gravador.parar()
+        await tarefa
+        return gravador
+
+    gravador = asyncio.run(cenario())
+    assert gravador.pendentes() == 0
+    assert tentativas == [1, 2]
+    assert "Falha ao gravar 1 partidas" in capsys.readouterr().err
+
+    jogo = abrir_jogo()
+    assert [p["tentativas"] for p in jogo.historico_partidas("ana")] == [[3, 7], [7]]
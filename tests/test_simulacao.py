@@ -0,0 +1,54 @@
+"""Testes da gravação em lote da simulação vetorizada."""
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import simulacao_numpy as vet  # noqa: E402
+
+
+def _estatisticas(jogo, usuario):
+    stats = dict(jogo.calcular_estatisticas_jogador(usuario)[usuario])
+    del stats["nome"]
+    return stats
+
+
+@pytest.mark.parametrize("backend", ["arquivo", "sqlite", "mmap"])
+def test_registrar_em_lote_igual_a_uma_a_uma(abrir_jogo, backend):
+    jogo = abrir_jogo(backend)
+    jogo.cadastrar_jogador("Ana", "ana")
+    jogo.cadastrar_jogador("Bia", "bia")
+    jogo.rankings_configuracao()  # materializa os agregados por configuração
+    lote = next(vet.simular_em_blocos(300, deslocamento=3, semente=1, com_palpites=True))
+    geradas = vet.partidas_do_bloco(lote, "ana", 0, date.today().isoformat())
+
+    for p in geradas:
+        jogo.registrar_partida(
+            "bia", p["numero_secreto"], p["tentativas"], p["resultado"] == "Vitória", data=p["data"]
+        )
+    jogo.registrar_partidas(geradas)
+
+    assert _estatisticas(jogo, "ana") == _estatisticas(jogo, "bia")
+    assert [p["id"] for p in geradas] == list(range(301, 601))
+    rankings = [jogo.rankings_gerais(), jogo.rankings_janela("semanal"), jogo.rankings_configuracao()]
+    assert rankings[1] == rankings[2] and rankings[1]["ranking_vitorias"][0][1] > 0
+
+    jogo = abrir_jogo(backend)  # o que foi gravado é o que estava na memória
+    assert _estatisticas(jogo, "ana") == _estatisticas(jogo, "bia")
+    assert [jogo.rankings_gerais(), jogo.rankings_janela("semanal"), jogo.rankings_configuracao()] == rankings
+    assert jogo.contador_partidas == 601
+
+
+def test_ids_em_lote_no_modo_multiprocesso(abrir_jogo):
+    jogo = abrir_jogo(multiprocesso=1)
+    jogo.cadastrar_jogador("Ana", "ana")
+    jogo.registrar_partida("ana", 7, [7], True)
+    lote = next(vet.simular_em_blocos(10, semente=2, com_palpites=True))
+    jogo.registrar_partidas(vet.partidas_do_bloco(lote, "ana", 0, "2026-01-01"))
+    jogo.registrar_partida("ana", 7, [7], True)
+
+    jogo = abrir_jogo(multiprocesso=1)
+    assert sorted(jogo.partidas.id) == list(range(1, 13))
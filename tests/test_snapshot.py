@@ -0,0 +1,117 @@
+"""Testes do snapshot das visões: restauração e invalidação."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+
+def _jogar(jogo, quantidade, inicio=0):
+    for i in range(inicio, inicio + quantidade):
+        usuario = ("ana", "bia", "caio")[i % 3]
+        tentativas = [50, 7] if i % 2 else [7]
+        data = f"2026-01-{1 + i % 5:02d}"
+        jogo.registrar_partida(usuario, 7, tentativas, i % 4 != 3, data=data)
+
+
+def _estado(jogo):
+    return {
+        "partidas": [dict(p) for p in jogo.partidas],
+        "contador": jogo.contador_partidas,
+        "rankings": jogo.rankings_gerais(limite=10),
+        "datas": sorted(jogo.datas_disponiveis()),
+        "estatisticas": [jogo.calcular_estatisticas_jogador(u) for u in ("ana", "bia", "caio")],
+    }
+
+
+@pytest.fixture
+def com_snapshot(abrir_jogo):
+    """Jogo com 12 partidas no snapshot e mais 4 só no log; devolve o estado."""
+    jogo = abrir_jogo()
+    for usuario in ("ana", "bia", "caio"):
+        jogo.cadastrar_jogador(usuario.title(), usuario)
+    _jogar(jogo, 12)
+    assert jogo.salvar_snapshot()
+    _jogar(jogo, 4, inicio=12)
+    return _estado(jogo)
+
+
+def _sem_leitura_completa(monkeypatch, jogo):
+    def falha(caminho):
+        raise AssertionError("o log inteiro foi lido")
+
+    monkeypatch.setattr(jogo, "_ler_log_partidas", falha)
+
+
+def test_restaura_snapshot_e_reaplica_so_o_final_do_log(abrir_jogo, com_snapshot, monkeypatch):
+    jogo = abrir_jogo(carregar=False)
+    _sem_leitura_completa(monkeypatch, jogo)
+    jogo._carregar_arquivos()
+    assert _estado(jogo) == com_snapshot
+
+    # partidas novas depois da restauração seguem o mesmo caminho
+    _jogar(jogo, 2, inicio=16)
+    esperado = _estado(jogo)
+    os.remove(abrir_jogo(carregar=False).ARQ_SNAPSHOT)  # recarregar desfaz o monkeypatch
+    assert _estado(abrir_jogo()) == esperado
+
+
+def test_log_regravado_invalida_o_snapshot(abrir_jogo, com_snapshot):
+    jogo = abrir_jogo()
+    jogo.partidas.definir(0, "pontuacao", 1)
+    jogo._reconstruir_indice()
+    jogo._salvar_partidas()  # arquivo novo: o snapshot aponta para o inode antigo
+    esperado = _estado(jogo)
+    assert esperado["partidas"][0]["pontuacao"] == 1
+
+    jogo = abrir_jogo()
+    assert _estado(jogo) == esperado
+
+
+def test_log_alterado_no_lugar_invalida_o_snapshot(abrir_jogo, com_snapshot):
+    jogo = abrir_jogo(carregar=False)
+    with open(jogo.ARQ_SNAPSHOT, "rb") as f:
+        posicao = json.loads(f.readline())["log"]["bytes"]
+    # mesmo inode e tamanho, mas os bytes cobertos pelo snapshot mudaram
+    with open(jogo.ARQ_PARTIDAS_LOG, "r+b") as f:
+        f.seek(posicao - 40)
+        trecho = f.read(30)
+        f.seek(posicao - 40)
+        f.write(trecho.replace(b'"2026-01-', b'"2026-02-'))
+    assert b'"2026-01-' in trecho
+
+    jogo._carregar_arquivos()
+    datas = jogo.datas_disponiveis()
+    assert any(d.startswith("2026-02-") for d in datas)
+    assert len(jogo.partidas) == len(com_snapshot["partidas"])
+
+
+@pytest.mark.parametrize("dano", ["truncado", "versao"])
+def test_snapshot_danificado_cai_na_carga_completa(abrir_jogo, com_snapshot, dano):
+    jogo = abrir_jogo(carregar=False)
+    with open(jogo.ARQ_SNAPSHOT, "rb") as f:
+        cabecalho = json.loads(f.readline())
+        colunas = f.read()
+    if dano == "truncado":
+        colunas = colunas[:-5]
+    else:
+        cabecalho["versao"] += 1
+    with open(jogo.ARQ_SNAPSHOT, "wb") as f:
+        f.write(json.dumps(cabecalho).encode() + b"\n" + colunas)
+
+    jogo._carregar_arquivos()
+    assert _estado(jogo) == com_snapshot
+
+
+def test_linha_cortada_depois_do_snapshot_e_descartada(abrir_jogo, com_snapshot):
+    jogo = abrir_jogo(carregar=False)
+    with open(jogo.ARQ_PARTIDAS_LOG, "a") as f:
+        f.write('{"id": 999, "jogador": "ana", "numero')  # queda no meio da escrita
+    tamanho = os.path.getsize(jogo.ARQ_PARTIDAS_LOG)
+
+    jogo._carregar_arquivos()
+    assert _estado(jogo) == com_snapshot
+    assert os.path.getsize(jogo.ARQ_PARTIDAS_LOG) < tamanho
+    _jogar(jogo, 1, inicio=16)
+    assert len(abrir_jogo().partidas) == len(com_snapshot["partidas"]) + 1